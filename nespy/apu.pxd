@@ -1,2 +1,22 @@
+from nespy.interrupt cimport InterruptLines
+
+
 cdef class APU:
-    cdef list memory
\ No newline at end of file
+    cdef InterruptLines interrupts
+    cdef public object pulse1
+    cdef public object pulse2
+    cdef public object triangle
+    cdef public object noise
+    cdef public object dmc
+    cdef public object clock
+    cdef object _synthesizer
+    cdef list _writes
+    cdef long long _now
+    cdef long long _cycle
+    cdef long long _deadline
+    cdef long long _block_end
+    cdef int _mode
+    cdef bint _irq_inhibit
+    cdef bint _frame_interrupt
+    cdef long long _frame_start
+    cdef int _frame_step
@@ -1,6 +1,920 @@
+import struct
+from typing import Callable, Optional
+
+from nespy.clock import ChildClock
+from nespy.enum import IRQSource
+from nespy.exceptions import InvalidState
+from nespy.interrupt import InterruptLines
+
+
+def _no_read(address: int) -> int:
+    return 0
+
+
+def _no_stall(cycles: int) -> None:
+    pass
+
+
+# NTSC CPU clock frequency, master / 12
+CPU_FREQUENCY = 21477272 / 12
+# CPU cycles between blocks of samples, about one frame
+_BLOCK_CYCLES = 29781
+# a cycle that is never reached, but that still fits in the master clock's cycles
+_NEVER = 1 << 58
+# the most writes queued before the APU catches up anyway, when there are no blocks of samples to catch up at
+_MAX_QUEUED_WRITES = 256
+# the registers whose writes have effects games can see: length counters and their halt flags, the DMC's sample
+# and timing, the status and the frame counter. the rest only shape the sound
+_TIMING_REGISTERS = frozenset((0x00, 0x03, 0x04, 0x07, 0x08, 0x0B, 0x0C, 0x0F, 0x10, 0x12, 0x13, 0x15, 0x17))
+
+# the lengths selected by the top 5 bits of writes to a channel's length counter load register
+LENGTH_TABLE = (10, 254, 20, 2, 40, 4, 80, 6, 160, 8, 60, 10, 14, 12, 26, 14,
+                12, 16, 24, 18, 48, 20, 96, 22, 192, 24, 72, 26, 16, 28, 32, 30)
+# the 8 steps of the pulse channels' 4 duty cycles
+DUTY_TABLE = ((0, 1, 0, 0, 0, 0, 0, 0), (0, 1, 1, 0, 0, 0, 0, 0), (0, 1, 1, 1, 1, 0, 0, 0), (1, 0, 0, 1, 1, 1, 1, 1))
+# the 32 steps of the triangle channel
+TRIANGLE_TABLE = tuple(range(15, -1, -1)) + tuple(range(16))
+# the noise and DMC channels' timer periods, in CPU cycles
+NOISE_PERIODS = (4, 8, 16, 32, 64, 96, 128, 160, 202, 254, 380, 508, 762, 1016, 2034, 4068)
+DMC_PERIODS = (428, 380, 340, 320, 286, 254, 226, 214, 190, 160, 142, 128, 106, 84, 72, 54)
+
+# how much the mixed output changes per unit of each channel's level.
+# the NES mixes its channels non-linearly, this is the linear approximation of the mixer
+PULSE_GAIN = 0.00752
+TRIANGLE_GAIN = 0.00851
+NOISE_GAIN = 0.00494
+DMC_GAIN = 0.00335
+
+# what the frame counter's steps clock
+_QUARTER_FRAME = 1  # envelopes and the triangle's linear counter
+_HALF_FRAME = 2  # length counters and sweep units
+_FRAME_IRQ = 4
+# the steps of the 4-step and the 5-step sequences, as (CPU cycles since the sequence started, what is clocked)
+_FRAME_SEQUENCES = (((7457, _QUARTER_FRAME), (14913, _QUARTER_FRAME | _HALF_FRAME), (22371, _QUARTER_FRAME),
+                     (29829, _QUARTER_FRAME | _HALF_FRAME | _FRAME_IRQ)),
+                    ((7457, _QUARTER_FRAME), (14913, _QUARTER_FRAME | _HALF_FRAME), (22371, _QUARTER_FRAME),
+                     (37281, _QUARTER_FRAME | _HALF_FRAME)))
+# CPU cycles until each sequence starts over
+_FRAME_PERIODS = (29830, 37282)
+
+# CPU cycles run, cycle the frame sequence started at, sequence (0 for 4-step, 1 for 5-step), next step in the sequence,
+# IRQ inhibit, frame interrupt flag
+_STATE_STRUCT = struct.Struct("<qqBB??")
+# loop/halt flag, constant volume flag, period/volume, start flag, divider, decay level
+_ENVELOPE_STRUCT = struct.Struct("<???BBB")
+# enabled, length counter, duty, sweep enabled, sweep period, sweep negate, sweep shift, sweep reload flag,
+# sweep divider, timer period, sequencer position, next timer step
+_PULSE_STRUCT = struct.Struct("<?BB?B?B?BHBq")
+# enabled, length counter, control flag, linear counter reload value, linear counter, linear counter reload flag,
+# timer period, sequencer position, next timer step
+_TRIANGLE_STRUCT = struct.Struct("<?B?BB?HBq")
+# enabled, length counter, mode, period index, shift register, next timer step
+_NOISE_STRUCT = struct.Struct("<?BBBHq")
+# IRQ enabled, loop, rate index, output level, sample address, sample length, current address, bytes remaining,
+# sample buffer, sample buffer full, shift register, bits remaining, silence flag, interrupt flag, next timer step
+_DMC_STRUCT = struct.Struct("<??BBHHHHB?BB??q")
+
+
+class Envelope:
+    """
+    The volume of a pulse or noise channel. Either constant, or a level that decays from 15 to 0 by one every
+    `period + 1` quarter frames, and optionally loops back to 15.
+    """
+    def __init__(self) -> None:
+        self.loop = False  # also halts the channel's length counter
+        self.constant = False
+        self.period = 0  # also the volume, if the volume is constant
+        self.start = False
+        self.divider = 0
+        self.decay = 0
+
+    def write(self, value: int) -> None:
+        """
+        Args:
+            value(int): a write to the channel's first register, --LC VVVV
+        """
+        self.loop = bool(value & 0x20)
+        self.constant = bool(value & 0x10)
+        self.period = value & 0x0F
+
+    def volume(self) -> int:
+        if self.constant:
+            return self.period
+        return self.decay
+
+    def clock(self) -> None:
+        """
+        Clocked every quarter frame.
+        """
+        if self.start:
+            self.start = False
+            self.decay = 15
+            self.divider = self.period
+        elif self.divider == 0:
+            self.divider = self.period
+            if self.decay > 0:
+                self.decay -= 1
+            elif self.loop:
+                self.decay = 15
+        else:
+            self.divider -= 1
+
+    def save_state(self) -> bytes:
+        return _ENVELOPE_STRUCT.pack(self.loop, self.constant, self.period, self.start, self.divider, self.decay)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        (self.loop, self.constant, self.period, self.start, self.divider,
+         self.decay) = _ENVELOPE_STRUCT.unpack_from(state, offset)
+        return offset + _ENVELOPE_STRUCT.size
+
+
+class Pulse:
+    """
+    One of the two pulse channels, at 0x4000-0x4003 and 0x4004-0x4007.
+
+    Args:
+        channel(int): 0 for the first pulse channel, 1 for the second. they differ in how their sweeps subtract
+    """
+    def __init__(self, channel: int) -> None:
+        # the first channel's sweep subtracts one more than the second's
+        self._negate_offset = 1 if channel == 0 else 0
+        self.envelope = Envelope()
+        self.enabled = False
+        self.length = 0
+        self.duty = 0
+        self.sweep_enabled = False
+        self.sweep_period = 0
+        self.sweep_negate = False
+        self.sweep_shift = 0
+        self.sweep_reload = False
+        self.sweep_divider = 0
+        self.period = 0  # the timer's period, in APU cycles
+        self.position = 0  # position in the duty cycle
+        self.next_step = 0  # the CPU cycle of the timer's next step
+        self.level = 0  # output level last given to the synthesizer
+
+    def write(self, register: int, value: int) -> None:
+        """
+        Args:
+            register(int): 0-3
+            value(int): one byte
+        """
+        if register == 0:
+            self.duty = value >> 6
+            self.envelope.write(value)
+        elif register == 1:
+            self.sweep_enabled = bool(value & 0x80)
+            self.sweep_period = value >> 4 & 0x07
+            self.sweep_negate = bool(value & 0x08)
+            self.sweep_shift = value & 0x07
+            self.sweep_reload = True
+        elif register == 2:
+            self.period = self.period & 0x700 | value
+        else:
+            self.period = self.period & 0xFF | (value & 0x07) << 8
+            if self.enabled:
+                self.length = LENGTH_TABLE[value >> 3]
+            self.position = 0
+            self.envelope.start = True
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if not enabled:
+            self.length = 0
+
+    def target_period(self) -> int:
+        """
+        Returns:
+            int: the period the sweep unit would change the timer's period to
+        """
+        change = self.period >> self.sweep_shift
+        if self.sweep_negate:
+            return self.period - change - self._negate_offset
+        return self.period + change
+
+    def muted(self) -> bool:
+        """
+        Returns:
+            bool: whether the sweep unit silences the channel, which it does even while it is disabled
+        """
+        return self.period < 8 or self.target_period() > 0x7FF
+
+    def clock_length(self) -> None:
+        """
+        Clocked every half frame.
+        """
+        if self.length > 0 and not self.envelope.loop:
+            self.length -= 1
+
+    def clock_sweep(self) -> None:
+        """
+        Clocked every half frame.
+        """
+        if self.sweep_divider == 0 and self.sweep_enabled and self.sweep_shift > 0 and not self.muted():
+            self.period = self.target_period()
+        if self.sweep_divider == 0 or self.sweep_reload:
+            self.sweep_divider = self.sweep_period
+            self.sweep_reload = False
+        else:
+            self.sweep_divider -= 1
+
+    def render(self, start: int, end: int, synthesizer) -> None:
+        """
+        Runs the timer over the CPU cycles after `start`, up to and including `end`,
+        and gives the synthesizer every change in the channel's output.
+
+        Args:
+            start(int): CPU cycle the channel has been run up to
+            end(int): CPU cycle to run the channel up to
+            synthesizer(nespy.audio.Synthesizer): where the output goes
+        """
+        volume = 0
+        if self.length > 0 and not self.muted():
+            volume = self.envelope.volume()
+        level = DUTY_TABLE[self.duty][self.position] * volume
+        if level != self.level:
+            synthesizer.add_step(start, (level - self.level) * PULSE_GAIN)
+        period = self.period + 1 << 1  # the timer is clocked every APU cycle, which is every other CPU cycle
+        count = 0
+        if self.next_step <= end:
+            count = (end - self.next_step) // period + 1
+        if count > 0 and volume > 0:
+            level = synthesizer.add_sequence(self.next_step, period, count, DUTY_TABLE[self.duty], self.position,
+                                             level, volume, PULSE_GAIN)
+        self.level = level
+        self.position = self.position + count & 0x07
+        self.next_step += count * period
+
+    def save_state(self) -> bytes:
+        return self.envelope.save_state() + _PULSE_STRUCT.pack(
+            self.enabled, self.length, self.duty, self.sweep_enabled, self.sweep_period, self.sweep_negate,
+            self.sweep_shift, self.sweep_reload, self.sweep_divider, self.period, self.position, self.next_step)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        offset = self.envelope.load_state(state, offset)
+        (self.enabled, self.length, self.duty, self.sweep_enabled, self.sweep_period, self.sweep_negate,
+         self.sweep_shift, self.sweep_reload, self.sweep_divider, self.period, self.position,
+         self.next_step) = _PULSE_STRUCT.unpack_from(state, offset)
+        return offset + _PULSE_STRUCT.size
+
+
+class Triangle:
+    """
+    The triangle channel, at 0x4008-0x400B.
+    """
+    def __init__(self) -> None:
+        self.enabled = False
+        self.length = 0
+        self.control = False  # also halts the length counter
+        self.linear_reload_value = 0
+        self.linear_counter = 0
+        self.linear_reload = False
+        self.period = 0  # the timer's period, in CPU cycles
+        self.position = 0  # position in the triangle
+        self.next_step = 0  # the CPU cycle of the timer's next step
+        self.level = 0  # output level last given to the synthesizer
+
+    def write(self, register: int, value: int) -> None:
+        """
+        Args:
+            register(int): 0-3. register 1 is unused
+            value(int): one byte
+        """
+        if register == 0:
+            self.control = bool(value & 0x80)
+            self.linear_reload_value = value & 0x7F
+        elif register == 2:
+            self.period = self.period & 0x700 | value
+        elif register == 3:
+            self.period = self.period & 0xFF | (value & 0x07) << 8
+            if self.enabled:
+                self.length = LENGTH_TABLE[value >> 3]
+            self.linear_reload = True
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if not enabled:
+            self.length = 0
+
+    def clock_linear(self) -> None:
+        """
+        Clocked every quarter frame.
+        """
+        if self.linear_reload:
+            self.linear_counter = self.linear_reload_value
+        elif self.linear_counter > 0:
+            self.linear_counter -= 1
+        if not self.control:
+            self.linear_reload = False
+
+    def clock_length(self) -> None:
+        """
+        Clocked every half frame.
+        """
+        if self.length > 0 and not self.control:
+            self.length -= 1
+
+    def render(self, start: int, end: int, synthesizer) -> None:
+        """
+        Runs the timer over the CPU cycles after `start`, up to and including `end`,
+        and gives the synthesizer every change in the channel's output.
+        The triangle keeps outputting the level it stopped at while it is silenced by its counters.
+        Periods below 2 are far above hearing, and are treated as silenced too, rather than aliasing.
+
+        Args:
+            start(int): CPU cycle the channel has been run up to
+            end(int): CPU cycle to run the channel up to
+            synthesizer(nespy.audio.Synthesizer): where the output goes
+        """
+        level = TRIANGLE_TABLE[self.position]
+        if level != self.level:
+            synthesizer.add_step(start, (level - self.level) * TRIANGLE_GAIN)
+        period = self.period + 1
+        count = 0
+        if self.next_step <= end:
+            count = (end - self.next_step) // period + 1
+        if count > 0 and self.linear_counter > 0 and self.length > 0 and self.period >= 2:
+            level = synthesizer.add_sequence(self.next_step, period, count, TRIANGLE_TABLE, self.position, level, 1,
+                                             TRIANGLE_GAIN)
+            self.position = self.position + count & 0x1F
+        self.level = level
+        self.next_step += count * period
+
+    def save_state(self) -> bytes:
+        return _TRIANGLE_STRUCT.pack(self.enabled, self.length, self.control, self.linear_reload_value,
+                                     self.linear_counter, self.linear_reload, self.period, self.position,
+                                     self.next_step)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        (self.enabled, self.length, self.control, self.linear_reload_value, self.linear_counter, self.linear_reload,
+         self.period, self.position, self.next_step) = _TRIANGLE_STRUCT.unpack_from(state, offset)
+        return offset + _TRIANGLE_STRUCT.size
+
+
+class Noise:
+    """
+    The noise channel, at 0x400C-0x400F.
+    """
+    def __init__(self) -> None:
+        self.envelope = Envelope()
+        self.enabled = False
+        self.length = 0
+        self.mode = 0
+        self.period_index = 0
+        self.shift_register = 1
+        self.next_step = 0  # the CPU cycle of the timer's next step
+        self.level = 0  # output level last given to the synthesizer
+
+    def write(self, register: int, value: int) -> None:
+        """
+        Args:
+            register(int): 0-3. register 1 is unused
+            value(int): one byte
+        """
+        if register == 0:
+            self.envelope.write(value)
+        elif register == 2:
+            self.mode = value >> 7
+            self.period_index = value & 0x0F
+        elif register == 3:
+            if self.enabled:
+                self.length = LENGTH_TABLE[value >> 3]
+            self.envelope.start = True
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        if not enabled:
+            self.length = 0
+
+    def clock_length(self) -> None:
+        """
+        Clocked every half frame.
+        """
+        if self.length > 0 and not self.envelope.loop:
+            self.length -= 1
+
+    def render(self, start: int, end: int, synthesizer) -> None:
+        """
+        Runs the timer and the shift register over the CPU cycles after `start`, up to and including `end`,
+        and gives the synthesizer every change in the channel's output.
+
+        Args:
+            start(int): CPU cycle the channel has been run up to
+            end(int): CPU cycle to run the channel up to
+            synthesizer(nespy.audio.Synthesizer): where the output goes
+        """
+        volume = 0
+        if self.length > 0:
+            volume = self.envelope.volume()
+        level = 0 if self.shift_register & 1 else volume
+        if level != self.level:
+            synthesizer.add_step(start, (level - self.level) * NOISE_GAIN)
+        period = NOISE_PERIODS[self.period_index]
+        count = 0
+        if self.next_step <= end:
+            count = (end - self.next_step) // period + 1
+        if count > 0:
+            states, outputs, position = synthesizer.noise_cycle(self.shift_register, self.mode)
+            if volume > 0:
+                level = synthesizer.add_sequence(self.next_step, period, count, outputs, position, level, volume,
+                                                 NOISE_GAIN)
+            self.shift_register = int(states[(position + count) % len(states)])
+        self.level = level
+        self.next_step += count * period
+
+    def save_state(self) -> bytes:
+        return self.envelope.save_state() + _NOISE_STRUCT.pack(self.enabled, self.length, self.mode,
+                                                               self.period_index, self.shift_register, self.next_step)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        offset = self.envelope.load_state(state, offset)
+        (self.enabled, self.length, self.mode, self.period_index, self.shift_register,
+         self.next_step) = _NOISE_STRUCT.unpack_from(state, offset)
+        return offset + _NOISE_STRUCT.size
+
+
+class DMC:
+    """
+    The delta modulation channel, at 0x4010-0x4013. Plays 1-bit delta encoded samples from CPU memory.
+
+    Every sample byte is fetched by DMA while the previous one plays, which halts the CPU for a few cycles,
+    and an IRQ can be raised when the last byte of a sample has been fetched.
+
+    Args:
+        interrupts(InterruptLines): the CPU's interrupt lines, for the DMC's IRQ
+    """
+    def __init__(self, interrupts: InterruptLines) -> None:
+        self.interrupts = interrupts
+        # reads sample bytes from CPU memory
+        self.read_hook: Callable[[int], int] = _no_read
+        # halts the CPU while a sample byte is fetched
+        self.stall_hook: Callable[[int], None] = _no_stall
+        self.irq_enabled = False
+        self.loop = False
+        self.period_index = 0
+        self.output = 0  # the output level, 0-127
+        self.sample_address = 0xC000
+        self.sample_length = 1
+        self.address = 0xC000  # address of the next byte to fetch
+        self.remaining = 0  # bytes of the sample left to fetch
+        self.buffer = 0
+        self.buffer_full = False
+        self.shift_register = 0
+        self.bits = 8  # bits left in the current output cycle
+        self.silent = True
+        self.interrupt = False
+        self.next_step = 0  # the CPU cycle of the timer's next step
+        self.level = 0  # output level last given to the synthesizer
+
+    def write(self, register: int, value: int) -> None:
+        """
+        Args:
+            register(int): 0-3
+            value(int): one byte
+        """
+        if register == 0:
+            self.irq_enabled = bool(value & 0x80)
+            self.loop = bool(value & 0x40)
+            self.period_index = value & 0x0F
+            if not self.irq_enabled:
+                self.interrupt = False
+                self.interrupts.release_irq(IRQSource.DMC)
+        elif register == 1:
+            self.output = value & 0x7F
+        elif register == 2:
+            self.sample_address = 0xC000 | value << 6
+        else:
+            self.sample_length = value << 4 | 1
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Starts the sample over if it had finished, or stops it.
+        """
+        if not enabled:
+            self.remaining = 0
+        elif self.remaining == 0:
+            self.address = self.sample_address
+            self.remaining = self.sample_length
+            if not self.buffer_full:
+                self.fetch()
+
+    def fetch(self) -> None:
+        """
+        Fills the sample buffer with the sample's next byte.
+        """
+        self.stall_hook(4)
+        self.buffer = self.read_hook(self.address)
+        self.buffer_full = True
+        self.address = self.address + 1 if self.address < 0xFFFF else 0x8000
+        self.remaining -= 1
+        if self.remaining == 0:
+            if self.loop:
+                self.address = self.sample_address
+                self.remaining = self.sample_length
+            elif self.irq_enabled:
+                self.interrupt = True
+                self.interrupts.assert_irq(IRQSource.DMC)
+
+    def next_fetch(self) -> int:
+        """
+        Returns:
+            int: the CPU cycle of the next sample byte fetch, or `_NEVER` if there is nothing left to fetch
+        """
+        if not self.buffer_full or self.remaining == 0:
+            return _NEVER
+        # the byte is fetched when the buffer is emptied, at the start of the next output cycle
+        return self.next_step + (self.bits - 1) * DMC_PERIODS[self.period_index]
+
+    def run(self, start: int, end: int, synthesizer) -> None:
+        """
+        Runs the timer and the output unit over the CPU cycles after `start`, up to and including `end`, fetching
+        sample bytes as the sample buffer is emptied, and gives the synthesizer every change in the channel's output.
+
+        Args:
+            start(int): CPU cycle the channel has been run up to
+            end(int): CPU cycle to run the channel up to
+            synthesizer(nespy.audio.Synthesizer): where the output goes
+        """
+        output = self.output
+        if output != self.level:
+            synthesizer.add_step(start, (output - self.level) * DMC_GAIN)
+            self.level = output
+        period = DMC_PERIODS[self.period_index]
+        step = self.next_step
+        # only the bits of a sample need to be stepped through one at a time
+        while step <= end and not (self.silent and not self.buffer_full):
+            if not self.silent:
+                if self.shift_register & 1:
+                    if output <= 125:
+                        output += 2
+                elif output >= 2:
+                    output -= 2
+                self.shift_register >>= 1
+                if output != self.level:
+                    synthesizer.add_step(step, (output - self.level) * DMC_GAIN)
+                    self.level = output
+            self.bits -= 1
+            if self.bits == 0:
+                self.bits = 8
+                if self.buffer_full:
+                    self.shift_register = self.buffer
+                    self.buffer_full = False
+                    self.silent = False
+                    if self.remaining > 0:
+                        self.fetch()
+                else:
+                    self.silent = True
+            step += period
+        if step <= end:
+            # silent, with nothing to play next. only the timer runs
+            count = (end - step) // period + 1
+            step += count * period
+            self.bits = (self.bits - count - 1) % 8 + 1
+        self.output = output
+        self.next_step = step
+
+    def skip(self, end: int) -> None:
+        """
+        Runs the timer up to and including `end` without making any output, for when there is no sound.
+        Only the ends of output cycles matter then, since they are when sample bytes are fetched, so the timer skips
+        from the end of one output cycle straight to the end of the next.
+
+        Args:
+            end(int): CPU cycle to run the channel up to
+        """
+        period = DMC_PERIODS[self.period_index]
+        step = self.next_step
+        while self.buffer_full:
+            last = step + (self.bits - 1) * period  # the last timer step of the output cycle
+            if last > end:
+                break
+            step = last + period
+            self.bits = 8
+            self.buffer_full = False
+            if self.remaining > 0:
+                self.fetch()
+        if step <= end:
+            count = (end - step) // period + 1
+            step += count * period
+            self.bits = (self.bits - count - 1) % 8 + 1
+        self.next_step = step
+
+    def save_state(self) -> bytes:
+        return _DMC_STRUCT.pack(self.irq_enabled, self.loop, self.period_index, self.output, self.sample_address,
+                                self.sample_length, self.address, self.remaining, self.buffer, self.buffer_full,
+                                self.shift_register, self.bits, self.silent, self.interrupt, self.next_step)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        (self.irq_enabled, self.loop, self.period_index, self.output, self.sample_address, self.sample_length,
+         self.address, self.remaining, self.buffer, self.buffer_full, self.shift_register, self.bits, self.silent,
+         self.interrupt, self.next_step) = _DMC_STRUCT.unpack_from(state, offset)
+        return offset + _DMC_STRUCT.size
+
+
 class APU:
-    def __init__(self, memory: list[int]) -> None:
-        self.memory = memory
+    """
+    The audio processing unit: two pulse channels, a triangle channel, a noise channel, the DMC, and the frame counter
+    that clocks their envelopes, sweeps and length counters.
+
+    The APU is not run one cycle at a time. The master clock only tells it how many CPU cycles have passed, and
+    register writes are queued with the cycle they happen at. The APU catches up, playing the queued writes back in
+    order with the frame counter's steps in between, only when it has to: when 0x4015 is read, when a write changes
+    when the next interrupt or DMC fetch is due, when that interrupt or fetch is due, and at the end of every block of
+    about a frame's worth of cycles. While it catches up, the channels' output between two events is handed to the
+    synthesizer as whole runs of timer steps, which turns them into samples with NumPy one block at a time.
+
+    Without sound, the APU only keeps what games can see: the length counters behind 0x4015, the frame counter's
+    interrupt, and the DMC's sample fetches, CPU stalls and interrupt. Writes that only shape the sound aren't queued,
+    the other channels' timers, envelopes, sweeps and linear counter don't run, and there are no blocks to catch up at,
+    so the APU only catches up when 0x4015 is read or an interrupt or DMC fetch is due.
+
+    Args:
+        interrupts(InterruptLines): the CPU's interrupt lines, for the frame counter's and the DMC's IRQs
+        sample_rate(int): samples per second of the APU's output
+        audio(bool): whether to make sound. NumPy is only needed for sound
+
+    Attributes:
+        clock(ChildClock): the master clock's child that runs the APU, if any. The APU defers it until the APU's next
+            deadline, so the master clock doesn't tell it about every instruction
+    """
+    def __init__(self, interrupts: InterruptLines, sample_rate: int = 48000, audio: bool = True) -> None:
+        self.interrupts = interrupts
+        self.pulse1 = Pulse(0)
+        self.pulse2 = Pulse(1)
+        self.triangle = Triangle()
+        self.noise = Noise()
+        self.dmc = DMC(interrupts)
+        self.clock: Optional[ChildClock] = None
+        self._synthesizer = None
+        self._writes: list[tuple[int, int, int]] = []  # (CPU cycle, address, value)
+        self._now = 0  # the CPU cycle the master clock has run the APU up to
+        self._cycle = 0  # the CPU cycle the channels have actually been run up to
+        self._deadline = 0  # the CPU cycle the APU has to catch up at, even if nothing asks it to
+        self._block_end = _NEVER
+        self._mode = 0
+        self._irq_inhibit = False
+        self._frame_interrupt = False
+        self._frame_start = 0
+        self._frame_step = 0
+        if audio:
+            from nespy.audio import Synthesizer
+            self._synthesizer = Synthesizer(CPU_FREQUENCY, sample_rate)
+            self._block_end = _BLOCK_CYCLES
+
+    def reset(self) -> None:
+        """
+        Silences every channel and restarts the frame counter, as the console's reset button does.
+        """
+        self._catch_up()
+        self._write(0x4015, 0)
+        self._write(0x4017, self._mode << 7 | self._irq_inhibit << 6)
+        self._frame_interrupt = False
+        self.interrupts.release_irq(IRQSource.FRAME_COUNTER)
+        self._update_deadline()
+
+    def read_register(self, address: int) -> int:
+        """
+        Bus read handler for the APU and I/O registers at 0x4000-0x40FF. Only 0x4015, the APU's status, is readable.
+        The other registers read back the last value on the data bus, which is the high byte of their address.
+
+        Args:
+            address(int): CPU address being read
+
+        Returns:
+            int: the value of the register
+        """
+        if address != 0x4015:
+            return address >> 8
+        self._catch_up()
+        dmc = self.dmc
+        status = (dmc.interrupt << 7 | self._frame_interrupt << 6 | (dmc.remaining > 0) << 4 |
+                  (self.noise.length > 0) << 3 | (self.triangle.length > 0) << 2 |
+                  (self.pulse2.length > 0) << 1 | (self.pulse1.length > 0))
+        # reading the status acknowledges the frame interrupt
+        if self._frame_interrupt:
+            self._frame_interrupt = False
+            self.interrupts.release_irq(IRQSource.FRAME_COUNTER)
+            self._update_deadline()
+        return status
+
+    def write_register(self, address: int, value: int) -> None:
+        """
+        Bus write handler for the APU and I/O registers at 0x4000-0x40FF.
+        The write is queued, and takes effect when the APU next catches up.
+
+        Args:
+            address(int): CPU address being written
+            value(int): one byte
+        """
+        if address > 0x4017:
+            return
+        if self._synthesizer is None and address & 0x1F not in _TIMING_REGISTERS:
+            return
+        self._writes.append((self._now, address, value))
+        if address == 0x4010 or address == 0x4015 or address == 0x4017:
+            # these move the next DMC fetch or interrupt
+            self._catch_up()
+        elif len(self._writes) >= _MAX_QUEUED_WRITES:
+            self._catch_up()
+
+    def emulate_cycle(self) -> None:
+        self.emulate_cycles(1)
+
+    def emulate_cycles(self, count: int) -> None:
+        """
+        Tells the APU that the given number of CPU cycles have passed.
+        The APU only catches up if an interrupt, a DMC fetch or the end of a block is due.
+
+        Args:
+            count(int): number of CPU cycles
+        """
+        self._now += count
+        if self._now >= self._deadline:
+            self._catch_up()
+
+    def read_samples(self) -> "numpy.ndarray":
+        """
+        Returns:
+            numpy.ndarray: float32 array of the samples made since the last call, in the range -1 to 1
+        """
+        if self._synthesizer is None:
+            raise InvalidState("The APU was made without sound.")
+        return self._synthesizer.read_samples()
+
+    def set_stream(self, stream) -> None:
+        """
+        Starts writing every block of samples to the given stream, at its sample rate, instead of to the last stream.
+
+        Args:
+            stream(nespy.audio.AudioStream): the stream
+        """
+        if self._synthesizer is None:
+            raise InvalidState("The APU was made without sound.")
+        self._synthesizer.set_sample_rate(stream.sample_rate)
+        self._synthesizer.stream = stream
+
+    def _catch_up(self) -> None:
+        """
+        Runs the channels and the frame counter up to the current cycle, applying the queued writes on the way.
+        """
+        writes = self._writes
+        index = 0
+        while True:
+            frame_step = self._frame_start + _FRAME_SEQUENCES[self._mode][self._frame_step][0]
+            write = writes[index][0] if index < len(writes) else _NEVER
+            event = min(frame_step, write)
+            if event > self._now:
+                break
+            self._run(event)
+            if frame_step <= write:
+                self._clock_frame_counter()
+            else:
+                self._write(writes[index][1], writes[index][2])
+                index += 1
+        self._run(self._now)
+        del writes[:]
+        if self._now >= self._block_end:
+            self._synthesizer.end_block(self._now)
+            self._block_end = self._now + _BLOCK_CYCLES
+        self._update_deadline()
+
+    def _run(self, end: int) -> None:
+        """
+        Runs the channels over the CPU cycles after the last one they were run up to, up to and including `end`.
+        """
+        start = self._cycle
+        if end <= start:
+            return
+        synthesizer = self._synthesizer
+        if synthesizer is None:
+            self.dmc.skip(end)
+            self._cycle = end
+            return
+        self.pulse1.render(start, end, synthesizer)
+        self.pulse2.render(start, end, synthesizer)
+        self.triangle.render(start, end, synthesizer)
+        self.noise.render(start, end, synthesizer)
+        self.dmc.run(start, end, synthesizer)
+        self._cycle = end
+
+    def _clock_frame_counter(self) -> None:
+        """
+        Takes the frame counter's next step.
+        """
+        sequence = _FRAME_SEQUENCES[self._mode]
+        clocks = sequence[self._frame_step][1]
+        if clocks & _QUARTER_FRAME:
+            self._clock_quarter_frame()
+        if clocks & _HALF_FRAME:
+            self._clock_half_frame()
+        if clocks & _FRAME_IRQ and not self._irq_inhibit:
+            self._frame_interrupt = True
+            self.interrupts.assert_irq(IRQSource.FRAME_COUNTER)
+        self._frame_step += 1
+        if self._frame_step == len(sequence):
+            self._frame_step = 0
+            self._frame_start += _FRAME_PERIODS[self._mode]
+
+    def _clock_quarter_frame(self) -> None:
+        if self._synthesizer is None:
+            # envelopes and the linear counter only shape the sound
+            return
+        self.pulse1.envelope.clock()
+        self.pulse2.envelope.clock()
+        self.noise.envelope.clock()
+        self.triangle.clock_linear()
+
+    def _clock_half_frame(self) -> None:
+        self.pulse1.clock_length()
+        self.pulse2.clock_length()
+        self.triangle.clock_length()
+        self.noise.clock_length()
+        if self._synthesizer is not None:
+            self.pulse1.clock_sweep()
+            self.pulse2.clock_sweep()
+
+    def _write(self, address: int, value: int) -> None:
+        """
+        Applies a register write, once the channels have been run up to the cycle it happened at.
+        """
+        register = address & 0x1F
+        if register < 0x04:
+            self.pulse1.write(register, value)
+        elif register < 0x08:
+            self.pulse2.write(register & 0x03, value)
+        elif register < 0x0C:
+            self.triangle.write(register & 0x03, value)
+        elif register < 0x10:
+            self.noise.write(register & 0x03, value)
+        elif register < 0x14:
+            self.dmc.write(register & 0x03, value)
+        elif register == 0x15:
+            self.pulse1.set_enabled(bool(value & 0x01))
+            self.pulse2.set_enabled(bool(value & 0x02))
+            self.triangle.set_enabled(bool(value & 0x04))
+            self.noise.set_enabled(bool(value & 0x08))
+            self.dmc.set_enabled(bool(value & 0x10))
+            self.dmc.interrupt = False
+            self.interrupts.release_irq(IRQSource.DMC)
+        elif register == 0x17:
+            self._mode = value >> 7
+            self._irq_inhibit = bool(value & 0x40)
+            if self._irq_inhibit:
+                self._frame_interrupt = False
+                self.interrupts.release_irq(IRQSource.FRAME_COUNTER)
+            # the sequence starts over 3 or 4 CPU cycles after the write, depending on where in an APU cycle it lands
+            self._frame_start = self._cycle + 3 + (self._cycle & 1)
+            self._frame_step = 0
+            if self._mode:
+                # the 5-step sequence clocks everything as soon as it is selected
+                self._clock_quarter_frame()
+                self._clock_half_frame()
+
+    def _update_deadline(self) -> None:
+        deadline = min(self._block_end, self.dmc.next_fetch())
+        if self._mode == 0 and not self._irq_inhibit and not self._frame_interrupt:
+            # the 4-step sequence's last step raises the frame interrupt
+            deadline = min(deadline, self._frame_start + _FRAME_SEQUENCES[0][-1][0])
+        self._deadline = deadline
+        if self.clock is not None:
+            self.clock.defer(deadline - self._now)
+
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the state of the frame counter and every channel, packed for a save state
+        """
+        self._catch_up()
+        return b"".join([_STATE_STRUCT.pack(self._now, self._frame_start, self._mode, self._frame_step,
+                                            self._irq_inhibit, self._frame_interrupt),
+                         self.pulse1.save_state(), self.pulse2.save_state(), self.triangle.save_state(),
+                         self.noise.save_state(), self.dmc.save_state()])
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the APU's part of the save state starts
 
-    def emulate_cycle(self):
-        pass
+        Returns:
+            int: where the APU's part of the save state ends
+        """
+        (self._now, self._frame_start, self._mode, self._frame_step, self._irq_inhibit,
+         self._frame_interrupt) = _STATE_STRUCT.unpack_from(state, offset)
+        offset += _STATE_STRUCT.size
+        offset = self.pulse1.load_state(state, offset)
+        offset = self.pulse2.load_state(state, offset)
+        offset = self.triangle.load_state(state, offset)
+        offset = self.noise.load_state(state, offset)
+        offset = self.dmc.load_state(state, offset)
+        self._cycle = self._now
+        del self._writes[:]
+        if self._synthesizer is not None:
+            self._synthesizer.restart(self._now)
+            self._block_end = self._now + _BLOCK_CYCLES
+            # states saved without sound don't keep the other channels' timers running
+            for channel in (self.pulse1, self.pulse2, self.triangle, self.noise):
+                if channel.next_step < self._now:
+                    channel.next_step = self._now + 1
+        self._update_deadline()
+        return offset
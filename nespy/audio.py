@@ -0,0 +1,371 @@
+"""
+Band-limited synthesis of the APU's output into NumPy arrays of samples.
+
+This module needs NumPy, which the emulation core does not depend on. It is only imported by an APU that makes sound.
+"""
+from typing import Callable, Optional, Union
+
+import numpy
+
+
+# number of fractional positions between two samples that the step kernel is tabulated at
+_PHASES = 64
+# number of samples every step is spread across
+_WIDTH = 16
+# the most samples integrated at once. the integration leaks by a constant factor per sample, and is done with the
+# factor raised to the power of the sample's index, which has to stay well within float64 range
+_CHUNK = 1024
+# high-pass filter cutoff, in Hz. the first of the NES's output filters, which keeps the output centered on 0
+_HIGH_PASS = 90
+# seconds of samples kept for `.read_samples()` before the oldest are dropped
+_CAPACITY = 1
+# the largest 16-bit sample
+_INT16_SCALE = 32767
+
+
+def _make_kernel() -> numpy.ndarray:
+    """
+    Tabulates a band-limited impulse, a Blackman-windowed sinc, at `_PHASES` positions between two samples.
+
+    Returns:
+        numpy.ndarray: (_PHASES, _WIDTH) float64 array. every row sums to 1
+    """
+    half = _WIDTH // 2
+    # distance of every sample the impulse is spread across from the impulse
+    offsets = numpy.arange(_WIDTH) - (half - 1) - numpy.arange(_PHASES)[:, None] / _PHASES
+    window = 0.42 + 0.5 * numpy.cos(numpy.pi * offsets / half) + 0.08 * numpy.cos(2 * numpy.pi * offsets / half)
+    # cut off a little below Nyquist, so the window's transition band doesn't alias
+    kernel = numpy.sinc(0.9 * offsets) * window
+    return kernel / kernel.sum(axis=1, keepdims=True)
+
+
+_KERNEL = _make_kernel()
+_TAPS = numpy.arange(_WIDTH)
+
+
+class Synthesizer:
+    """
+    Turns the steps in the APU's mixed output into samples.
+
+    The APU's channels only change their output on CPU cycles, so the mixed output is a sum of steps. Every step is
+    added to a buffer as a band-limited impulse, spread over `_WIDTH` samples around the step's exact position
+    between two samples, and the samples are made by integrating the impulses. Integrating band-limited impulses
+    gives band-limited steps, which don't alias the way point sampling the channels' square waves would.
+    The integration leaks, which is the NES's 90Hz high-pass filter.
+
+    Steps are collected with `.add_step(...)` and `.add_sequence(...)` as the APU runs, and turned into samples a
+    block at a time by `.end_block(...)`, so that NumPy works on whole blocks instead of single steps.
+    Every block is also written to `stream`, if there is one. Since steps are placed at their exact time, any
+    sample rate can be made directly, and the stream's rate ratio can change from one block to the next.
+
+    Args:
+        clock_rate(float): the rate of the cycles that steps are timed in, i.e. the CPU clock frequency
+        sample_rate(int): samples per second
+        cycle(int): the cycle that the first block starts at
+    """
+    def __init__(self, clock_rate: float, sample_rate: int, cycle: int = 0) -> None:
+        self._clock_rate = clock_rate
+        self.stream: Optional[AudioStream] = None
+        self.set_sample_rate(sample_rate)
+        self._block_start = cycle
+        # fractional sample position of the start of the block
+        self._position = 0.0
+        self._step_times: list[int] = []
+        self._step_deltas: list[float] = []
+        self._sequence_times: list[numpy.ndarray] = []
+        self._sequence_deltas: list[numpy.ndarray] = []
+        # impulses that spill over past the end of the last block
+        self._tail = numpy.zeros(_WIDTH)
+        self._level = 0.0
+        self._tables: dict[tuple, numpy.ndarray] = {}
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """
+        Changes the rate that samples are made at, from the next block on. Samples that haven't been read are dropped.
+        """
+        self.sample_rate = sample_rate
+        self._cycles_per_sample = self._clock_rate / sample_rate
+        self._decay = numpy.exp(-2 * numpy.pi * _HIGH_PASS / sample_rate)
+        self._output = numpy.zeros(sample_rate * _CAPACITY, dtype=numpy.float32)
+        self._count = 0
+
+    def restart(self, cycle: int) -> None:
+        """
+        Drops the steps of the current block, and starts the next block at the given cycle, e.g. after a save state
+        is loaded. The samples already made are kept.
+        """
+        self._block_start = cycle
+        del self._step_times[:], self._step_deltas[:], self._sequence_times[:], self._sequence_deltas[:]
+
+    def add_step(self, cycle: int, delta: float) -> None:
+        """
+        Args:
+            cycle(int): when the output changes
+            delta(float): how much it changes by
+        """
+        self._step_times.append(cycle)
+        self._step_deltas.append(delta)
+
+    def add_sequence(self, first: int, period: int, count: int, table: Union[tuple, numpy.ndarray], position: int,
+                     level: int, multiplier: int, gain: float) -> int:
+        """
+        Adds the steps of a channel whose timer steps through a table of output levels, e.g. a pulse channel's duty
+        cycle. The timer steps `count` times, every `period` cycles from `first`. At every timer step, the position in
+        the table goes up by one, wrapping at the end of the table, and the channel outputs the value at that
+        position times `multiplier`.
+
+        Args:
+            first(int): cycle of the first timer step
+            period(int): cycles between timer steps
+            count(int): number of timer steps
+            table(tuple): the output levels the timer steps through
+            position(int): position in the table before the first timer step
+            level(int): output level before the first timer step
+            multiplier(int): e.g. the channel's volume
+            gain(float): how much the mixed output changes per unit of the channel's level
+
+        Returns:
+            int: the output level after the last timer step
+        """
+        if type(table) is tuple:
+            array = self._tables.get(table)
+            if array is None:
+                array = self._tables[table] = numpy.array(table, dtype=numpy.int64)
+            table = array
+        steps = numpy.arange(count)
+        levels = table[(position + 1 + steps) % len(table)] * multiplier
+        previous = numpy.empty_like(levels)
+        previous[0] = level
+        previous[1:] = levels[:-1]
+        changes = numpy.flatnonzero(levels != previous)
+        if len(changes):
+            self._sequence_times.append(first + period * changes)
+            self._sequence_deltas.append((levels[changes] - previous[changes]) * gain)
+        return int(levels[-1])
+
+    def noise_cycle(self, state: int, mode: int) -> tuple[numpy.ndarray, numpy.ndarray, int]:
+        """
+        See `noise_cycle(...)`.
+        """
+        return noise_cycle(state, mode)
+
+    def end_block(self, cycle: int) -> None:
+        """
+        Makes the samples between the start of the block and the given cycle from the steps added since the last block,
+        and starts the next block.
+
+        Args:
+            cycle(int): where the block ends. every step has to be at or before it
+        """
+        cycles_per_sample = self._cycles_per_sample
+        if self.stream is not None:
+            cycles_per_sample /= self.stream.ratio
+        end = self._position + (cycle - self._block_start) / cycles_per_sample
+        count = int(end)
+        impulses = numpy.zeros(count + _WIDTH)
+        impulses[:_WIDTH] = self._tail
+        if self._step_times or self._sequence_times:
+            times = numpy.concatenate([numpy.array(self._step_times, dtype=numpy.int64)] + self._sequence_times)
+            deltas = numpy.concatenate([numpy.array(self._step_deltas)] + self._sequence_deltas)
+            positions = self._position + (times - self._block_start) / cycles_per_sample
+            indices = positions.astype(numpy.int64)
+            phases = ((positions - indices) * _PHASES).astype(numpy.int64)
+            weights = _KERNEL[phases] * deltas[:, None]
+            impulses += numpy.bincount((indices[:, None] + _TAPS).ravel(), weights.ravel(), minlength=len(impulses))
+        self.restart(cycle)
+        self._position = end - count
+        self._tail = impulses[count:]
+        samples = self._integrate(impulses[:count])
+        self._write(samples)
+        if self.stream is not None:
+            self.stream.write(samples)
+
+    def _integrate(self, impulses: numpy.ndarray) -> numpy.ndarray:
+        """
+        Leaky integration: sample[n] = sample[n - 1] * decay + impulses[n], continuing from the last block.
+        Worked out in closed form, as decay ** n * (level * decay + cumsum(impulses * decay ** -n)),
+        so it is vectorized.
+        """
+        samples = numpy.empty(len(impulses), dtype=numpy.float32)
+        start = 0
+        while start < len(impulses):
+            chunk = impulses[start:start + _CHUNK]
+            powers = self._decay ** numpy.arange(1, len(chunk) + 1)
+            levels = powers * (self._level + numpy.cumsum(chunk / powers))
+            samples[start:start + len(chunk)] = levels
+            self._level = levels[-1]
+            start += _CHUNK
+        return samples
+
+    def _write(self, samples: numpy.ndarray) -> None:
+        output = self._output
+        if len(samples) > len(output):
+            samples = samples[-len(output):]
+        overflow = self._count + len(samples) - len(output)
+        if overflow > 0:
+            # nobody is reading the samples, so the oldest are dropped
+            output[:self._count - overflow] = output[overflow:self._count]
+            self._count -= overflow
+        output[self._count:self._count + len(samples)] = samples
+        self._count += len(samples)
+
+    def read_samples(self) -> numpy.ndarray:
+        """
+        Returns:
+            numpy.ndarray: float32 array of the samples made since the last call, in the range -1 to 1
+        """
+        samples = self._output[:self._count].copy()
+        self._count = 0
+        return samples
+
+
+class AudioStream:
+    """
+    A ring buffer of 16-bit mono samples, for passing the APU's output from the thread running the emulator to an
+    audio device, e.g. in the device's callback.
+
+    One thread writes and one thread reads, without any locks: the writer only ever moves the write position and
+    the reader only ever moves the read position, each after it has copied its samples. Neither side ever waits.
+    Samples written while the buffer is full are dropped and counted in `overruns`. Samples read while the buffer is
+    empty are made up by repeating the last sample read, and counted in `underruns`.
+
+    The emulator can be paced by the audio device instead of by a wall clock, by running a frame whenever
+    `available` falls below a target. The device's clock and the emulator's never quite agree, so the buffer
+    would still slowly fill up or run dry. `rate_control` corrects for that. It is called after every block is written,
+    and returns `ratio`, the number of samples to make per sample at `sample_rate`, for the next block.
+    See `dynamic_rate_control(...)`.
+
+    Args:
+        sample_rate(int): samples per second
+        capacity(int): the most samples the buffer holds. a quarter of a second if not given
+    """
+    def __init__(self, sample_rate: int = 48000, capacity: Optional[int] = None) -> None:
+        self.sample_rate = sample_rate
+        self.capacity = capacity or sample_rate // 4
+        self._buffer = numpy.zeros(self.capacity, dtype=numpy.int16)
+        # the number of samples ever written and ever read. the positions in the buffer are these modulo its capacity
+        self._written = 0
+        self._read = 0
+        self._last = 0  # the last sample read, repeated on underruns
+        self.overruns = 0
+        self.underruns = 0
+        self.ratio = 1.0
+        self.rate_control: Optional[Callable[[AudioStream], float]] = None
+
+    @property
+    def available(self) -> int:
+        """
+        The number of samples that can be read.
+        """
+        return self._written - self._read
+
+    @property
+    def fill(self) -> float:
+        """
+        How full the buffer is, from 0 to 1.
+        """
+        return (self._written - self._read) / self.capacity
+
+    def write(self, samples: numpy.ndarray) -> None:
+        """
+        Called by the emulator's thread.
+
+        Args:
+            samples(numpy.ndarray): float samples in the range -1 to 1
+        """
+        space = self.capacity - (self._written - self._read)
+        if len(samples) > space:
+            self.overruns += len(samples) - space
+            samples = samples[:space]
+        self._copy_in(numpy.clip(samples * _INT16_SCALE, -_INT16_SCALE - 1, _INT16_SCALE).astype(numpy.int16))
+        if self.rate_control is not None:
+            self.ratio = self.rate_control(self)
+
+    def _copy_in(self, samples: numpy.ndarray) -> None:
+        start = self._written % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        self._buffer[:len(samples) - first] = samples[first:]
+        # only moved once the samples are in place, so the reader never sees a sample before it is written
+        self._written += len(samples)
+
+    def read(self, count: Optional[int] = None) -> numpy.ndarray:
+        """
+        Called by the audio device's thread.
+
+        Args:
+            count(int): the number of samples to read. if there aren't enough, the rest are made up.
+                if None, every sample that is available is read
+
+        Returns:
+            numpy.ndarray: int16 array of `count` samples
+        """
+        available = self._written - self._read
+        if count is None:
+            count = available
+        taken = min(count, available)
+        start = self._read % self.capacity
+        first = min(taken, self.capacity - start)
+        samples = numpy.empty(count, dtype=numpy.int16)
+        samples[:first] = self._buffer[start:start + first]
+        samples[first:taken] = self._buffer[:taken - first]
+        if taken > 0:
+            self._last = samples[taken - 1]
+        # only moved once the samples are copied out, so the writer never overwrites a sample before it is read
+        self._read += taken
+        if taken < count:
+            self.underruns += count - taken
+            samples[taken:] = self._last
+        return samples
+
+
+def dynamic_rate_control(max_deviation: float = 0.005) -> Callable[[AudioStream], float]:
+    """
+    Makes a `rate_control` for an `AudioStream` that keeps its buffer about half full. It makes up to `max_deviation`
+    more samples than the sample rate asks for while the buffer is less than half full, and up to that many fewer while
+    it is more than half full. Half a percent is too little to hear as a change in pitch.
+
+    Args:
+        max_deviation(float): the most the ratio strays from 1
+
+    Returns:
+        callable: takes the stream, returns its next ratio
+    """
+    def rate_control(stream: AudioStream) -> float:
+        return 1.0 + max_deviation * (1.0 - 2.0 * stream.fill)
+    return rate_control
+
+
+# the states of the noise channel's shift register, in the order the register steps through them, for both of its
+# modes. every state is on exactly one cycle: one cycle of all 32767 states in mode 0, and cycles of 93 or 31 states
+# in mode 1. worked out the first time they are needed
+_NOISE_CYCLES: tuple[dict[int, tuple[numpy.ndarray, numpy.ndarray, int]], ...] = ({}, {})
+
+
+def noise_cycle(state: int, mode: int) -> tuple[numpy.ndarray, numpy.ndarray, int]:
+    """
+    Args:
+        state(int): the noise channel's shift register
+        mode(int): the noise channel's mode bit, which picks the bit the shift register's feedback is taken from
+
+    Returns:
+        tuple: (the states on the shift register's cycle, as an array, 1 for every state in which the channel
+            outputs its volume and 0 for the others, the position of `state` in the cycle)
+    """
+    cycles = _NOISE_CYCLES[mode]
+    found = cycles.get(state)
+    if found is None:
+        tap = 6 if mode else 1
+        states = [state]
+        following = state
+        while True:
+            following = following >> 1 | ((following ^ following >> tap) & 1) << 14
+            if following == state:
+                break
+            states.append(following)
+        array = numpy.array(states, dtype=numpy.int64)
+        outputs = 1 - (array & 1)
+        for position, member in enumerate(states):
+            cycles[member] = (array, outputs, position)
+        found = cycles[state]
+    return found
@@ -0,0 +1,11 @@
+import cython
+
+
+cdef class Bus:
+    cdef public bytearray memory
+    cdef public object ram
+    cdef public object sync
+    cdef list _read_pages
+    cdef list _write_pages
+    cdef list _read_handlers
+    cdef list _write_handlers
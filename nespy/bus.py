@@ -0,0 +1,160 @@
+from typing import Callable, Optional
+
+
+READ_HANDLER = Callable[[int], int]
+WRITE_HANDLER = Callable[[int, int], None]
+
+
+def _no_sync() -> None:
+    pass
+
+
+class Bus:
+    """
+    The CPU's 64KiB address space.
+
+    The address space is split into 256 pages of 256 bytes each. Every page is either mapped to a 256-byte memoryview
+    window into some buffer (internal RAM, PRG ROM, PRG RAM), or to a read handler and/or a write handler
+    (PPU registers, APU/IO registers, cartridge registers).
+
+    Memory pages are accessed with a single index into their window. Mirrored regions, such as internal RAM, are
+    simply several pages sharing the same windows, so mirroring doesn't cost anything extra. Pages with handlers
+    call `sync` before dispatching to the handler, so that the components behind the registers can be caught up first.
+
+    `memory` is the bytearray backing every page that hasn't been mapped to another buffer. The 2KiB of internal RAM
+    live at the start of it, and are also exposed as the memoryview `ram`.
+    """
+    def __init__(self) -> None:
+        self.memory = bytearray(0x10000)  # 64KiB
+        self.sync: Callable[[], None] = _no_sync
+        view = memoryview(self.memory)
+        self.ram = view[0x0000:0x0800]
+        self._read_pages: list[Optional[memoryview]] = [view[page << 8:(page + 1) << 8] for page in range(0x100)]
+        self._write_pages: list[Optional[memoryview]] = list(self._read_pages)
+        self._read_handlers: list[Optional[READ_HANDLER]] = [None] * 0x100
+        self._write_handlers: list[Optional[WRITE_HANDLER]] = [None] * 0x100
+        # 2KiB of internal RAM at 0x0000-0x07FF, mirrored up to 0x1FFF
+        self.map_memory(0x0000, 0x2000, self.ram)
+
+    def map_memory(self, start: int, end: int, buffer: memoryview, writable: bool = True) -> None:
+        """
+        Maps the pages from `start` to `end` directly to `buffer`.
+        If `buffer` is smaller than the region, it is mirrored across the whole region.
+
+        Args:
+            start(int): first address of the region. must be page-aligned
+            end(int): first address after the region. must be page-aligned
+            buffer(memoryview): memory to map into the region. its size must be a multiple of 256 bytes
+            writable(bool): if False, writes to the region are ignored
+        """
+        size = len(buffer)
+        for page in range(start >> 8, end >> 8):
+            offset = ((page << 8) - start) % size
+            window = buffer[offset:offset + 0x100]
+            self._read_pages[page] = window
+            self._read_handlers[page] = None
+            if writable:
+                self._write_pages[page] = window
+                self._write_handlers[page] = None
+            else:
+                self._write_pages[page] = None
+                self._write_handlers[page] = self.ignore_write
+
+    def swap_read_pages(self, start: int, windows: list[memoryview]) -> None:
+        """
+        Replaces the read windows of a run of pages, starting at `start`, with a single slice assignment.
+        Used by cartridges for PRG bank switching, with windows they split their banks into ahead of time.
+
+        Args:
+            start(int): first address of the region. must be page-aligned
+            windows(list): 256-byte memoryview windows, one per page
+        """
+        page = start >> 8
+        self._read_pages[page:page + len(windows)] = windows
+
+    def map_handlers(self, start: int, end: int,
+                     read: Optional[READ_HANDLER], write: Optional[WRITE_HANDLER]) -> None:
+        """
+        Routes accesses to the pages from `start` to `end` through the given handlers.
+        Passing None for a handler leaves that kind of access mapped to whatever memory it is currently mapped to.
+
+        Args:
+            start(int): first address of the region. must be page-aligned
+            end(int): first address after the region. must be page-aligned
+            read(callable): called with the address being read. returns one byte
+            write(callable): called with the address being written and the value
+        """
+        for page in range(start >> 8, end >> 8):
+            if read is not None:
+                self._read_pages[page] = None
+                self._read_handlers[page] = read
+            if write is not None:
+                self._write_pages[page] = None
+                self._write_handlers[page] = write
+
+    def read(self, address: int) -> int:
+        """
+        Args:
+            address(int): address to read from
+
+        Returns:
+            int: one byte
+        """
+        page = address >> 8
+        window = self._read_pages[page]
+        if window is not None:
+            return window[address & 0xFF]
+        self.sync()
+        return self._read_handlers[page](address)
+
+    def write(self, address: int, value: int) -> None:
+        """
+        Args:
+            address(int): address to write to
+            value(int): one byte
+        """
+        page = address >> 8
+        window = self._write_pages[page]
+        if window is not None:
+            window[address & 0xFF] = value
+            return
+        self.sync()
+        self._write_handlers[page](address, value)
+
+    def peek(self, address: int) -> int:
+        """
+        Reads a byte without any side effects, e.g. for disassembly. Registers behind handlers change when they are
+        read, so they aren't read at all.
+
+        Args:
+            address(int): address to read from
+
+        Returns:
+            int: one byte, or -1 if the address is mapped to a handler
+        """
+        window = self._read_pages[address >> 8]
+        if window is None:
+            return -1
+        return window[address & 0xFF]
+
+    def read_page(self, page: int) -> bytes:
+        """
+        Reads a whole page, for DMA. Pages that are mapped to memory are copied in one slice,
+        pages that go through handlers are read one byte at a time.
+
+        Args:
+            page(int): the high byte of the page's addresses
+
+        Returns:
+            bytes: the 256 bytes of the page
+        """
+        window = self._read_pages[page]
+        if window is not None:
+            return bytes(window)
+        return bytes([self.read(page << 8 | offset) for offset in range(0x100)])
+
+    def ignore_write(self, address: int, value: int) -> None:
+        """
+        Write handler for read-only regions, such as PRG ROM.
+        """
+        pass
@@ -0,0 +1,489 @@
+import struct
+from typing import Optional
+
+from nespy.bus import Bus
+from nespy.enum import IRQSource, Mapper, Mirroring
+from nespy.interrupt import InterruptLines
+from nespy.ppu import PPU
+from nespy.rom import ROM
+
+
+def _split_banks(buffer: memoryview, bank_size: int, window_size: int) -> list[list[memoryview]]:
+    """
+    Splits a buffer into banks, and every bank into memoryview windows that can be dropped straight into a page table.
+
+    Args:
+        buffer(memoryview): PRG or CHR data
+        bank_size(int): size of one bank
+        window_size(int): size of one page in the page table the banks will be mapped into
+
+    Returns:
+        list: one list of windows per bank
+    """
+    return [[buffer[offset:offset + window_size] for offset in range(bank, bank + bank_size, window_size)]
+            for bank in range(0, len(buffer), bank_size)]
+
+
+class Cartridge:
+    """
+    A cartridge, made of PRG ROM, CHR ROM or CHR RAM, optional PRG RAM, and the mapper that switches between banks.
+
+    Every PRG bank is split into 256-byte windows for the CPU bus, and every CHR bank into 1KiB windows for the PPU,
+    when the cartridge is created. Switching banks is a slice assignment of those windows into the page tables,
+    so it costs the same no matter how large the banks are.
+
+    Subclasses set the bank sizes their mapper works in, map their power-on banks in `reset`,
+    and handle writes to 0x8000-0xFFFF in `write_register`. Mappers with registers list them for save states in
+    `_save_registers`, and map the banks they select again in `_load_registers`.
+
+    Args:
+        rom(ROM): the ROM to build the cartridge from
+    """
+    prg_bank_size = 0x4000
+    chr_bank_size = 0x2000
+    _register_count = 0
+
+    def __init__(self, rom: ROM) -> None:
+        self.header = rom.header
+        self.prg_rom = rom.prg
+        if rom.header.chr_size:
+            self.chr = rom.chr
+            self.chr_writable = False
+        else:
+            # cartridges without CHR ROM have 8KiB of CHR RAM instead
+            self.chr = memoryview(bytearray(0x2000))
+            self.chr_writable = True
+        self.prg_ram = bytearray(rom.header.prg_ram_size or 0x2000)
+        if rom.header.four_screen:
+            self.mirroring = Mirroring.FOUR_SCREEN
+        elif rom.header.vertical_mirroring:
+            self.mirroring = Mirroring.VERTICAL
+        else:
+            self.mirroring = Mirroring.HORIZONTAL
+        self._prg_banks = _split_banks(self.prg_rom, self.prg_bank_size, 0x100)
+        self._chr_banks = _split_banks(self.chr, self.chr_bank_size, 0x400)
+        self._bus: Optional[Bus] = None
+        self._ppu: Optional[PPU] = None
+        self._interrupts: Optional[InterruptLines] = None
+        # nametable mirroring, then the mapper's registers
+        self._state_struct = struct.Struct(f"<B{self._register_count}i")
+
+    def connect(self, bus: Bus, ppu: PPU, interrupts: InterruptLines) -> None:
+        """
+        Plugs the cartridge into the console: maps PRG RAM, the mapper's registers and the power-on banks.
+
+        Args:
+            bus(Bus): the CPU's bus
+            ppu(PPU): the PPU, whose pattern tables and nametable mirroring are controlled by the cartridge
+            interrupts(InterruptLines): the CPU's interrupt lines, for mappers that raise IRQs
+        """
+        self._bus = bus
+        self._ppu = ppu
+        self._interrupts = interrupts
+        bus.map_memory(0x6000, 0x8000, memoryview(self.prg_ram))
+        # reads from 0x8000-0xFFFF go to the PRG windows mapped by the mapper, writes go to the mapper's registers
+        bus.map_handlers(0x8000, 0x10000, None, self.write_register)
+        ppu.scanline_hook = None
+        ppu.pattern_hook = None
+        self.reset()
+
+    def reset(self) -> None:
+        self._set_mirroring(self.mirroring)
+        self._map_prg(0x8000, 0)
+        self._map_prg(0xC000, -1)
+        self._map_chr(0x0000, 0)
+
+    def write_register(self, address: int, value: int) -> None:
+        """
+        Bus write handler for 0x8000-0xFFFF. Cartridges without a mapper ignore these writes.
+
+        Args:
+            address(int): CPU address being written
+            value(int): one byte
+        """
+        pass
+
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the mapper's registers, PRG RAM and CHR RAM, packed for a save state
+        """
+        parts = [self._state_struct.pack(self.mirroring, *self._save_registers()), self.prg_ram]
+        if self.chr_writable:
+            parts.append(self.chr)
+        return b"".join(parts)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the cartridge's part of the save state starts
+
+        Returns:
+            int: where the cartridge's part of the save state ends
+        """
+        values = self._state_struct.unpack_from(state, offset)
+        offset += self._state_struct.size
+        self._set_mirroring(values[0])
+        self._load_registers(values[1:])
+        self.prg_ram[:] = state[offset:offset + len(self.prg_ram)]
+        offset += len(self.prg_ram)
+        if self.chr_writable:
+            self.chr[:] = state[offset:offset + len(self.chr)]
+            offset += len(self.chr)
+        return offset
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return ()
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        pass
+
+    def _map_prg(self, address: int, bank: int) -> None:
+        """
+        Maps a PRG bank into the CPU's address space. Bank numbers wrap around the number of banks on the ROM,
+        so negative numbers count from the last bank.
+        """
+        self._bus.swap_read_pages(address, self._prg_banks[bank % len(self._prg_banks)])
+
+    def _map_chr(self, address: int, bank: int) -> None:
+        """
+        Maps a CHR bank into the PPU's address space. Bank numbers wrap around the number of banks on the ROM.
+        """
+        self._ppu.swap_pages(address, self._chr_banks[bank % len(self._chr_banks)], self.chr_writable)
+
+    def _set_mirroring(self, mirroring: int) -> None:
+        self.mirroring = mirroring
+        self._ppu.set_mirroring(mirroring)
+
+
+class NROM(Cartridge):
+    """
+    Mapper 0. 16KiB or 32KiB of PRG ROM (16KiB is mirrored), and 8KiB of CHR. No bank switching.
+    """
+    pass
+
+
+class MMC1(Cartridge):
+    """
+    Mapper 1. Registers are written one bit at a time through a 5-bit shift register.
+    Switches PRG in 16KiB or 32KiB banks and CHR in 4KiB or 8KiB banks, and controls nametable mirroring.
+    """
+    prg_bank_size = 0x4000
+    chr_bank_size = 0x1000
+    _register_count = 5
+
+    def reset(self) -> None:
+        self._shift = 0b10000  # the 1 reaches bit 0 when the 5th bit is written
+        self._control = 0b01100  # PRG mode 3 at power-on: last bank fixed at 0xC000
+        self._chr_bank_0 = 0
+        self._chr_bank_1 = 0
+        self._prg_bank = 0
+        self._update_banks()
+
+    def write_register(self, address: int, value: int) -> None:
+        if value & 0b10000000:
+            # writing a value with bit 7 set resets the shift register, and sets PRG mode 3
+            self._shift = 0b10000
+            self._control |= 0b01100
+            self._update_banks()
+            return
+        complete = self._shift & 1
+        self._shift = (self._shift >> 1) | ((value & 1) << 4)
+        if not complete:
+            return
+        # on the 5th write, bits 13 and 14 of the address select the register the shift register is copied to
+        register = (address >> 13) & 0b11
+        if register == 0:
+            self._control = self._shift
+        elif register == 1:
+            self._chr_bank_0 = self._shift
+        elif register == 2:
+            self._chr_bank_1 = self._shift
+        else:
+            self._prg_bank = self._shift
+        self._shift = 0b10000
+        self._update_banks()
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return self._shift, self._control, self._chr_bank_0, self._chr_bank_1, self._prg_bank
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self._shift, self._control, self._chr_bank_0, self._chr_bank_1, self._prg_bank = registers
+        self._update_banks()
+
+    def _update_banks(self) -> None:
+        self._set_mirroring((Mirroring.SINGLE_SCREEN_LOWER, Mirroring.SINGLE_SCREEN_UPPER,
+                             Mirroring.VERTICAL, Mirroring.HORIZONTAL)[self._control & 0b11])
+        # 512KiB boards (SUROM) use bit 4 of the CHR bank register to select which 256KiB of PRG ROM is used
+        outer = self._chr_bank_0 & 0b10000 if len(self._prg_banks) > 16 else 0
+        bank = outer | (self._prg_bank & 0b1111)
+        prg_mode = (self._control >> 2) & 0b11
+        if prg_mode <= 1:  # switch 32KiB at 0x8000, ignoring the low bit of the bank number
+            self._map_prg(0x8000, bank & ~1)
+            self._map_prg(0xC000, bank | 1)
+        elif prg_mode == 2:  # fix the first bank at 0x8000, switch 16KiB at 0xC000
+            self._map_prg(0x8000, outer)
+            self._map_prg(0xC000, bank)
+        else:  # switch 16KiB at 0x8000, fix the last bank at 0xC000
+            self._map_prg(0x8000, bank)
+            self._map_prg(0xC000, outer | 0b1111)
+        if self._control & 0b10000:  # switch two separate 4KiB banks
+            self._map_chr(0x0000, self._chr_bank_0)
+            self._map_chr(0x1000, self._chr_bank_1)
+        else:  # switch 8KiB at a time, ignoring the low bit of the bank number
+            self._map_chr(0x0000, self._chr_bank_0 & ~1)
+            self._map_chr(0x1000, self._chr_bank_0 | 1)
+
+
+class UxROM(Cartridge):
+    """
+    Mapper 2. Switches 16KiB of PRG ROM at 0x8000, with the last bank fixed at 0xC000. CHR is usually RAM.
+    """
+    _register_count = 1
+
+    def reset(self) -> None:
+        self._prg_bank = 0
+        super().reset()
+
+    def write_register(self, address: int, value: int) -> None:
+        self._prg_bank = value
+        self._map_prg(0x8000, value)
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return self._prg_bank,
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self.write_register(0x8000, registers[0])
+
+
+class CNROM(Cartridge):
+    """
+    Mapper 3. Fixed PRG ROM, and switches 8KiB of CHR ROM at a time.
+    """
+    _register_count = 1
+
+    def reset(self) -> None:
+        self._chr_bank = 0
+        super().reset()
+
+    def write_register(self, address: int, value: int) -> None:
+        self._chr_bank = value
+        self._map_chr(0x0000, value)
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return self._chr_bank,
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self.write_register(0x8000, registers[0])
+
+
+class MMC3(Cartridge):
+    """
+    Mapper 4. Switches PRG in 8KiB banks and CHR in 1KiB and 2KiB banks through eight bank registers,
+    controls nametable mirroring, and raises an IRQ after a programmable number of scanlines.
+    """
+    prg_bank_size = 0x2000
+    chr_bank_size = 0x400
+    _register_count = 13
+
+    def connect(self, bus: Bus, ppu: PPU, interrupts: InterruptLines) -> None:
+        super().connect(bus, ppu, interrupts)
+        ppu.scanline_hook = self.clock_scanline
+
+    def reset(self) -> None:
+        self._bank_select = 0
+        self._bank_registers = [0, 2, 4, 5, 6, 7, 0, 1]
+        self._irq_latch = 0
+        self._irq_counter = 0
+        self._irq_reload = False
+        self._irq_enabled = False
+        self._interrupts.release_irq(IRQSource.CARTRIDGE)
+        self._set_mirroring(self.mirroring)
+        self._update_banks()
+
+    def write_register(self, address: int, value: int) -> None:
+        # every register is mirrored across an 8KiB region, and selected by whether the address is even or odd
+        even = address & 1 == 0
+        if address < 0xA000:
+            if even:
+                self._bank_select = value
+            else:
+                self._bank_registers[self._bank_select & 0b111] = value
+            self._update_banks()
+        elif address < 0xC000:
+            if even:
+                if self.mirroring != Mirroring.FOUR_SCREEN:
+                    self._set_mirroring(Mirroring.HORIZONTAL if value & 1 else Mirroring.VERTICAL)
+            # odd addresses protect PRG RAM, which isn't emulated
+        elif address < 0xE000:
+            if even:
+                self._irq_latch = value
+            else:
+                self._irq_counter = 0
+                self._irq_reload = True
+        else:
+            if even:
+                # disabling IRQs also acknowledges the pending one
+                self._irq_enabled = False
+                self._interrupts.release_irq(IRQSource.CARTRIDGE)
+            else:
+                self._irq_enabled = True
+
+    def clock_scanline(self) -> None:
+        """
+        Clocks the IRQ counter. Called by the PPU once per scanline while rendering is enabled.
+        """
+        if self._irq_counter == 0 or self._irq_reload:
+            self._irq_counter = self._irq_latch
+            self._irq_reload = False
+        else:
+            self._irq_counter -= 1
+        if self._irq_counter == 0 and self._irq_enabled:
+            self._interrupts.assert_irq(IRQSource.CARTRIDGE)
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return (self._bank_select, *self._bank_registers, self._irq_latch, self._irq_counter,
+                self._irq_reload, self._irq_enabled)
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self._bank_select = registers[0]
+        self._bank_registers = list(registers[1:9])
+        self._irq_latch, self._irq_counter = registers[9:11]
+        self._irq_reload, self._irq_enabled = (bool(flag) for flag in registers[11:13])
+        self._update_banks()
+
+    def _update_banks(self) -> None:
+        registers = self._bank_registers
+        # bit 6 of bank select swaps the switchable bank at 0x8000 with the second-to-last bank at 0xC000
+        if self._bank_select & 0b01000000:
+            self._map_prg(0x8000, -2)
+            self._map_prg(0xC000, registers[6])
+        else:
+            self._map_prg(0x8000, registers[6])
+            self._map_prg(0xC000, -2)
+        self._map_prg(0xA000, registers[7])
+        self._map_prg(0xE000, -1)
+        # bit 7 of bank select swaps the 2KiB banks at 0x0000-0x0FFF with the 1KiB banks at 0x1000-0x1FFF
+        inversion = (self._bank_select & 0b10000000) << 5
+        self._map_chr(0x0000 ^ inversion, registers[0] & ~1)
+        self._map_chr(0x0400 ^ inversion, registers[0] | 1)
+        self._map_chr(0x0800 ^ inversion, registers[1] & ~1)
+        self._map_chr(0x0C00 ^ inversion, registers[1] | 1)
+        self._map_chr(0x1000 ^ inversion, registers[2])
+        self._map_chr(0x1400 ^ inversion, registers[3])
+        self._map_chr(0x1800 ^ inversion, registers[4])
+        self._map_chr(0x1C00 ^ inversion, registers[5])
+
+
+class AxROM(Cartridge):
+    """
+    Mapper 7. Switches 32KiB of PRG ROM at a time, and selects one of two single-screen nametables. CHR is RAM.
+    """
+    prg_bank_size = 0x8000
+    _register_count = 1
+
+    def reset(self) -> None:
+        self._map_chr(0x0000, 0)
+        self.write_register(0x8000, 0)
+
+    def write_register(self, address: int, value: int) -> None:
+        self._bank_register = value
+        self._map_prg(0x8000, value & 0b111)
+        self._set_mirroring(Mirroring.SINGLE_SCREEN_UPPER if value & 0b10000 else Mirroring.SINGLE_SCREEN_LOWER)
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return self._bank_register,
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self.write_register(0x8000, registers[0])
+
+
+class MMC2(Cartridge):
+    """
+    Mapper 9. Switches 8KiB of PRG ROM at 0x8000, with the last three banks fixed.
+    Each 4KiB CHR region has two banks, and a latch picks between them whenever the PPU fetches tile 0xFD or 0xFE.
+    """
+    prg_bank_size = 0x2000
+    chr_bank_size = 0x1000
+    _register_count = 7
+
+    def connect(self, bus: Bus, ppu: PPU, interrupts: InterruptLines) -> None:
+        super().connect(bus, ppu, interrupts)
+        ppu.pattern_hook = self.latch
+
+    def reset(self) -> None:
+        self._prg_bank = 0
+        self._chr_registers_0 = {0xFD: 0, 0xFE: 0}
+        self._chr_registers_1 = {0xFD: 0, 0xFE: 0}
+        self._latch_0 = 0xFE
+        self._latch_1 = 0xFE
+        self._set_mirroring(self.mirroring)
+        self._map_prg(0x8000, self._prg_bank)
+        self._map_prg(0xA000, -3)
+        self._map_prg(0xC000, -2)
+        self._map_prg(0xE000, -1)
+        self._update_chr()
+
+    def write_register(self, address: int, value: int) -> None:
+        register = address & 0xF000
+        if register == 0xA000:
+            self._prg_bank = value & 0b1111
+            self._map_prg(0x8000, self._prg_bank)
+        elif register == 0xB000:
+            self._chr_registers_0[0xFD] = value & 0b11111
+        elif register == 0xC000:
+            self._chr_registers_0[0xFE] = value & 0b11111
+        elif register == 0xD000:
+            self._chr_registers_1[0xFD] = value & 0b11111
+        elif register == 0xE000:
+            self._chr_registers_1[0xFE] = value & 0b11111
+        elif register == 0xF000:
+            self._set_mirroring(Mirroring.HORIZONTAL if value & 1 else Mirroring.VERTICAL)
+        self._update_chr()
+
+    def latch(self, address: int) -> None:
+        """
+        Updates the CHR latches. Called by the PPU with the address of every pattern table fetch.
+
+        Args:
+            address(int): PPU address being fetched
+        """
+        if address == 0x0FD8:
+            self._latch_0 = 0xFD
+        elif address == 0x0FE8:
+            self._latch_0 = 0xFE
+        elif 0x1FD8 <= address <= 0x1FDF:
+            self._latch_1 = 0xFD
+        elif 0x1FE8 <= address <= 0x1FEF:
+            self._latch_1 = 0xFE
+        else:
+            return
+        self._update_chr()
+
+    def _save_registers(self) -> tuple[int, ...]:
+        return (self._prg_bank, self._chr_registers_0[0xFD], self._chr_registers_0[0xFE],
+                self._chr_registers_1[0xFD], self._chr_registers_1[0xFE], self._latch_0, self._latch_1)
+
+    def _load_registers(self, registers: tuple[int, ...]) -> None:
+        self._prg_bank = registers[0]
+        self._chr_registers_0 = {0xFD: registers[1], 0xFE: registers[2]}
+        self._chr_registers_1 = {0xFD: registers[3], 0xFE: registers[4]}
+        self._latch_0, self._latch_1 = registers[5:7]
+        self._map_prg(0x8000, self._prg_bank)
+        self._update_chr()
+
+    def _update_chr(self) -> None:
+        self._map_chr(0x0000, self._chr_registers_0[self._latch_0])
+        self._map_chr(0x1000, self._chr_registers_1[self._latch_1])
+
+
+CARTRIDGES: dict[int, type[Cartridge]] = {
+    Mapper.NROM: NROM,
+    Mapper.MMC1: MMC1,
+    Mapper.UXROM: UxROM,
+    Mapper.CNROM: CNROM,
+    Mapper.MMC3: MMC3,
+    Mapper.AXROM: AxROM,
+    Mapper.MMC2: MMC2,
+}
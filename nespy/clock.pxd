@@ -8,11 +8,12 @@ import cython
 
 cdef class Clock:
     cdef int frequency
-    cdef int cycle
+    cdef long long cycle
     cdef bint ticking
     cdef double nanoseconds_per_tick
     cdef double last_cycle_time
     cdef double last_print_time
+    cdef long long next_print_cycle
     cdef list children
     cdef int num_children
     cdef int speed
@@ -21,7 +22,13 @@ cdef class Clock:
     #cpdef void start(self)
     #cpdef void stop(self)
 
-    @cython.locals(delta=cython.double, ii=cython.int)
+    @cython.locals(ii=cython.int, cycle=cython.longlong)
+    cdef void _sync_due(self)
+
+    @cython.locals(cycles=cython.int)
+    cpdef int step(self)
+
+    @cython.locals(delta=cython.double)
     cdef void tick(self)
 
     #cdef void add_child(self, int divisor, void (*func)())
@@ -29,4 +36,7 @@ cdef class Clock:
 cdef class ChildClock:
     cdef int divisor
     cdef object func
-    cdef void tick(self)
\ No newline at end of file
+    cdef object catch_up
+    cdef long long timestamp
+    cdef long long deadline
+    cdef void tick(self)
@@ -1,15 +1,29 @@
+import logging
+import struct
 from time import time
-from multiprocessing import Process
-from typing import Callable
+from typing import Callable, Optional
 
 
-EMULATE_CYCLE_FUNCTION = Callable[[], None]
+EMULATE_CYCLE_FUNCTION = Callable[[], Optional[int]]
+CATCH_UP_FUNCTION = Callable[[int], None]
 
 
 class Clock:
     """
     A Clock that ticks at a given frequency.
     ChildClocks whose frequencies are derived from this parent Clock's frequency can be added using `.add_child(...)`
+
+    The Clock is a catch-up scheduler rather than a per-tick loop. The first child added (the CPU) drives the schedule:
+    it is run one whole step at a time, and its callable returns the number of its own cycles that step took.
+    Every other child is then run forward to the matching master clock time.
+    Components that need the other children to be up-to-date in the middle of a step (e.g. when a PPU register is
+    accessed) can call `.sync(...)` to catch them up early.
+
+    Before every step, the other children are caught up to one driving child cycle before the step starts.
+    That is where the CPU polls its interrupt lines for the step, so interrupts raised in the last cycle of an
+    instruction are seen one instruction later, as on the real CPU.
+    A child that has nothing to do until some later time can `.defer(...)` itself, and is skipped by the catch up
+    before every step until then. `.sync(...)` still runs it.
     """
     def __init__(self, frequency: int) -> None:
         self.frequency = frequency
@@ -18,64 +32,203 @@ class Clock:
         self.nanoseconds_per_tick = 1 * 1000 * 1000 * 1000 / self.frequency
         self.last_cycle_time = 0.0
         self.last_print_time = 0.0
+        self.next_print_cycle = 10000000
         self.children: list[ChildClock] = []
         self.num_children = 0
         self.speed = 0
         self.start_time = 0.0
 
     def start(self) -> None:
+        """
+        Runs the clock in the caller's thread until `.stop()` is called.
+        """
         self.start_time = time()
         self.ticking = True
-        # Process(target=self.tick).start()
-        Process(target=self._tick_cwrapper).start()
+        self.tick()
 
     def stop(self) -> None:
         self.ticking = False
 
-    def add_child(self, divisor: int, func: EMULATE_CYCLE_FUNCTION) -> None:
+    def add_child(self, divisor: int, func: EMULATE_CYCLE_FUNCTION,
+                  catch_up: Optional[CATCH_UP_FUNCTION] = None) -> "ChildClock":
         """
         Creates a clock whose clock rate is derived from this clock.
         This child clock runs the given callable every time it ticks.
+        If `catch_up` is given, it is called once with the number of ticks to run whenever the child is caught up,
+        instead of calling `func` once per tick.
+
+        Returns:
+            ChildClock: the new child clock
         """
-        self.children.append(ChildClock(divisor, func))
+        child = ChildClock(divisor, func, catch_up)
+        self.children.append(child)
         self.num_children += 1
+        if self.num_children == 1:
+            # the driving child's first tick happens one period after the master clock starts
+            self.cycle = divisor
+        return child
 
-    def _tick_cwrapper(self) -> None:
-        self.tick()
+    def sync(self, cycles_ahead: int = 0) -> None:
+        """
+        Runs every child clock, except for the driving child, forward to the current master clock time.
+
+        Args:
+            cycles_ahead(int): number of driving child cycles past the start of its current step to run up to.
+                negative numbers run up to a point before the start of the step
+        """
+        driver: ChildClock = self.children[0]
+        cycle = self.cycle
+        if cycles_ahead != 0:
+            cycle += cycles_ahead * driver.divisor
+        ii = 1
+        # while loop instead of for loop over the list for greater Cython speedup
+        while ii < self.num_children:
+            child: ChildClock = self.children[ii]
+            child.run_until(cycle)
+            ii += 1
+
+    def _sync_due(self) -> None:
+        """
+        Runs the children that are due forward to one driving child cycle before the start of the current step.
+        Children that have deferred themselves past that point are left alone.
+        """
+        driver: ChildClock = self.children[0]
+        cycle = self.cycle - driver.divisor
+        ii = 1
+        while ii < self.num_children:
+            child: ChildClock = self.children[ii]
+            if cycle > child.deadline:
+                child.run_until(cycle)
+            ii += 1
+
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the master clock time and the time of every child clock's last tick, packed for a save state
+        """
+        # deferred children are run to where the catch up before the next step would have run them if they weren't,
+        # so the state doesn't depend on when they deferred. that's still before their deadlines
+        driver: ChildClock = self.children[0]
+        cycle = self.cycle - driver.divisor
+        ii = 1
+        while ii < self.num_children:
+            child: ChildClock = self.children[ii]
+            if cycle <= child.deadline:
+                child.run_until(cycle)
+            ii += 1
+        timestamps = [self.cycle]
+        ii = 0
+        while ii < self.num_children:
+            child = self.children[ii]
+            timestamps.append(child.timestamp)
+            ii += 1
+        return struct.pack(f"<{len(timestamps)}q", *timestamps)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the clock's part of the save state starts
+
+        Returns:
+            int: where the clock's part of the save state ends
+        """
+        state_struct = struct.Struct(f"<{1 + self.num_children}q")
+        timestamps = state_struct.unpack_from(state, offset)
+        self.cycle = timestamps[0]
+        ii = 0
+        while ii < self.num_children:
+            child: ChildClock = self.children[ii]
+            child.timestamp = timestamps[ii + 1]
+            ii += 1
+        return offset + state_struct.size
+
+    def step(self) -> int:
+        """
+        Catches every other child clock that is due up to just before the master clock, then runs the driving child
+        clock for one step.
+
+        Returns:
+            int: the number of the driving child's cycles the step took
+        """
+        driver: ChildClock = self.children[0]
+        self._sync_due()
+        cycles = driver.func()
+        self.cycle += driver.divisor * cycles
+        return cycles
+
+    def run_until(self, cycle: int) -> None:
+        """
+        Runs the driving child clock one step at a time until the master clock reaches the given cycle.
+        Steps are never split, so the master clock can end up part of a step past `cycle`.
+
+        Args:
+            cycle(int): master clock cycle to run up to
+        """
+        driver: ChildClock = self.children[0]
+        while self.cycle < cycle:
+            self._sync_due()
+            self.cycle += driver.divisor * driver.func()
 
     def tick(self) -> None:
         """
-        Requests that the clock tick once.
-        If enough time has passed, ticks any child clocks derived from this clock as well.
-        Blocks until all child clocks have finished executing their cycle.
+        Runs the driving child clock one step at a time, catching every other child clock that is due up to the
+        master clock before each step. Runs until the clock is stopped.
         """
+        driver: ChildClock = self.children[0]
         while self.ticking:
-            self.cycle += 1
-            ii = 0
-            # while loop instead of for loop over the list for greater Cython speedup
-            while ii < self.num_children:
-                child: ChildClock = self.children[ii]
-                if self.cycle % child.divisor == 0:
-                    child.tick()
-                ii += 1
+            self._sync_due()
+            self.cycle += driver.divisor * driver.func()
             #while time_ns() - self._last_cycle_time_ns < self._nanoseconds_per_tick:
             #    # wait until enough time has passed to move onto the next tick
             #    pass
-            # DEBUG
-            if self.cycle % 10000000 == 0:  # print every 10 million cycles
+            if self.cycle >= self.next_print_cycle:  # log the speed every 10 million cycles
+                self.next_print_cycle += 10000000
                 self.last_print_time = time()
                 delta = self.last_print_time - self.start_time
-                print(f"{'{:,}'.format(self.cycle // delta)} c/s avg over {delta}s")
+                logging.debug(f"{'{:,}'.format(self.cycle // delta)} c/s avg over {delta}s")
 
 
 class ChildClock:
     """
     A Clock whose frequency is calculated by dividing its parent's frequency by `divisor`.
     When this ChildClock ticks, it runs the callback function given when this clock is instantiated.
+    The ChildClock tracks the master clock time of its most recent tick in `timestamp`, and the master clock time of
+    its next tick that can't wait for a `.sync(...)` in `deadline`.
     """
-    def __init__(self, divisor: int, func: EMULATE_CYCLE_FUNCTION) -> None:
+    def __init__(self, divisor: int, func: EMULATE_CYCLE_FUNCTION,
+                 catch_up: Optional[CATCH_UP_FUNCTION] = None) -> None:
         self.divisor = divisor
         self.func = func
+        self.catch_up = catch_up
+        self.timestamp = 0
+        self.deadline = 0
+
+    def defer(self, ticks: int) -> None:
+        """
+        Lets the parent clock skip this child before each step until the given number of ticks past its last tick
+        is due.
+
+        Args:
+            ticks(int): number of ticks this child can wait for
+        """
+        self.deadline = self.timestamp + ticks * self.divisor
 
     def tick(self) -> None:
         self.func()
+        self.timestamp += self.divisor
+
+    def run_until(self, cycle: int) -> None:
+        """
+        Runs every tick of this clock that falls before the given master clock cycle.
+        """
+        ticks = (cycle - 1 - self.timestamp) // self.divisor
+        if ticks <= 0:
+            return
+        self.timestamp += ticks * self.divisor
+        if self.catch_up is not None:
+            self.catch_up(ticks)
+        else:
+            while ticks > 0:
+                self.func()
+                ticks -= 1
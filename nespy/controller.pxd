@@ -0,0 +1,6 @@
+cdef class Controller:
+    cdef public int buttons
+    cdef int _shift
+    cdef bint _strobe
+
+    cpdef int read(self)
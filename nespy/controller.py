@@ -0,0 +1,58 @@
+import struct
+
+
+# buttons, shift register, strobe
+_STATE_STRUCT = struct.Struct("<BB?")
+
+
+class Controller:
+    """
+    A standard NES controller, read one button at a time through 0x4016 (player 1) or 0x4017 (player 2).
+
+    While the strobe bit written to 0x4016 is set, the controller continuously reloads its shift register from the
+    buttons being held. Once it is cleared, every read returns the next button, in the order of `nespy.enum.Button`.
+    """
+    def __init__(self) -> None:
+        self.buttons = 0  # bitmask of nespy.enum.Button values currently being held
+        self._shift = 0
+        self._strobe = False
+
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the buttons being held and the shift register, packed for a save state
+        """
+        return _STATE_STRUCT.pack(self.buttons, self._shift, self._strobe)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the controller's part of the save state starts
+
+        Returns:
+            int: where the controller's part of the save state ends
+        """
+        self.buttons, self._shift, self._strobe = _STATE_STRUCT.unpack_from(state, offset)
+        return offset + _STATE_STRUCT.size
+
+    def write(self, value: int) -> None:
+        """
+        Args:
+            value(int): the byte written to 0x4016. only bit 0, the strobe, is used
+        """
+        self._strobe = value & 1 == 1
+        if self._strobe:
+            self._shift = self.buttons
+
+    def read(self) -> int:
+        """
+        Returns:
+            int: the next button in bit 0. bit 6 is set, as the upper bits are open bus on most consoles
+        """
+        if self._strobe:
+            return (self.buttons & 1) | 0x40
+        value = self._shift & 1
+        # after all eight buttons have been read, official controllers return 1
+        self._shift = (self._shift >> 1) | 0x80
+        return value | 0x40
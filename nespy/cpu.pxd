@@ -1,9 +1,16 @@
+from nespy.bus cimport Bus
+from nespy.interrupt cimport InterruptLines
+
+
 cdef class CPU:
     cdef:
-        list memory
-        bint disassemble, nmi_low, irq_low
-        dict opcodes
-        int c, z, i, d, b, u, v, n, a, x, y, pc, sp, opcode
+        Bus bus
+        InterruptLines interrupts
+        bytearray memory
+        bint disassemble
+        list instructions, cycle_table
+        object sync
+        int c, z, i, d, b, u, v, n, a, x, y, pc, sp, opcode, cycles, delayed_i, stall_cycles
     #cpdef int fetch_uint16(self, int length=*, int address=*)
     #cpdef list fetch_memory(self, int length=*, int address=*)
     #cpdef void write_memory(self, int address, int value)
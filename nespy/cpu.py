@@ -1,87 +1,46 @@
 import logging
+import struct
+from typing import Callable
 
+from nespy.bus import Bus
+from nespy.interrupt import InterruptLines
 from nespy.util import to_signed_int, to_uint16, to_hex
 from nespy.enum import AddressingMode, AddressingModeDisasmFormat, InstructionAddressingModeMap,\
-    InstructionMnemonicMap, InstructionDisasmExtras, InstructionLengthMap
+    InstructionMnemonicMap, InstructionDisasmExtras, InstructionLengthMap, InstructionCycleMap, \
+    InstructionPageCrossPenalty
+
+
+def _no_sync(cycles_ahead: int = 0) -> None:
+    pass
+
+
+def _peek_hex(value: int) -> str:
+    """
+    Formats a byte from `Bus.peek(...)`, which is -1 for addresses that can't be read without side effects.
+    """
+    return "??" if value < 0 else to_hex(value)
+
+# PC, A, X, Y, SP, the eight flags (C Z I D B U V N), the delayed interrupt disable flag, and the pending stall
+_STATE_STRUCT = struct.Struct("<H4B8BbH")
 
 
 class CPU:
-    def __init__(self, memory: list[int], disassemble: bool = False) -> None:
-        self.memory = memory
+    """
+    Args:
+        bus(Bus): the CPU's address space
+        interrupts(InterruptLines): the NMI and IRQ lines, which are polled before every instruction
+        disassemble(bool): print every instruction as it is executed
+    """
+    def __init__(self, bus: Bus, interrupts: InterruptLines, disassemble: bool = False) -> None:
+        self.bus = bus
+        self.interrupts = interrupts
+        # the zero page and the stack are always plain RAM, so they are accessed directly
+        self.memory = bus.memory
         self.disassemble = disassemble
-        self.opcodes = {0x69: self.adc, 0x65: self.adc, 0x75: self.adc, 0x6D: self.adc,
-                        0x7D: self.adc, 0x79: self.adc, 0x61: self.adc, 0x71: self.adc,
-                        0x29: self._and, 0x25: self._and, 0x35: self._and, 0x2D: self._and,
-                        0x3D: self._and, 0x39: self._and, 0x21: self._and, 0x31: self._and,
-                        0x0A: self.asl, 0x06: self.asl, 0x16: self.asl, 0x0E: self.asl,
-                        0x1E: self.asl,
-                        0x90: self.bcc,
-                        0xB0: self.bcs,
-                        0xF0: self.beq,
-                        0x24: self.bit, 0x2C: self.bit,
-                        0x30: self.bmi,
-                        0xD0: self.bne,
-                        0x10: self.bpl,
-                        0x0: self.brk,
-                        0x50: self.bvc,
-                        0x70: self.bvs,
-                        0x18: self.clc,
-                        0xD8: self.cld,
-                        0x58: self.cli,
-                        0xB8: self.clv,
-                        0xC9: self.cmp, 0xC5: self.cmp, 0xD5: self.cmp, 0xCD: self.cmp,
-                        0xDD: self.cmp, 0xD9: self.cmp, 0xC1: self.cmp, 0xD1: self.cmp,
-                        0xE0: self.cpx, 0xE4: self.cpx, 0xEC: self.cpx,
-                        0xC0: self.cpy, 0xC4: self.cpy, 0xCC: self.cpy,
-                        0xC6: self.dec, 0xD6: self.dec, 0xCE: self.dec, 0xDE: self.dec,
-                        0xCA: self.dex,
-                        0x88: self.dey,
-                        0x49: self.eor, 0x45: self.eor, 0x55: self.eor, 0x4D: self.eor,
-                        0x5D: self.eor, 0x59: self.eor, 0x41: self.eor, 0x51: self.eor,
-                        0xE6: self.inc, 0xF6: self.inc, 0xEE: self.inc, 0xFE: self.inc,
-                        0xE8: self.inx,
-                        0xC8: self.iny,
-                        0x4C: self.jmp, 0x6C: self.jmp,
-                        0x20: self.jsr,
-                        0xA9: self.lda, 0xA5: self.lda, 0xB5: self.lda, 0xAD: self.lda,
-                        0xBD: self.lda, 0xB9: self.lda, 0xA1: self.lda, 0xB1: self.lda,
-                        0xA2: self.ldx, 0xA6: self.ldx, 0xB6: self.ldx, 0xAE: self.ldx,
-                        0xBE: self.ldx,
-                        0xA0: self.ldy, 0xA4: self.ldy, 0xB4: self.ldy, 0xAC: self.ldy,
-                        0xBC: self.ldy,
-                        0x4A: self.lsr, 0x46: self.lsr, 0x56: self.lsr, 0x4E: self.lsr,
-                        0x5E: self.lsr,
-                        0xEA: self.nop, 0x1A: self.nop, 0x3A: self.nop, 0x5A: self.nop,
-                        0x7A: self.nop, 0xDA: self.nop, 0xFA: self.nop,
-                        0x80: self.nop_immediate, 0x82: self.nop_immediate, 0x89: self.nop_immediate,
-                        0xC2: self.nop_immediate, 0xE2: self.nop_immediate,
-                        0x09: self.ora, 0x05: self.ora, 0x15: self.ora, 0x0D: self.ora,
-                        0x1D: self.ora, 0x19: self.ora, 0x01: self.ora, 0x11: self.ora,
-                        0x48: self.pha,
-                        0x08: self.php,
-                        0x68: self.pla,
-                        0x28: self.plp,
-                        0x2A: self.rol, 0x26: self.rol, 0x36: self.rol, 0x2E: self.rol,
-                        0x3E: self.rol,
-                        0x6A: self.ror, 0x66: self.ror, 0x76: self.ror, 0x6E: self.ror,
-                        0x7E: self.ror,
-                        0x40: self.rti,
-                        0x60: self.rts,
-                        0xE9: self.sbc, 0xE5: self.sbc, 0xF5: self.sbc, 0xED: self.sbc,
-                        0xFD: self.sbc, 0xF9: self.sbc, 0xE1: self.sbc, 0xF1: self.sbc,
-                        0x38: self.sec,
-                        0xF8: self.sed,
-                        0x78: self.sei,
-                        0x85: self.sta, 0x95: self.sta, 0x8D: self.sta, 0x9D: self.sta,
-                        0x99: self.sta, 0x81: self.sta, 0x91: self.sta,
-                        0x86: self.stx, 0x96: self.stx, 0x8E: self.stx,
-                        0x84: self.sty, 0x94: self.sty, 0x8C: self.sty,
-                        0xAA: self.tax,
-                        0xA8: self.tay,
-                        0xBA: self.tsx,
-                        0x8A: self.txa,
-                        0x9A: self.txs,
-                        0x98: self.tya}
+        # called before any PPU or APU/IO register is accessed, so the master clock can catch those components up.
+        # it is given the number of cycles into the current instruction at which the access happens
+        self.sync: Callable[[int], None] = _no_sync
+        self.bus.sync = self.sync_registers
         self.sp = 0xFD  # stack pointer, 0xFD at power-on
         self.c = 0  # carry
         self.z = 0  # zero
@@ -96,8 +55,15 @@ class CPU:
         self.y = 0
         self.pc = 0x8000  # program counter
         self.opcode = 0x00  # the current instruction being executed
-        self.irq_low = False
-        self.nmi_low = False
+        self.cycles = 0  # the number of cycles taken by the current instruction
+        # CLI, SEI and PLP change the interrupt disable flag after the CPU has already polled for interrupts, so the
+        # poll before the next instruction still sees the old flag. holds that old flag, or -1
+        self.delayed_i = -1
+        # the number of cycles the CPU is halted for before its next instruction, while DMA runs
+        self.stall_cycles = 0
+        # handlers and base cycle counts for every opcode, indexed by opcode
+        self.instructions = self._build_instruction_table()
+        self.cycle_table = [InstructionCycleMap.get(opcode, 2) for opcode in range(0x100)]
 
         self.reset()
 
@@ -116,11 +82,12 @@ class CPU:
         self.y = 0
         self.pc = 0x8000
         self.opcode = 0x00
-        self.irq_low = False
-        self.nmi_low = False
+        self.cycles = 0
+        self.delayed_i = -1
+        self.stall_cycles = 0
 
         # set pc to RESET vector (0xFFFC-0xFFFD)
-        reset_interrupt = self.fetch_uint16(2, address=0xFFFC)
+        reset_interrupt = self.read16(0xFFFC)
         self.pc = reset_interrupt
 
     # the 6502 has a very particular order that the flags are arranged in: (little endian)
@@ -149,6 +116,29 @@ class CPU:
         self.v = flags >> 6 & 1
         self.n = flags >> 7 & 1
 
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the registers, flags and interrupt lines, packed for a save state
+        """
+        return _STATE_STRUCT.pack(self.pc, self.a, self.x, self.y, self.sp,
+                                  self.c, self.z, self.i, self.d, self.b, self.u, self.v, self.n,
+                                  self.delayed_i, self.stall_cycles)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the CPU's part of the save state starts
+
+        Returns:
+            int: where the CPU's part of the save state ends
+        """
+        (self.pc, self.a, self.x, self.y, self.sp,
+         self.c, self.z, self.i, self.d, self.b, self.u, self.v, self.n,
+         self.delayed_i, self.stall_cycles) = _STATE_STRUCT.unpack_from(state, offset)
+        return offset + _STATE_STRUCT.size
+
     def push(self, byte: int) -> None:
         """
         Pushes one byte onto the stack
@@ -165,7 +155,7 @@ class CPU:
             int: one byte from the top of the stack
         """
         self.sp = self.sp + 1 & 0xFF
-        value = self.fetch_uint16(1, address=0x100 | self.sp)
+        value = self.read8(0x100 | self.sp)
         return value
 
     def push16(self, data: int) -> None:
@@ -192,6 +182,39 @@ class CPU:
     def push_pc(self) -> None:
         self.push16(self.pc)
 
+    def read8(self, address: int) -> int:
+        """
+        Args:
+            address(int): address to read from
+
+        Returns:
+            int: one byte of memory
+        """
+        return self.bus.read(address)
+
+    def read16(self, address: int) -> int:
+        """
+        Args:
+            address(int): address of the least significant byte
+
+        Returns:
+            int: a 16-bit little-endian value
+        """
+        return self.read8(address) | self.read8(address + 1 & 0xFFFF) << 8
+
+    def read16_zp_wrap(self, address: int) -> int:
+        """
+        Reads a 16-bit pointer from the zero page. The most significant byte wraps around to 0x00 if the least
+        significant byte is at 0xFF.
+
+        Args:
+            address(int): zero page address of the least significant byte
+
+        Returns:
+            int: a 16-bit little-endian value
+        """
+        return self.memory[address] | self.memory[address + 1 & 0xFF] << 8
+
     def fetch_uint16(self, length: int = 2, address: int = -1) -> int:
         data = self.fetch_memory(length, address)
         if length > 1:
@@ -201,34 +224,54 @@ class CPU:
 
     def fetch_memory(self, length: int = 2, address: int = -1) -> list[int]:
         """
+        Peeks at memory without side effects, for disassembly.
+
         Args:
             length(int): number of bytes to retrieve. default=2
             address(int): address to start reading from. uses self.pc if address=-1. default=-1
 
         Returns:
-            list or int: if return_int, returns an integer. Otherwise, a list of bytes
+            list: the bytes, with -1 for each address that is mapped to a register handler
         """
         if address == -1:
             address = self.pc
-        # handle mirrored memory accesses
-        if 0x2008 <= address <= 0x3FFF:
-            address = (address % 0x8) + 0x2000
-        # if this is a zero-page lookup, we have to handle potential overflows
-        if address <= 0xFF < address + length:
-            overflow_amount = address + length & 0xFF
-            data = self.memory[address:address+length-overflow_amount]
-            data += self.memory[0:overflow_amount]
-        else:
-            # TODO: handle 16-bit overflow?
-            data = self.memory[address:address+length]
-
+        data = []
+        for offset in range(length):
+            location = address + offset
+            # if this is a zero-page lookup, it wraps around within the zero page
+            if address <= 0xFF:
+                location &= 0xFF
+            data.append(self.bus.peek(location & 0xFFFF))
         return data
 
     def write_memory(self, address: int, value: int) -> None:
-        self.memory[address] = value
+        self.bus.write(address, value)
 
-    def emulate_cycle(self) -> None:
-        self.opcode = self.fetch_uint16(length=1)
+    def sync_registers(self) -> None:
+        """
+        Catches the other components up before a register on the bus is accessed.
+        """
+        # register accesses happen on the last cycle of the instruction
+        self.sync(self.cycles - 1)
+
+    def emulate_cycle(self) -> int:
+        """
+        Executes one whole instruction, or jumps into an interrupt handler if an interrupt is pending.
+
+        Returns:
+            int: the number of CPU cycles the instruction took, including page-cross and branch penalties
+        """
+        if self.stall_cycles:
+            # the CPU is halted for DMA, which takes a whole step of its own
+            cycles = self.stall_cycles
+            self.stall_cycles = 0
+            return cycles
+        interrupts = self.interrupts
+        if interrupts.nmi or interrupts.irq:
+            if self.handle_interrupt():
+                return 7
+        self.opcode = self.read8(self.pc)
+        self.cycles = self.cycle_table[self.opcode]
 
         # build disassembly output
         if self.disassemble:
@@ -242,17 +285,19 @@ class CPU:
             addressing_mode = InstructionAddressingModeMap[self.opcode]
             instruction_length = InstructionLengthMap[self.opcode]
             instruction_bytes = self.fetch_memory(length=instruction_length)  # fetch whole instruction, with opcode
-            raw_bytes = ' '.join([to_hex(x) for x in instruction_bytes])
+            # bytes behind register handlers can't be read without side effects, so they're shown as ??
+            raw_bytes = ' '.join([_peek_hex(x) for x in instruction_bytes])
             if instruction_length > 1:
-                disassembly_values['operand'] = ''.join([to_hex(x) for x in instruction_bytes[1:][::-1]])
+                disassembly_values['operand'] = ''.join([_peek_hex(x) for x in instruction_bytes[1:][::-1]])
             # also show the value of any indirect memory accesses
-            if addressing_mode in (AddressingMode.Indirect, AddressingMode.IndirectX, AddressingMode.IndirectY):
+            if -1 in instruction_bytes:
+                disassembly_values['value2'] = '??'
+            elif addressing_mode in (AddressingMode.Indirect, AddressingMode.IndirectX, AddressingMode.IndirectY):
                 pass  # TODO - show memory indirection during indirect memory accesses
             elif addressing_mode == AddressingMode.Relative:  # show the actual memory address for relative operations
                 disassembly_values['value2'] = to_hex(self.pc + instruction_length + to_signed_int(instruction_bytes[1]))
             elif instruction in ("BIT",):  # BIT uses indirect memory access in Zero Page and Absolute modes
-                disassembly_values['value2'] = to_hex(self.fetch_uint16(instruction_length-1,
-                                                                        address=to_uint16(instruction_bytes[1:])))
+                disassembly_values['value2'] = _peek_hex(self.bus.peek(to_uint16(instruction_bytes[1:])))
             disassembly = AddressingModeDisasmFormat[addressing_mode]
             disassembly_extra = InstructionDisasmExtras.get(self.opcode, "")
             disassembly = (disassembly + disassembly_extra).format(**disassembly_values)
@@ -260,80 +305,219 @@ class CPU:
             print(f"0x{location:<5}{raw_bytes:<9}{instruction:<4}{disassembly:<32}{registers}")
 
         self.pc += 1
+        self.instructions[self.opcode]()
+        return self.cycles
 
-        try:
-            self.opcodes[self.opcode]()
-        except KeyError:
-            logging.warning(f"Invalid opcode: {to_hex(self.opcode)} at 0x{to_hex(self.pc)}")
+    def delay_i(self) -> None:
+        """
+        Called before an instruction that changes the interrupt disable flag, so that an IRQ that is already pending
+        is polled with the flag as it was before the instruction.
+        An IRQ stays asserted until the game acknowledges it, so it is still pending at the next poll.
+        """
+        if self.interrupts.irq:
+            self.delayed_i = self.i
 
-    # handles IRQ and NMI
-    def handle_interrupt(self) -> None:
-        # cycle 1
-        # cycle 2
-        self.push_pc()
-        flags = self.get_flags()
-        # IRQ and NMI set bit 5 and clear bit 4 of the flags
-        flags |= 1 << 5
-        if self.irq_low:
-            address = 0xFFFE
-        elif self.nmi_low:
+    def stall(self, cycles: int) -> None:
+        """
+        Halts the CPU for a number of cycles before its next instruction, e.g. while OAM DMA or a DMC sample fetch
+        runs. The halt is run as one step of its own, so the scheduler runs its cycles all at once.
+
+        Args:
+            cycles(int): number of CPU cycles
+        """
+        self.stall_cycles += cycles
+
+    def branch(self, location: int) -> None:
+        """
+        Takes a relative branch. Costs one extra cycle, or two if the branch lands on a different page.
+
+        Args:
+            location(int): the branch target
+        """
+        self.cycles += 1
+        if location & 0xFF00 != self.pc & 0xFF00:
+            self.cycles += 1
+        self.pc = location
+
+    def handle_interrupt(self) -> bool:
+        """
+        Starts handling a pending NMI, or a pending IRQ if interrupts are enabled: pushes PC and the flags, and jumps
+        to the interrupt's vector. NMI takes priority over IRQ. Takes 7 cycles.
+
+        The CPU polls its interrupt lines before the last cycle of every instruction. The other components are
+        caught up to that point before every instruction (see `Clock.step`), so an interrupt raised during the last
+        cycle of an instruction is handled after the next one, like on the real CPU.
+
+        Returns:
+            bool: whether an interrupt is being handled
+        """
+        i = self.i
+        if self.delayed_i >= 0:
+            i = self.delayed_i
+            self.delayed_i = -1
+        if self.interrupts.nmi:
+            self.interrupts.nmi = False
             address = 0xFFFA
+        elif self.interrupts.irq and not i:
+            address = 0xFFFE
         else:
-            # TODO: can this even happen? interrupt cleared by something else?
-            return
-        self.pc = self.fetch_uint16(2, address=address)
+            return False
+        self.push_pc()
+        # IRQ and NMI set bit 5 and clear bit 4 of the flags
+        self.push(self.get_flags() & ~(1 << 4) | 1 << 5)
         self.i = 1
+        self.pc = self.read16(address)
+        self.cycles = 7
+        return True
+
+    # Addressing modes
+    # Each of these reads the operand of the current instruction (starting at PC) and returns the effective address
+    # the instruction operates on. They do not advance PC; the instruction table does that after resolving the address.
+
+    # Immediate - the operand itself is the value, so its address is the effective address
+    def _immediate(self) -> int:
+        return self.pc
+
+    # Zero Page
+    def _zeropage(self) -> int:
+        return self.read8(self.pc)
+
+    # Zero Page, X - wraps around within the zero page
+    def _zeropage_x(self) -> int:
+        return self.read8(self.pc) + self.x & 0xFF
+
+    # Zero Page, Y - wraps around within the zero page
+    def _zeropage_y(self) -> int:
+        return self.read8(self.pc) + self.y & 0xFF
+
+    # Absolute
+    def _absolute(self) -> int:
+        return self.read16(self.pc)
+
+    # Absolute, X
+    def _absolute_x(self) -> int:
+        return self.read16(self.pc) + self.x & 0xFFFF
+
+    # Absolute, X - read instructions take an extra cycle when indexing crosses a page
+    def _absolute_x_page_cross(self) -> int:
+        base_address = self.read16(self.pc)
+        address = base_address + self.x & 0xFFFF
+        if base_address & 0xFF00 != address & 0xFF00:
+            self.cycles += 1  # page crossed
+        return address
+
+    # Absolute, Y
+    def _absolute_y(self) -> int:
+        return self.read16(self.pc) + self.y & 0xFFFF
+
+    # Absolute, Y - read instructions take an extra cycle when indexing crosses a page
+    def _absolute_y_page_cross(self) -> int:
+        base_address = self.read16(self.pc)
+        address = base_address + self.y & 0xFFFF
+        if base_address & 0xFF00 != address & 0xFF00:
+            self.cycles += 1  # page crossed
+        return address
+
+    # Indirect - only used by JMP
+    def _indirect(self) -> int:
+        location = self.read16(self.pc)
+        # indirect JMP on the 6502 has a bug where it wraps around to grab the MSB from $xx00 if the LSB is on $xxFF
+        msb_location = location & 0xFF00 | location + 1 & 0xFF
+        return self.read8(location) | self.read8(msb_location) << 8
+
+    # Indirect, X - the pointer is read from the zero page, indexed by X
+    def _indirect_x(self) -> int:
+        indirect_address = self.read8(self.pc) + self.x & 0xFF
+        return self.read16_zp_wrap(indirect_address)
+
+    # Indirect, Y - the pointer is read from the zero page, then indexed by Y
+    def _indirect_y(self) -> int:
+        indirect_address = self.read8(self.pc)
+        return self.read16_zp_wrap(indirect_address) + self.y & 0xFFFF
+
+    # Indirect, Y - read instructions take an extra cycle when indexing crosses a page
+    def _indirect_y_page_cross(self) -> int:
+        indirect_address = self.read8(self.pc)
+        base_address = self.read16_zp_wrap(indirect_address)
+        address = base_address + self.y & 0xFFFF
+        if base_address & 0xFF00 != address & 0xFF00:
+            self.cycles += 1  # page crossed
+        return address
+
+    # Relative - only used by branches. The effective address is the branch target.
+    def _relative(self) -> int:
+        return self.pc + 1 + to_signed_int(self.read8(self.pc))
+
+    def _build_instruction_table(self) -> list[Callable[[], None]]:
+        """
+        Builds a table of 256 handlers, indexed by opcode. Each handler is specialized to its instruction's
+        operation and addressing mode, so executing an instruction is a single lookup and call.
+        Undefined opcodes are handled by `invalid_opcode`.
+
+        Returns:
+            list: a handler for every possible opcode
+        """
+        addressing_modes = {
+            AddressingMode.Absolute: self._absolute,
+            AddressingMode.AbsoluteX: self._absolute_x,
+            AddressingMode.AbsoluteY: self._absolute_y,
+            AddressingMode.ZeroPage: self._zeropage,
+            AddressingMode.ZeroPageX: self._zeropage_x,
+            AddressingMode.ZeroPageY: self._zeropage_y,
+            AddressingMode.Immediate: self._immediate,
+            AddressingMode.Relative: self._relative,
+            AddressingMode.Indirect: self._indirect,
+            AddressingMode.IndirectX: self._indirect_x,
+            AddressingMode.IndirectY: self._indirect_y,
+        }
+        page_cross_addressing_modes = {
+            AddressingMode.AbsoluteX: self._absolute_x_page_cross,
+            AddressingMode.AbsoluteY: self._absolute_y_page_cross,
+            AddressingMode.IndirectY: self._indirect_y_page_cross,
+        }
+        instructions = [self.invalid_opcode] * 0x100
+        for opcode, mnemonic in InstructionMnemonicMap.items():
+            addressing_mode = InstructionAddressingModeMap[opcode]
+            name = "_and" if mnemonic == "AND" else mnemonic.lower()
+            if addressing_mode == AddressingMode.Implicit:
+                # shifts and rotates without an operand work on the accumulator
+                instructions[opcode] = getattr(self, f"{name}_accumulator", None) or getattr(self, name)
+                continue
+            if opcode in InstructionPageCrossPenalty:
+                resolve_address = page_cross_addressing_modes[addressing_mode]
+            else:
+                resolve_address = addressing_modes[addressing_mode]
+            instructions[opcode] = self._specialize(getattr(self, name), resolve_address,
+                                                    InstructionLengthMap[opcode] - 1)
+        return instructions
+
+    def _specialize(self, operation: Callable[[int], None], resolve_address: Callable[[], int],
+                    operand_length: int) -> Callable[[], None]:
+        """
+        Returns:
+            a handler that resolves the instruction's effective address, moves PC past the operand,
+            then runs the operation on that address
+        """
+        def instruction() -> None:
+            address = resolve_address()
+            self.pc += operand_length
+            operation(address)
+        return instruction
+
+    def invalid_opcode(self) -> None:
+        logging.warning(f"Invalid opcode: {to_hex(self.opcode)} at 0x{to_hex(self.pc)}")
 
     # ADC - Add with Carry
     # Flags: carry, zero, overflow, negative
-    def adc(self) -> None:
-        # immediate
-        if self.opcode == 0x69:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0x65:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x75:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x6D:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0x7D:
-            value_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0x79:
-            value_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0x61:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect, y (opcode 71)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def adc(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.n = 0
         self.v = 0
         old_accumulator = self.a
-        self.a = self.a + value + self.c & 0xFF
-        if self.a < old_accumulator:
+        total = self.a + value + self.c
+        self.a = total & 0xFF
+        if total > 0xFF:
             # accumulator overflowed and wrapped
             self.c = 1
         else:
@@ -350,48 +534,8 @@ class CPU:
 
     # AND - Logical AND
     # Flags: zero, negative
-    def _and(self) -> None:
-        # immediate
-        if self.opcode == 0x29:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0x25:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x35:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x2D:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0x3D:
-            value_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0x39:
-            value_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0x21:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect, y (opcode 31)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def _and(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.n = 0
         self.a = self.a & value
@@ -403,40 +547,21 @@ class CPU:
     # ASL - Arithmetic Shift Left
     # Bitwise shift left by one bit. Bit 7 is shifted into the Carry flag. Bit 0 is set to zero.
     # Flags: carry, zero, negative
-    def asl(self) -> None:
-        # implicit (accumulator)
-        if self.opcode == 0x0A:
-            old_value = self.a
-            value = old_value << 1 & 0xFF
-            self.a = value
-        # zero page
-        elif self.opcode == 0x06:
-            memory_location = self.fetch_uint16(1)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF
-            self.memory[memory_location] = value
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x16:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF
-            self.memory[memory_location] = value
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x0E:
-            memory_location = self.fetch_uint16(2)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF
-            self.memory[memory_location] = value
-            self.pc += 2
-        # absolute, x (opcode 1E)
-        else:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF
-            self.memory[memory_location] = value
-            self.pc += 2
+    def asl(self, address: int) -> None:
+        old_value = self.read8(address)
+        value = old_value << 1 & 0xFF
+        self.write_memory(address, value)
+        self.c = old_value >> 7 & 1
+        self.z = 0
+        self.n = value >> 7 & 1
+        if value == 0:
+            self.z = 1
+
+    # ASL - Arithmetic Shift Left, implicit (accumulator) (0A)
+    def asl_accumulator(self) -> None:
+        old_value = self.a
+        value = old_value << 1 & 0xFF
+        self.a = value
         self.c = old_value >> 7 & 1
         self.z = 0
         self.n = value >> 7 & 1
@@ -445,43 +570,28 @@ class CPU:
 
     # BCC - Branch if Carry Clear (90)
     # Branch to relative offset if carry flag is not set
-    def bcc(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bcc(self, address: int) -> None:
         if self.c == 0:
-            self.pc += offset
+            self.branch(address)
 
     # BCS - Branch if Carry Set (B0)
     # Branch to relative offset if carry flag is not set
-    def bcs(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bcs(self, address: int) -> None:
         if self.c == 1:
-            self.pc += offset
+            self.branch(address)
 
     # BEQ - Branch if Equal (F0)
     # Branch to relative offset if zero flag is set
-    def beq(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def beq(self, address: int) -> None:
         if self.z == 1:
-            self.pc += offset
+            self.branch(address)
 
     # BIT - Bit Test
     # The value in memory is AND'd with the Accumulator to set the Zero flag, and then the result is discarded.
     # Bit 6 of that same value in memory is used to set the Overflow flag, and bit 7 is used for the Negative flag
     # Flags: zero, overflow, negative
-    def bit(self) -> None:
-        # zero page
-        if self.opcode == 0x24:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, value_location)
-            self.pc += 1
-        # absolute (opcode 2C)
-        else:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, value_location)
-            self.pc += 2
+    def bit(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.v = value >> 6 & 1
         self.n = value >> 7 & 1
@@ -490,27 +600,21 @@ class CPU:
 
     # BMI - Branch if Minus (30)
     # Branch to relative offset if negative flag is set
-    def bmi(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bmi(self, address: int) -> None:
         if self.n == 1:
-            self.pc += offset
+            self.branch(address)
 
     # BNE - Branch if Not Equal (D0)
     # Branch to relative offset if zero flag is not set
-    def bne(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bne(self, address: int) -> None:
         if self.z == 0:
-            self.pc += offset
+            self.branch(address)
 
     # BPL - Branch if Positive (10)
     # Branch to relative offset if negative flag is not set
-    def bpl(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bpl(self, address: int) -> None:
         if self.n == 0:
-            self.pc += offset
+            self.branch(address)
 
     # BRK - Force Interrupt (00)
     # Push PC onto stack. Set Break flag. Push processor flags onto stack. Set Interrupt flag.
@@ -524,24 +628,20 @@ class CPU:
         flags |= 0b11 << 4
         self.push(flags)
         self.i = 1
-        irq_interrupt_location = self.fetch_uint16(2, address=0xFFFE)
+        irq_interrupt_location = self.read16(0xFFFE)
         self.pc = irq_interrupt_location
 
     # BVC - Branch if Overflow Clear (50)
     # Branch to relative offset if overflow flag is not set
-    def bvc(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bvc(self, address: int) -> None:
         if self.v == 0:
-            self.pc += offset
+            self.branch(address)
 
     # BVS - Branch if Overflow Set (70)
     # Branch to relative offset if overflow flag is set
-    def bvs(self) -> None:
-        offset = to_signed_int(self.fetch_uint16(1))
-        self.pc += 1
+    def bvs(self, address: int) -> None:
         if self.v == 1:
-            self.pc += offset
+            self.branch(address)
 
     # CLC - Clear Carry Flag (18)
     def clc(self) -> None:
@@ -553,6 +653,7 @@ class CPU:
 
     # CLI - Clear Interrupt Disable Flag (58)
     def cli(self) -> None:
+        self.delay_i()
         self.i = 0
 
     # CLV - Clear Overflow Flag (B8)
@@ -560,142 +661,60 @@ class CPU:
         self.v = 0
 
     # CMP - Compare
-    # Compares A with a value in memory. Set Carry if A>=M, set Zero if A==M, set Negative if A-M<0
+    # Compares A with a value in memory. Set Carry if A>=M, set Zero if A==M, set Negative if bit 7 of A-M is set
     # Flags: carry, zero, negative
-    def cmp(self) -> None:
-        # immediate
-        if self.opcode == 0xC9:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xC5:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0xD5:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xCD:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0xDD:
-            value_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0xD9:
-            value_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0xC1:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect y (opcode D1)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def cmp(self, address: int) -> None:
+        value = self.read8(address)
         self.c = 0
         self.z = 0
         self.n = 0
         if self.a >= value:
             self.c = 1
-        result = self.a - value
+        result = self.a - value & 0xFF
         if result == 0:
             self.z = 1
-        elif result < 0:
+        elif result > 127:
             self.n = 1
 
     # CPX - Compare X Register
-    # Compares X with a value in memory. Set Carry if X>=M, set Zero if X==M, set Negative if X-M<0
+    # Compares X with a value in memory. Set Carry if X>=M, set Zero if X==M, set Negative if bit 7 of X-M is set
     # Flags: carry, zero, negative
-    def cpx(self) -> None:
-        # immediate
-        if self.opcode == 0xE0:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xE4:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute (opcode EC)
-        else:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
+    def cpx(self, address: int) -> None:
+        value = self.read8(address)
         self.c = 0
         self.z = 0
         self.n = 0
         if self.x >= value:
             self.c = 1
-        result = self.x - value
+        result = self.x - value & 0xFF
         if result == 0:
             self.z = 1
-        elif result < 0:
+        elif result > 127:
             self.n = 1
 
     # CPY - Compare Y Register
-    # Compares Y with a value in memory. Set Carry if Y>=M, set Zero if Y==M, set Negative if Y-M<0
+    # Compares Y with a value in memory. Set Carry if Y>=M, set Zero if Y==M, set Negative if bit 7 of Y-M is set
     # Flags: carry, zero, negative
-    def cpy(self) -> None:
-        # immediate
-        if self.opcode == 0xC0:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xC4:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute (opcode CC)
-        else:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
+    def cpy(self, address: int) -> None:
+        value = self.read8(address)
         self.c = 0
         self.z = 0
         self.n = 0
         if self.y >= value:
             self.c = 1
-        result = self.y - value
+        result = self.y - value & 0xFF
         if result == 0:
             self.z = 1
-        elif result < 0:
+        elif result > 127:
             self.n = 1
 
     # DEC - Decrement Memory
     # Flags: zero, negative
-    def dec(self) -> None:
-        # zero page
-        if self.opcode == 0xC6:
-            value_location = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0xD6:
-            value_location = self.fetch_uint16(1) + self.x & 0xff
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xCE:
-            value_location = self.fetch_uint16(2)
-            self.pc += 2
-        # absolute, x (opcode DE)
-        else:
-            value_location = self.fetch_uint16(2) + self.x & 0xffff
-            self.pc += 2
+    def dec(self, address: int) -> None:
         self.z = 0
         self.n = 0
-        value = self.fetch_uint16(1, address=value_location) - 1 & 0xFF
-        self.memory[value_location] = value
+        value = self.read8(address) - 1 & 0xFF
+        self.write_memory(address, value)
         if value == 0:
             self.z = 1
         elif value > 127:
@@ -726,48 +745,8 @@ class CPU:
     # EOR - Exclusive OR
     # Performs an Exclusive OR on the Accumulator using a byte from memory
     # Flags: zero, negative
-    def eor(self) -> None:
-        # immediate
-        if self.opcode == 0x49:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0x45:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x55:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x4D:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0x5D:
-            value_location = self.fetch_uint16(2) + self.x & 0xffff
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0x59:
-            value_location = self.fetch_uint16(2) + self.y & 0xffff
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0x41:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect, y (opcode 51)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def eor(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.n = 0
         self.a = self.a ^ value
@@ -778,27 +757,11 @@ class CPU:
 
     # INC - Increment Memory
     # Flags: zero, negative
-    def inc(self) -> None:
-        # zero page
-        if self.opcode == 0xE6:
-            value_location = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0xF6:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xEE:
-            value_location = self.fetch_uint16(2)
-            self.pc += 2
-        # absolute, x (opcode FE)
-        else:
-            value_location = self.fetch_uint16(2) + self.x & 0xffff
-            self.pc += 2
+    def inc(self, address: int) -> None:
         self.z = 0
         self.n = 0
-        value = self.fetch_uint16(1, address=value_location) + 1 & 0xFF
-        self.memory[value_location] = value
+        value = self.read8(address) + 1 & 0xFF
+        self.write_memory(address, value)
         if value == 0:
             self.z = 1
         elif value > 127:
@@ -826,78 +789,25 @@ class CPU:
         elif self.y > 127:
             self.n = 1
 
-    # JMP - Jump
+    # JMP - Jump (4C, 6C)
     # Set PC to specified address
-    def jmp(self) -> None:
-        location = self.fetch_uint16(2)
-        # absolute (opcode 4C) -- no special logic
-        # indirect (opcode 6C)
-        if self.opcode == 0x6C:
-            # indirect JMP on the 6502 has a bug where it wraps around to grab the MSB from $xx00 if the LSB is on $xxFF
-            if location & 0xFF == 0xFF:
-                msb_location = location & 0xFF00
-                jump_to = self.fetch_memory(length=1, address=location)
-                jump_to += self.fetch_memory(length=1, address=msb_location)
-                location = to_uint16(jump_to)
-            else:
-                location = self.fetch_uint16(length=2, address=location)
-        self.pc = location
+    def jmp(self, address: int) -> None:
+        self.pc = address
 
     # JSR - Jump to Subroutine (20)
     # Store PC-1 in stack (RTS adds 1 when it returns), then jump to absolute address of subroutine
-    def jsr(self) -> None:
-        subroutine_loc = self.fetch_uint16(2)
-        self.pc += 1  # set PC to last byte of current instruction
+    def jsr(self, address: int) -> None:
+        self.pc -= 1  # set PC to last byte of current instruction
         self.push_pc()
-        self.pc = subroutine_loc
+        self.pc = address
 
     # LDA - Load Accumulator (A9, A5, B5, AD, BD, B9, A1, B1)
     # Load a byte into the accumulator.
     # Flags: negative, zero
-    def lda(self) -> None:
+    def lda(self, address: int) -> None:
         self.n = 0
         self.z = 0
-        # immediate
-        if self.opcode == 0xA9:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xA5:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page,x
-        elif self.opcode == 0xB5:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xAD:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute,x
-        elif self.opcode == 0xBD:
-            value_location = self.fetch_uint16(2) + self.x & 0xffff
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute,y
-        elif self.opcode == 0xB9:
-            value_location = self.fetch_uint16(2) + self.y & 0xffff
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect,x
-        elif self.opcode == 0xA1:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect,y (opcode B1)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+        value = self.read8(address)
         self.a = value
         if value > 127:
             self.n = 1
@@ -907,33 +817,10 @@ class CPU:
     # LDX - Load X Register
     # Load a byte into the X register.
     # Flags: negative, zero
-    def ldx(self) -> None:
+    def ldx(self, address: int) -> None:
         self.n = 0
         self.z = 0
-        # immediate
-        if self.opcode == 0xA2:
-            data_to_load = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xA6:
-            memory_location = self.fetch_uint16(1)
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 1
-        # zero page,y
-        elif self.opcode == 0xB6:
-            memory_location = self.fetch_uint16(1) + self.y & 0xFF
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xAE:
-            memory_location = self.fetch_uint16(2)
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 2
-        # absolute,y (opcode BE)
-        else:
-            memory_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 2
+        data_to_load = self.read8(address)
         self.x = data_to_load
         if data_to_load == 0:
             self.z = 1
@@ -943,33 +830,10 @@ class CPU:
     # LDY - Load Y Register
     # Load a byte into the Y register.
     # Flags: negative, zero
-    def ldy(self) -> None:
+    def ldy(self, address: int) -> None:
         self.n = 0
         self.z = 0
-        # immediate
-        if self.opcode == 0xA0:
-            data_to_load = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xA4:
-            memory_location = self.fetch_uint16(1)
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0xB4:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xAC:
-            memory_location = self.fetch_uint16(2)
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 2
-        # absolute, x (opcode BC)
-        else:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            data_to_load = self.fetch_uint16(1, address=memory_location)
-            self.pc += 2
+        data_to_load = self.read8(address)
         self.y = data_to_load
         if data_to_load == 0:
             self.z = 1
@@ -979,101 +843,37 @@ class CPU:
     # LSR - Logical Shift Right
     # Bitwise shift right by one bit. Bit 0 is shifted into the Carry flag. Bit 7 is set to zero.
     # Flags: carry, zero, negative
-    def lsr(self) -> None:
-        # implicit (accumulator)
-        if self.opcode == 0x4A:
-            old_value = self.a
-            value = old_value >> 1
-            self.a = value
-        # zero page
-        elif self.opcode == 0x46:
-            memory_location = self.fetch_uint16(1)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1
-            self.memory[memory_location] = value
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x56:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1
-            self.memory[memory_location] = value
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x4E:
-            memory_location = self.fetch_uint16(2)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1
-            self.memory[memory_location] = value
-            self.pc += 2
-        # absolute, x (opcode 5E)
-        else:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1
-            self.memory[memory_location] = value
-            self.pc += 2
+    def lsr(self, address: int) -> None:
+        old_value = self.read8(address)
+        value = old_value >> 1
+        self.write_memory(address, value)
         self.c = old_value & 1
         self.z = 0
         self.n = 0
         if value == 0:
             self.z = 1
 
-    # NOP - No Operation (1 byte)
-    def nop(self) -> None:
-        pass
+    # LSR - Logical Shift Right, implicit (accumulator) (4A)
+    def lsr_accumulator(self) -> None:
+        old_value = self.a
+        value = old_value >> 1
+        self.a = value
+        self.c = old_value & 1
+        self.z = 0
+        self.n = 0
+        if value == 0:
+            self.z = 1
 
-    def nop_immediate(self) -> None:
-        """
-        Unofficial opcode for NOP. Reads an immediate byte and ignores the value.
-        """
-        self.pc += 1
+    # NOP - No Operation
+    # The 1 byte form is implicit. The unofficial 2 byte forms read an immediate byte and ignore the value.
+    def nop(self, address: int = -1) -> None:
+        pass
 
     # ORA - Logical Inclusive OR
     # Performs a bitwise OR on the Accumulator using a byte from memory
     # Flags: zero, negative
-    def ora(self) -> None:
-        # immediate
-        if self.opcode == 0x09:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0x05:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x15:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x0D:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0x1D:
-            value_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0x19:
-            value_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0x01:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect, y (opcode 11)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def ora(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.n = 0
         self.a = self.a | value
@@ -1107,44 +907,30 @@ class CPU:
     # PLP - Pull Processor Status (28)
     # Flags: all
     def plp(self) -> None:
+        self.delay_i()
         self.set_flags(self.pop())
 
     # ROL - Rotate Left
     # Flags: carry, zero, negative
-    def rol(self) -> None:
-        # implicit (accumulator)
-        if self.opcode == 0x2A:
-            old_value = self.a
-            value = old_value << 1 & 0xFF | self.c
-            self.a = value
-        # zero page
-        elif self.opcode == 0x26:
-            memory_location = self.fetch_uint16(1)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF | self.c
-            self.memory[memory_location] = value
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x36:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF | self.c
-            self.memory[memory_location] = value
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x2E:
-            memory_location = self.fetch_uint16(2)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF | self.c
-            self.memory[memory_location] = value
-            self.pc += 2
-        # absolute, x (opcode 3E)
-        else:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value << 1 & 0xFF | self.c
-            self.memory[memory_location] = value
-            self.pc += 2
+    def rol(self, address: int) -> None:
+        old_value = self.read8(address)
+        value = old_value << 1 & 0xFF | self.c
+        self.write_memory(address, value)
+        self.c = 0
+        self.z = 0
+        self.n = 0
+        if value == 0:
+            self.z = 1
+        elif value > 127:
+            self.n = 1
+        if old_value > 127:
+            self.c = 1
+
+    # ROL - Rotate Left, implicit (accumulator) (2A)
+    def rol_accumulator(self) -> None:
+        old_value = self.a
+        value = old_value << 1 & 0xFF | self.c
+        self.a = value
         self.c = 0
         self.z = 0
         self.n = 0
@@ -1157,40 +943,23 @@ class CPU:
 
     # ROR - Rotate Right
     # Flags: carry, zero, negative
-    def ror(self) -> None:
-        # implicit (accumulator)
-        if self.opcode == 0x6A:
-            old_value = self.a
-            value = old_value >> 1 | self.c << 7
-            self.a = value
-        # zero page
-        elif self.opcode == 0x66:
-            memory_location = self.fetch_uint16(1)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1 | self.c << 7
-            self.memory[memory_location] = value
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x76:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1 | self.c << 7
-            self.memory[memory_location] = value
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x6E:
-            memory_location = self.fetch_uint16(2)
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1 | self.c << 7
-            self.memory[memory_location] = value
-            self.pc += 2
-        # absolute, x (opcode 7E)
-        else:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            old_value = self.fetch_uint16(1, address=memory_location)
-            value = old_value >> 1 | self.c << 7
-            self.memory[memory_location] = value
-            self.pc += 2
+    def ror(self, address: int) -> None:
+        old_value = self.read8(address)
+        value = old_value >> 1 | self.c << 7
+        self.write_memory(address, value)
+        self.c = old_value & 1
+        self.z = 0
+        self.n = 0
+        if value == 0:
+            self.z = 1
+        elif value > 127:
+            self.n = 1
+
+    # ROR - Rotate Right, implicit (accumulator) (6A)
+    def ror_accumulator(self) -> None:
+        old_value = self.a
+        value = old_value >> 1 | self.c << 7
+        self.a = value
         self.c = old_value & 1
         self.z = 0
         self.n = 0
@@ -1213,55 +982,17 @@ class CPU:
 
     # SBC - Subtract with Carry
     # Flags: carry, zero, overflow, negative
-    def sbc(self) -> None:
-        # immediate
-        if self.opcode == 0xE9:
-            value = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page
-        elif self.opcode == 0xE5:
-            value_location = self.fetch_uint16(1)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0xF5:
-            value_location = self.fetch_uint16(1) + self.x & 0xFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0xED:
-            value_location = self.fetch_uint16(2)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, x
-        elif self.opcode == 0xFD:
-            value_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # absolute, y
-        elif self.opcode == 0xF9:
-            value_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 2
-        # indirect, x
-        elif self.opcode == 0xE1:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            value_location = self.fetch_uint16(2, address=indirect_address)
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
-        # indirect, y (opcode F1)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            value_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            value = self.fetch_uint16(1, address=value_location)
-            self.pc += 1
+    def sbc(self, address: int) -> None:
+        value = self.read8(address)
         self.z = 0
         self.n = 0
         self.v = 0
         old_accumulator = self.a
-        self.a = self.a - value - (1 - self.c) & 0xFF
+        total = self.a - value - (1 - self.c)
+        self.a = total & 0xFF
         self.c = 1
-        if self.a > old_accumulator:
+        if total < 0:
+            # accumulator borrowed and wrapped
             self.c = 0
         if self.a == 0:
             self.z = 1
@@ -1284,76 +1015,23 @@ class CPU:
 
     # SEI - Set Interrupt Disable (78)
     def sei(self) -> None:
+        self.delay_i()
         self.i = 1
 
     # STA - Store Accumulator
     # Store the accumulator at the specified location in memory
-    def sta(self) -> None:
-        # zero page
-        if self.opcode == 0x85:
-            memory_location = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page,x
-        elif self.opcode == 0x95:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            self.pc += 1
-        # absolute
-        elif self.opcode == 0x8D:
-            memory_location = self.fetch_uint16(2)
-            self.pc += 2
-        # absolute,x
-        elif self.opcode == 0x9D:
-            memory_location = self.fetch_uint16(2) + self.x & 0xFFFF
-            self.pc += 2
-        # absolute,y
-        elif self.opcode == 0x99:
-            memory_location = self.fetch_uint16(2) + self.y & 0xFFFF
-            self.pc += 2
-        # indirect,x
-        elif self.opcode == 0x81:
-            indirect_address = self.fetch_uint16(1) + self.x & 0xFF
-            memory_location = self.fetch_uint16(2, address=indirect_address)
-            self.pc += 1
-        # indirect,y (opcode 91)
-        else:
-            indirect_address = self.fetch_uint16(1)
-            memory_location = self.fetch_uint16(2, address=indirect_address) + self.y & 0xFFFF
-            self.pc += 1
-        self.memory[memory_location] = self.a
+    def sta(self, address: int) -> None:
+        self.write_memory(address, self.a)
 
     # STX - Store X Register
     # Store the X register at the specified location in memory
-    def stx(self) -> None:
-        # zero page
-        if self.opcode == 0x86:
-            memory_location = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page, y
-        elif self.opcode == 0x96:
-            memory_location = self.fetch_uint16(1) + self.y & 0xFF
-            self.pc += 1
-        # absolute (opcode 8E)
-        else:
-            memory_location = self.fetch_uint16(2)
-            self.pc += 2
-        self.memory[memory_location] = self.x
+    def stx(self, address: int) -> None:
+        self.write_memory(address, self.x)
 
     # STY - Store Y Register
     # Store the Y register at the specified location in memory
-    def sty(self) -> None:
-        # zero page
-        if self.opcode == 0x84:
-            memory_location = self.fetch_uint16(1)
-            self.pc += 1
-        # zero page, x
-        elif self.opcode == 0x94:
-            memory_location = self.fetch_uint16(1) + self.x & 0xFF
-            self.pc += 1
-        # absolute (opcode 8C)
-        else:
-            memory_location = self.fetch_uint16(2)
-            self.pc += 2
-        self.memory[memory_location] = self.y
+    def sty(self, address: int) -> None:
+        self.write_memory(address, self.y)
 
     # TAX - Transfer Accumulator to X (AA)
     # Flags: zero, negative
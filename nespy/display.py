@@ -0,0 +1,67 @@
+"""
+The OpenGL/GLUT frontend.
+
+This module is only imported when an NES is created with a resolution, so the emulation core can run on machines
+without any GL libraries installed.
+"""
+from OpenGL.GL import glBegin, glVertex2f, glEnd, glViewport, glMatrixMode, glLoadIdentity, glOrtho, glClear, \
+    glColor3f, glTexParameteri, GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, \
+    GL_TEXTURE_MAG_FILTER, GL_NEAREST, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_QUADS, GL_PROJECTION, GL_MODELVIEW
+from OpenGL.GLUT import glutInit, glutInitDisplayMode, glutInitWindowSize, glutInitWindowPosition, glutCreateWindow, \
+    glutSwapBuffers, glutSetOption, glutHideWindow, GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_GLUTMAINLOOP_RETURNS, \
+    GLUT_RGBA
+
+
+def square():
+    glBegin(GL_QUADS)
+    glVertex2f(100, 100)
+    glVertex2f(200, 100)
+    glVertex2f(200, 200)
+    glVertex2f(100, 200)
+    glEnd()
+
+
+def iterate():
+    glViewport(0, 0, 500, 500)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    glOrtho(0.0, 500, 0.0, 500, 0.0, 1.0)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+
+
+def show_screen():
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    glLoadIdentity()
+    iterate()
+    glColor3f(1.0, 0.0, 3.0)
+    square()
+    glutSwapBuffers()
+
+
+class Display:
+    """
+    The main window, and the hidden PPU debug window.
+
+    Args:
+        resolution(tuple): in the form (int, int). Render resolution.
+    """
+    def __init__(self, resolution: tuple[int, int]) -> None:
+        self.width_scale = resolution[0] / 256  # NES native width is 256 pixels
+        self.height_scale = resolution[1] / 240  # NES native height is 240 pixels
+        # overrides opengl's default filtering behavior from GL_LINEAR to GL_NEAREST
+        # GL_LINEAR creates really bad blurriness
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        # initialize graphics
+        glutInit()
+        glutInitDisplayMode(GLUT_RGBA)
+        glutInitWindowSize(*resolution)
+        glutInitWindowPosition(0, 0)
+        self.main_window = glutCreateWindow("NESpy - Main Window")
+        glutSetOption(GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_GLUTMAINLOOP_RETURNS)
+        glutInitWindowSize(int(256 * self.width_scale), int(128 * self.height_scale))
+        self.debug_window_ppu = glutCreateWindow("NESpy - Debug (PPU)")
+        glutHideWindow()
+        #glutSetOption(GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_CONTINUE_EXECUTION)
+        #self._render_batch_ppu_debug = pyglet.graphics.Batch()
@@ -1,11 +1,11 @@
-/* Generated by Cython 3.0.0a9 */
+/* Generated by Cython 3.3.0 */
 
 /* BEGIN: Cython Metadata
 {
     "distutils": {
         "name": "nespy.enum",
         "sources": [
-            "D:\\projects\\github\\nespy\\nespy\\enum.py"
+            "nespy/enum.py"
         ]
     },
     "module_name": "nespy.enum"
@@ -15,27 +15,31 @@ END: Cython Metadata */
 #ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
 #endif /* PY_SSIZE_T_CLEAN */
-#if defined(CYTHON_LIMITED_API) && 0
-  #ifndef Py_LIMITED_API
-    #if CYTHON_LIMITED_API+0 > 0x03030000
-      #define Py_LIMITED_API CYTHON_LIMITED_API
-    #else
-      #define Py_LIMITED_API 0x03030000
-    #endif
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
   #endif
 #endif
 
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02070000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
-    #error Cython requires Python 2.7+ or Python 3.3+.
+#elif PY_VERSION_HEX < 0x03090000
+    #error Cython requires Python 3.9+.
+#elif defined(Py_LIMITED_API) && (Py_LIMITED_API & 0xFFFF0000) > (PY_VERSION_HEX & 0xFFFF0000)
+    #error 'Py_LIMITED_API' can only select past Python X.Y versions, not future ones.
 #else
-#define CYTHON_ABI "3_0_0a9"
-#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
-#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
-#define CYTHON_HEX_VERSION 0x030000A9
+#define __PYX_ABI_VERSION "3_3_0"
+#define CYTHON_HEX_VERSION 0x030300F0
 #define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
 #include <stddef.h>
 #ifndef offsetof
   #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
@@ -51,6 +55,11 @@ END: Cython Metadata */
     #define __fastcall
   #endif
 #endif
+#ifdef __has_builtin
+  #define __Pyx_has_cbuiltin(name) __has_builtin(name)
+#else
+  #define __Pyx_has_cbuiltin(name) (0)
+#endif
 #ifndef DL_IMPORT
   #define DL_IMPORT(t) t
 #endif
@@ -58,31 +67,124 @@ END: Cython Metadata */
   #define DL_EXPORT(t) t
 #endif
 #define __PYX_COMMA ,
-#ifndef HAVE_LONG_LONG
-  #define HAVE_LONG_LONG
-#endif
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
 #ifndef Py_HUGE_VAL
   #define Py_HUGE_VAL HUGE_VAL
 #endif
-#ifdef PYPY_VERSION
-  #define CYTHON_COMPILING_IN_PYPY 1
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+    #if Py_LIMITED_API < 0x03090000
+      #error "Cython 3.3 requires the Python Limited API version to be 3.9 or greater."
+    #endif
+  #endif
+  #if defined(GRAALVM_PYTHON) || defined(PYPY_VERSION)
+    #ifdef _MSC_VER
+      #pragma message ("Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work.")
+    #else
+      #warning "Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work."
+    #endif
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
-  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_TYPE_SPECS
-  #define CYTHON_USE_TYPE_SPECS 0
+  #define CYTHON_USE_TYPE_SPECS 1
   #undef CYTHON_USE_PYTYPE_LOOKUP
   #define CYTHON_USE_PYTYPE_LOOKUP 0
-  #if PY_VERSION_HEX < 0x03050000
-    #undef CYTHON_USE_ASYNC_SLOTS
-    #define CYTHON_USE_ASYNC_SLOTS 0
-  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
-    #define CYTHON_USE_ASYNC_SLOTS 1
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_VECTORCALL
+  #define CYTHON_VECTORCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #ifndef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW (CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (__PYX_LIMITED_VERSION_HEX >= 0x030F0000 && PY_VERSION_HEX > 0x030F00A8)
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #if __PYX_LIMITED_VERSION_HEX < 0x030E0000
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+  #elif !defined(CYTHON_OPAQUE_OBJECTS)
+  #define CYTHON_OPAQUE_OBJECTS (__PYX_LIMITED_VERSION_HEX >= 0x030F0000)
+  #endif
+#elif defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 0
   #endif
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
   #undef CYTHON_USE_PYLIST_INTERNALS
   #define CYTHON_USE_PYLIST_INTERNALS 0
   #undef CYTHON_USE_UNICODE_INTERNALS
@@ -93,86 +195,146 @@ END: Cython Metadata */
   #define CYTHON_USE_PYLONG_INTERNALS 0
   #undef CYTHON_AVOID_BORROWED_REFS
   #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
   #undef CYTHON_ASSUME_SAFE_MACROS
   #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
   #undef CYTHON_UNPACK_METHODS
   #define CYTHON_UNPACK_METHODS 0
   #undef CYTHON_FAST_THREAD_STATE
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_GIL
   #define CYTHON_FAST_GIL 0
-  #undef CYTHON_METH_FASTCALL
-  #define CYTHON_METH_FASTCALL 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
-    #define CYTHON_PEP487_INIT_SUBCLASS (PY_MAJOR_VERSION >= 3)
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
   #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
   #undef CYTHON_USE_MODULE_STATE
   #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
   #undef CYTHON_USE_TP_FINALIZE
   #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
-  #define CYTHON_USE_EXC_INFO_STACK 0
-#elif defined(CYTHON_LIMITED_API)
-  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
-  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
   #undef CYTHON_USE_TYPE_SLOTS
-  #define CYTHON_USE_TYPE_SLOTS 0
-  #undef CYTHON_USE_TYPE_SPECS
-  #define CYTHON_USE_TYPE_SPECS 1
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
   #undef CYTHON_USE_PYTYPE_LOOKUP
   #define CYTHON_USE_PYTYPE_LOOKUP 0
-  #undef CYTHON_USE_ASYNC_SLOTS
-  #define CYTHON_USE_ASYNC_SLOTS 0
   #undef CYTHON_USE_PYLIST_INTERNALS
   #define CYTHON_USE_PYLIST_INTERNALS 0
   #undef CYTHON_USE_UNICODE_INTERNALS
   #define CYTHON_USE_UNICODE_INTERNALS 0
-  #ifndef CYTHON_USE_UNICODE_WRITER
-    #define CYTHON_USE_UNICODE_WRITER 1
-  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
   #undef CYTHON_USE_PYLONG_INTERNALS
   #define CYTHON_USE_PYLONG_INTERNALS 0
-  #ifndef CYTHON_AVOID_BORROWED_REFS
-    #define CYTHON_AVOID_BORROWED_REFS 0
-  #endif
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
   #undef CYTHON_ASSUME_SAFE_MACROS
   #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
   #undef CYTHON_UNPACK_METHODS
   #define CYTHON_UNPACK_METHODS 0
   #undef CYTHON_FAST_THREAD_STATE
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_GIL
   #define CYTHON_FAST_GIL 0
-  #undef CYTHON_METH_FASTCALL
-  #define CYTHON_METH_FASTCALL 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW (PYPY_VERSION_NUM >= 0x07030800 && CYTHON_VECTORCALL)
+  #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_MODULE_STATE
-  #define CYTHON_USE_MODULE_STATE 1
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
   #ifndef CYTHON_USE_TP_FINALIZE
-    #define CYTHON_USE_TP_FINALIZE 1
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
   #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
   #define CYTHON_COMPILING_IN_LIMITED_API 0
-  #ifndef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
   #ifndef CYTHON_USE_TYPE_SPECS
@@ -181,22 +343,19 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_PYTYPE_LOOKUP
     #define CYTHON_USE_PYTYPE_LOOKUP 1
   #endif
-  #if PY_MAJOR_VERSION < 3
-    #undef CYTHON_USE_ASYNC_SLOTS
-    #define CYTHON_USE_ASYNC_SLOTS 0
-  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
-    #define CYTHON_USE_ASYNC_SLOTS 1
-  #endif
   #ifndef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 1
   #endif
-  #ifndef CYTHON_USE_PYLIST_INTERNALS
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
     #define CYTHON_USE_PYLIST_INTERNALS 1
   #endif
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -205,64 +364,86 @@ END: Cython Metadata */
   #ifndef CYTHON_AVOID_BORROWED_REFS
     #define CYTHON_AVOID_BORROWED_REFS 0
   #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
   #ifndef CYTHON_ASSUME_SAFE_MACROS
     #define CYTHON_ASSUME_SAFE_MACROS 1
   #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
   #ifndef CYTHON_FAST_THREAD_STATE
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
-  #ifndef CYTHON_FAST_GIL
-    #define CYTHON_FAST_GIL (PY_MAJOR_VERSION < 3 || PY_VERSION_HEX >= 0x03060000)
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
   #endif
-  #ifndef CYTHON_METH_FASTCALL
-    #define CYTHON_METH_FASTCALL (PY_VERSION_HEX >= 0x030700A1)
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
   #endif
-  #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
   #endif
   #ifndef CYTHON_PEP487_INIT_SUBCLASS
     #define CYTHON_PEP487_INIT_SUBCLASS 1
   #endif
-  #if PY_VERSION_HEX < 0x03050000
-    #undef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
-  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT 1
   #endif
   #ifndef CYTHON_USE_MODULE_STATE
     #define CYTHON_USE_MODULE_STATE 0
   #endif
-  #if PY_VERSION_HEX < 0x030400a1
-    #undef CYTHON_USE_TP_FINALIZE
-    #define CYTHON_USE_TP_FINALIZE 0
-  #elif !defined(CYTHON_USE_TP_FINALIZE)
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
     #define CYTHON_USE_TP_FINALIZE 1
   #endif
-  #if PY_VERSION_HEX < 0x030600B1
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
     #undef CYTHON_USE_DICT_VERSIONS
     #define CYTHON_USE_DICT_VERSIONS 0
   #elif !defined(CYTHON_USE_DICT_VERSIONS)
-    #define CYTHON_USE_DICT_VERSIONS 1
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
   #endif
-  #if PY_VERSION_HEX < 0x030700A3
-    #undef CYTHON_USE_EXC_INFO_STACK
-    #define CYTHON_USE_EXC_INFO_STACK 0
-  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+  #ifndef CYTHON_USE_EXC_INFO_STACK
     #define CYTHON_USE_EXC_INFO_STACK 1
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR (PY_VERSION_HEX < 0x030C00B2)
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #ifndef CYTHON_OPAQUE_OBJECTS
+    #define CYTHON_OPAQUE_OBJECTS 0
+  #endif
 #endif
-#if !defined(CYTHON_FAST_PYCCALL)
-#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
-#endif
-#if !defined(CYTHON_VECTORCALL)
-#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL && PY_VERSION_HEX >= 0x030800B1)
-#endif
-#define CYTHON_BACKPORT_VECTORCALL (CYTHON_METH_FASTCALL && PY_VERSION_HEX < 0x030800B1)
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -287,6 +468,19 @@ END: Cython Metadata */
     #define CYTHON_RESTRICT
   #endif
 #endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 202311L
+    #define CYTHON_UNUSED [[maybe_unused]]
+  #endif
+#endif
 #ifndef CYTHON_UNUSED
 # if defined(__GNUC__)
 #   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
@@ -311,50 +505,38 @@ END: Cython Metadata */
   #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
 #endif
 #ifndef CYTHON_NCP_UNUSED
-# if CYTHON_COMPILING_IN_CPYTHON
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
 #  define CYTHON_NCP_UNUSED
 # else
 #  define CYTHON_NCP_UNUSED CYTHON_UNUSED
 # endif
 #endif
-#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
-#ifdef _MSC_VER
-    #ifndef _MSC_STDINT_H_
-        #if _MSC_VER < 1300
-            typedef unsigned char     uint8_t;
-            typedef unsigned short    uint16_t;
-            typedef unsigned int      uint32_t;
-        #else
-            typedef unsigned __int8   uint8_t;
-            typedef unsigned __int16  uint16_t;
-            typedef unsigned __int32  uint32_t;
-        #endif
-    #endif
-    #if _MSC_VER < 1300
-        #ifdef _WIN64
-            typedef unsigned long long  __pyx_uintptr_t;
-        #else
-            typedef unsigned int        __pyx_uintptr_t;
-        #endif
-    #else
-        #ifdef _WIN64
-            typedef unsigned __int64    __pyx_uintptr_t;
-        #else
-            typedef unsigned __int32    __pyx_uintptr_t;
-        #endif
-    #endif
-#else
-    #include <stdint.h>
-    typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
 #endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
 #ifndef CYTHON_FALLTHROUGH
-  #if defined(__cplusplus) && __cplusplus >= 201103L
-    #if __has_cpp_attribute(fallthrough)
-      #define CYTHON_FALLTHROUGH [[fallthrough]]
-    #elif __has_cpp_attribute(clang::fallthrough)
-      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
-    #elif __has_cpp_attribute(gnu::fallthrough)
-      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
     #endif
   #endif
   #ifndef CYTHON_FALLTHROUGH
@@ -364,14 +546,49 @@ END: Cython Metadata */
       #define CYTHON_FALLTHROUGH
     #endif
   #endif
-  #if defined(__clang__ ) && defined(__apple_build_version__)
+  #if defined(__clang__) && defined(__apple_build_version__)
     #if __apple_build_version__ < 7000000
       #undef  CYTHON_FALLTHROUGH
       #define CYTHON_FALLTHROUGH
     #endif
   #endif
 #endif
+#ifdef Py_UNREACHABLE
+  #define __Pyx_UNREACHABLE() Py_UNREACHABLE()
+#elif __Pyx_has_cbuiltin(__builtin_unreachable)
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(__clang__) || defined(__INTEL_COMPILER) || (defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 5)))
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(_MSC_VER)
+  #define __Pyx_UNREACHABLE() __assume(0)
+#else
+  #define __Pyx_UNREACHABLE() Py_FatalError("Unreachable C code path reached")
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE() __Pyx_UNREACHABLE()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  0
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+#define __Pyx_PyErr_FetchException(petype, peval, petb) PyErr_Fetch(petype, peval, petb)
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_Restore(etype, eval, etb)
+#else
+#define __Pyx_PyErr_FetchException(petype, peval, petb) *(petype)=NULL; *(peval)=PyErr_GetRaisedException(); *(petb)=NULL
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_SetRaisedException(eval)
+#endif
 
+/* CInitCode */
 #ifndef CYTHON_INLINE
   #if defined(__clang__)
     #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
@@ -386,51 +603,95 @@ END: Cython Metadata */
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
+/* PythonCompatibility */
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_DefaultClassType PyClass_Type
-  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
 #else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_DefaultClassType PyType_Type
-#if PY_VERSION_HEX >= 0x030800B2
-  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-#elif PY_VERSION_HEX >= 0x030800A4
-  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
 #else
-  #define __Pyx_PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
 #endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
 #endif
-#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
-  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
 #else
-  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
 #endif
-#ifndef Py_TPFLAGS_CHECKTYPES
-  #define Py_TPFLAGS_CHECKTYPES 0
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
 #endif
-#ifndef Py_TPFLAGS_HAVE_INDEX
-  #define Py_TPFLAGS_HAVE_INDEX 0
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
 #endif
-#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#if CYTHON_COMPILING_IN_LIMITED_API
+static unsigned long __Pyx_Runtime_TPFLAGS_SEQUENCE;
+static unsigned long __Pyx_Runtime_TPFLAGS_MAPPING;
+#else
+#define __Pyx_Runtime_TPFLAGS_SEQUENCE Py_TPFLAGS_SEQUENCE
+#define __Pyx_Runtime_TPFLAGS_MAPPING Py_TPFLAGS_MAPPING
 #endif
+static int __Pyx_init_tpflags_variables(void);
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 5)
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 6)
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
 #ifndef METH_STACKLESS
   #define METH_STACKLESS 0
 #endif
-#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+#if !defined(METH_FASTCALL) || CYTHON_COMPILING_IN_PYPY
   #ifndef METH_FASTCALL
      #define METH_FASTCALL 0x80
   #endif
@@ -438,10 +699,15 @@ END: Cython Metadata */
   typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
                                                           Py_ssize_t nargs, PyObject *kwnames);
 #else
-  #define __Pyx_PyCFunctionFast _PyCFunctionFast
-  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
 #endif
-#if CYTHON_METH_FASTCALL
+#if CYTHON_VECTORCALL
   #define __Pyx_METH_FASTCALL METH_FASTCALL
   #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
   #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
@@ -454,20 +720,39 @@ END: Cython Metadata */
   #define __pyx_vectorcallfunc vectorcallfunc
   #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
   #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
-#elif CYTHON_BACKPORT_VECTORCALL
-  typedef PyObject *(*__pyx_vectorcallfunc)(PyObject *callable, PyObject *const *args,
-                                            size_t nargsf, PyObject *kwnames);
-  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  ((size_t)1 << (8 * sizeof(size_t) - 1))
-  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(((size_t)(n)) & ~__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET))
 #else
   #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
   #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
 #endif
-#if PY_VERSION_HEX < 0x030900B1
+#define __Pyx_PyCFunction_CheckExact(func) PyCFunction_CheckExact(func)
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
   #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
-  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
 #else
   #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
   #define __Pyx_PyCMethod  PyCMethod
 #endif
 #ifndef METH_METHOD
@@ -478,14 +763,14 @@ END: Cython Metadata */
   #define PyObject_Free(p)     PyMem_Free(p)
   #define PyObject_Realloc(p)  PyMem_Realloc(p)
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
-  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
-  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
-  #define PyMem_RawFree(p)             PyMem_Free(p)
-#endif
 #if CYTHON_COMPILING_IN_LIMITED_API
-  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
   #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
 #else
   #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
   #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
@@ -494,15 +779,22 @@ END: Cython Metadata */
   #define __Pyx_PyThreadState_Current PyThreadState_Get()
 #elif !CYTHON_FAST_THREAD_STATE
   #define __Pyx_PyThreadState_Current PyThreadState_GET()
-#elif PY_VERSION_HEX >= 0x03060000
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
   #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
-#elif PY_VERSION_HEX >= 0x03000000
-  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_SHARED_SIZEOF(T) -((int)sizeof(T))
+    #define __PYX_SHARED_RELATIVE_OFFSET Py_RELATIVE_OFFSET
+    #define CYTHON_OPAQUE_SHARED_TYPES 1
 #else
-  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+    #define __PYX_SHARED_SIZEOF(T) sizeof(T)
+    #define __PYX_SHARED_RELATIVE_OFFSET 0
+    #define CYTHON_OPAQUE_SHARED_TYPES 0
 #endif
-#if CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_INLINE void *__Pyx_PyModule_GetState(PyObject *op)
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
 {
     void *result;
     result = PyModule_GetState(op);
@@ -510,57 +802,45 @@ static CYTHON_INLINE void *__Pyx_PyModule_GetState(PyObject *op)
         Py_FatalError("Couldn't find the module state");
     return result;
 }
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
 #endif
-#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
-#include "pythread.h"
-#define Py_tss_NEEDS_INIT 0
-typedef int Py_tss_t;
-static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
-  *key = PyThread_create_key();
-  return 0;
-}
-static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
-  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
-  *key = Py_tss_NEEDS_INIT;
-  return key;
-}
-static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
-  PyObject_Free(key);
-}
-static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
-  return *key != Py_tss_NEEDS_INIT;
-}
-static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
-  PyThread_delete_key(*key);
-  *key = Py_tss_NEEDS_INIT;
-}
-static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
-  return PyThread_set_key_value(*key, value);
-}
-static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
-  return PyThread_get_key_value(*key);
-}
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
 #endif
 #if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
 #define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
 #else
 #define __Pyx_PyDict_NewPresized(n)  PyDict_New()
 #endif
-#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX > 0x030600B4 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
 #define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
 static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
     PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
-    if (res == NULL) PyErr_Clear();
+    if (res == NULL && PyErr_Occurred()) {
+        PyErr_WriteUnraisable(NULL);
+    }
     return res;
 }
-#elif PY_MAJOR_VERSION >= 3 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000)
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
 #define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
 #define __Pyx_PyDict_GetItemStr           PyDict_GetItem
 #else
@@ -584,15 +864,14 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
 #if CYTHON_USE_TYPE_SLOTS
   #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
   #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
-  #define __Pyx_PyObject_GetIterNextFunc(obj)  (Py_TYPE(obj)->tp_iternext)
 #else
   #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
   #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
-  #define __Pyx_PyObject_GetIterNextFunc(obj)  PyIter_Next
 #endif
-#if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX >= 0x03080000
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
 #define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
-    PyTypeObject *type = Py_TYPE(obj);\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
     assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
     PyObject_GC_Del(obj);\
     Py_DECREF(type);\
@@ -601,53 +880,39 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
 #define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
 #endif
 #if CYTHON_COMPILING_IN_LIMITED_API
-  #define CYTHON_PEP393_ENABLED 1
   #define __Pyx_PyUnicode_READY(op)       (0)
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GetLength(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
-  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
   #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_KIND_04(u)      __Pyx_PyUnicode_KIND(u)
   #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
   #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
   #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
-#elif PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
-  #define CYTHON_PEP393_ENABLED 1
-  #if defined(PyUnicode_IS_READY)
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
   #else
-  #define __Pyx_PyUnicode_READY(op)       (0)
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
   #endif
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
   #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
-  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #if defined(PyUnicode_IS_READY) && defined(PyUnicode_GET_SIZE)
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
-  #else
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
-  #endif
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
   #else
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+    #if CYTHON_COMPILING_IN_CPYTHON
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
   #endif
-#else
-  #define CYTHON_PEP393_ENABLED 0
-  #define PyUnicode_1BYTE_KIND  1
-  #define PyUnicode_2BYTE_KIND  2
-  #define PyUnicode_4BYTE_KIND  4
-  #define __Pyx_PyUnicode_READY(op)       (0)
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
-  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
-  #define __Pyx_PyUnicode_KIND(u)         ((int)sizeof(Py_UNICODE))
-  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
-  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
-  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+  static CYTHON_INLINE int __Pyx_PyUnicode_KIND_04(PyObject *o) {
+      return __Pyx_PyUnicode_KIND(o) - (int) !!PyUnicode_IS_ASCII(o);
+  }
 #endif
 #if CYTHON_COMPILING_IN_PYPY
   #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
@@ -661,8 +926,7 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
   #if !defined(PyUnicode_DecodeUnicodeEscape)
     #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
   #endif
-  #if !defined(PyUnicode_Contains) || (PY_MAJOR_VERSION == 2 && PYPY_VERSION_NUM < 0x07030500)
-    #undef PyUnicode_Contains
+  #if !defined(PyUnicode_Contains)
     #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
   #endif
   #if !defined(PyByteArray_Check)
@@ -672,130 +936,318 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
     #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
   #endif
 #endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
 #define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
-#else
-  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
-#endif
-#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
-  #define PyObject_ASCII(o)            PyObject_Repr(o)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#ifndef PyObject_Unicode
-  #define PyObject_Unicode             PyObject_Str
-#endif
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
-  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
-#else
-  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
-  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
   #define __Pyx_PySequence_ListKeepNew(obj)\
     (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
 #else
   #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
 #endif
 #ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
-#endif
-#if PY_VERSION_HEX >= 0x030900A4
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
-#else
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+  #define PySet_CheckExact(obj)        Py_IS_TYPE(obj, &PySet_Type)
 #endif
-#if CYTHON_ASSUME_SAFE_MACROS
-  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
 #else
-  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
 #endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define PyNumber_Int                 PyNumber_Long
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
-  #ifndef PyUnicode_InternFromString
-    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
   #endif
-#endif
-#if PY_VERSION_HEX < 0x030200A4
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#elif CYTHON_COMPILING_IN_LIMITED_API || !(CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE)
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
 #else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
-#endif
-#if CYTHON_USE_ASYNC_SLOTS
-  #if PY_VERSION_HEX >= 0x030500B1
-    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
-    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #define __Pyx_PyList_GetItemRef(o, i) (likely(__Pyx_is_valid_index(i, PyList_GET_SIZE(o))) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_PyList_GetItemRef(o, i))
+#elif CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
   #else
-    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_XNewRef(PyList_GetItem(o, i)) : __Pyx_PyList_GetItemRef(o, i))
   #endif
+#elif CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)))
+#else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_XNewRef(PyList_GetItem(o, i)))
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
 #else
-  #define __Pyx_PyType_AsAsync(obj) NULL
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
 #endif
-#ifndef __Pyx_PyAsyncMethodsStruct
-    typedef struct {
-        unaryfunc am_await;
-        unaryfunc am_aiter;
-        unaryfunc am_anext;
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
     } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
 #endif
-
-#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
 #endif
-#include <math.h>
-#ifdef NAN
-#define __PYX_NAN() ((float) NAN)
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+static int __Pyx_init_tpflags_bitcount(unsigned long flag) {
+    int count = 0;
+    while (flag) {
+        count += (int) (flag & 1);
+        flag >>= 1;
+    }
+    return count;
+}
+static int __Pyx_init_tpflags_variables(void) {
+    if (__Pyx_Runtime_TPFLAGS_SEQUENCE != 0 && __Pyx_Runtime_TPFLAGS_MAPPING != 0) {
+        return 0;
+    }
+    PyObject *collections_abc = PyImport_ImportModule("collections.abc");
+    if (!collections_abc) return -1;
+    int result = 0;
+    PyObject *sequence = NULL, *mapping = NULL;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030D0000
+    if (PyObject_GetOptionalAttrString(collections_abc, "Sequence", &sequence) != 1) goto fail;
+    if (PyObject_GetOptionalAttrString(collections_abc, "Mapping", &mapping) != 1) goto fail;
+#else
+    sequence = PyObject_GetAttrString(collections_abc, "Sequence");
+    if (!sequence) goto fail_attr_lookup;
+    mapping = PyObject_GetAttrString(collections_abc, "Mapping");
+    if (!mapping) goto fail_attr_lookup;
+#endif
+    if (!PyType_Check(sequence) || !PyType_Check(mapping)) goto fail;
+    {
+        unsigned long sequence_flags = PyType_GetFlags((PyTypeObject*)sequence);
+        unsigned long mapping_flags = PyType_GetFlags((PyTypeObject*)mapping);
+        unsigned long mutual_flags = sequence_flags & mapping_flags;
+        sequence_flags = sequence_flags ^ mutual_flags;
+        mapping_flags = mapping_flags ^ mutual_flags;
+        if (__Pyx_Runtime_TPFLAGS_SEQUENCE == 0 && __Pyx_init_tpflags_bitcount(sequence_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_SEQUENCE = sequence_flags;
+        }
+        if (__Pyx_Runtime_TPFLAGS_MAPPING == 0 && __Pyx_init_tpflags_bitcount(mapping_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_MAPPING = mapping_flags;
+        }
+    }
+    cleanup:
+    Py_XDECREF(mapping);
+    Py_XDECREF(sequence);
+    Py_DECREF(collections_abc);
+    return result;
+#if __PYX_LIMITED_VERSION_HEX < 0x030D0000
+    fail_attr_lookup:
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    }
+#endif
+    fail:
+    result = PyErr_Occurred() ? -1 : 0;
+    goto cleanup;
+}
 #else
-static CYTHON_INLINE float __PYX_NAN() {
-  float value;
-  memset(&value, 0xFF, sizeof(value));
-  return value;
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+static int __Pyx_init_tpflags_variables(void) {
+    return 0;  // It's a limited API-only feature
 }
 #endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
 #if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
 #define __Pyx_truncl trunc
 #else
 #define __Pyx_truncl truncl
 #endif
 
-#define __PYX_MARK_ERR_POS(f_index, lineno) \
-    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
 #define __PYX_ERR(f_index, lineno, Ln_error) \
     { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
-#ifndef __PYX_EXTERN_C
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
   #ifdef __cplusplus
     #define __PYX_EXTERN_C extern "C"
   #else
@@ -814,12 +1266,17 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define CYTHON_WITHOUT_ASSERTIONS
 #endif
 
-typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
-                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
-
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
 #define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
@@ -854,26 +1311,31 @@ static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
 #else
     #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
 #endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
 static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
 static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
-#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
 #define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
 #define __Pyx_PyBytes_FromString        PyBytes_FromString
 #define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
 static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
-#if PY_MAJOR_VERSION < 3
-    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#else
-    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
-#endif
-#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
 #define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
 #define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
 #define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
@@ -882,121 +1344,117 @@ static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
 #define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
 #define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
 #define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
-#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
 #define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
-#if CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const wchar_t *u)
-{
-    const wchar_t *u_end = u;
-    while (*u_end++) ;
-    return (size_t)(u_end - u - 1);
-}
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
 #else
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
-{
-    const Py_UNICODE *u_end = u;
-    while (*u_end++) ;
-    return (size_t)(u_end - u - 1);
+    Py_INCREF(obj);
+    return obj;
+#endif
 }
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
 #endif
-#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
-#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
-#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
-#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
-#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PyObject_RichCompareBool(a,b,cmp)  __Pyx_PyObject_IsTrueAndDecref(PyObject_RichCompare((a),(b),(cmp)))
 #define __Pyx_PySequence_Tuple(obj)\
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
 static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#define __Pyx_PyFloat_IsNonZero(x) (PyFloat_AS_DOUBLE(x) != 0.0)
 #else
-#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_IsNonZero(x) PyObject_IsTrue(x)
 #endif
-#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
-#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
 #define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_SignBits(x)  ((int) (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK))
+  #define __Pyx_PyLong_Sign(x)  (1 - __Pyx_PyLong_SignBits(x))
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_SignBits(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_SignBits(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_SignBits(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_CompareSignAndSize(PyObject *a, PyObject *b) {
+      uintptr_t tag_a = ((PyLongObject*)a)->long_value.lv_tag;
+      uintptr_t tag_b = ((PyLongObject*)b)->long_value.lv_tag;
+      if (tag_a == tag_b) return 0;
+      int sign_a = (int) (tag_a & _PyLong_SIGN_MASK);
+      int sign_b = (int) (tag_b & _PyLong_SIGN_MASK);
+      if (sign_a > sign_b) return -1;
+      if (sign_a < sign_b) return 1;
+      Py_ssize_t size_a = (Py_ssize_t) (tag_a >> _PyLong_NON_SIZE_BITS);
+      Py_ssize_t size_b = (Py_ssize_t) (tag_b >> _PyLong_NON_SIZE_BITS);
+      return (1 - sign_a) * (size_a - size_b);
+  }
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_Sign(x)  ((int) ((Py_SIZE(x) == 0) ? 0 : (Py_SIZE(x) < 0) ? -1 : 1))
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  #define __Pyx_PyLong_CompareSignAndSize(a, b)  (Py_SIZE(a) - Py_SIZE(b))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+  #define __Pyx_PyLong_IsNonZero(x)  (!__Pyx_PyLong_IsZero(x))
 #else
-#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
-#endif
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-static int __Pyx_sys_getdefaultencoding_not_ascii;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    PyObject* ascii_chars_u = NULL;
-    PyObject* ascii_chars_b = NULL;
-    const char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    if (strcmp(default_encoding_c, "ascii") == 0) {
-        __Pyx_sys_getdefaultencoding_not_ascii = 0;
-    } else {
-        char ascii_chars[128];
-        int c;
-        for (c = 0; c < 128; c++) {
-            ascii_chars[c] = c;
-        }
-        __Pyx_sys_getdefaultencoding_not_ascii = 1;
-        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
-        if (!ascii_chars_u) goto bad;
-        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
-        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
-            PyErr_Format(
-                PyExc_ValueError,
-                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
-                default_encoding_c);
-            goto bad;
-        }
-        Py_DECREF(ascii_chars_u);
-        Py_DECREF(ascii_chars_b);
-    }
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    Py_XDECREF(ascii_chars_u);
-    Py_XDECREF(ascii_chars_b);
-    return -1;
-}
-#endif
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
-#else
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-static char* __PYX_DEFAULT_STRING_ENCODING;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
-    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
-    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    return -1;
-}
+  #define __Pyx_PyLong_IsNonZero(x)  PyObject_IsTrue(x)
 #endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
 #endif
 
 
@@ -1008,28 +1466,172 @@ bad:
   #define likely(x)   (x)
   #define unlikely(x) (x)
 #endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
 static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
 
 #if !CYTHON_USE_MODULE_STATE
 static PyObject *__pyx_m = NULL;
-static PyObject *__pyx_d;
-static PyObject *__pyx_b;
-static PyObject *__pyx_cython_runtime = NULL;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static PyObject *__pyx_empty_unicode;
-#endif
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm = __FILE__;
-static const char *__pyx_filename;
+#endif
+static const char * const __pyx_cfilenm = __FILE__;
 
 /* #### Code section: filename_table ### */
 
-static const char *__pyx_f[] = {
-  "nespy\\\\enum.py",
+static const char* const __pyx_f[] = {
+  "nespy/enum.py",
 };
 /* #### Code section: utility_code_proto_before_types ### */
+/* Atomics.proto (used by CodeObjectCache) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
 /* #### Code section: numeric_typedefs ### */
 /* #### Code section: complex_type_declarations ### */
 /* #### Code section: type_declarations ### */
@@ -1054,7 +1656,6 @@ static const char *__pyx_f[] = {
   static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
   static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
   #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-#ifdef WITH_THREAD
   #define __Pyx_RefNannySetupContext(name, acquire_gil)\
           if (acquire_gil) {\
               PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
@@ -1068,11 +1669,11 @@ static const char *__pyx_f[] = {
               __Pyx_RefNannyFinishContext();\
               PyGILState_Release(__pyx_gilstate_save);\
           }
-#else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
-          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__))
-  #define __Pyx_RefNannyFinishContextNogil() __Pyx_RefNannyFinishContext()
-#endif
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
   #define __Pyx_RefNannyFinishContext()\
           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
   #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
@@ -1113,7 +1714,7 @@ static const char *__pyx_f[] = {
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
 /* SetNameInClass.proto */
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030d0000
 #define __Pyx_SetNameInClass(ns, name, value)\
     (likely(PyDict_CheckExact(ns)) ? _PyDict_SetItem_KnownHash(ns, name, value, ((PyASCIIObject *) name)->hash) : PyObject_SetItem(ns, name, value))
 #elif CYTHON_COMPILING_IN_CPYTHON
@@ -1123,29 +1724,60 @@ static const char *__pyx_f[] = {
 #define __Pyx_SetNameInClass(ns, name, value)  PyObject_SetItem(ns, name, value)
 #endif
 
-/* CalculateMetaclass.proto */
+/* CalculateMetaclass.proto (used by Py3ClassCreate) */
 static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases);
 
-/* PyErrExceptionMatches.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
 #else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto (used by PyObjectCall2Args) */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargsf, PyObject *kwargs);
+
+/* PyObjectCall2Args.proto (used by Py3ClassCreate) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* FastTypeChecks.proto (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+#define __Pyx_PyAnySet_Check(obj)  __Pyx_TypeCheck2(obj, &PySet_Type, &PyFrozenSet_Type)
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyAnySet_Check(obj)  PyAnySet_Check(obj)
 #endif
 
-/* PyThreadStateGet.proto */
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
 #define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
 #else
 #define __Pyx_PyThreadState_declare
 #define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
 #endif
 
-/* PyErrFetchRestore.proto */
+/* PyErrFetchRestore.proto (used by GivenExceptionMatches) */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
 #define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
@@ -1154,7 +1786,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
 static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
 #define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
 #else
 #define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
@@ -1170,60 +1802,37 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
 #endif
 
-/* PyObjectGetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+/* GivenExceptionMatches.proto (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
 #else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-/* PyObjectGetAttrStrNoError.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
-
-/* GetBuiltinName.proto */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#if !CYTHON_VECTORCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
-#endif
-#define __Pyx_BUILD_ASSERT_EXPR(cond)\
-    (sizeof(char [1 - 2*!(cond)]) - 1)
-#ifndef Py_MEMBER_SIZE
-#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
-#endif
-  static size_t __pyx_pyframe_localsplus_offset = 0;
-  #include "frameobject.h"
-  #define __Pxy_PyFrame_Initialize_Offsets()\
-    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
-     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
-  #define __Pyx_PyFrame_GetLocalsplus(frame)\
-    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
 #endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
 
-/* PyObjectCall.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
 #else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
 #endif
 
-/* PyObjectCallMethO.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
 #endif
 
-/* PyObjectFastCall.proto */
-#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs);
-
-/* PyObjectCall2Args.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+/* PyObjectGetAttrStrNoError.proto (used by Py3ClassCreate) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
 
-/* PyObjectLookupSpecial.proto */
+/* PyObjectLookupSpecial.proto (used by Py3ClassCreate) */
 #if CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
 #define __Pyx_PyObject_LookupSpecialNoError(obj, attr_name)  __Pyx__PyObject_LookupSpecial(obj, attr_name, 0)
 #define __Pyx_PyObject_LookupSpecial(obj, attr_name)  __Pyx__PyObject_LookupSpecial(obj, attr_name, 1)
@@ -1233,13 +1842,32 @@ static CYTHON_INLINE PyObject* __Pyx__PyObject_LookupSpecial(PyObject* obj, PyOb
 #define __Pyx_PyObject_LookupSpecial(o,n) __Pyx_PyObject_GetAttrStr(o,n)
 #endif
 
-/* Py3ClassCreate.proto */
+/* Py3ClassCreate.export */
 static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name, PyObject *qualname,
                                            PyObject *mkw, PyObject *modname, PyObject *doc);
 static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
                                       PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
 
-/* PyDictVersioning.proto */
+/* CopyObjectArray.proto (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length);
+#endif
+
+/* TupleOrListFromArrayImpl.proto (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+
+/* ListFromArray.proto */
+
+
+/* IgnoreException.proto (used by GetModuleGlobalName) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception);
+#define __Pyx_IgnoreException(ignorable_exception) __Pyx_IgnoreGivenException(NULL, ignorable_exception)
+
+/* GetBuiltinName.proto (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
 #define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
 #define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
@@ -1250,7 +1878,7 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
     static PY_UINT64_T __pyx_dict_version = 0;\
     static PyObject *__pyx_dict_cached_value = NULL;\
     if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __pyx_dict_cached_value;\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
     } else {\
         (VAR) = __pyx_dict_cached_value = (LOOKUP);\
         __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
@@ -1267,18 +1895,18 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 
 /* GetModuleGlobalName.proto */
 #if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
     static PY_UINT64_T __pyx_dict_version = 0;\
     static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
         (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
         __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
     PY_UINT64_T __pyx_dict_version;\
     PyObject *__pyx_dict_cached_value;\
     (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
+} while(0)
 static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
 #define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
@@ -1286,99 +1914,252 @@ static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_ve
 static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
+/* PyObjectFastCallMethod.proto */
+#if CYTHON_VECTORCALL
+#define __Pyx_PyObject_FastCallMethod(name, args, nargsf) PyObject_VectorcallMethod(name, args, nargsf, NULL)
+#else
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf);
+#endif
+
+/* PyFrozenDict.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyFrozenDict_TypePtr  ((PyTypeObject*) __pyx_mstate_global->__Pyx_PyFrozenDictType)
+#define __Pyx_PyFrozenDict_New(it)  __Pyx__PyFrozenDict_New(__pyx_mstate_global->__Pyx_PyFrozenDictType, it)
+static CYTHON_INLINE PyObject* __Pyx__PyFrozenDict_New(PyObject* frozendict_type, PyObject* it);
+#define __Pyx_PyFrozenDict_NewEmpty()  __Pyx_PyFrozenDict_New(NULL)
+#define __Pyx_PyFrozenDict_Check(obj)  PyObject_TypeCheck((obj), __Pyx_PyFrozenDict_TypePtr)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  Py_IS_TYPE((obj), __Pyx_PyFrozenDict_TypePtr)
+#define __Pyx_PyAnyDict_Check(obj)   __Pyx__PyAnyDict_Check(obj, __Pyx_PyFrozenDict_TypePtr)
+static CYTHON_INLINE int __Pyx__PyAnyDict_Check(PyObject *obj, PyTypeObject* frozendict_type) {
+    return PyObject_TypeCheck(obj, &PyDict_Type) || PyObject_TypeCheck(obj, frozendict_type);
+}
+#define __Pyx_PyAnyDict_CheckExact(obj)  __Pyx__PyAnyDict_CheckExact(obj, __Pyx_PyFrozenDict_TypePtr)
+static CYTHON_INLINE int __Pyx__PyAnyDict_CheckExact(PyObject *obj, PyTypeObject* frozendict_type) {
+    return Py_IS_TYPE(obj, &PyDict_Type) || Py_IS_TYPE(obj, frozendict_type);
+}
+#elif PY_VERSION_HEX >= 0x030f00a6 ||\
+    (defined(PyFrozenDict_Check) && defined(PyAnyDict_Check) && defined(PyFrozenDict_New))
+#define __Pyx_PyFrozenDict_TypePtr  (&PyFrozenDict_Type)
+#define __Pyx_PyFrozenDict_New(it)  PyFrozenDict_New(it)
+#define __Pyx_PyFrozenDict_NewEmpty()  PyFrozenDict_New(NULL)
+#define __Pyx_PyFrozenDict_Check(obj)  PyFrozenDict_Check(obj)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  PyFrozenDict_CheckExact(obj)
+#define __Pyx_PyAnyDict_Check(obj)  PyAnyDict_Check(obj)
+#define __Pyx_PyAnyDict_CheckExact(obj)  PyAnyDict_CheckExact(obj)
+#else
+#define __Pyx_PyFrozenDict_TypePtr  (&PyDict_Type)
+static CYTHON_INLINE PyObject* __Pyx_PyFrozenDict_New(PyObject* it) {
+    if (!it) {
+        return PyDict_New();
+    } else if (PyDict_Check(it)) {
+        return PyDict_Copy(it);
+    } else {
+        PyObject *dict = PyDict_New();
+        if (!dict) return NULL;
+        PyObject *result = PyNumber_InPlaceOr(dict, it);
+        Py_DECREF(dict);
+        return result;
+    }
+}
+#define __Pyx_PyFrozenDict_NewEmpty()  PyDict_New()
+#define __Pyx_PyFrozenDict_Check(obj)  PyDict_Check(obj)
+#define __Pyx_PyFrozenDict_CheckExact(obj)  PyDict_CheckExact(obj)
+#define __Pyx_PyAnyDict_Check(obj)  PyDict_Check(obj)
+#define __Pyx_PyAnyDict_CheckExact(obj)  PyDict_CheckExact(obj)
+#endif
+
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* FormatTypeName.proto (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%N"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) Py_NewRef((PyObject*)tp)
+#define __Pyx_DECREF_TypeName(obj) Py_DECREF(obj)
+#elif CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* RaiseErrorWithObjectType.proto (used by RaiseMappingExpected) */
+#define __Pyx_RaiseTypeErrorWithObjectType(message, obj)  __Pyx_RaiseErrorWithObjectType(PyExc_TypeError, message, obj)
+#define __Pyx_RaiseErrorWithObjectType(exc_type, message, obj)  __Pyx_RaiseErrorWithType(exc_type, message, Py_TYPE(obj))
+CYTHON_UNUSED
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj);
+
 /* RaiseMappingExpected.proto */
 static void __Pyx_RaiseMappingExpectedError(PyObject* arg);
 
-/* CLineInTraceback.proto */
-#ifdef CYTHON_CLINE_IN_TRACEBACK
-#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+/* TupleOrListFromArrayImpl.proto (used by TupleFromArray) */
+#if PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_PyTuple_FromArray(src, n) PyTuple_FromArray(src, ((n)<0) ? 0 : (n))
 #else
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* TupleFromArray.proto */
+
+
+/* dict_setdefault.proto (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
 static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
 #endif
 
-/* CodeObjectCache.proto */
-#if !CYTHON_COMPILING_IN_LIMITED_API
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
 typedef struct {
-    PyCodeObject* code_object;
+    __Pyx_CachedCodeObjectType* code_object;
     int code_line;
 } __Pyx_CodeObjectCacheEntry;
 struct __Pyx_CodeObjectCache {
     int count;
     int max_count;
     __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
 };
-static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
 static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
-static PyCodeObject *__pyx_find_code_object(int code_line);
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
-#endif
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
 
 /* AddTraceback.proto */
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* FormatTypeName.proto */
-#if CYTHON_COMPILING_IN_LIMITED_API
-typedef PyObject *__Pyx_TypeName;
-#define __Pyx_FMT_TYPENAME "%U"
-static __Pyx_TypeName __Pyx_PyType_GetName(PyTypeObject* tp);
-#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
-#else
-typedef const char *__Pyx_TypeName;
-#define __Pyx_FMT_TYPENAME "%.200s"
-#define __Pyx_PyType_GetName(tp) ((tp)->tp_name)
-#define __Pyx_DECREF_TypeName(obj)
+/* GCCDiagnostics.proto (used by CIntToPy) */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
 #endif
 
-/* GCCDiagnostics.proto */
-#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
-#define __Pyx_HAS_GCC_DIAGNOSTIC
+/* PyObjectVectorcallKwds.proto (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallKwds PyObject_Vectorcall
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i);
+#else
+#define __Pyx_Object_VectorcallKwds __Pyx_PyObject_FastCallDict
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n);
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i);
+#endif
+
+/* PyObjectVectorcallMethodKwds.proto (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallMethodKwds PyObject_VectorcallMethod
+#else
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 #endif
 
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
 /* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
 
-/* FastTypeChecks.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
 #else
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
-#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
-#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* AddModuleRef.proto */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
 #endif
-#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_Occurred(), err1, err2)
-#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
 
 /* CheckBinaryVersion.proto */
-static int __Pyx_check_binary_version(void);
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* DecompressString.proto */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo);
 
-/* InitStrings.proto */
+/* IncludeStringH.proto (used by DecompressString_LZSS) */
+#include <string.h>
+
+/* DecompressString_LZSS.proto */
+static PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#include <stdlib.h>
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
 #if CYTHON_COMPILING_IN_LIMITED_API
-static int __Pyx_InitString(__Pyx_StringTabEntry t, PyObject **str);
+    #if CYTHON_VECTORCALL
+        #define __PYX_VECTORCALL_ABI_SUFFIX  "_vectorcall"
+    #else
+        #define __PYX_VECTORCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_VECTORCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
 #else
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+    #define __PYX_LIMITED_ABI_SUFFIX
 #endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX "opaque"
+#else
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
 
-/* #### Code section: module_declarations ### */
 
 /* Module declarations from "nespy.enum" */
-#if !CYTHON_USE_MODULE_STATE
-#endif
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "nespy.enum"
@@ -1388,805 +2169,421 @@ int __pyx_module_is_main_nespy__enum = 0;
 /* Implementation of "nespy.enum" */
 /* #### Code section: global_var ### */
 /* #### Code section: string_decls ### */
-static const char __pyx_k_[] = "";
-static const char __pyx_k_a[] = "; = {a}";
-static const char __pyx_k_x[] = "; = {x}";
-static const char __pyx_k_y[] = "; = {y}";
-static const char __pyx_k__2[] = "?";
-static const char __pyx_k_ADC[] = "ADC";
-static const char __pyx_k_AND[] = "AND";
-static const char __pyx_k_ASL[] = "ASL";
-static const char __pyx_k_BCC[] = "BCC";
-static const char __pyx_k_BCS[] = "BCS";
-static const char __pyx_k_BEQ[] = "BEQ";
-static const char __pyx_k_BIT[] = "BIT";
-static const char __pyx_k_BMI[] = "BMI";
-static const char __pyx_k_BNE[] = "BNE";
-static const char __pyx_k_BPL[] = "BPL";
-static const char __pyx_k_BRK[] = "BRK";
-static const char __pyx_k_BVC[] = "BVC";
-static const char __pyx_k_BVS[] = "BVS";
-static const char __pyx_k_CLC[] = "CLC";
-static const char __pyx_k_CLD[] = "CLD";
-static const char __pyx_k_CLI[] = "CLI";
-static const char __pyx_k_CLV[] = "CLV";
-static const char __pyx_k_CMP[] = "CMP";
-static const char __pyx_k_CPX[] = "CPX";
-static const char __pyx_k_CPY[] = "CPY";
-static const char __pyx_k_DEC[] = "DEC";
-static const char __pyx_k_DEX[] = "DEX";
-static const char __pyx_k_DEY[] = "DEY";
-static const char __pyx_k_EOR[] = "EOR";
-static const char __pyx_k_INC[] = "INC";
-static const char __pyx_k_INX[] = "INX";
-static const char __pyx_k_INY[] = "INY";
-static const char __pyx_k_JMP[] = "JMP";
-static const char __pyx_k_JSR[] = "JSR";
-static const char __pyx_k_LDA[] = "LDA";
-static const char __pyx_k_LDX[] = "LDX";
-static const char __pyx_k_LDY[] = "LDY";
-static const char __pyx_k_LSR[] = "LSR";
-static const char __pyx_k_NOP[] = "NOP";
-static const char __pyx_k_ORA[] = "ORA";
-static const char __pyx_k_PHA[] = "PHA";
-static const char __pyx_k_PHP[] = "PHP";
-static const char __pyx_k_PLA[] = "PLA";
-static const char __pyx_k_PLP[] = "PLP";
-static const char __pyx_k_ROL[] = "ROL";
-static const char __pyx_k_ROR[] = "ROR";
-static const char __pyx_k_RTI[] = "RTI";
-static const char __pyx_k_RTS[] = "RTS";
-static const char __pyx_k_SBC[] = "SBC";
-static const char __pyx_k_SEC[] = "SEC";
-static const char __pyx_k_SED[] = "SED";
-static const char __pyx_k_SEI[] = "SEI";
-static const char __pyx_k_STA[] = "STA";
-static const char __pyx_k_STX[] = "STX";
-static const char __pyx_k_STY[] = "STY";
-static const char __pyx_k_TAX[] = "TAX";
-static const char __pyx_k_TAY[] = "TAY";
-static const char __pyx_k_TSX[] = "TSX";
-static const char __pyx_k_TXA[] = "TXA";
-static const char __pyx_k_TXS[] = "TXS";
-static const char __pyx_k_TYA[] = "TYA";
-static const char __pyx_k_doc[] = "__doc__";
-static const char __pyx_k_INES[] = "INES";
-static const char __pyx_k_MMC1[] = "MMC1";
-static const char __pyx_k_MMC2[] = "MMC2";
-static const char __pyx_k_MMC3[] = "MMC3";
-static const char __pyx_k_NROM[] = "NROM";
-static const char __pyx_k_dict[] = "__dict__";
-static const char __pyx_k_main[] = "__main__";
-static const char __pyx_k_name[] = "__name__";
-static const char __pyx_k_test[] = "__test__";
-static const char __pyx_k_AXROM[] = "AXROM";
-static const char __pyx_k_CNROM[] = "CNROM";
-static const char __pyx_k_UXROM[] = "UXROM";
-static const char __pyx_k_super[] = "super";
-static const char __pyx_k_Mapper[] = "Mapper";
-static const char __pyx_k_module[] = "__module__";
-static const char __pyx_k_value2[] = "; = {value2}";
-static const char __pyx_k_INES2_0[] = "INES2_0";
-static const char __pyx_k_OAMADDR[] = "OAMADDR";
-static const char __pyx_k_OAMDATA[] = "OAMDATA";
-static const char __pyx_k_PPUADDR[] = "PPUADDR";
-static const char __pyx_k_PPUCTRL[] = "PPUCTRL";
-static const char __pyx_k_PPUDATA[] = "PPUDATA";
-static const char __pyx_k_PPUMASK[] = "PPUMASK";
-static const char __pyx_k_operand[] = "${operand}";
-static const char __pyx_k_prepare[] = "__prepare__";
-static const char __pyx_k_Absolute[] = "Absolute";
-static const char __pyx_k_Implicit[] = "Implicit";
-static const char __pyx_k_Indirect[] = "Indirect";
-static const char __pyx_k_Relative[] = "Relative";
-static const char __pyx_k_ZeroPage[] = "ZeroPage";
-static const char __pyx_k_absolute[] = "absolute";
-static const char __pyx_k_fromkeys[] = "fromkeys";
-static const char __pyx_k_implicit[] = "implicit";
-static const char __pyx_k_indirect[] = "indirect";
-static const char __pyx_k_qualname[] = "__qualname__";
-static const char __pyx_k_relative[] = "relative";
-static const char __pyx_k_set_name[] = "__set_name__";
-static const char __pyx_k_zeropage[] = "zeropage";
-static const char __pyx_k_AbsoluteX[] = "AbsoluteX";
-static const char __pyx_k_AbsoluteY[] = "AbsoluteY";
-static const char __pyx_k_Immediate[] = "Immediate";
-static const char __pyx_k_IndirectX[] = "IndirectX";
-static const char __pyx_k_IndirectY[] = "IndirectY";
-static const char __pyx_k_PPUSCROLL[] = "PPUSCROLL";
-static const char __pyx_k_PPUSTATUS[] = "PPUSTATUS";
-static const char __pyx_k_ROMFormat[] = "ROMFormat";
-static const char __pyx_k_ZeroPageX[] = "ZeroPageX";
-static const char __pyx_k_ZeroPageY[] = "ZeroPageY";
-static const char __pyx_k_immediate[] = "immediate";
-static const char __pyx_k_metaclass[] = "__metaclass__";
-static const char __pyx_k_operand_2[] = "#${operand}";
-static const char __pyx_k_operand_3[] = "(${operand})";
-static const char __pyx_k_operand_X[] = "${operand},X";
-static const char __pyx_k_operand_Y[] = "${operand},Y";
-static const char __pyx_k_absolute_x[] = "absolute,x";
-static const char __pyx_k_absolute_y[] = "absolute,y";
-static const char __pyx_k_indirect_x[] = "indirect,x";
-static const char __pyx_k_indirect_y[] = "indirect,y";
-static const char __pyx_k_nespy_enum[] = "nespy.enum";
-static const char __pyx_k_zeropage_x[] = "zeropage,x";
-static const char __pyx_k_zeropage_y[] = "zeropage,y";
-static const char __pyx_k_PPURegister[] = "PPURegister";
-static const char __pyx_k_operand_X_2[] = "(${operand},X)";
-static const char __pyx_k_operand_Y_2[] = "(${operand}),Y";
-static const char __pyx_k_init_subclass[] = "__init_subclass__";
-static const char __pyx_k_AddressingMode[] = "AddressingMode";
-static const char __pyx_k_operand_value2[] = "${operand}; = ${value2}";
-static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
-static const char __pyx_k_InstructionLengthMap[] = "InstructionLengthMap";
-static const char __pyx_k_InstructionMnemonicMap[] = "InstructionMnemonicMap";
-static const char __pyx_k_InstructionDisasmExtras[] = "InstructionDisasmExtras";
-static const char __pyx_k_AddressingModeDisasmFormat[] = "AddressingModeDisasmFormat";
-static const char __pyx_k_InstructionAddressingModeMap[] = "InstructionAddressingModeMap";
-static const char __pyx_k_Maps_mapper_names_to_mapper_val[] = "\n    Maps mapper names to mapper values found in iNES ROMs\n    ";
-#if !CYTHON_USE_MODULE_STATE
-static PyObject *__pyx_kp_u_;
-static PyObject *__pyx_n_u_ADC;
-static PyObject *__pyx_n_u_AND;
-static PyObject *__pyx_n_u_ASL;
-static PyObject *__pyx_n_s_AXROM;
-static PyObject *__pyx_n_s_Absolute;
-static PyObject *__pyx_n_s_AbsoluteX;
-static PyObject *__pyx_n_s_AbsoluteY;
-static PyObject *__pyx_n_s_AddressingMode;
-static PyObject *__pyx_n_s_AddressingModeDisasmFormat;
-static PyObject *__pyx_n_u_BCC;
-static PyObject *__pyx_n_u_BCS;
-static PyObject *__pyx_n_u_BEQ;
-static PyObject *__pyx_n_u_BIT;
-static PyObject *__pyx_n_u_BMI;
-static PyObject *__pyx_n_u_BNE;
-static PyObject *__pyx_n_u_BPL;
-static PyObject *__pyx_n_u_BRK;
-static PyObject *__pyx_n_u_BVC;
-static PyObject *__pyx_n_u_BVS;
-static PyObject *__pyx_n_u_CLC;
-static PyObject *__pyx_n_u_CLD;
-static PyObject *__pyx_n_u_CLI;
-static PyObject *__pyx_n_u_CLV;
-static PyObject *__pyx_n_u_CMP;
-static PyObject *__pyx_n_s_CNROM;
-static PyObject *__pyx_n_u_CPX;
-static PyObject *__pyx_n_u_CPY;
-static PyObject *__pyx_n_u_DEC;
-static PyObject *__pyx_n_u_DEX;
-static PyObject *__pyx_n_u_DEY;
-static PyObject *__pyx_n_u_EOR;
-static PyObject *__pyx_n_u_INC;
-static PyObject *__pyx_n_s_INES;
-static PyObject *__pyx_n_s_INES2_0;
-static PyObject *__pyx_n_u_INX;
-static PyObject *__pyx_n_u_INY;
-static PyObject *__pyx_n_s_Immediate;
-static PyObject *__pyx_n_s_Implicit;
-static PyObject *__pyx_n_s_Indirect;
-static PyObject *__pyx_n_s_IndirectX;
-static PyObject *__pyx_n_s_IndirectY;
-static PyObject *__pyx_n_s_InstructionAddressingModeMap;
-static PyObject *__pyx_n_s_InstructionDisasmExtras;
-static PyObject *__pyx_n_s_InstructionLengthMap;
-static PyObject *__pyx_n_s_InstructionMnemonicMap;
-static PyObject *__pyx_n_u_JMP;
-static PyObject *__pyx_n_u_JSR;
-static PyObject *__pyx_n_u_LDA;
-static PyObject *__pyx_n_u_LDX;
-static PyObject *__pyx_n_u_LDY;
-static PyObject *__pyx_n_u_LSR;
-static PyObject *__pyx_n_s_MMC1;
-static PyObject *__pyx_n_s_MMC2;
-static PyObject *__pyx_n_s_MMC3;
-static PyObject *__pyx_n_s_Mapper;
-static PyObject *__pyx_kp_s_Maps_mapper_names_to_mapper_val;
-static PyObject *__pyx_n_u_NOP;
-static PyObject *__pyx_n_s_NROM;
-static PyObject *__pyx_n_s_OAMADDR;
-static PyObject *__pyx_n_s_OAMDATA;
-static PyObject *__pyx_n_u_ORA;
-static PyObject *__pyx_n_u_PHA;
-static PyObject *__pyx_n_u_PHP;
-static PyObject *__pyx_n_u_PLA;
-static PyObject *__pyx_n_u_PLP;
-static PyObject *__pyx_n_s_PPUADDR;
-static PyObject *__pyx_n_s_PPUCTRL;
-static PyObject *__pyx_n_s_PPUDATA;
-static PyObject *__pyx_n_s_PPUMASK;
-static PyObject *__pyx_n_s_PPURegister;
-static PyObject *__pyx_n_s_PPUSCROLL;
-static PyObject *__pyx_n_s_PPUSTATUS;
-static PyObject *__pyx_n_u_ROL;
-static PyObject *__pyx_n_s_ROMFormat;
-static PyObject *__pyx_n_u_ROR;
-static PyObject *__pyx_n_u_RTI;
-static PyObject *__pyx_n_u_RTS;
-static PyObject *__pyx_n_s_Relative;
-static PyObject *__pyx_n_u_SBC;
-static PyObject *__pyx_n_u_SEC;
-static PyObject *__pyx_n_u_SED;
-static PyObject *__pyx_n_u_SEI;
-static PyObject *__pyx_n_u_STA;
-static PyObject *__pyx_n_u_STX;
-static PyObject *__pyx_n_u_STY;
-static PyObject *__pyx_n_u_TAX;
-static PyObject *__pyx_n_u_TAY;
-static PyObject *__pyx_n_u_TSX;
-static PyObject *__pyx_n_u_TXA;
-static PyObject *__pyx_n_u_TXS;
-static PyObject *__pyx_n_u_TYA;
-static PyObject *__pyx_n_s_UXROM;
-static PyObject *__pyx_n_s_ZeroPage;
-static PyObject *__pyx_n_s_ZeroPageX;
-static PyObject *__pyx_n_s_ZeroPageY;
-static PyObject *__pyx_n_s__2;
-static PyObject *__pyx_kp_u_a;
-static PyObject *__pyx_n_u_absolute;
-static PyObject *__pyx_kp_u_absolute_x;
-static PyObject *__pyx_kp_u_absolute_y;
-static PyObject *__pyx_n_s_cline_in_traceback;
-static PyObject *__pyx_n_s_dict;
-static PyObject *__pyx_n_s_doc;
-static PyObject *__pyx_n_s_fromkeys;
-static PyObject *__pyx_n_u_immediate;
-static PyObject *__pyx_n_u_implicit;
-static PyObject *__pyx_n_u_indirect;
-static PyObject *__pyx_kp_u_indirect_x;
-static PyObject *__pyx_kp_u_indirect_y;
-static PyObject *__pyx_n_s_init_subclass;
-static PyObject *__pyx_n_s_main;
-static PyObject *__pyx_n_s_metaclass;
-static PyObject *__pyx_n_s_module;
-static PyObject *__pyx_n_s_name;
-static PyObject *__pyx_n_s_nespy_enum;
-static PyObject *__pyx_kp_u_operand;
-static PyObject *__pyx_kp_u_operand_2;
-static PyObject *__pyx_kp_u_operand_3;
-static PyObject *__pyx_kp_u_operand_X;
-static PyObject *__pyx_kp_u_operand_X_2;
-static PyObject *__pyx_kp_u_operand_Y;
-static PyObject *__pyx_kp_u_operand_Y_2;
-static PyObject *__pyx_kp_u_operand_value2;
-static PyObject *__pyx_n_s_prepare;
-static PyObject *__pyx_n_s_qualname;
-static PyObject *__pyx_n_u_relative;
-static PyObject *__pyx_n_s_set_name;
-static PyObject *__pyx_n_s_super;
-static PyObject *__pyx_n_s_test;
-static PyObject *__pyx_kp_u_value2;
-static PyObject *__pyx_kp_u_x;
-static PyObject *__pyx_kp_u_y;
-static PyObject *__pyx_n_u_zeropage;
-static PyObject *__pyx_kp_u_zeropage_x;
-static PyObject *__pyx_kp_u_zeropage_y;
-#endif
 /* #### Code section: decls ### */
-#if !CYTHON_USE_MODULE_STATE
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_2;
-static PyObject *__pyx_int_3;
-static PyObject *__pyx_int_4;
-static PyObject *__pyx_int_5;
-static PyObject *__pyx_int_6;
-static PyObject *__pyx_int_7;
-static PyObject *__pyx_int_8;
-static PyObject *__pyx_int_9;
-static PyObject *__pyx_int_10;
-static PyObject *__pyx_int_13;
-static PyObject *__pyx_int_14;
-static PyObject *__pyx_int_16;
-static PyObject *__pyx_int_17;
-static PyObject *__pyx_int_21;
-static PyObject *__pyx_int_22;
-static PyObject *__pyx_int_24;
-static PyObject *__pyx_int_25;
-static PyObject *__pyx_int_26;
-static PyObject *__pyx_int_29;
-static PyObject *__pyx_int_30;
-static PyObject *__pyx_int_32;
-static PyObject *__pyx_int_33;
-static PyObject *__pyx_int_36;
-static PyObject *__pyx_int_37;
-static PyObject *__pyx_int_38;
-static PyObject *__pyx_int_40;
-static PyObject *__pyx_int_41;
-static PyObject *__pyx_int_42;
-static PyObject *__pyx_int_44;
-static PyObject *__pyx_int_45;
-static PyObject *__pyx_int_46;
-static PyObject *__pyx_int_48;
-static PyObject *__pyx_int_49;
-static PyObject *__pyx_int_53;
-static PyObject *__pyx_int_54;
-static PyObject *__pyx_int_56;
-static PyObject *__pyx_int_57;
-static PyObject *__pyx_int_58;
-static PyObject *__pyx_int_61;
-static PyObject *__pyx_int_62;
-static PyObject *__pyx_int_64;
-static PyObject *__pyx_int_65;
-static PyObject *__pyx_int_69;
-static PyObject *__pyx_int_70;
-static PyObject *__pyx_int_72;
-static PyObject *__pyx_int_73;
-static PyObject *__pyx_int_74;
-static PyObject *__pyx_int_76;
-static PyObject *__pyx_int_77;
-static PyObject *__pyx_int_78;
-static PyObject *__pyx_int_80;
-static PyObject *__pyx_int_81;
-static PyObject *__pyx_int_85;
-static PyObject *__pyx_int_86;
-static PyObject *__pyx_int_88;
-static PyObject *__pyx_int_89;
-static PyObject *__pyx_int_90;
-static PyObject *__pyx_int_93;
-static PyObject *__pyx_int_94;
-static PyObject *__pyx_int_96;
-static PyObject *__pyx_int_97;
-static PyObject *__pyx_int_101;
-static PyObject *__pyx_int_102;
-static PyObject *__pyx_int_104;
-static PyObject *__pyx_int_105;
-static PyObject *__pyx_int_106;
-static PyObject *__pyx_int_108;
-static PyObject *__pyx_int_109;
-static PyObject *__pyx_int_110;
-static PyObject *__pyx_int_112;
-static PyObject *__pyx_int_113;
-static PyObject *__pyx_int_117;
-static PyObject *__pyx_int_118;
-static PyObject *__pyx_int_120;
-static PyObject *__pyx_int_121;
-static PyObject *__pyx_int_122;
-static PyObject *__pyx_int_125;
-static PyObject *__pyx_int_126;
-static PyObject *__pyx_int_128;
-static PyObject *__pyx_int_129;
-static PyObject *__pyx_int_130;
-static PyObject *__pyx_int_132;
-static PyObject *__pyx_int_133;
-static PyObject *__pyx_int_134;
-static PyObject *__pyx_int_136;
-static PyObject *__pyx_int_137;
-static PyObject *__pyx_int_138;
-static PyObject *__pyx_int_140;
-static PyObject *__pyx_int_141;
-static PyObject *__pyx_int_142;
-static PyObject *__pyx_int_144;
-static PyObject *__pyx_int_145;
-static PyObject *__pyx_int_148;
-static PyObject *__pyx_int_149;
-static PyObject *__pyx_int_150;
-static PyObject *__pyx_int_152;
-static PyObject *__pyx_int_153;
-static PyObject *__pyx_int_154;
-static PyObject *__pyx_int_157;
-static PyObject *__pyx_int_160;
-static PyObject *__pyx_int_161;
-static PyObject *__pyx_int_162;
-static PyObject *__pyx_int_164;
-static PyObject *__pyx_int_165;
-static PyObject *__pyx_int_166;
-static PyObject *__pyx_int_168;
-static PyObject *__pyx_int_169;
-static PyObject *__pyx_int_170;
-static PyObject *__pyx_int_172;
-static PyObject *__pyx_int_173;
-static PyObject *__pyx_int_174;
-static PyObject *__pyx_int_176;
-static PyObject *__pyx_int_177;
-static PyObject *__pyx_int_180;
-static PyObject *__pyx_int_181;
-static PyObject *__pyx_int_182;
-static PyObject *__pyx_int_184;
-static PyObject *__pyx_int_185;
-static PyObject *__pyx_int_186;
-static PyObject *__pyx_int_188;
-static PyObject *__pyx_int_189;
-static PyObject *__pyx_int_190;
-static PyObject *__pyx_int_192;
-static PyObject *__pyx_int_193;
-static PyObject *__pyx_int_194;
-static PyObject *__pyx_int_196;
-static PyObject *__pyx_int_197;
-static PyObject *__pyx_int_198;
-static PyObject *__pyx_int_200;
-static PyObject *__pyx_int_201;
-static PyObject *__pyx_int_202;
-static PyObject *__pyx_int_204;
-static PyObject *__pyx_int_205;
-static PyObject *__pyx_int_206;
-static PyObject *__pyx_int_208;
-static PyObject *__pyx_int_209;
-static PyObject *__pyx_int_213;
-static PyObject *__pyx_int_214;
-static PyObject *__pyx_int_216;
-static PyObject *__pyx_int_217;
-static PyObject *__pyx_int_218;
-static PyObject *__pyx_int_221;
-static PyObject *__pyx_int_222;
-static PyObject *__pyx_int_224;
-static PyObject *__pyx_int_225;
-static PyObject *__pyx_int_226;
-static PyObject *__pyx_int_228;
-static PyObject *__pyx_int_229;
-static PyObject *__pyx_int_230;
-static PyObject *__pyx_int_232;
-static PyObject *__pyx_int_233;
-static PyObject *__pyx_int_234;
-static PyObject *__pyx_int_236;
-static PyObject *__pyx_int_237;
-static PyObject *__pyx_int_238;
-static PyObject *__pyx_int_240;
-static PyObject *__pyx_int_241;
-static PyObject *__pyx_int_245;
-static PyObject *__pyx_int_246;
-static PyObject *__pyx_int_248;
-static PyObject *__pyx_int_249;
-static PyObject *__pyx_int_250;
-static PyObject *__pyx_int_253;
-static PyObject *__pyx_int_254;
-static PyObject *__pyx_int_8192;
-static PyObject *__pyx_int_8193;
-static PyObject *__pyx_int_8194;
-static PyObject *__pyx_int_8195;
-static PyObject *__pyx_int_8196;
-static PyObject *__pyx_int_8197;
-static PyObject *__pyx_int_8198;
-static PyObject *__pyx_int_8199;
-#endif
-#if !CYTHON_USE_MODULE_STATE
-#endif
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
-#if CYTHON_USE_MODULE_STATE
-typedef struct {
-  PyObject *__pyx_d;
-  PyObject *__pyx_b;
-  PyObject *__pyx_cython_runtime;
-  PyObject *__pyx_empty_tuple;
-  PyObject *__pyx_empty_bytes;
-  PyObject *__pyx_empty_unicode;
-  #ifdef __Pyx_CyFunction_USED
-  PyTypeObject *__pyx_CyFunctionType;
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  PyTypeObject *__pyx_FusedFunctionType;
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+#ifdef __cplusplus
+namespace {
   #endif
-  PyObject *__pyx_kp_u_;
-  PyObject *__pyx_n_u_ADC;
-  PyObject *__pyx_n_u_AND;
-  PyObject *__pyx_n_u_ASL;
-  PyObject *__pyx_n_s_AXROM;
-  PyObject *__pyx_n_s_Absolute;
-  PyObject *__pyx_n_s_AbsoluteX;
-  PyObject *__pyx_n_s_AbsoluteY;
-  PyObject *__pyx_n_s_AddressingMode;
-  PyObject *__pyx_n_s_AddressingModeDisasmFormat;
-  PyObject *__pyx_n_u_BCC;
-  PyObject *__pyx_n_u_BCS;
-  PyObject *__pyx_n_u_BEQ;
-  PyObject *__pyx_n_u_BIT;
-  PyObject *__pyx_n_u_BMI;
-  PyObject *__pyx_n_u_BNE;
-  PyObject *__pyx_n_u_BPL;
-  PyObject *__pyx_n_u_BRK;
-  PyObject *__pyx_n_u_BVC;
-  PyObject *__pyx_n_u_BVS;
-  PyObject *__pyx_n_u_CLC;
-  PyObject *__pyx_n_u_CLD;
-  PyObject *__pyx_n_u_CLI;
-  PyObject *__pyx_n_u_CLV;
-  PyObject *__pyx_n_u_CMP;
-  PyObject *__pyx_n_s_CNROM;
-  PyObject *__pyx_n_u_CPX;
-  PyObject *__pyx_n_u_CPY;
-  PyObject *__pyx_n_u_DEC;
-  PyObject *__pyx_n_u_DEX;
-  PyObject *__pyx_n_u_DEY;
-  PyObject *__pyx_n_u_EOR;
-  PyObject *__pyx_n_u_INC;
-  PyObject *__pyx_n_s_INES;
-  PyObject *__pyx_n_s_INES2_0;
-  PyObject *__pyx_n_u_INX;
-  PyObject *__pyx_n_u_INY;
-  PyObject *__pyx_n_s_Immediate;
-  PyObject *__pyx_n_s_Implicit;
-  PyObject *__pyx_n_s_Indirect;
-  PyObject *__pyx_n_s_IndirectX;
-  PyObject *__pyx_n_s_IndirectY;
-  PyObject *__pyx_n_s_InstructionAddressingModeMap;
-  PyObject *__pyx_n_s_InstructionDisasmExtras;
-  PyObject *__pyx_n_s_InstructionLengthMap;
-  PyObject *__pyx_n_s_InstructionMnemonicMap;
-  PyObject *__pyx_n_u_JMP;
-  PyObject *__pyx_n_u_JSR;
-  PyObject *__pyx_n_u_LDA;
-  PyObject *__pyx_n_u_LDX;
-  PyObject *__pyx_n_u_LDY;
-  PyObject *__pyx_n_u_LSR;
-  PyObject *__pyx_n_s_MMC1;
-  PyObject *__pyx_n_s_MMC2;
-  PyObject *__pyx_n_s_MMC3;
-  PyObject *__pyx_n_s_Mapper;
-  PyObject *__pyx_kp_s_Maps_mapper_names_to_mapper_val;
-  PyObject *__pyx_n_u_NOP;
-  PyObject *__pyx_n_s_NROM;
-  PyObject *__pyx_n_s_OAMADDR;
-  PyObject *__pyx_n_s_OAMDATA;
-  PyObject *__pyx_n_u_ORA;
-  PyObject *__pyx_n_u_PHA;
-  PyObject *__pyx_n_u_PHP;
-  PyObject *__pyx_n_u_PLA;
-  PyObject *__pyx_n_u_PLP;
-  PyObject *__pyx_n_s_PPUADDR;
-  PyObject *__pyx_n_s_PPUCTRL;
-  PyObject *__pyx_n_s_PPUDATA;
-  PyObject *__pyx_n_s_PPUMASK;
-  PyObject *__pyx_n_s_PPURegister;
-  PyObject *__pyx_n_s_PPUSCROLL;
-  PyObject *__pyx_n_s_PPUSTATUS;
-  PyObject *__pyx_n_u_ROL;
-  PyObject *__pyx_n_s_ROMFormat;
-  PyObject *__pyx_n_u_ROR;
-  PyObject *__pyx_n_u_RTI;
-  PyObject *__pyx_n_u_RTS;
-  PyObject *__pyx_n_s_Relative;
-  PyObject *__pyx_n_u_SBC;
-  PyObject *__pyx_n_u_SEC;
-  PyObject *__pyx_n_u_SED;
-  PyObject *__pyx_n_u_SEI;
-  PyObject *__pyx_n_u_STA;
-  PyObject *__pyx_n_u_STX;
-  PyObject *__pyx_n_u_STY;
-  PyObject *__pyx_n_u_TAX;
-  PyObject *__pyx_n_u_TAY;
-  PyObject *__pyx_n_u_TSX;
-  PyObject *__pyx_n_u_TXA;
-  PyObject *__pyx_n_u_TXS;
-  PyObject *__pyx_n_u_TYA;
-  PyObject *__pyx_n_s_UXROM;
-  PyObject *__pyx_n_s_ZeroPage;
-  PyObject *__pyx_n_s_ZeroPageX;
-  PyObject *__pyx_n_s_ZeroPageY;
-  PyObject *__pyx_n_s__2;
-  PyObject *__pyx_kp_u_a;
-  PyObject *__pyx_n_u_absolute;
-  PyObject *__pyx_kp_u_absolute_x;
-  PyObject *__pyx_kp_u_absolute_y;
-  PyObject *__pyx_n_s_cline_in_traceback;
-  PyObject *__pyx_n_s_dict;
-  PyObject *__pyx_n_s_doc;
-  PyObject *__pyx_n_s_fromkeys;
-  PyObject *__pyx_n_u_immediate;
-  PyObject *__pyx_n_u_implicit;
-  PyObject *__pyx_n_u_indirect;
-  PyObject *__pyx_kp_u_indirect_x;
-  PyObject *__pyx_kp_u_indirect_y;
-  PyObject *__pyx_n_s_init_subclass;
-  PyObject *__pyx_n_s_main;
-  PyObject *__pyx_n_s_metaclass;
-  PyObject *__pyx_n_s_module;
-  PyObject *__pyx_n_s_name;
-  PyObject *__pyx_n_s_nespy_enum;
-  PyObject *__pyx_kp_u_operand;
-  PyObject *__pyx_kp_u_operand_2;
-  PyObject *__pyx_kp_u_operand_3;
-  PyObject *__pyx_kp_u_operand_X;
-  PyObject *__pyx_kp_u_operand_X_2;
-  PyObject *__pyx_kp_u_operand_Y;
-  PyObject *__pyx_kp_u_operand_Y_2;
-  PyObject *__pyx_kp_u_operand_value2;
-  PyObject *__pyx_n_s_prepare;
-  PyObject *__pyx_n_s_qualname;
-  PyObject *__pyx_n_u_relative;
-  PyObject *__pyx_n_s_set_name;
-  PyObject *__pyx_n_s_super;
-  PyObject *__pyx_n_s_test;
-  PyObject *__pyx_kp_u_value2;
-  PyObject *__pyx_kp_u_x;
-  PyObject *__pyx_kp_u_y;
-  PyObject *__pyx_n_u_zeropage;
-  PyObject *__pyx_kp_u_zeropage_x;
-  PyObject *__pyx_kp_u_zeropage_y;
-  PyObject *__pyx_int_0;
-  PyObject *__pyx_int_1;
-  PyObject *__pyx_int_2;
-  PyObject *__pyx_int_3;
-  PyObject *__pyx_int_4;
-  PyObject *__pyx_int_5;
-  PyObject *__pyx_int_6;
-  PyObject *__pyx_int_7;
-  PyObject *__pyx_int_8;
-  PyObject *__pyx_int_9;
-  PyObject *__pyx_int_10;
-  PyObject *__pyx_int_13;
-  PyObject *__pyx_int_14;
-  PyObject *__pyx_int_16;
-  PyObject *__pyx_int_17;
-  PyObject *__pyx_int_21;
-  PyObject *__pyx_int_22;
-  PyObject *__pyx_int_24;
-  PyObject *__pyx_int_25;
-  PyObject *__pyx_int_26;
-  PyObject *__pyx_int_29;
-  PyObject *__pyx_int_30;
-  PyObject *__pyx_int_32;
-  PyObject *__pyx_int_33;
-  PyObject *__pyx_int_36;
-  PyObject *__pyx_int_37;
-  PyObject *__pyx_int_38;
-  PyObject *__pyx_int_40;
-  PyObject *__pyx_int_41;
-  PyObject *__pyx_int_42;
-  PyObject *__pyx_int_44;
-  PyObject *__pyx_int_45;
-  PyObject *__pyx_int_46;
-  PyObject *__pyx_int_48;
-  PyObject *__pyx_int_49;
-  PyObject *__pyx_int_53;
-  PyObject *__pyx_int_54;
-  PyObject *__pyx_int_56;
-  PyObject *__pyx_int_57;
-  PyObject *__pyx_int_58;
-  PyObject *__pyx_int_61;
-  PyObject *__pyx_int_62;
-  PyObject *__pyx_int_64;
-  PyObject *__pyx_int_65;
-  PyObject *__pyx_int_69;
-  PyObject *__pyx_int_70;
-  PyObject *__pyx_int_72;
-  PyObject *__pyx_int_73;
-  PyObject *__pyx_int_74;
-  PyObject *__pyx_int_76;
-  PyObject *__pyx_int_77;
-  PyObject *__pyx_int_78;
-  PyObject *__pyx_int_80;
-  PyObject *__pyx_int_81;
-  PyObject *__pyx_int_85;
-  PyObject *__pyx_int_86;
-  PyObject *__pyx_int_88;
-  PyObject *__pyx_int_89;
-  PyObject *__pyx_int_90;
-  PyObject *__pyx_int_93;
-  PyObject *__pyx_int_94;
-  PyObject *__pyx_int_96;
-  PyObject *__pyx_int_97;
-  PyObject *__pyx_int_101;
-  PyObject *__pyx_int_102;
-  PyObject *__pyx_int_104;
-  PyObject *__pyx_int_105;
-  PyObject *__pyx_int_106;
-  PyObject *__pyx_int_108;
-  PyObject *__pyx_int_109;
-  PyObject *__pyx_int_110;
-  PyObject *__pyx_int_112;
-  PyObject *__pyx_int_113;
-  PyObject *__pyx_int_117;
-  PyObject *__pyx_int_118;
-  PyObject *__pyx_int_120;
-  PyObject *__pyx_int_121;
-  PyObject *__pyx_int_122;
-  PyObject *__pyx_int_125;
-  PyObject *__pyx_int_126;
-  PyObject *__pyx_int_128;
-  PyObject *__pyx_int_129;
-  PyObject *__pyx_int_130;
-  PyObject *__pyx_int_132;
-  PyObject *__pyx_int_133;
-  PyObject *__pyx_int_134;
-  PyObject *__pyx_int_136;
-  PyObject *__pyx_int_137;
-  PyObject *__pyx_int_138;
-  PyObject *__pyx_int_140;
-  PyObject *__pyx_int_141;
-  PyObject *__pyx_int_142;
-  PyObject *__pyx_int_144;
-  PyObject *__pyx_int_145;
-  PyObject *__pyx_int_148;
-  PyObject *__pyx_int_149;
-  PyObject *__pyx_int_150;
-  PyObject *__pyx_int_152;
-  PyObject *__pyx_int_153;
-  PyObject *__pyx_int_154;
-  PyObject *__pyx_int_157;
-  PyObject *__pyx_int_160;
-  PyObject *__pyx_int_161;
-  PyObject *__pyx_int_162;
-  PyObject *__pyx_int_164;
-  PyObject *__pyx_int_165;
-  PyObject *__pyx_int_166;
-  PyObject *__pyx_int_168;
-  PyObject *__pyx_int_169;
-  PyObject *__pyx_int_170;
-  PyObject *__pyx_int_172;
-  PyObject *__pyx_int_173;
-  PyObject *__pyx_int_174;
-  PyObject *__pyx_int_176;
-  PyObject *__pyx_int_177;
-  PyObject *__pyx_int_180;
-  PyObject *__pyx_int_181;
-  PyObject *__pyx_int_182;
-  PyObject *__pyx_int_184;
-  PyObject *__pyx_int_185;
-  PyObject *__pyx_int_186;
-  PyObject *__pyx_int_188;
-  PyObject *__pyx_int_189;
-  PyObject *__pyx_int_190;
-  PyObject *__pyx_int_192;
-  PyObject *__pyx_int_193;
-  PyObject *__pyx_int_194;
-  PyObject *__pyx_int_196;
-  PyObject *__pyx_int_197;
-  PyObject *__pyx_int_198;
-  PyObject *__pyx_int_200;
-  PyObject *__pyx_int_201;
-  PyObject *__pyx_int_202;
-  PyObject *__pyx_int_204;
-  PyObject *__pyx_int_205;
-  PyObject *__pyx_int_206;
-  PyObject *__pyx_int_208;
-  PyObject *__pyx_int_209;
-  PyObject *__pyx_int_213;
-  PyObject *__pyx_int_214;
-  PyObject *__pyx_int_216;
-  PyObject *__pyx_int_217;
-  PyObject *__pyx_int_218;
-  PyObject *__pyx_int_221;
-  PyObject *__pyx_int_222;
-  PyObject *__pyx_int_224;
-  PyObject *__pyx_int_225;
-  PyObject *__pyx_int_226;
-  PyObject *__pyx_int_228;
-  PyObject *__pyx_int_229;
-  PyObject *__pyx_int_230;
-  PyObject *__pyx_int_232;
-  PyObject *__pyx_int_233;
-  PyObject *__pyx_int_234;
-  PyObject *__pyx_int_236;
-  PyObject *__pyx_int_237;
-  PyObject *__pyx_int_238;
-  PyObject *__pyx_int_240;
-  PyObject *__pyx_int_241;
-  PyObject *__pyx_int_245;
-  PyObject *__pyx_int_246;
-  PyObject *__pyx_int_248;
-  PyObject *__pyx_int_249;
-  PyObject *__pyx_int_250;
-  PyObject *__pyx_int_253;
-  PyObject *__pyx_int_254;
-  PyObject *__pyx_int_8192;
-  PyObject *__pyx_int_8193;
-  PyObject *__pyx_int_8194;
-  PyObject *__pyx_int_8195;
-  PyObject *__pyx_int_8196;
-  PyObject *__pyx_int_8197;
-  PyObject *__pyx_int_8198;
-  PyObject *__pyx_int_8199;
-} __pyx_mstate;
+  typedef struct {
+    PyObject *__pyx_d;
+    PyObject *__pyx_b;
+    PyObject *__pyx_cython_runtime;
+    PyObject *__pyx_empty_tuple;
+    PyObject *__pyx_empty_bytes;
+    PyObject *__pyx_empty_unicode;
+    PyObject *__pyx_tuple[55];
+    PyObject *__pyx_string_tab[158];
+    PyObject *__pyx_number_tab[189];
+/* #### Code section: module_state_contents ### */
+/* PyFrozenDict.module_state_decls */
+#if CYTHON_COMPILING_IN_LIMITED_API
+PyObject *__Pyx_PyFrozenDictType;
+#endif
+
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
 
+#if CYTHON_USE_MODULE_STATE
 #ifdef __cplusplus
 namespace {
-  extern struct PyModuleDef __pyx_moduledef;
+extern struct PyModuleDef __pyx_moduledef;
 } /* anonymous namespace */
 #else
 static struct PyModuleDef __pyx_moduledef;
 #endif
 
-#define __pyx_mstate(o) ((__pyx_mstate *)__Pyx_PyModule_GetState(o))
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
 
-#define __pyx_mstate_global (__pyx_mstate(PyState_FindModule(&__pyx_moduledef)))
-
-#define __pyx_m (PyState_FindModule(&__pyx_moduledef))
-#endif
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u__2 __pyx_string_tab[0]
+#define __pyx_kp_u_Components_that_can_hold_the_CP __pyx_string_tab[1]
+#define __pyx_kp_u_Controller_buttons_as_bits_in_t __pyx_string_tab[2]
+#define __pyx_kp_u_Maps_mapper_names_to_mapper_val __pyx_string_tab[3]
+#define __pyx_kp_u_Nametable_mirroring_arrangement __pyx_string_tab[4]
+#define __pyx_kp_u_operand_2 __pyx_string_tab[5]
+#define __pyx_kp_u_operand __pyx_string_tab[6]
+#define __pyx_kp_u_operand_X __pyx_string_tab[7]
+#define __pyx_kp_u_operand_Y __pyx_string_tab[8]
+#define __pyx_kp_u_operand_value2 __pyx_string_tab[9]
+#define __pyx_kp_u_operand_3 __pyx_string_tab[10]
+#define __pyx_kp_u_operand_Y_2 __pyx_string_tab[11]
+#define __pyx_kp_u_operand_X_2 __pyx_string_tab[12]
+#define __pyx_kp_u_a __pyx_string_tab[13]
+#define __pyx_kp_u_value2 __pyx_string_tab[14]
+#define __pyx_kp_u_x __pyx_string_tab[15]
+#define __pyx_kp_u_y __pyx_string_tab[16]
+#define __pyx_kp_u_ __pyx_string_tab[17]
+#define __pyx_kp_u_absolute_x __pyx_string_tab[18]
+#define __pyx_kp_u_absolute_y __pyx_string_tab[19]
+#define __pyx_kp_u_indirect_x __pyx_string_tab[20]
+#define __pyx_kp_u_indirect_y __pyx_string_tab[21]
+#define __pyx_kp_u_zeropage_x __pyx_string_tab[22]
+#define __pyx_kp_u_zeropage_y __pyx_string_tab[23]
+#define __pyx_n_u_A __pyx_string_tab[24]
+#define __pyx_n_u_ADC __pyx_string_tab[25]
+#define __pyx_n_u_AND __pyx_string_tab[26]
+#define __pyx_n_u_ASL __pyx_string_tab[27]
+#define __pyx_n_u_AXROM __pyx_string_tab[28]
+#define __pyx_n_u_Absolute __pyx_string_tab[29]
+#define __pyx_n_u_AbsoluteX __pyx_string_tab[30]
+#define __pyx_n_u_AbsoluteY __pyx_string_tab[31]
+#define __pyx_n_u_AddressingMode __pyx_string_tab[32]
+#define __pyx_n_u_AddressingModeDisasmFormat __pyx_string_tab[33]
+#define __pyx_n_u_B __pyx_string_tab[34]
+#define __pyx_n_u_BCC __pyx_string_tab[35]
+#define __pyx_n_u_BCS __pyx_string_tab[36]
+#define __pyx_n_u_BEQ __pyx_string_tab[37]
+#define __pyx_n_u_BIT __pyx_string_tab[38]
+#define __pyx_n_u_BMI __pyx_string_tab[39]
+#define __pyx_n_u_BNE __pyx_string_tab[40]
+#define __pyx_n_u_BPL __pyx_string_tab[41]
+#define __pyx_n_u_BRK __pyx_string_tab[42]
+#define __pyx_n_u_BVC __pyx_string_tab[43]
+#define __pyx_n_u_BVS __pyx_string_tab[44]
+#define __pyx_n_u_Button __pyx_string_tab[45]
+#define __pyx_n_u_CARTRIDGE __pyx_string_tab[46]
+#define __pyx_n_u_CLC __pyx_string_tab[47]
+#define __pyx_n_u_CLD __pyx_string_tab[48]
+#define __pyx_n_u_CLI __pyx_string_tab[49]
+#define __pyx_n_u_CLV __pyx_string_tab[50]
+#define __pyx_n_u_CMP __pyx_string_tab[51]
+#define __pyx_n_u_CNROM __pyx_string_tab[52]
+#define __pyx_n_u_CPX __pyx_string_tab[53]
+#define __pyx_n_u_CPY __pyx_string_tab[54]
+#define __pyx_n_u_DEC __pyx_string_tab[55]
+#define __pyx_n_u_DEX __pyx_string_tab[56]
+#define __pyx_n_u_DEY __pyx_string_tab[57]
+#define __pyx_n_u_DMC __pyx_string_tab[58]
+#define __pyx_n_u_DOWN __pyx_string_tab[59]
+#define __pyx_n_u_EOR __pyx_string_tab[60]
+#define __pyx_n_u_FOUR_SCREEN __pyx_string_tab[61]
+#define __pyx_n_u_FRAME_COUNTER __pyx_string_tab[62]
+#define __pyx_n_u_HORIZONTAL __pyx_string_tab[63]
+#define __pyx_n_u_INC __pyx_string_tab[64]
+#define __pyx_n_u_INES __pyx_string_tab[65]
+#define __pyx_n_u_INES2_0 __pyx_string_tab[66]
+#define __pyx_n_u_INX __pyx_string_tab[67]
+#define __pyx_n_u_INY __pyx_string_tab[68]
+#define __pyx_n_u_IRQSource __pyx_string_tab[69]
+#define __pyx_n_u_Immediate __pyx_string_tab[70]
+#define __pyx_n_u_Implicit __pyx_string_tab[71]
+#define __pyx_n_u_Indirect __pyx_string_tab[72]
+#define __pyx_n_u_IndirectX __pyx_string_tab[73]
+#define __pyx_n_u_IndirectY __pyx_string_tab[74]
+#define __pyx_n_u_InstructionAddressingModeMap __pyx_string_tab[75]
+#define __pyx_n_u_InstructionCycleMap __pyx_string_tab[76]
+#define __pyx_n_u_InstructionDisasmExtras __pyx_string_tab[77]
+#define __pyx_n_u_InstructionLengthMap __pyx_string_tab[78]
+#define __pyx_n_u_InstructionMnemonicMap __pyx_string_tab[79]
+#define __pyx_n_u_InstructionPageCrossPenalty __pyx_string_tab[80]
+#define __pyx_n_u_JMP __pyx_string_tab[81]
+#define __pyx_n_u_JSR __pyx_string_tab[82]
+#define __pyx_n_u_LDA __pyx_string_tab[83]
+#define __pyx_n_u_LDX __pyx_string_tab[84]
+#define __pyx_n_u_LDY __pyx_string_tab[85]
+#define __pyx_n_u_LEFT __pyx_string_tab[86]
+#define __pyx_n_u_LSR __pyx_string_tab[87]
+#define __pyx_n_u_MMC1 __pyx_string_tab[88]
+#define __pyx_n_u_MMC2 __pyx_string_tab[89]
+#define __pyx_n_u_MMC3 __pyx_string_tab[90]
+#define __pyx_n_u_Mapper __pyx_string_tab[91]
+#define __pyx_n_u_Mirroring __pyx_string_tab[92]
+#define __pyx_n_u_NOP __pyx_string_tab[93]
+#define __pyx_n_u_NROM __pyx_string_tab[94]
+#define __pyx_n_u_NTSCPalette __pyx_string_tab[95]
+#define __pyx_n_u_OAMADDR __pyx_string_tab[96]
+#define __pyx_n_u_OAMDATA __pyx_string_tab[97]
+#define __pyx_n_u_ORA __pyx_string_tab[98]
+#define __pyx_n_u_PHA __pyx_string_tab[99]
+#define __pyx_n_u_PHP __pyx_string_tab[100]
+#define __pyx_n_u_PLA __pyx_string_tab[101]
+#define __pyx_n_u_PLP __pyx_string_tab[102]
+#define __pyx_n_u_PPUADDR __pyx_string_tab[103]
+#define __pyx_n_u_PPUCTRL __pyx_string_tab[104]
+#define __pyx_n_u_PPUDATA __pyx_string_tab[105]
+#define __pyx_n_u_PPUMASK __pyx_string_tab[106]
+#define __pyx_n_u_PPURegister __pyx_string_tab[107]
+#define __pyx_n_u_PPUSCROLL __pyx_string_tab[108]
+#define __pyx_n_u_PPUSTATUS __pyx_string_tab[109]
+#define __pyx_n_u_RIGHT __pyx_string_tab[110]
+#define __pyx_n_u_ROL __pyx_string_tab[111]
+#define __pyx_n_u_ROMFormat __pyx_string_tab[112]
+#define __pyx_n_u_ROR __pyx_string_tab[113]
+#define __pyx_n_u_RTI __pyx_string_tab[114]
+#define __pyx_n_u_RTS __pyx_string_tab[115]
+#define __pyx_n_u_Relative __pyx_string_tab[116]
+#define __pyx_n_u_SBC __pyx_string_tab[117]
+#define __pyx_n_u_SEC __pyx_string_tab[118]
+#define __pyx_n_u_SED __pyx_string_tab[119]
+#define __pyx_n_u_SEI __pyx_string_tab[120]
+#define __pyx_n_u_SELECT __pyx_string_tab[121]
+#define __pyx_n_u_SINGLE_SCREEN_LOWER __pyx_string_tab[122]
+#define __pyx_n_u_SINGLE_SCREEN_UPPER __pyx_string_tab[123]
+#define __pyx_n_u_STA __pyx_string_tab[124]
+#define __pyx_n_u_START __pyx_string_tab[125]
+#define __pyx_n_u_STX __pyx_string_tab[126]
+#define __pyx_n_u_STY __pyx_string_tab[127]
+#define __pyx_n_u_TAX __pyx_string_tab[128]
+#define __pyx_n_u_TAY __pyx_string_tab[129]
+#define __pyx_n_u_TSX __pyx_string_tab[130]
+#define __pyx_n_u_TXA __pyx_string_tab[131]
+#define __pyx_n_u_TXS __pyx_string_tab[132]
+#define __pyx_n_u_TYA __pyx_string_tab[133]
+#define __pyx_n_u_UP __pyx_string_tab[134]
+#define __pyx_n_u_UXROM __pyx_string_tab[135]
+#define __pyx_n_u_VERTICAL __pyx_string_tab[136]
+#define __pyx_n_u_ZeroPage __pyx_string_tab[137]
+#define __pyx_n_u_ZeroPageX __pyx_string_tab[138]
+#define __pyx_n_u_ZeroPageY __pyx_string_tab[139]
+#define __pyx_n_u_doc __pyx_string_tab[140]
+#define __pyx_n_u_main __pyx_string_tab[141]
+#define __pyx_n_u_metaclass __pyx_string_tab[142]
+#define __pyx_n_u_module __pyx_string_tab[143]
+#define __pyx_n_u_name __pyx_string_tab[144]
+#define __pyx_n_u_prepare __pyx_string_tab[145]
+#define __pyx_n_u_qualname __pyx_string_tab[146]
+#define __pyx_n_u_test __pyx_string_tab[147]
+#define __pyx_n_u_absolute __pyx_string_tab[148]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[149]
+#define __pyx_n_u_fromkeys __pyx_string_tab[150]
+#define __pyx_n_u_immediate __pyx_string_tab[151]
+#define __pyx_n_u_implicit __pyx_string_tab[152]
+#define __pyx_n_u_indirect __pyx_string_tab[153]
+#define __pyx_n_u_nespy_enum __pyx_string_tab[154]
+#define __pyx_n_u_relative __pyx_string_tab[155]
+#define __pyx_n_u_setdefault __pyx_string_tab[156]
+#define __pyx_n_u_zeropage __pyx_string_tab[157]
+#define __pyx_int_0 __pyx_number_tab[0]
+#define __pyx_int_1 __pyx_number_tab[1]
+#define __pyx_int_2 __pyx_number_tab[2]
+#define __pyx_int_3 __pyx_number_tab[3]
+#define __pyx_int_4 __pyx_number_tab[4]
+#define __pyx_int_5 __pyx_number_tab[5]
+#define __pyx_int_6 __pyx_number_tab[6]
+#define __pyx_int_7 __pyx_number_tab[7]
+#define __pyx_int_8 __pyx_number_tab[8]
+#define __pyx_int_9 __pyx_number_tab[9]
+#define __pyx_int_10 __pyx_number_tab[10]
+#define __pyx_int_13 __pyx_number_tab[11]
+#define __pyx_int_14 __pyx_number_tab[12]
+#define __pyx_int_16 __pyx_number_tab[13]
+#define __pyx_int_17 __pyx_number_tab[14]
+#define __pyx_int_20 __pyx_number_tab[15]
+#define __pyx_int_21 __pyx_number_tab[16]
+#define __pyx_int_22 __pyx_number_tab[17]
+#define __pyx_int_24 __pyx_number_tab[18]
+#define __pyx_int_25 __pyx_number_tab[19]
+#define __pyx_int_26 __pyx_number_tab[20]
+#define __pyx_int_29 __pyx_number_tab[21]
+#define __pyx_int_30 __pyx_number_tab[22]
+#define __pyx_int_32 __pyx_number_tab[23]
+#define __pyx_int_33 __pyx_number_tab[24]
+#define __pyx_int_34 __pyx_number_tab[25]
+#define __pyx_int_36 __pyx_number_tab[26]
+#define __pyx_int_37 __pyx_number_tab[27]
+#define __pyx_int_38 __pyx_number_tab[28]
+#define __pyx_int_40 __pyx_number_tab[29]
+#define __pyx_int_41 __pyx_number_tab[30]
+#define __pyx_int_42 __pyx_number_tab[31]
+#define __pyx_int_44 __pyx_number_tab[32]
+#define __pyx_int_45 __pyx_number_tab[33]
+#define __pyx_int_46 __pyx_number_tab[34]
+#define __pyx_int_48 __pyx_number_tab[35]
+#define __pyx_int_49 __pyx_number_tab[36]
+#define __pyx_int_50 __pyx_number_tab[37]
+#define __pyx_int_53 __pyx_number_tab[38]
+#define __pyx_int_54 __pyx_number_tab[39]
+#define __pyx_int_56 __pyx_number_tab[40]
+#define __pyx_int_57 __pyx_number_tab[41]
+#define __pyx_int_58 __pyx_number_tab[42]
+#define __pyx_int_60 __pyx_number_tab[43]
+#define __pyx_int_61 __pyx_number_tab[44]
+#define __pyx_int_62 __pyx_number_tab[45]
+#define __pyx_int_64 __pyx_number_tab[46]
+#define __pyx_int_65 __pyx_number_tab[47]
+#define __pyx_int_68 __pyx_number_tab[48]
+#define __pyx_int_69 __pyx_number_tab[49]
+#define __pyx_int_70 __pyx_number_tab[50]
+#define __pyx_int_72 __pyx_number_tab[51]
+#define __pyx_int_73 __pyx_number_tab[52]
+#define __pyx_int_74 __pyx_number_tab[53]
+#define __pyx_int_76 __pyx_number_tab[54]
+#define __pyx_int_77 __pyx_number_tab[55]
+#define __pyx_int_78 __pyx_number_tab[56]
+#define __pyx_int_80 __pyx_number_tab[57]
+#define __pyx_int_81 __pyx_number_tab[58]
+#define __pyx_int_84 __pyx_number_tab[59]
+#define __pyx_int_85 __pyx_number_tab[60]
+#define __pyx_int_86 __pyx_number_tab[61]
+#define __pyx_int_88 __pyx_number_tab[62]
+#define __pyx_int_89 __pyx_number_tab[63]
+#define __pyx_int_90 __pyx_number_tab[64]
+#define __pyx_int_92 __pyx_number_tab[65]
+#define __pyx_int_93 __pyx_number_tab[66]
+#define __pyx_int_94 __pyx_number_tab[67]
+#define __pyx_int_96 __pyx_number_tab[68]
+#define __pyx_int_97 __pyx_number_tab[69]
+#define __pyx_int_98 __pyx_number_tab[70]
+#define __pyx_int_100 __pyx_number_tab[71]
+#define __pyx_int_101 __pyx_number_tab[72]
+#define __pyx_int_102 __pyx_number_tab[73]
+#define __pyx_int_104 __pyx_number_tab[74]
+#define __pyx_int_105 __pyx_number_tab[75]
+#define __pyx_int_106 __pyx_number_tab[76]
+#define __pyx_int_108 __pyx_number_tab[77]
+#define __pyx_int_109 __pyx_number_tab[78]
+#define __pyx_int_110 __pyx_number_tab[79]
+#define __pyx_int_112 __pyx_number_tab[80]
+#define __pyx_int_113 __pyx_number_tab[81]
+#define __pyx_int_114 __pyx_number_tab[82]
+#define __pyx_int_116 __pyx_number_tab[83]
+#define __pyx_int_117 __pyx_number_tab[84]
+#define __pyx_int_118 __pyx_number_tab[85]
+#define __pyx_int_120 __pyx_number_tab[86]
+#define __pyx_int_121 __pyx_number_tab[87]
+#define __pyx_int_122 __pyx_number_tab[88]
+#define __pyx_int_124 __pyx_number_tab[89]
+#define __pyx_int_125 __pyx_number_tab[90]
+#define __pyx_int_126 __pyx_number_tab[91]
+#define __pyx_int_128 __pyx_number_tab[92]
+#define __pyx_int_129 __pyx_number_tab[93]
+#define __pyx_int_130 __pyx_number_tab[94]
+#define __pyx_int_132 __pyx_number_tab[95]
+#define __pyx_int_133 __pyx_number_tab[96]
+#define __pyx_int_134 __pyx_number_tab[97]
+#define __pyx_int_136 __pyx_number_tab[98]
+#define __pyx_int_137 __pyx_number_tab[99]
+#define __pyx_int_138 __pyx_number_tab[100]
+#define __pyx_int_140 __pyx_number_tab[101]
+#define __pyx_int_141 __pyx_number_tab[102]
+#define __pyx_int_142 __pyx_number_tab[103]
+#define __pyx_int_144 __pyx_number_tab[104]
+#define __pyx_int_145 __pyx_number_tab[105]
+#define __pyx_int_148 __pyx_number_tab[106]
+#define __pyx_int_149 __pyx_number_tab[107]
+#define __pyx_int_150 __pyx_number_tab[108]
+#define __pyx_int_152 __pyx_number_tab[109]
+#define __pyx_int_153 __pyx_number_tab[110]
+#define __pyx_int_154 __pyx_number_tab[111]
+#define __pyx_int_157 __pyx_number_tab[112]
+#define __pyx_int_160 __pyx_number_tab[113]
+#define __pyx_int_161 __pyx_number_tab[114]
+#define __pyx_int_162 __pyx_number_tab[115]
+#define __pyx_int_164 __pyx_number_tab[116]
+#define __pyx_int_165 __pyx_number_tab[117]
+#define __pyx_int_166 __pyx_number_tab[118]
+#define __pyx_int_168 __pyx_number_tab[119]
+#define __pyx_int_169 __pyx_number_tab[120]
+#define __pyx_int_170 __pyx_number_tab[121]
+#define __pyx_int_172 __pyx_number_tab[122]
+#define __pyx_int_173 __pyx_number_tab[123]
+#define __pyx_int_174 __pyx_number_tab[124]
+#define __pyx_int_176 __pyx_number_tab[125]
+#define __pyx_int_177 __pyx_number_tab[126]
+#define __pyx_int_178 __pyx_number_tab[127]
+#define __pyx_int_180 __pyx_number_tab[128]
+#define __pyx_int_181 __pyx_number_tab[129]
+#define __pyx_int_182 __pyx_number_tab[130]
+#define __pyx_int_184 __pyx_number_tab[131]
+#define __pyx_int_185 __pyx_number_tab[132]
+#define __pyx_int_186 __pyx_number_tab[133]
+#define __pyx_int_188 __pyx_number_tab[134]
+#define __pyx_int_189 __pyx_number_tab[135]
+#define __pyx_int_190 __pyx_number_tab[136]
+#define __pyx_int_192 __pyx_number_tab[137]
+#define __pyx_int_193 __pyx_number_tab[138]
+#define __pyx_int_194 __pyx_number_tab[139]
+#define __pyx_int_196 __pyx_number_tab[140]
+#define __pyx_int_197 __pyx_number_tab[141]
+#define __pyx_int_198 __pyx_number_tab[142]
+#define __pyx_int_200 __pyx_number_tab[143]
+#define __pyx_int_201 __pyx_number_tab[144]
+#define __pyx_int_202 __pyx_number_tab[145]
+#define __pyx_int_204 __pyx_number_tab[146]
+#define __pyx_int_205 __pyx_number_tab[147]
+#define __pyx_int_206 __pyx_number_tab[148]
+#define __pyx_int_208 __pyx_number_tab[149]
+#define __pyx_int_209 __pyx_number_tab[150]
+#define __pyx_int_210 __pyx_number_tab[151]
+#define __pyx_int_212 __pyx_number_tab[152]
+#define __pyx_int_213 __pyx_number_tab[153]
+#define __pyx_int_214 __pyx_number_tab[154]
+#define __pyx_int_216 __pyx_number_tab[155]
+#define __pyx_int_217 __pyx_number_tab[156]
+#define __pyx_int_218 __pyx_number_tab[157]
+#define __pyx_int_221 __pyx_number_tab[158]
+#define __pyx_int_222 __pyx_number_tab[159]
+#define __pyx_int_224 __pyx_number_tab[160]
+#define __pyx_int_225 __pyx_number_tab[161]
+#define __pyx_int_226 __pyx_number_tab[162]
+#define __pyx_int_228 __pyx_number_tab[163]
+#define __pyx_int_229 __pyx_number_tab[164]
+#define __pyx_int_230 __pyx_number_tab[165]
+#define __pyx_int_232 __pyx_number_tab[166]
+#define __pyx_int_233 __pyx_number_tab[167]
+#define __pyx_int_234 __pyx_number_tab[168]
+#define __pyx_int_236 __pyx_number_tab[169]
+#define __pyx_int_237 __pyx_number_tab[170]
+#define __pyx_int_238 __pyx_number_tab[171]
+#define __pyx_int_240 __pyx_number_tab[172]
+#define __pyx_int_241 __pyx_number_tab[173]
+#define __pyx_int_245 __pyx_number_tab[174]
+#define __pyx_int_246 __pyx_number_tab[175]
+#define __pyx_int_248 __pyx_number_tab[176]
+#define __pyx_int_249 __pyx_number_tab[177]
+#define __pyx_int_250 __pyx_number_tab[178]
+#define __pyx_int_253 __pyx_number_tab[179]
+#define __pyx_int_254 __pyx_number_tab[180]
+#define __pyx_int_8192 __pyx_number_tab[181]
+#define __pyx_int_8193 __pyx_number_tab[182]
+#define __pyx_int_8194 __pyx_number_tab[183]
+#define __pyx_int_8195 __pyx_number_tab[184]
+#define __pyx_int_8196 __pyx_number_tab[185]
+#define __pyx_int_8197 __pyx_number_tab[186]
+#define __pyx_int_8198 __pyx_number_tab[187]
+#define __pyx_int_8199 __pyx_number_tab[188]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
-static int __pyx_m_clear(PyObject *m) {
-  __pyx_mstate *clear_module_state = __pyx_mstate(m);
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
   if (!clear_module_state) return 0;
   Py_CLEAR(clear_module_state->__pyx_d);
   Py_CLEAR(clear_module_state->__pyx_b);
@@ -2194,1682 +2591,123 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_empty_tuple);
   Py_CLEAR(clear_module_state->__pyx_empty_bytes);
   Py_CLEAR(clear_module_state->__pyx_empty_unicode);
-  #ifdef __Pyx_CyFunction_USED
-  Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  Py_CLEAR(clear_module_state->__pyx_FusedFunctionType);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
   #endif
-  Py_CLEAR(clear_module_state->__pyx_kp_u_);
-  Py_CLEAR(clear_module_state->__pyx_n_u_ADC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_AND);
-  Py_CLEAR(clear_module_state->__pyx_n_u_ASL);
-  Py_CLEAR(clear_module_state->__pyx_n_s_AXROM);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Absolute);
-  Py_CLEAR(clear_module_state->__pyx_n_s_AbsoluteX);
-  Py_CLEAR(clear_module_state->__pyx_n_s_AbsoluteY);
-  Py_CLEAR(clear_module_state->__pyx_n_s_AddressingMode);
-  Py_CLEAR(clear_module_state->__pyx_n_s_AddressingModeDisasmFormat);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BCC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BCS);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BEQ);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BIT);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BMI);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BNE);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BPL);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BRK);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BVC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_BVS);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CLC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CLD);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CLI);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CLV);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CMP);
-  Py_CLEAR(clear_module_state->__pyx_n_s_CNROM);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CPX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_CPY);
-  Py_CLEAR(clear_module_state->__pyx_n_u_DEC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_DEX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_DEY);
-  Py_CLEAR(clear_module_state->__pyx_n_u_EOR);
-  Py_CLEAR(clear_module_state->__pyx_n_u_INC);
-  Py_CLEAR(clear_module_state->__pyx_n_s_INES);
-  Py_CLEAR(clear_module_state->__pyx_n_s_INES2_0);
-  Py_CLEAR(clear_module_state->__pyx_n_u_INX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_INY);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Immediate);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Implicit);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Indirect);
-  Py_CLEAR(clear_module_state->__pyx_n_s_IndirectX);
-  Py_CLEAR(clear_module_state->__pyx_n_s_IndirectY);
-  Py_CLEAR(clear_module_state->__pyx_n_s_InstructionAddressingModeMap);
-  Py_CLEAR(clear_module_state->__pyx_n_s_InstructionDisasmExtras);
-  Py_CLEAR(clear_module_state->__pyx_n_s_InstructionLengthMap);
-  Py_CLEAR(clear_module_state->__pyx_n_s_InstructionMnemonicMap);
-  Py_CLEAR(clear_module_state->__pyx_n_u_JMP);
-  Py_CLEAR(clear_module_state->__pyx_n_u_JSR);
-  Py_CLEAR(clear_module_state->__pyx_n_u_LDA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_LDX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_LDY);
-  Py_CLEAR(clear_module_state->__pyx_n_u_LSR);
-  Py_CLEAR(clear_module_state->__pyx_n_s_MMC1);
-  Py_CLEAR(clear_module_state->__pyx_n_s_MMC2);
-  Py_CLEAR(clear_module_state->__pyx_n_s_MMC3);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Mapper);
-  Py_CLEAR(clear_module_state->__pyx_kp_s_Maps_mapper_names_to_mapper_val);
-  Py_CLEAR(clear_module_state->__pyx_n_u_NOP);
-  Py_CLEAR(clear_module_state->__pyx_n_s_NROM);
-  Py_CLEAR(clear_module_state->__pyx_n_s_OAMADDR);
-  Py_CLEAR(clear_module_state->__pyx_n_s_OAMDATA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_ORA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_PHA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_PHP);
-  Py_CLEAR(clear_module_state->__pyx_n_u_PLA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_PLP);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUADDR);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUCTRL);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUDATA);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUMASK);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPURegister);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUSCROLL);
-  Py_CLEAR(clear_module_state->__pyx_n_s_PPUSTATUS);
-  Py_CLEAR(clear_module_state->__pyx_n_u_ROL);
-  Py_CLEAR(clear_module_state->__pyx_n_s_ROMFormat);
-  Py_CLEAR(clear_module_state->__pyx_n_u_ROR);
-  Py_CLEAR(clear_module_state->__pyx_n_u_RTI);
-  Py_CLEAR(clear_module_state->__pyx_n_u_RTS);
-  Py_CLEAR(clear_module_state->__pyx_n_s_Relative);
-  Py_CLEAR(clear_module_state->__pyx_n_u_SBC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_SEC);
-  Py_CLEAR(clear_module_state->__pyx_n_u_SED);
-  Py_CLEAR(clear_module_state->__pyx_n_u_SEI);
-  Py_CLEAR(clear_module_state->__pyx_n_u_STA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_STX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_STY);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TAX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TAY);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TSX);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TXA);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TXS);
-  Py_CLEAR(clear_module_state->__pyx_n_u_TYA);
-  Py_CLEAR(clear_module_state->__pyx_n_s_UXROM);
-  Py_CLEAR(clear_module_state->__pyx_n_s_ZeroPage);
-  Py_CLEAR(clear_module_state->__pyx_n_s_ZeroPageX);
-  Py_CLEAR(clear_module_state->__pyx_n_s_ZeroPageY);
-  Py_CLEAR(clear_module_state->__pyx_n_s__2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_a);
-  Py_CLEAR(clear_module_state->__pyx_n_u_absolute);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_absolute_x);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_absolute_y);
-  Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
-  Py_CLEAR(clear_module_state->__pyx_n_s_dict);
-  Py_CLEAR(clear_module_state->__pyx_n_s_doc);
-  Py_CLEAR(clear_module_state->__pyx_n_s_fromkeys);
-  Py_CLEAR(clear_module_state->__pyx_n_u_immediate);
-  Py_CLEAR(clear_module_state->__pyx_n_u_implicit);
-  Py_CLEAR(clear_module_state->__pyx_n_u_indirect);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_indirect_x);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_indirect_y);
-  Py_CLEAR(clear_module_state->__pyx_n_s_init_subclass);
-  Py_CLEAR(clear_module_state->__pyx_n_s_main);
-  Py_CLEAR(clear_module_state->__pyx_n_s_metaclass);
-  Py_CLEAR(clear_module_state->__pyx_n_s_module);
-  Py_CLEAR(clear_module_state->__pyx_n_s_name);
-  Py_CLEAR(clear_module_state->__pyx_n_s_nespy_enum);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_3);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_X);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_X_2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_Y);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_Y_2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_operand_value2);
-  Py_CLEAR(clear_module_state->__pyx_n_s_prepare);
-  Py_CLEAR(clear_module_state->__pyx_n_s_qualname);
-  Py_CLEAR(clear_module_state->__pyx_n_u_relative);
-  Py_CLEAR(clear_module_state->__pyx_n_s_set_name);
-  Py_CLEAR(clear_module_state->__pyx_n_s_super);
-  Py_CLEAR(clear_module_state->__pyx_n_s_test);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_value2);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_x);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_y);
-  Py_CLEAR(clear_module_state->__pyx_n_u_zeropage);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_zeropage_x);
-  Py_CLEAR(clear_module_state->__pyx_kp_u_zeropage_y);
-  Py_CLEAR(clear_module_state->__pyx_int_0);
-  Py_CLEAR(clear_module_state->__pyx_int_1);
-  Py_CLEAR(clear_module_state->__pyx_int_2);
-  Py_CLEAR(clear_module_state->__pyx_int_3);
-  Py_CLEAR(clear_module_state->__pyx_int_4);
-  Py_CLEAR(clear_module_state->__pyx_int_5);
-  Py_CLEAR(clear_module_state->__pyx_int_6);
-  Py_CLEAR(clear_module_state->__pyx_int_7);
-  Py_CLEAR(clear_module_state->__pyx_int_8);
-  Py_CLEAR(clear_module_state->__pyx_int_9);
-  Py_CLEAR(clear_module_state->__pyx_int_10);
-  Py_CLEAR(clear_module_state->__pyx_int_13);
-  Py_CLEAR(clear_module_state->__pyx_int_14);
-  Py_CLEAR(clear_module_state->__pyx_int_16);
-  Py_CLEAR(clear_module_state->__pyx_int_17);
-  Py_CLEAR(clear_module_state->__pyx_int_21);
-  Py_CLEAR(clear_module_state->__pyx_int_22);
-  Py_CLEAR(clear_module_state->__pyx_int_24);
-  Py_CLEAR(clear_module_state->__pyx_int_25);
-  Py_CLEAR(clear_module_state->__pyx_int_26);
-  Py_CLEAR(clear_module_state->__pyx_int_29);
-  Py_CLEAR(clear_module_state->__pyx_int_30);
-  Py_CLEAR(clear_module_state->__pyx_int_32);
-  Py_CLEAR(clear_module_state->__pyx_int_33);
-  Py_CLEAR(clear_module_state->__pyx_int_36);
-  Py_CLEAR(clear_module_state->__pyx_int_37);
-  Py_CLEAR(clear_module_state->__pyx_int_38);
-  Py_CLEAR(clear_module_state->__pyx_int_40);
-  Py_CLEAR(clear_module_state->__pyx_int_41);
-  Py_CLEAR(clear_module_state->__pyx_int_42);
-  Py_CLEAR(clear_module_state->__pyx_int_44);
-  Py_CLEAR(clear_module_state->__pyx_int_45);
-  Py_CLEAR(clear_module_state->__pyx_int_46);
-  Py_CLEAR(clear_module_state->__pyx_int_48);
-  Py_CLEAR(clear_module_state->__pyx_int_49);
-  Py_CLEAR(clear_module_state->__pyx_int_53);
-  Py_CLEAR(clear_module_state->__pyx_int_54);
-  Py_CLEAR(clear_module_state->__pyx_int_56);
-  Py_CLEAR(clear_module_state->__pyx_int_57);
-  Py_CLEAR(clear_module_state->__pyx_int_58);
-  Py_CLEAR(clear_module_state->__pyx_int_61);
-  Py_CLEAR(clear_module_state->__pyx_int_62);
-  Py_CLEAR(clear_module_state->__pyx_int_64);
-  Py_CLEAR(clear_module_state->__pyx_int_65);
-  Py_CLEAR(clear_module_state->__pyx_int_69);
-  Py_CLEAR(clear_module_state->__pyx_int_70);
-  Py_CLEAR(clear_module_state->__pyx_int_72);
-  Py_CLEAR(clear_module_state->__pyx_int_73);
-  Py_CLEAR(clear_module_state->__pyx_int_74);
-  Py_CLEAR(clear_module_state->__pyx_int_76);
-  Py_CLEAR(clear_module_state->__pyx_int_77);
-  Py_CLEAR(clear_module_state->__pyx_int_78);
-  Py_CLEAR(clear_module_state->__pyx_int_80);
-  Py_CLEAR(clear_module_state->__pyx_int_81);
-  Py_CLEAR(clear_module_state->__pyx_int_85);
-  Py_CLEAR(clear_module_state->__pyx_int_86);
-  Py_CLEAR(clear_module_state->__pyx_int_88);
-  Py_CLEAR(clear_module_state->__pyx_int_89);
-  Py_CLEAR(clear_module_state->__pyx_int_90);
-  Py_CLEAR(clear_module_state->__pyx_int_93);
-  Py_CLEAR(clear_module_state->__pyx_int_94);
-  Py_CLEAR(clear_module_state->__pyx_int_96);
-  Py_CLEAR(clear_module_state->__pyx_int_97);
-  Py_CLEAR(clear_module_state->__pyx_int_101);
-  Py_CLEAR(clear_module_state->__pyx_int_102);
-  Py_CLEAR(clear_module_state->__pyx_int_104);
-  Py_CLEAR(clear_module_state->__pyx_int_105);
-  Py_CLEAR(clear_module_state->__pyx_int_106);
-  Py_CLEAR(clear_module_state->__pyx_int_108);
-  Py_CLEAR(clear_module_state->__pyx_int_109);
-  Py_CLEAR(clear_module_state->__pyx_int_110);
-  Py_CLEAR(clear_module_state->__pyx_int_112);
-  Py_CLEAR(clear_module_state->__pyx_int_113);
-  Py_CLEAR(clear_module_state->__pyx_int_117);
-  Py_CLEAR(clear_module_state->__pyx_int_118);
-  Py_CLEAR(clear_module_state->__pyx_int_120);
-  Py_CLEAR(clear_module_state->__pyx_int_121);
-  Py_CLEAR(clear_module_state->__pyx_int_122);
-  Py_CLEAR(clear_module_state->__pyx_int_125);
-  Py_CLEAR(clear_module_state->__pyx_int_126);
-  Py_CLEAR(clear_module_state->__pyx_int_128);
-  Py_CLEAR(clear_module_state->__pyx_int_129);
-  Py_CLEAR(clear_module_state->__pyx_int_130);
-  Py_CLEAR(clear_module_state->__pyx_int_132);
-  Py_CLEAR(clear_module_state->__pyx_int_133);
-  Py_CLEAR(clear_module_state->__pyx_int_134);
-  Py_CLEAR(clear_module_state->__pyx_int_136);
-  Py_CLEAR(clear_module_state->__pyx_int_137);
-  Py_CLEAR(clear_module_state->__pyx_int_138);
-  Py_CLEAR(clear_module_state->__pyx_int_140);
-  Py_CLEAR(clear_module_state->__pyx_int_141);
-  Py_CLEAR(clear_module_state->__pyx_int_142);
-  Py_CLEAR(clear_module_state->__pyx_int_144);
-  Py_CLEAR(clear_module_state->__pyx_int_145);
-  Py_CLEAR(clear_module_state->__pyx_int_148);
-  Py_CLEAR(clear_module_state->__pyx_int_149);
-  Py_CLEAR(clear_module_state->__pyx_int_150);
-  Py_CLEAR(clear_module_state->__pyx_int_152);
-  Py_CLEAR(clear_module_state->__pyx_int_153);
-  Py_CLEAR(clear_module_state->__pyx_int_154);
-  Py_CLEAR(clear_module_state->__pyx_int_157);
-  Py_CLEAR(clear_module_state->__pyx_int_160);
-  Py_CLEAR(clear_module_state->__pyx_int_161);
-  Py_CLEAR(clear_module_state->__pyx_int_162);
-  Py_CLEAR(clear_module_state->__pyx_int_164);
-  Py_CLEAR(clear_module_state->__pyx_int_165);
-  Py_CLEAR(clear_module_state->__pyx_int_166);
-  Py_CLEAR(clear_module_state->__pyx_int_168);
-  Py_CLEAR(clear_module_state->__pyx_int_169);
-  Py_CLEAR(clear_module_state->__pyx_int_170);
-  Py_CLEAR(clear_module_state->__pyx_int_172);
-  Py_CLEAR(clear_module_state->__pyx_int_173);
-  Py_CLEAR(clear_module_state->__pyx_int_174);
-  Py_CLEAR(clear_module_state->__pyx_int_176);
-  Py_CLEAR(clear_module_state->__pyx_int_177);
-  Py_CLEAR(clear_module_state->__pyx_int_180);
-  Py_CLEAR(clear_module_state->__pyx_int_181);
-  Py_CLEAR(clear_module_state->__pyx_int_182);
-  Py_CLEAR(clear_module_state->__pyx_int_184);
-  Py_CLEAR(clear_module_state->__pyx_int_185);
-  Py_CLEAR(clear_module_state->__pyx_int_186);
-  Py_CLEAR(clear_module_state->__pyx_int_188);
-  Py_CLEAR(clear_module_state->__pyx_int_189);
-  Py_CLEAR(clear_module_state->__pyx_int_190);
-  Py_CLEAR(clear_module_state->__pyx_int_192);
-  Py_CLEAR(clear_module_state->__pyx_int_193);
-  Py_CLEAR(clear_module_state->__pyx_int_194);
-  Py_CLEAR(clear_module_state->__pyx_int_196);
-  Py_CLEAR(clear_module_state->__pyx_int_197);
-  Py_CLEAR(clear_module_state->__pyx_int_198);
-  Py_CLEAR(clear_module_state->__pyx_int_200);
-  Py_CLEAR(clear_module_state->__pyx_int_201);
-  Py_CLEAR(clear_module_state->__pyx_int_202);
-  Py_CLEAR(clear_module_state->__pyx_int_204);
-  Py_CLEAR(clear_module_state->__pyx_int_205);
-  Py_CLEAR(clear_module_state->__pyx_int_206);
-  Py_CLEAR(clear_module_state->__pyx_int_208);
-  Py_CLEAR(clear_module_state->__pyx_int_209);
-  Py_CLEAR(clear_module_state->__pyx_int_213);
-  Py_CLEAR(clear_module_state->__pyx_int_214);
-  Py_CLEAR(clear_module_state->__pyx_int_216);
-  Py_CLEAR(clear_module_state->__pyx_int_217);
-  Py_CLEAR(clear_module_state->__pyx_int_218);
-  Py_CLEAR(clear_module_state->__pyx_int_221);
-  Py_CLEAR(clear_module_state->__pyx_int_222);
-  Py_CLEAR(clear_module_state->__pyx_int_224);
-  Py_CLEAR(clear_module_state->__pyx_int_225);
-  Py_CLEAR(clear_module_state->__pyx_int_226);
-  Py_CLEAR(clear_module_state->__pyx_int_228);
-  Py_CLEAR(clear_module_state->__pyx_int_229);
-  Py_CLEAR(clear_module_state->__pyx_int_230);
-  Py_CLEAR(clear_module_state->__pyx_int_232);
-  Py_CLEAR(clear_module_state->__pyx_int_233);
-  Py_CLEAR(clear_module_state->__pyx_int_234);
-  Py_CLEAR(clear_module_state->__pyx_int_236);
-  Py_CLEAR(clear_module_state->__pyx_int_237);
-  Py_CLEAR(clear_module_state->__pyx_int_238);
-  Py_CLEAR(clear_module_state->__pyx_int_240);
-  Py_CLEAR(clear_module_state->__pyx_int_241);
-  Py_CLEAR(clear_module_state->__pyx_int_245);
-  Py_CLEAR(clear_module_state->__pyx_int_246);
-  Py_CLEAR(clear_module_state->__pyx_int_248);
-  Py_CLEAR(clear_module_state->__pyx_int_249);
-  Py_CLEAR(clear_module_state->__pyx_int_250);
-  Py_CLEAR(clear_module_state->__pyx_int_253);
-  Py_CLEAR(clear_module_state->__pyx_int_254);
-  Py_CLEAR(clear_module_state->__pyx_int_8192);
-  Py_CLEAR(clear_module_state->__pyx_int_8193);
-  Py_CLEAR(clear_module_state->__pyx_int_8194);
-  Py_CLEAR(clear_module_state->__pyx_int_8195);
-  Py_CLEAR(clear_module_state->__pyx_int_8196);
-  Py_CLEAR(clear_module_state->__pyx_int_8197);
-  Py_CLEAR(clear_module_state->__pyx_int_8198);
-  Py_CLEAR(clear_module_state->__pyx_int_8199);
-  return 0;
+  for (int i=0; i<55; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<158; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<189; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* #### Code section: module_state_clear_end ### */
+return 0;
 }
 #endif
 /* #### Code section: module_state_traverse ### */
 #if CYTHON_USE_MODULE_STATE
-static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
-  __pyx_mstate *traverse_module_state = __pyx_mstate(m);
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
   if (!traverse_module_state) return 0;
   Py_VISIT(traverse_module_state->__pyx_d);
   Py_VISIT(traverse_module_state->__pyx_b);
   Py_VISIT(traverse_module_state->__pyx_cython_runtime);
-  Py_VISIT(traverse_module_state->__pyx_empty_tuple);
-  Py_VISIT(traverse_module_state->__pyx_empty_bytes);
-  Py_VISIT(traverse_module_state->__pyx_empty_unicode);
-  #ifdef __Pyx_CyFunction_USED
-  Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
-  #endif
-  Py_VISIT(traverse_module_state->__pyx_kp_u_);
-  Py_VISIT(traverse_module_state->__pyx_n_u_ADC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_AND);
-  Py_VISIT(traverse_module_state->__pyx_n_u_ASL);
-  Py_VISIT(traverse_module_state->__pyx_n_s_AXROM);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Absolute);
-  Py_VISIT(traverse_module_state->__pyx_n_s_AbsoluteX);
-  Py_VISIT(traverse_module_state->__pyx_n_s_AbsoluteY);
-  Py_VISIT(traverse_module_state->__pyx_n_s_AddressingMode);
-  Py_VISIT(traverse_module_state->__pyx_n_s_AddressingModeDisasmFormat);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BCC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BCS);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BEQ);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BIT);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BMI);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BNE);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BPL);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BRK);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BVC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_BVS);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CLC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CLD);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CLI);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CLV);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CMP);
-  Py_VISIT(traverse_module_state->__pyx_n_s_CNROM);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CPX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_CPY);
-  Py_VISIT(traverse_module_state->__pyx_n_u_DEC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_DEX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_DEY);
-  Py_VISIT(traverse_module_state->__pyx_n_u_EOR);
-  Py_VISIT(traverse_module_state->__pyx_n_u_INC);
-  Py_VISIT(traverse_module_state->__pyx_n_s_INES);
-  Py_VISIT(traverse_module_state->__pyx_n_s_INES2_0);
-  Py_VISIT(traverse_module_state->__pyx_n_u_INX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_INY);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Immediate);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Implicit);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Indirect);
-  Py_VISIT(traverse_module_state->__pyx_n_s_IndirectX);
-  Py_VISIT(traverse_module_state->__pyx_n_s_IndirectY);
-  Py_VISIT(traverse_module_state->__pyx_n_s_InstructionAddressingModeMap);
-  Py_VISIT(traverse_module_state->__pyx_n_s_InstructionDisasmExtras);
-  Py_VISIT(traverse_module_state->__pyx_n_s_InstructionLengthMap);
-  Py_VISIT(traverse_module_state->__pyx_n_s_InstructionMnemonicMap);
-  Py_VISIT(traverse_module_state->__pyx_n_u_JMP);
-  Py_VISIT(traverse_module_state->__pyx_n_u_JSR);
-  Py_VISIT(traverse_module_state->__pyx_n_u_LDA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_LDX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_LDY);
-  Py_VISIT(traverse_module_state->__pyx_n_u_LSR);
-  Py_VISIT(traverse_module_state->__pyx_n_s_MMC1);
-  Py_VISIT(traverse_module_state->__pyx_n_s_MMC2);
-  Py_VISIT(traverse_module_state->__pyx_n_s_MMC3);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Mapper);
-  Py_VISIT(traverse_module_state->__pyx_kp_s_Maps_mapper_names_to_mapper_val);
-  Py_VISIT(traverse_module_state->__pyx_n_u_NOP);
-  Py_VISIT(traverse_module_state->__pyx_n_s_NROM);
-  Py_VISIT(traverse_module_state->__pyx_n_s_OAMADDR);
-  Py_VISIT(traverse_module_state->__pyx_n_s_OAMDATA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_ORA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_PHA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_PHP);
-  Py_VISIT(traverse_module_state->__pyx_n_u_PLA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_PLP);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUADDR);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUCTRL);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUDATA);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUMASK);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPURegister);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUSCROLL);
-  Py_VISIT(traverse_module_state->__pyx_n_s_PPUSTATUS);
-  Py_VISIT(traverse_module_state->__pyx_n_u_ROL);
-  Py_VISIT(traverse_module_state->__pyx_n_s_ROMFormat);
-  Py_VISIT(traverse_module_state->__pyx_n_u_ROR);
-  Py_VISIT(traverse_module_state->__pyx_n_u_RTI);
-  Py_VISIT(traverse_module_state->__pyx_n_u_RTS);
-  Py_VISIT(traverse_module_state->__pyx_n_s_Relative);
-  Py_VISIT(traverse_module_state->__pyx_n_u_SBC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_SEC);
-  Py_VISIT(traverse_module_state->__pyx_n_u_SED);
-  Py_VISIT(traverse_module_state->__pyx_n_u_SEI);
-  Py_VISIT(traverse_module_state->__pyx_n_u_STA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_STX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_STY);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TAX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TAY);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TSX);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TXA);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TXS);
-  Py_VISIT(traverse_module_state->__pyx_n_u_TYA);
-  Py_VISIT(traverse_module_state->__pyx_n_s_UXROM);
-  Py_VISIT(traverse_module_state->__pyx_n_s_ZeroPage);
-  Py_VISIT(traverse_module_state->__pyx_n_s_ZeroPageX);
-  Py_VISIT(traverse_module_state->__pyx_n_s_ZeroPageY);
-  Py_VISIT(traverse_module_state->__pyx_n_s__2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_a);
-  Py_VISIT(traverse_module_state->__pyx_n_u_absolute);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_absolute_x);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_absolute_y);
-  Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
-  Py_VISIT(traverse_module_state->__pyx_n_s_dict);
-  Py_VISIT(traverse_module_state->__pyx_n_s_doc);
-  Py_VISIT(traverse_module_state->__pyx_n_s_fromkeys);
-  Py_VISIT(traverse_module_state->__pyx_n_u_immediate);
-  Py_VISIT(traverse_module_state->__pyx_n_u_implicit);
-  Py_VISIT(traverse_module_state->__pyx_n_u_indirect);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_indirect_x);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_indirect_y);
-  Py_VISIT(traverse_module_state->__pyx_n_s_init_subclass);
-  Py_VISIT(traverse_module_state->__pyx_n_s_main);
-  Py_VISIT(traverse_module_state->__pyx_n_s_metaclass);
-  Py_VISIT(traverse_module_state->__pyx_n_s_module);
-  Py_VISIT(traverse_module_state->__pyx_n_s_name);
-  Py_VISIT(traverse_module_state->__pyx_n_s_nespy_enum);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_3);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_X);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_X_2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_Y);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_Y_2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_operand_value2);
-  Py_VISIT(traverse_module_state->__pyx_n_s_prepare);
-  Py_VISIT(traverse_module_state->__pyx_n_s_qualname);
-  Py_VISIT(traverse_module_state->__pyx_n_u_relative);
-  Py_VISIT(traverse_module_state->__pyx_n_s_set_name);
-  Py_VISIT(traverse_module_state->__pyx_n_s_super);
-  Py_VISIT(traverse_module_state->__pyx_n_s_test);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_value2);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_x);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_y);
-  Py_VISIT(traverse_module_state->__pyx_n_u_zeropage);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_zeropage_x);
-  Py_VISIT(traverse_module_state->__pyx_kp_u_zeropage_y);
-  Py_VISIT(traverse_module_state->__pyx_int_0);
-  Py_VISIT(traverse_module_state->__pyx_int_1);
-  Py_VISIT(traverse_module_state->__pyx_int_2);
-  Py_VISIT(traverse_module_state->__pyx_int_3);
-  Py_VISIT(traverse_module_state->__pyx_int_4);
-  Py_VISIT(traverse_module_state->__pyx_int_5);
-  Py_VISIT(traverse_module_state->__pyx_int_6);
-  Py_VISIT(traverse_module_state->__pyx_int_7);
-  Py_VISIT(traverse_module_state->__pyx_int_8);
-  Py_VISIT(traverse_module_state->__pyx_int_9);
-  Py_VISIT(traverse_module_state->__pyx_int_10);
-  Py_VISIT(traverse_module_state->__pyx_int_13);
-  Py_VISIT(traverse_module_state->__pyx_int_14);
-  Py_VISIT(traverse_module_state->__pyx_int_16);
-  Py_VISIT(traverse_module_state->__pyx_int_17);
-  Py_VISIT(traverse_module_state->__pyx_int_21);
-  Py_VISIT(traverse_module_state->__pyx_int_22);
-  Py_VISIT(traverse_module_state->__pyx_int_24);
-  Py_VISIT(traverse_module_state->__pyx_int_25);
-  Py_VISIT(traverse_module_state->__pyx_int_26);
-  Py_VISIT(traverse_module_state->__pyx_int_29);
-  Py_VISIT(traverse_module_state->__pyx_int_30);
-  Py_VISIT(traverse_module_state->__pyx_int_32);
-  Py_VISIT(traverse_module_state->__pyx_int_33);
-  Py_VISIT(traverse_module_state->__pyx_int_36);
-  Py_VISIT(traverse_module_state->__pyx_int_37);
-  Py_VISIT(traverse_module_state->__pyx_int_38);
-  Py_VISIT(traverse_module_state->__pyx_int_40);
-  Py_VISIT(traverse_module_state->__pyx_int_41);
-  Py_VISIT(traverse_module_state->__pyx_int_42);
-  Py_VISIT(traverse_module_state->__pyx_int_44);
-  Py_VISIT(traverse_module_state->__pyx_int_45);
-  Py_VISIT(traverse_module_state->__pyx_int_46);
-  Py_VISIT(traverse_module_state->__pyx_int_48);
-  Py_VISIT(traverse_module_state->__pyx_int_49);
-  Py_VISIT(traverse_module_state->__pyx_int_53);
-  Py_VISIT(traverse_module_state->__pyx_int_54);
-  Py_VISIT(traverse_module_state->__pyx_int_56);
-  Py_VISIT(traverse_module_state->__pyx_int_57);
-  Py_VISIT(traverse_module_state->__pyx_int_58);
-  Py_VISIT(traverse_module_state->__pyx_int_61);
-  Py_VISIT(traverse_module_state->__pyx_int_62);
-  Py_VISIT(traverse_module_state->__pyx_int_64);
-  Py_VISIT(traverse_module_state->__pyx_int_65);
-  Py_VISIT(traverse_module_state->__pyx_int_69);
-  Py_VISIT(traverse_module_state->__pyx_int_70);
-  Py_VISIT(traverse_module_state->__pyx_int_72);
-  Py_VISIT(traverse_module_state->__pyx_int_73);
-  Py_VISIT(traverse_module_state->__pyx_int_74);
-  Py_VISIT(traverse_module_state->__pyx_int_76);
-  Py_VISIT(traverse_module_state->__pyx_int_77);
-  Py_VISIT(traverse_module_state->__pyx_int_78);
-  Py_VISIT(traverse_module_state->__pyx_int_80);
-  Py_VISIT(traverse_module_state->__pyx_int_81);
-  Py_VISIT(traverse_module_state->__pyx_int_85);
-  Py_VISIT(traverse_module_state->__pyx_int_86);
-  Py_VISIT(traverse_module_state->__pyx_int_88);
-  Py_VISIT(traverse_module_state->__pyx_int_89);
-  Py_VISIT(traverse_module_state->__pyx_int_90);
-  Py_VISIT(traverse_module_state->__pyx_int_93);
-  Py_VISIT(traverse_module_state->__pyx_int_94);
-  Py_VISIT(traverse_module_state->__pyx_int_96);
-  Py_VISIT(traverse_module_state->__pyx_int_97);
-  Py_VISIT(traverse_module_state->__pyx_int_101);
-  Py_VISIT(traverse_module_state->__pyx_int_102);
-  Py_VISIT(traverse_module_state->__pyx_int_104);
-  Py_VISIT(traverse_module_state->__pyx_int_105);
-  Py_VISIT(traverse_module_state->__pyx_int_106);
-  Py_VISIT(traverse_module_state->__pyx_int_108);
-  Py_VISIT(traverse_module_state->__pyx_int_109);
-  Py_VISIT(traverse_module_state->__pyx_int_110);
-  Py_VISIT(traverse_module_state->__pyx_int_112);
-  Py_VISIT(traverse_module_state->__pyx_int_113);
-  Py_VISIT(traverse_module_state->__pyx_int_117);
-  Py_VISIT(traverse_module_state->__pyx_int_118);
-  Py_VISIT(traverse_module_state->__pyx_int_120);
-  Py_VISIT(traverse_module_state->__pyx_int_121);
-  Py_VISIT(traverse_module_state->__pyx_int_122);
-  Py_VISIT(traverse_module_state->__pyx_int_125);
-  Py_VISIT(traverse_module_state->__pyx_int_126);
-  Py_VISIT(traverse_module_state->__pyx_int_128);
-  Py_VISIT(traverse_module_state->__pyx_int_129);
-  Py_VISIT(traverse_module_state->__pyx_int_130);
-  Py_VISIT(traverse_module_state->__pyx_int_132);
-  Py_VISIT(traverse_module_state->__pyx_int_133);
-  Py_VISIT(traverse_module_state->__pyx_int_134);
-  Py_VISIT(traverse_module_state->__pyx_int_136);
-  Py_VISIT(traverse_module_state->__pyx_int_137);
-  Py_VISIT(traverse_module_state->__pyx_int_138);
-  Py_VISIT(traverse_module_state->__pyx_int_140);
-  Py_VISIT(traverse_module_state->__pyx_int_141);
-  Py_VISIT(traverse_module_state->__pyx_int_142);
-  Py_VISIT(traverse_module_state->__pyx_int_144);
-  Py_VISIT(traverse_module_state->__pyx_int_145);
-  Py_VISIT(traverse_module_state->__pyx_int_148);
-  Py_VISIT(traverse_module_state->__pyx_int_149);
-  Py_VISIT(traverse_module_state->__pyx_int_150);
-  Py_VISIT(traverse_module_state->__pyx_int_152);
-  Py_VISIT(traverse_module_state->__pyx_int_153);
-  Py_VISIT(traverse_module_state->__pyx_int_154);
-  Py_VISIT(traverse_module_state->__pyx_int_157);
-  Py_VISIT(traverse_module_state->__pyx_int_160);
-  Py_VISIT(traverse_module_state->__pyx_int_161);
-  Py_VISIT(traverse_module_state->__pyx_int_162);
-  Py_VISIT(traverse_module_state->__pyx_int_164);
-  Py_VISIT(traverse_module_state->__pyx_int_165);
-  Py_VISIT(traverse_module_state->__pyx_int_166);
-  Py_VISIT(traverse_module_state->__pyx_int_168);
-  Py_VISIT(traverse_module_state->__pyx_int_169);
-  Py_VISIT(traverse_module_state->__pyx_int_170);
-  Py_VISIT(traverse_module_state->__pyx_int_172);
-  Py_VISIT(traverse_module_state->__pyx_int_173);
-  Py_VISIT(traverse_module_state->__pyx_int_174);
-  Py_VISIT(traverse_module_state->__pyx_int_176);
-  Py_VISIT(traverse_module_state->__pyx_int_177);
-  Py_VISIT(traverse_module_state->__pyx_int_180);
-  Py_VISIT(traverse_module_state->__pyx_int_181);
-  Py_VISIT(traverse_module_state->__pyx_int_182);
-  Py_VISIT(traverse_module_state->__pyx_int_184);
-  Py_VISIT(traverse_module_state->__pyx_int_185);
-  Py_VISIT(traverse_module_state->__pyx_int_186);
-  Py_VISIT(traverse_module_state->__pyx_int_188);
-  Py_VISIT(traverse_module_state->__pyx_int_189);
-  Py_VISIT(traverse_module_state->__pyx_int_190);
-  Py_VISIT(traverse_module_state->__pyx_int_192);
-  Py_VISIT(traverse_module_state->__pyx_int_193);
-  Py_VISIT(traverse_module_state->__pyx_int_194);
-  Py_VISIT(traverse_module_state->__pyx_int_196);
-  Py_VISIT(traverse_module_state->__pyx_int_197);
-  Py_VISIT(traverse_module_state->__pyx_int_198);
-  Py_VISIT(traverse_module_state->__pyx_int_200);
-  Py_VISIT(traverse_module_state->__pyx_int_201);
-  Py_VISIT(traverse_module_state->__pyx_int_202);
-  Py_VISIT(traverse_module_state->__pyx_int_204);
-  Py_VISIT(traverse_module_state->__pyx_int_205);
-  Py_VISIT(traverse_module_state->__pyx_int_206);
-  Py_VISIT(traverse_module_state->__pyx_int_208);
-  Py_VISIT(traverse_module_state->__pyx_int_209);
-  Py_VISIT(traverse_module_state->__pyx_int_213);
-  Py_VISIT(traverse_module_state->__pyx_int_214);
-  Py_VISIT(traverse_module_state->__pyx_int_216);
-  Py_VISIT(traverse_module_state->__pyx_int_217);
-  Py_VISIT(traverse_module_state->__pyx_int_218);
-  Py_VISIT(traverse_module_state->__pyx_int_221);
-  Py_VISIT(traverse_module_state->__pyx_int_222);
-  Py_VISIT(traverse_module_state->__pyx_int_224);
-  Py_VISIT(traverse_module_state->__pyx_int_225);
-  Py_VISIT(traverse_module_state->__pyx_int_226);
-  Py_VISIT(traverse_module_state->__pyx_int_228);
-  Py_VISIT(traverse_module_state->__pyx_int_229);
-  Py_VISIT(traverse_module_state->__pyx_int_230);
-  Py_VISIT(traverse_module_state->__pyx_int_232);
-  Py_VISIT(traverse_module_state->__pyx_int_233);
-  Py_VISIT(traverse_module_state->__pyx_int_234);
-  Py_VISIT(traverse_module_state->__pyx_int_236);
-  Py_VISIT(traverse_module_state->__pyx_int_237);
-  Py_VISIT(traverse_module_state->__pyx_int_238);
-  Py_VISIT(traverse_module_state->__pyx_int_240);
-  Py_VISIT(traverse_module_state->__pyx_int_241);
-  Py_VISIT(traverse_module_state->__pyx_int_245);
-  Py_VISIT(traverse_module_state->__pyx_int_246);
-  Py_VISIT(traverse_module_state->__pyx_int_248);
-  Py_VISIT(traverse_module_state->__pyx_int_249);
-  Py_VISIT(traverse_module_state->__pyx_int_250);
-  Py_VISIT(traverse_module_state->__pyx_int_253);
-  Py_VISIT(traverse_module_state->__pyx_int_254);
-  Py_VISIT(traverse_module_state->__pyx_int_8192);
-  Py_VISIT(traverse_module_state->__pyx_int_8193);
-  Py_VISIT(traverse_module_state->__pyx_int_8194);
-  Py_VISIT(traverse_module_state->__pyx_int_8195);
-  Py_VISIT(traverse_module_state->__pyx_int_8196);
-  Py_VISIT(traverse_module_state->__pyx_int_8197);
-  Py_VISIT(traverse_module_state->__pyx_int_8198);
-  Py_VISIT(traverse_module_state->__pyx_int_8199);
-  return 0;
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  for (int i=0; i<55; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<158; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<189; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* #### Code section: module_state_traverse_end ### */
+return 0;
 }
 #endif
-/* #### Code section: module_state_defines ### */
-#if CYTHON_USE_MODULE_STATE
-#define __pyx_d __pyx_mstate_global->__pyx_d
-#define __pyx_b __pyx_mstate_global->__pyx_b
-#define __pyx_cython_runtime __pyx_mstate_global->__pyx_cython_runtime
-#define __pyx_empty_tuple __pyx_mstate_global->__pyx_empty_tuple
-#define __pyx_empty_bytes __pyx_mstate_global->__pyx_empty_bytes
-#define __pyx_empty_unicode __pyx_mstate_global->__pyx_empty_unicode
-#ifdef __Pyx_CyFunction_USED
-#define __pyx_CyFunctionType __pyx_mstate_global->__pyx_CyFunctionType
-#endif
-#ifdef __Pyx_FusedFunction_USED
-#define __pyx_FusedFunctionType __pyx_mstate_global->__pyx_FusedFunctionType
-#endif
-#define __pyx_kp_u_ __pyx_mstate_global->__pyx_kp_u_
-#define __pyx_n_u_ADC __pyx_mstate_global->__pyx_n_u_ADC
-#define __pyx_n_u_AND __pyx_mstate_global->__pyx_n_u_AND
-#define __pyx_n_u_ASL __pyx_mstate_global->__pyx_n_u_ASL
-#define __pyx_n_s_AXROM __pyx_mstate_global->__pyx_n_s_AXROM
-#define __pyx_n_s_Absolute __pyx_mstate_global->__pyx_n_s_Absolute
-#define __pyx_n_s_AbsoluteX __pyx_mstate_global->__pyx_n_s_AbsoluteX
-#define __pyx_n_s_AbsoluteY __pyx_mstate_global->__pyx_n_s_AbsoluteY
-#define __pyx_n_s_AddressingMode __pyx_mstate_global->__pyx_n_s_AddressingMode
-#define __pyx_n_s_AddressingModeDisasmFormat __pyx_mstate_global->__pyx_n_s_AddressingModeDisasmFormat
-#define __pyx_n_u_BCC __pyx_mstate_global->__pyx_n_u_BCC
-#define __pyx_n_u_BCS __pyx_mstate_global->__pyx_n_u_BCS
-#define __pyx_n_u_BEQ __pyx_mstate_global->__pyx_n_u_BEQ
-#define __pyx_n_u_BIT __pyx_mstate_global->__pyx_n_u_BIT
-#define __pyx_n_u_BMI __pyx_mstate_global->__pyx_n_u_BMI
-#define __pyx_n_u_BNE __pyx_mstate_global->__pyx_n_u_BNE
-#define __pyx_n_u_BPL __pyx_mstate_global->__pyx_n_u_BPL
-#define __pyx_n_u_BRK __pyx_mstate_global->__pyx_n_u_BRK
-#define __pyx_n_u_BVC __pyx_mstate_global->__pyx_n_u_BVC
-#define __pyx_n_u_BVS __pyx_mstate_global->__pyx_n_u_BVS
-#define __pyx_n_u_CLC __pyx_mstate_global->__pyx_n_u_CLC
-#define __pyx_n_u_CLD __pyx_mstate_global->__pyx_n_u_CLD
-#define __pyx_n_u_CLI __pyx_mstate_global->__pyx_n_u_CLI
-#define __pyx_n_u_CLV __pyx_mstate_global->__pyx_n_u_CLV
-#define __pyx_n_u_CMP __pyx_mstate_global->__pyx_n_u_CMP
-#define __pyx_n_s_CNROM __pyx_mstate_global->__pyx_n_s_CNROM
-#define __pyx_n_u_CPX __pyx_mstate_global->__pyx_n_u_CPX
-#define __pyx_n_u_CPY __pyx_mstate_global->__pyx_n_u_CPY
-#define __pyx_n_u_DEC __pyx_mstate_global->__pyx_n_u_DEC
-#define __pyx_n_u_DEX __pyx_mstate_global->__pyx_n_u_DEX
-#define __pyx_n_u_DEY __pyx_mstate_global->__pyx_n_u_DEY
-#define __pyx_n_u_EOR __pyx_mstate_global->__pyx_n_u_EOR
-#define __pyx_n_u_INC __pyx_mstate_global->__pyx_n_u_INC
-#define __pyx_n_s_INES __pyx_mstate_global->__pyx_n_s_INES
-#define __pyx_n_s_INES2_0 __pyx_mstate_global->__pyx_n_s_INES2_0
-#define __pyx_n_u_INX __pyx_mstate_global->__pyx_n_u_INX
-#define __pyx_n_u_INY __pyx_mstate_global->__pyx_n_u_INY
-#define __pyx_n_s_Immediate __pyx_mstate_global->__pyx_n_s_Immediate
-#define __pyx_n_s_Implicit __pyx_mstate_global->__pyx_n_s_Implicit
-#define __pyx_n_s_Indirect __pyx_mstate_global->__pyx_n_s_Indirect
-#define __pyx_n_s_IndirectX __pyx_mstate_global->__pyx_n_s_IndirectX
-#define __pyx_n_s_IndirectY __pyx_mstate_global->__pyx_n_s_IndirectY
-#define __pyx_n_s_InstructionAddressingModeMap __pyx_mstate_global->__pyx_n_s_InstructionAddressingModeMap
-#define __pyx_n_s_InstructionDisasmExtras __pyx_mstate_global->__pyx_n_s_InstructionDisasmExtras
-#define __pyx_n_s_InstructionLengthMap __pyx_mstate_global->__pyx_n_s_InstructionLengthMap
-#define __pyx_n_s_InstructionMnemonicMap __pyx_mstate_global->__pyx_n_s_InstructionMnemonicMap
-#define __pyx_n_u_JMP __pyx_mstate_global->__pyx_n_u_JMP
-#define __pyx_n_u_JSR __pyx_mstate_global->__pyx_n_u_JSR
-#define __pyx_n_u_LDA __pyx_mstate_global->__pyx_n_u_LDA
-#define __pyx_n_u_LDX __pyx_mstate_global->__pyx_n_u_LDX
-#define __pyx_n_u_LDY __pyx_mstate_global->__pyx_n_u_LDY
-#define __pyx_n_u_LSR __pyx_mstate_global->__pyx_n_u_LSR
-#define __pyx_n_s_MMC1 __pyx_mstate_global->__pyx_n_s_MMC1
-#define __pyx_n_s_MMC2 __pyx_mstate_global->__pyx_n_s_MMC2
-#define __pyx_n_s_MMC3 __pyx_mstate_global->__pyx_n_s_MMC3
-#define __pyx_n_s_Mapper __pyx_mstate_global->__pyx_n_s_Mapper
-#define __pyx_kp_s_Maps_mapper_names_to_mapper_val __pyx_mstate_global->__pyx_kp_s_Maps_mapper_names_to_mapper_val
-#define __pyx_n_u_NOP __pyx_mstate_global->__pyx_n_u_NOP
-#define __pyx_n_s_NROM __pyx_mstate_global->__pyx_n_s_NROM
-#define __pyx_n_s_OAMADDR __pyx_mstate_global->__pyx_n_s_OAMADDR
-#define __pyx_n_s_OAMDATA __pyx_mstate_global->__pyx_n_s_OAMDATA
-#define __pyx_n_u_ORA __pyx_mstate_global->__pyx_n_u_ORA
-#define __pyx_n_u_PHA __pyx_mstate_global->__pyx_n_u_PHA
-#define __pyx_n_u_PHP __pyx_mstate_global->__pyx_n_u_PHP
-#define __pyx_n_u_PLA __pyx_mstate_global->__pyx_n_u_PLA
-#define __pyx_n_u_PLP __pyx_mstate_global->__pyx_n_u_PLP
-#define __pyx_n_s_PPUADDR __pyx_mstate_global->__pyx_n_s_PPUADDR
-#define __pyx_n_s_PPUCTRL __pyx_mstate_global->__pyx_n_s_PPUCTRL
-#define __pyx_n_s_PPUDATA __pyx_mstate_global->__pyx_n_s_PPUDATA
-#define __pyx_n_s_PPUMASK __pyx_mstate_global->__pyx_n_s_PPUMASK
-#define __pyx_n_s_PPURegister __pyx_mstate_global->__pyx_n_s_PPURegister
-#define __pyx_n_s_PPUSCROLL __pyx_mstate_global->__pyx_n_s_PPUSCROLL
-#define __pyx_n_s_PPUSTATUS __pyx_mstate_global->__pyx_n_s_PPUSTATUS
-#define __pyx_n_u_ROL __pyx_mstate_global->__pyx_n_u_ROL
-#define __pyx_n_s_ROMFormat __pyx_mstate_global->__pyx_n_s_ROMFormat
-#define __pyx_n_u_ROR __pyx_mstate_global->__pyx_n_u_ROR
-#define __pyx_n_u_RTI __pyx_mstate_global->__pyx_n_u_RTI
-#define __pyx_n_u_RTS __pyx_mstate_global->__pyx_n_u_RTS
-#define __pyx_n_s_Relative __pyx_mstate_global->__pyx_n_s_Relative
-#define __pyx_n_u_SBC __pyx_mstate_global->__pyx_n_u_SBC
-#define __pyx_n_u_SEC __pyx_mstate_global->__pyx_n_u_SEC
-#define __pyx_n_u_SED __pyx_mstate_global->__pyx_n_u_SED
-#define __pyx_n_u_SEI __pyx_mstate_global->__pyx_n_u_SEI
-#define __pyx_n_u_STA __pyx_mstate_global->__pyx_n_u_STA
-#define __pyx_n_u_STX __pyx_mstate_global->__pyx_n_u_STX
-#define __pyx_n_u_STY __pyx_mstate_global->__pyx_n_u_STY
-#define __pyx_n_u_TAX __pyx_mstate_global->__pyx_n_u_TAX
-#define __pyx_n_u_TAY __pyx_mstate_global->__pyx_n_u_TAY
-#define __pyx_n_u_TSX __pyx_mstate_global->__pyx_n_u_TSX
-#define __pyx_n_u_TXA __pyx_mstate_global->__pyx_n_u_TXA
-#define __pyx_n_u_TXS __pyx_mstate_global->__pyx_n_u_TXS
-#define __pyx_n_u_TYA __pyx_mstate_global->__pyx_n_u_TYA
-#define __pyx_n_s_UXROM __pyx_mstate_global->__pyx_n_s_UXROM
-#define __pyx_n_s_ZeroPage __pyx_mstate_global->__pyx_n_s_ZeroPage
-#define __pyx_n_s_ZeroPageX __pyx_mstate_global->__pyx_n_s_ZeroPageX
-#define __pyx_n_s_ZeroPageY __pyx_mstate_global->__pyx_n_s_ZeroPageY
-#define __pyx_n_s__2 __pyx_mstate_global->__pyx_n_s__2
-#define __pyx_kp_u_a __pyx_mstate_global->__pyx_kp_u_a
-#define __pyx_n_u_absolute __pyx_mstate_global->__pyx_n_u_absolute
-#define __pyx_kp_u_absolute_x __pyx_mstate_global->__pyx_kp_u_absolute_x
-#define __pyx_kp_u_absolute_y __pyx_mstate_global->__pyx_kp_u_absolute_y
-#define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
-#define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
-#define __pyx_n_s_doc __pyx_mstate_global->__pyx_n_s_doc
-#define __pyx_n_s_fromkeys __pyx_mstate_global->__pyx_n_s_fromkeys
-#define __pyx_n_u_immediate __pyx_mstate_global->__pyx_n_u_immediate
-#define __pyx_n_u_implicit __pyx_mstate_global->__pyx_n_u_implicit
-#define __pyx_n_u_indirect __pyx_mstate_global->__pyx_n_u_indirect
-#define __pyx_kp_u_indirect_x __pyx_mstate_global->__pyx_kp_u_indirect_x
-#define __pyx_kp_u_indirect_y __pyx_mstate_global->__pyx_kp_u_indirect_y
-#define __pyx_n_s_init_subclass __pyx_mstate_global->__pyx_n_s_init_subclass
-#define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
-#define __pyx_n_s_metaclass __pyx_mstate_global->__pyx_n_s_metaclass
-#define __pyx_n_s_module __pyx_mstate_global->__pyx_n_s_module
-#define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
-#define __pyx_n_s_nespy_enum __pyx_mstate_global->__pyx_n_s_nespy_enum
-#define __pyx_kp_u_operand __pyx_mstate_global->__pyx_kp_u_operand
-#define __pyx_kp_u_operand_2 __pyx_mstate_global->__pyx_kp_u_operand_2
-#define __pyx_kp_u_operand_3 __pyx_mstate_global->__pyx_kp_u_operand_3
-#define __pyx_kp_u_operand_X __pyx_mstate_global->__pyx_kp_u_operand_X
-#define __pyx_kp_u_operand_X_2 __pyx_mstate_global->__pyx_kp_u_operand_X_2
-#define __pyx_kp_u_operand_Y __pyx_mstate_global->__pyx_kp_u_operand_Y
-#define __pyx_kp_u_operand_Y_2 __pyx_mstate_global->__pyx_kp_u_operand_Y_2
-#define __pyx_kp_u_operand_value2 __pyx_mstate_global->__pyx_kp_u_operand_value2
-#define __pyx_n_s_prepare __pyx_mstate_global->__pyx_n_s_prepare
-#define __pyx_n_s_qualname __pyx_mstate_global->__pyx_n_s_qualname
-#define __pyx_n_u_relative __pyx_mstate_global->__pyx_n_u_relative
-#define __pyx_n_s_set_name __pyx_mstate_global->__pyx_n_s_set_name
-#define __pyx_n_s_super __pyx_mstate_global->__pyx_n_s_super
-#define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
-#define __pyx_kp_u_value2 __pyx_mstate_global->__pyx_kp_u_value2
-#define __pyx_kp_u_x __pyx_mstate_global->__pyx_kp_u_x
-#define __pyx_kp_u_y __pyx_mstate_global->__pyx_kp_u_y
-#define __pyx_n_u_zeropage __pyx_mstate_global->__pyx_n_u_zeropage
-#define __pyx_kp_u_zeropage_x __pyx_mstate_global->__pyx_kp_u_zeropage_x
-#define __pyx_kp_u_zeropage_y __pyx_mstate_global->__pyx_kp_u_zeropage_y
-#define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
-#define __pyx_int_1 __pyx_mstate_global->__pyx_int_1
-#define __pyx_int_2 __pyx_mstate_global->__pyx_int_2
-#define __pyx_int_3 __pyx_mstate_global->__pyx_int_3
-#define __pyx_int_4 __pyx_mstate_global->__pyx_int_4
-#define __pyx_int_5 __pyx_mstate_global->__pyx_int_5
-#define __pyx_int_6 __pyx_mstate_global->__pyx_int_6
-#define __pyx_int_7 __pyx_mstate_global->__pyx_int_7
-#define __pyx_int_8 __pyx_mstate_global->__pyx_int_8
-#define __pyx_int_9 __pyx_mstate_global->__pyx_int_9
-#define __pyx_int_10 __pyx_mstate_global->__pyx_int_10
-#define __pyx_int_13 __pyx_mstate_global->__pyx_int_13
-#define __pyx_int_14 __pyx_mstate_global->__pyx_int_14
-#define __pyx_int_16 __pyx_mstate_global->__pyx_int_16
-#define __pyx_int_17 __pyx_mstate_global->__pyx_int_17
-#define __pyx_int_21 __pyx_mstate_global->__pyx_int_21
-#define __pyx_int_22 __pyx_mstate_global->__pyx_int_22
-#define __pyx_int_24 __pyx_mstate_global->__pyx_int_24
-#define __pyx_int_25 __pyx_mstate_global->__pyx_int_25
-#define __pyx_int_26 __pyx_mstate_global->__pyx_int_26
-#define __pyx_int_29 __pyx_mstate_global->__pyx_int_29
-#define __pyx_int_30 __pyx_mstate_global->__pyx_int_30
-#define __pyx_int_32 __pyx_mstate_global->__pyx_int_32
-#define __pyx_int_33 __pyx_mstate_global->__pyx_int_33
-#define __pyx_int_36 __pyx_mstate_global->__pyx_int_36
-#define __pyx_int_37 __pyx_mstate_global->__pyx_int_37
-#define __pyx_int_38 __pyx_mstate_global->__pyx_int_38
-#define __pyx_int_40 __pyx_mstate_global->__pyx_int_40
-#define __pyx_int_41 __pyx_mstate_global->__pyx_int_41
-#define __pyx_int_42 __pyx_mstate_global->__pyx_int_42
-#define __pyx_int_44 __pyx_mstate_global->__pyx_int_44
-#define __pyx_int_45 __pyx_mstate_global->__pyx_int_45
-#define __pyx_int_46 __pyx_mstate_global->__pyx_int_46
-#define __pyx_int_48 __pyx_mstate_global->__pyx_int_48
-#define __pyx_int_49 __pyx_mstate_global->__pyx_int_49
-#define __pyx_int_53 __pyx_mstate_global->__pyx_int_53
-#define __pyx_int_54 __pyx_mstate_global->__pyx_int_54
-#define __pyx_int_56 __pyx_mstate_global->__pyx_int_56
-#define __pyx_int_57 __pyx_mstate_global->__pyx_int_57
-#define __pyx_int_58 __pyx_mstate_global->__pyx_int_58
-#define __pyx_int_61 __pyx_mstate_global->__pyx_int_61
-#define __pyx_int_62 __pyx_mstate_global->__pyx_int_62
-#define __pyx_int_64 __pyx_mstate_global->__pyx_int_64
-#define __pyx_int_65 __pyx_mstate_global->__pyx_int_65
-#define __pyx_int_69 __pyx_mstate_global->__pyx_int_69
-#define __pyx_int_70 __pyx_mstate_global->__pyx_int_70
-#define __pyx_int_72 __pyx_mstate_global->__pyx_int_72
-#define __pyx_int_73 __pyx_mstate_global->__pyx_int_73
-#define __pyx_int_74 __pyx_mstate_global->__pyx_int_74
-#define __pyx_int_76 __pyx_mstate_global->__pyx_int_76
-#define __pyx_int_77 __pyx_mstate_global->__pyx_int_77
-#define __pyx_int_78 __pyx_mstate_global->__pyx_int_78
-#define __pyx_int_80 __pyx_mstate_global->__pyx_int_80
-#define __pyx_int_81 __pyx_mstate_global->__pyx_int_81
-#define __pyx_int_85 __pyx_mstate_global->__pyx_int_85
-#define __pyx_int_86 __pyx_mstate_global->__pyx_int_86
-#define __pyx_int_88 __pyx_mstate_global->__pyx_int_88
-#define __pyx_int_89 __pyx_mstate_global->__pyx_int_89
-#define __pyx_int_90 __pyx_mstate_global->__pyx_int_90
-#define __pyx_int_93 __pyx_mstate_global->__pyx_int_93
-#define __pyx_int_94 __pyx_mstate_global->__pyx_int_94
-#define __pyx_int_96 __pyx_mstate_global->__pyx_int_96
-#define __pyx_int_97 __pyx_mstate_global->__pyx_int_97
-#define __pyx_int_101 __pyx_mstate_global->__pyx_int_101
-#define __pyx_int_102 __pyx_mstate_global->__pyx_int_102
-#define __pyx_int_104 __pyx_mstate_global->__pyx_int_104
-#define __pyx_int_105 __pyx_mstate_global->__pyx_int_105
-#define __pyx_int_106 __pyx_mstate_global->__pyx_int_106
-#define __pyx_int_108 __pyx_mstate_global->__pyx_int_108
-#define __pyx_int_109 __pyx_mstate_global->__pyx_int_109
-#define __pyx_int_110 __pyx_mstate_global->__pyx_int_110
-#define __pyx_int_112 __pyx_mstate_global->__pyx_int_112
-#define __pyx_int_113 __pyx_mstate_global->__pyx_int_113
-#define __pyx_int_117 __pyx_mstate_global->__pyx_int_117
-#define __pyx_int_118 __pyx_mstate_global->__pyx_int_118
-#define __pyx_int_120 __pyx_mstate_global->__pyx_int_120
-#define __pyx_int_121 __pyx_mstate_global->__pyx_int_121
-#define __pyx_int_122 __pyx_mstate_global->__pyx_int_122
-#define __pyx_int_125 __pyx_mstate_global->__pyx_int_125
-#define __pyx_int_126 __pyx_mstate_global->__pyx_int_126
-#define __pyx_int_128 __pyx_mstate_global->__pyx_int_128
-#define __pyx_int_129 __pyx_mstate_global->__pyx_int_129
-#define __pyx_int_130 __pyx_mstate_global->__pyx_int_130
-#define __pyx_int_132 __pyx_mstate_global->__pyx_int_132
-#define __pyx_int_133 __pyx_mstate_global->__pyx_int_133
-#define __pyx_int_134 __pyx_mstate_global->__pyx_int_134
-#define __pyx_int_136 __pyx_mstate_global->__pyx_int_136
-#define __pyx_int_137 __pyx_mstate_global->__pyx_int_137
-#define __pyx_int_138 __pyx_mstate_global->__pyx_int_138
-#define __pyx_int_140 __pyx_mstate_global->__pyx_int_140
-#define __pyx_int_141 __pyx_mstate_global->__pyx_int_141
-#define __pyx_int_142 __pyx_mstate_global->__pyx_int_142
-#define __pyx_int_144 __pyx_mstate_global->__pyx_int_144
-#define __pyx_int_145 __pyx_mstate_global->__pyx_int_145
-#define __pyx_int_148 __pyx_mstate_global->__pyx_int_148
-#define __pyx_int_149 __pyx_mstate_global->__pyx_int_149
-#define __pyx_int_150 __pyx_mstate_global->__pyx_int_150
-#define __pyx_int_152 __pyx_mstate_global->__pyx_int_152
-#define __pyx_int_153 __pyx_mstate_global->__pyx_int_153
-#define __pyx_int_154 __pyx_mstate_global->__pyx_int_154
-#define __pyx_int_157 __pyx_mstate_global->__pyx_int_157
-#define __pyx_int_160 __pyx_mstate_global->__pyx_int_160
-#define __pyx_int_161 __pyx_mstate_global->__pyx_int_161
-#define __pyx_int_162 __pyx_mstate_global->__pyx_int_162
-#define __pyx_int_164 __pyx_mstate_global->__pyx_int_164
-#define __pyx_int_165 __pyx_mstate_global->__pyx_int_165
-#define __pyx_int_166 __pyx_mstate_global->__pyx_int_166
-#define __pyx_int_168 __pyx_mstate_global->__pyx_int_168
-#define __pyx_int_169 __pyx_mstate_global->__pyx_int_169
-#define __pyx_int_170 __pyx_mstate_global->__pyx_int_170
-#define __pyx_int_172 __pyx_mstate_global->__pyx_int_172
-#define __pyx_int_173 __pyx_mstate_global->__pyx_int_173
-#define __pyx_int_174 __pyx_mstate_global->__pyx_int_174
-#define __pyx_int_176 __pyx_mstate_global->__pyx_int_176
-#define __pyx_int_177 __pyx_mstate_global->__pyx_int_177
-#define __pyx_int_180 __pyx_mstate_global->__pyx_int_180
-#define __pyx_int_181 __pyx_mstate_global->__pyx_int_181
-#define __pyx_int_182 __pyx_mstate_global->__pyx_int_182
-#define __pyx_int_184 __pyx_mstate_global->__pyx_int_184
-#define __pyx_int_185 __pyx_mstate_global->__pyx_int_185
-#define __pyx_int_186 __pyx_mstate_global->__pyx_int_186
-#define __pyx_int_188 __pyx_mstate_global->__pyx_int_188
-#define __pyx_int_189 __pyx_mstate_global->__pyx_int_189
-#define __pyx_int_190 __pyx_mstate_global->__pyx_int_190
-#define __pyx_int_192 __pyx_mstate_global->__pyx_int_192
-#define __pyx_int_193 __pyx_mstate_global->__pyx_int_193
-#define __pyx_int_194 __pyx_mstate_global->__pyx_int_194
-#define __pyx_int_196 __pyx_mstate_global->__pyx_int_196
-#define __pyx_int_197 __pyx_mstate_global->__pyx_int_197
-#define __pyx_int_198 __pyx_mstate_global->__pyx_int_198
-#define __pyx_int_200 __pyx_mstate_global->__pyx_int_200
-#define __pyx_int_201 __pyx_mstate_global->__pyx_int_201
-#define __pyx_int_202 __pyx_mstate_global->__pyx_int_202
-#define __pyx_int_204 __pyx_mstate_global->__pyx_int_204
-#define __pyx_int_205 __pyx_mstate_global->__pyx_int_205
-#define __pyx_int_206 __pyx_mstate_global->__pyx_int_206
-#define __pyx_int_208 __pyx_mstate_global->__pyx_int_208
-#define __pyx_int_209 __pyx_mstate_global->__pyx_int_209
-#define __pyx_int_213 __pyx_mstate_global->__pyx_int_213
-#define __pyx_int_214 __pyx_mstate_global->__pyx_int_214
-#define __pyx_int_216 __pyx_mstate_global->__pyx_int_216
-#define __pyx_int_217 __pyx_mstate_global->__pyx_int_217
-#define __pyx_int_218 __pyx_mstate_global->__pyx_int_218
-#define __pyx_int_221 __pyx_mstate_global->__pyx_int_221
-#define __pyx_int_222 __pyx_mstate_global->__pyx_int_222
-#define __pyx_int_224 __pyx_mstate_global->__pyx_int_224
-#define __pyx_int_225 __pyx_mstate_global->__pyx_int_225
-#define __pyx_int_226 __pyx_mstate_global->__pyx_int_226
-#define __pyx_int_228 __pyx_mstate_global->__pyx_int_228
-#define __pyx_int_229 __pyx_mstate_global->__pyx_int_229
-#define __pyx_int_230 __pyx_mstate_global->__pyx_int_230
-#define __pyx_int_232 __pyx_mstate_global->__pyx_int_232
-#define __pyx_int_233 __pyx_mstate_global->__pyx_int_233
-#define __pyx_int_234 __pyx_mstate_global->__pyx_int_234
-#define __pyx_int_236 __pyx_mstate_global->__pyx_int_236
-#define __pyx_int_237 __pyx_mstate_global->__pyx_int_237
-#define __pyx_int_238 __pyx_mstate_global->__pyx_int_238
-#define __pyx_int_240 __pyx_mstate_global->__pyx_int_240
-#define __pyx_int_241 __pyx_mstate_global->__pyx_int_241
-#define __pyx_int_245 __pyx_mstate_global->__pyx_int_245
-#define __pyx_int_246 __pyx_mstate_global->__pyx_int_246
-#define __pyx_int_248 __pyx_mstate_global->__pyx_int_248
-#define __pyx_int_249 __pyx_mstate_global->__pyx_int_249
-#define __pyx_int_250 __pyx_mstate_global->__pyx_int_250
-#define __pyx_int_253 __pyx_mstate_global->__pyx_int_253
-#define __pyx_int_254 __pyx_mstate_global->__pyx_int_254
-#define __pyx_int_8192 __pyx_mstate_global->__pyx_int_8192
-#define __pyx_int_8193 __pyx_mstate_global->__pyx_int_8193
-#define __pyx_int_8194 __pyx_mstate_global->__pyx_int_8194
-#define __pyx_int_8195 __pyx_mstate_global->__pyx_int_8195
-#define __pyx_int_8196 __pyx_mstate_global->__pyx_int_8196
-#define __pyx_int_8197 __pyx_mstate_global->__pyx_int_8197
-#define __pyx_int_8198 __pyx_mstate_global->__pyx_int_8198
-#define __pyx_int_8199 __pyx_mstate_global->__pyx_int_8199
-#endif
 /* #### Code section: module_code ### */
+/* #### Code section: module_exttypes ### */
 
 static PyMethodDef __pyx_methods[] = {
   {0, 0, 0, 0}
 };
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
-    #define CYTHON_SMALL_CODE __attribute__((cold))
-#else
-    #define CYTHON_SMALL_CODE
-#endif
-#endif
-/* #### Code section: pystring_table ### */
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  #if CYTHON_USE_MODULE_STATE
-  {0, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
-  {0, __pyx_k_ADC, sizeof(__pyx_k_ADC), 0, 1, 0, 1},
-  {0, __pyx_k_AND, sizeof(__pyx_k_AND), 0, 1, 0, 1},
-  {0, __pyx_k_ASL, sizeof(__pyx_k_ASL), 0, 1, 0, 1},
-  {0, __pyx_k_AXROM, sizeof(__pyx_k_AXROM), 0, 0, 1, 1},
-  {0, __pyx_k_Absolute, sizeof(__pyx_k_Absolute), 0, 0, 1, 1},
-  {0, __pyx_k_AbsoluteX, sizeof(__pyx_k_AbsoluteX), 0, 0, 1, 1},
-  {0, __pyx_k_AbsoluteY, sizeof(__pyx_k_AbsoluteY), 0, 0, 1, 1},
-  {0, __pyx_k_AddressingMode, sizeof(__pyx_k_AddressingMode), 0, 0, 1, 1},
-  {0, __pyx_k_AddressingModeDisasmFormat, sizeof(__pyx_k_AddressingModeDisasmFormat), 0, 0, 1, 1},
-  {0, __pyx_k_BCC, sizeof(__pyx_k_BCC), 0, 1, 0, 1},
-  {0, __pyx_k_BCS, sizeof(__pyx_k_BCS), 0, 1, 0, 1},
-  {0, __pyx_k_BEQ, sizeof(__pyx_k_BEQ), 0, 1, 0, 1},
-  {0, __pyx_k_BIT, sizeof(__pyx_k_BIT), 0, 1, 0, 1},
-  {0, __pyx_k_BMI, sizeof(__pyx_k_BMI), 0, 1, 0, 1},
-  {0, __pyx_k_BNE, sizeof(__pyx_k_BNE), 0, 1, 0, 1},
-  {0, __pyx_k_BPL, sizeof(__pyx_k_BPL), 0, 1, 0, 1},
-  {0, __pyx_k_BRK, sizeof(__pyx_k_BRK), 0, 1, 0, 1},
-  {0, __pyx_k_BVC, sizeof(__pyx_k_BVC), 0, 1, 0, 1},
-  {0, __pyx_k_BVS, sizeof(__pyx_k_BVS), 0, 1, 0, 1},
-  {0, __pyx_k_CLC, sizeof(__pyx_k_CLC), 0, 1, 0, 1},
-  {0, __pyx_k_CLD, sizeof(__pyx_k_CLD), 0, 1, 0, 1},
-  {0, __pyx_k_CLI, sizeof(__pyx_k_CLI), 0, 1, 0, 1},
-  {0, __pyx_k_CLV, sizeof(__pyx_k_CLV), 0, 1, 0, 1},
-  {0, __pyx_k_CMP, sizeof(__pyx_k_CMP), 0, 1, 0, 1},
-  {0, __pyx_k_CNROM, sizeof(__pyx_k_CNROM), 0, 0, 1, 1},
-  {0, __pyx_k_CPX, sizeof(__pyx_k_CPX), 0, 1, 0, 1},
-  {0, __pyx_k_CPY, sizeof(__pyx_k_CPY), 0, 1, 0, 1},
-  {0, __pyx_k_DEC, sizeof(__pyx_k_DEC), 0, 1, 0, 1},
-  {0, __pyx_k_DEX, sizeof(__pyx_k_DEX), 0, 1, 0, 1},
-  {0, __pyx_k_DEY, sizeof(__pyx_k_DEY), 0, 1, 0, 1},
-  {0, __pyx_k_EOR, sizeof(__pyx_k_EOR), 0, 1, 0, 1},
-  {0, __pyx_k_INC, sizeof(__pyx_k_INC), 0, 1, 0, 1},
-  {0, __pyx_k_INES, sizeof(__pyx_k_INES), 0, 0, 1, 1},
-  {0, __pyx_k_INES2_0, sizeof(__pyx_k_INES2_0), 0, 0, 1, 1},
-  {0, __pyx_k_INX, sizeof(__pyx_k_INX), 0, 1, 0, 1},
-  {0, __pyx_k_INY, sizeof(__pyx_k_INY), 0, 1, 0, 1},
-  {0, __pyx_k_Immediate, sizeof(__pyx_k_Immediate), 0, 0, 1, 1},
-  {0, __pyx_k_Implicit, sizeof(__pyx_k_Implicit), 0, 0, 1, 1},
-  {0, __pyx_k_Indirect, sizeof(__pyx_k_Indirect), 0, 0, 1, 1},
-  {0, __pyx_k_IndirectX, sizeof(__pyx_k_IndirectX), 0, 0, 1, 1},
-  {0, __pyx_k_IndirectY, sizeof(__pyx_k_IndirectY), 0, 0, 1, 1},
-  {0, __pyx_k_InstructionAddressingModeMap, sizeof(__pyx_k_InstructionAddressingModeMap), 0, 0, 1, 1},
-  {0, __pyx_k_InstructionDisasmExtras, sizeof(__pyx_k_InstructionDisasmExtras), 0, 0, 1, 1},
-  {0, __pyx_k_InstructionLengthMap, sizeof(__pyx_k_InstructionLengthMap), 0, 0, 1, 1},
-  {0, __pyx_k_InstructionMnemonicMap, sizeof(__pyx_k_InstructionMnemonicMap), 0, 0, 1, 1},
-  {0, __pyx_k_JMP, sizeof(__pyx_k_JMP), 0, 1, 0, 1},
-  {0, __pyx_k_JSR, sizeof(__pyx_k_JSR), 0, 1, 0, 1},
-  {0, __pyx_k_LDA, sizeof(__pyx_k_LDA), 0, 1, 0, 1},
-  {0, __pyx_k_LDX, sizeof(__pyx_k_LDX), 0, 1, 0, 1},
-  {0, __pyx_k_LDY, sizeof(__pyx_k_LDY), 0, 1, 0, 1},
-  {0, __pyx_k_LSR, sizeof(__pyx_k_LSR), 0, 1, 0, 1},
-  {0, __pyx_k_MMC1, sizeof(__pyx_k_MMC1), 0, 0, 1, 1},
-  {0, __pyx_k_MMC2, sizeof(__pyx_k_MMC2), 0, 0, 1, 1},
-  {0, __pyx_k_MMC3, sizeof(__pyx_k_MMC3), 0, 0, 1, 1},
-  {0, __pyx_k_Mapper, sizeof(__pyx_k_Mapper), 0, 0, 1, 1},
-  {0, __pyx_k_Maps_mapper_names_to_mapper_val, sizeof(__pyx_k_Maps_mapper_names_to_mapper_val), 0, 0, 1, 0},
-  {0, __pyx_k_NOP, sizeof(__pyx_k_NOP), 0, 1, 0, 1},
-  {0, __pyx_k_NROM, sizeof(__pyx_k_NROM), 0, 0, 1, 1},
-  {0, __pyx_k_OAMADDR, sizeof(__pyx_k_OAMADDR), 0, 0, 1, 1},
-  {0, __pyx_k_OAMDATA, sizeof(__pyx_k_OAMDATA), 0, 0, 1, 1},
-  {0, __pyx_k_ORA, sizeof(__pyx_k_ORA), 0, 1, 0, 1},
-  {0, __pyx_k_PHA, sizeof(__pyx_k_PHA), 0, 1, 0, 1},
-  {0, __pyx_k_PHP, sizeof(__pyx_k_PHP), 0, 1, 0, 1},
-  {0, __pyx_k_PLA, sizeof(__pyx_k_PLA), 0, 1, 0, 1},
-  {0, __pyx_k_PLP, sizeof(__pyx_k_PLP), 0, 1, 0, 1},
-  {0, __pyx_k_PPUADDR, sizeof(__pyx_k_PPUADDR), 0, 0, 1, 1},
-  {0, __pyx_k_PPUCTRL, sizeof(__pyx_k_PPUCTRL), 0, 0, 1, 1},
-  {0, __pyx_k_PPUDATA, sizeof(__pyx_k_PPUDATA), 0, 0, 1, 1},
-  {0, __pyx_k_PPUMASK, sizeof(__pyx_k_PPUMASK), 0, 0, 1, 1},
-  {0, __pyx_k_PPURegister, sizeof(__pyx_k_PPURegister), 0, 0, 1, 1},
-  {0, __pyx_k_PPUSCROLL, sizeof(__pyx_k_PPUSCROLL), 0, 0, 1, 1},
-  {0, __pyx_k_PPUSTATUS, sizeof(__pyx_k_PPUSTATUS), 0, 0, 1, 1},
-  {0, __pyx_k_ROL, sizeof(__pyx_k_ROL), 0, 1, 0, 1},
-  {0, __pyx_k_ROMFormat, sizeof(__pyx_k_ROMFormat), 0, 0, 1, 1},
-  {0, __pyx_k_ROR, sizeof(__pyx_k_ROR), 0, 1, 0, 1},
-  {0, __pyx_k_RTI, sizeof(__pyx_k_RTI), 0, 1, 0, 1},
-  {0, __pyx_k_RTS, sizeof(__pyx_k_RTS), 0, 1, 0, 1},
-  {0, __pyx_k_Relative, sizeof(__pyx_k_Relative), 0, 0, 1, 1},
-  {0, __pyx_k_SBC, sizeof(__pyx_k_SBC), 0, 1, 0, 1},
-  {0, __pyx_k_SEC, sizeof(__pyx_k_SEC), 0, 1, 0, 1},
-  {0, __pyx_k_SED, sizeof(__pyx_k_SED), 0, 1, 0, 1},
-  {0, __pyx_k_SEI, sizeof(__pyx_k_SEI), 0, 1, 0, 1},
-  {0, __pyx_k_STA, sizeof(__pyx_k_STA), 0, 1, 0, 1},
-  {0, __pyx_k_STX, sizeof(__pyx_k_STX), 0, 1, 0, 1},
-  {0, __pyx_k_STY, sizeof(__pyx_k_STY), 0, 1, 0, 1},
-  {0, __pyx_k_TAX, sizeof(__pyx_k_TAX), 0, 1, 0, 1},
-  {0, __pyx_k_TAY, sizeof(__pyx_k_TAY), 0, 1, 0, 1},
-  {0, __pyx_k_TSX, sizeof(__pyx_k_TSX), 0, 1, 0, 1},
-  {0, __pyx_k_TXA, sizeof(__pyx_k_TXA), 0, 1, 0, 1},
-  {0, __pyx_k_TXS, sizeof(__pyx_k_TXS), 0, 1, 0, 1},
-  {0, __pyx_k_TYA, sizeof(__pyx_k_TYA), 0, 1, 0, 1},
-  {0, __pyx_k_UXROM, sizeof(__pyx_k_UXROM), 0, 0, 1, 1},
-  {0, __pyx_k_ZeroPage, sizeof(__pyx_k_ZeroPage), 0, 0, 1, 1},
-  {0, __pyx_k_ZeroPageX, sizeof(__pyx_k_ZeroPageX), 0, 0, 1, 1},
-  {0, __pyx_k_ZeroPageY, sizeof(__pyx_k_ZeroPageY), 0, 0, 1, 1},
-  {0, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 1},
-  {0, __pyx_k_a, sizeof(__pyx_k_a), 0, 1, 0, 0},
-  {0, __pyx_k_absolute, sizeof(__pyx_k_absolute), 0, 1, 0, 1},
-  {0, __pyx_k_absolute_x, sizeof(__pyx_k_absolute_x), 0, 1, 0, 0},
-  {0, __pyx_k_absolute_y, sizeof(__pyx_k_absolute_y), 0, 1, 0, 0},
-  {0, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-  {0, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
-  {0, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
-  {0, __pyx_k_fromkeys, sizeof(__pyx_k_fromkeys), 0, 0, 1, 1},
-  {0, __pyx_k_immediate, sizeof(__pyx_k_immediate), 0, 1, 0, 1},
-  {0, __pyx_k_implicit, sizeof(__pyx_k_implicit), 0, 1, 0, 1},
-  {0, __pyx_k_indirect, sizeof(__pyx_k_indirect), 0, 1, 0, 1},
-  {0, __pyx_k_indirect_x, sizeof(__pyx_k_indirect_x), 0, 1, 0, 0},
-  {0, __pyx_k_indirect_y, sizeof(__pyx_k_indirect_y), 0, 1, 0, 0},
-  {0, __pyx_k_init_subclass, sizeof(__pyx_k_init_subclass), 0, 0, 1, 1},
-  {0, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {0, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
-  {0, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
-  {0, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-  {0, __pyx_k_nespy_enum, sizeof(__pyx_k_nespy_enum), 0, 0, 1, 1},
-  {0, __pyx_k_operand, sizeof(__pyx_k_operand), 0, 1, 0, 0},
-  {0, __pyx_k_operand_2, sizeof(__pyx_k_operand_2), 0, 1, 0, 0},
-  {0, __pyx_k_operand_3, sizeof(__pyx_k_operand_3), 0, 1, 0, 0},
-  {0, __pyx_k_operand_X, sizeof(__pyx_k_operand_X), 0, 1, 0, 0},
-  {0, __pyx_k_operand_X_2, sizeof(__pyx_k_operand_X_2), 0, 1, 0, 0},
-  {0, __pyx_k_operand_Y, sizeof(__pyx_k_operand_Y), 0, 1, 0, 0},
-  {0, __pyx_k_operand_Y_2, sizeof(__pyx_k_operand_Y_2), 0, 1, 0, 0},
-  {0, __pyx_k_operand_value2, sizeof(__pyx_k_operand_value2), 0, 1, 0, 0},
-  {0, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
-  {0, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
-  {0, __pyx_k_relative, sizeof(__pyx_k_relative), 0, 1, 0, 1},
-  {0, __pyx_k_set_name, sizeof(__pyx_k_set_name), 0, 0, 1, 1},
-  {0, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
-  {0, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {0, __pyx_k_value2, sizeof(__pyx_k_value2), 0, 1, 0, 0},
-  {0, __pyx_k_x, sizeof(__pyx_k_x), 0, 1, 0, 0},
-  {0, __pyx_k_y, sizeof(__pyx_k_y), 0, 1, 0, 0},
-  {0, __pyx_k_zeropage, sizeof(__pyx_k_zeropage), 0, 1, 0, 1},
-  {0, __pyx_k_zeropage_x, sizeof(__pyx_k_zeropage_x), 0, 1, 0, 0},
-  {0, __pyx_k_zeropage_y, sizeof(__pyx_k_zeropage_y), 0, 1, 0, 0},
-  #else
-  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
-  {&__pyx_n_u_ADC, __pyx_k_ADC, sizeof(__pyx_k_ADC), 0, 1, 0, 1},
-  {&__pyx_n_u_AND, __pyx_k_AND, sizeof(__pyx_k_AND), 0, 1, 0, 1},
-  {&__pyx_n_u_ASL, __pyx_k_ASL, sizeof(__pyx_k_ASL), 0, 1, 0, 1},
-  {&__pyx_n_s_AXROM, __pyx_k_AXROM, sizeof(__pyx_k_AXROM), 0, 0, 1, 1},
-  {&__pyx_n_s_Absolute, __pyx_k_Absolute, sizeof(__pyx_k_Absolute), 0, 0, 1, 1},
-  {&__pyx_n_s_AbsoluteX, __pyx_k_AbsoluteX, sizeof(__pyx_k_AbsoluteX), 0, 0, 1, 1},
-  {&__pyx_n_s_AbsoluteY, __pyx_k_AbsoluteY, sizeof(__pyx_k_AbsoluteY), 0, 0, 1, 1},
-  {&__pyx_n_s_AddressingMode, __pyx_k_AddressingMode, sizeof(__pyx_k_AddressingMode), 0, 0, 1, 1},
-  {&__pyx_n_s_AddressingModeDisasmFormat, __pyx_k_AddressingModeDisasmFormat, sizeof(__pyx_k_AddressingModeDisasmFormat), 0, 0, 1, 1},
-  {&__pyx_n_u_BCC, __pyx_k_BCC, sizeof(__pyx_k_BCC), 0, 1, 0, 1},
-  {&__pyx_n_u_BCS, __pyx_k_BCS, sizeof(__pyx_k_BCS), 0, 1, 0, 1},
-  {&__pyx_n_u_BEQ, __pyx_k_BEQ, sizeof(__pyx_k_BEQ), 0, 1, 0, 1},
-  {&__pyx_n_u_BIT, __pyx_k_BIT, sizeof(__pyx_k_BIT), 0, 1, 0, 1},
-  {&__pyx_n_u_BMI, __pyx_k_BMI, sizeof(__pyx_k_BMI), 0, 1, 0, 1},
-  {&__pyx_n_u_BNE, __pyx_k_BNE, sizeof(__pyx_k_BNE), 0, 1, 0, 1},
-  {&__pyx_n_u_BPL, __pyx_k_BPL, sizeof(__pyx_k_BPL), 0, 1, 0, 1},
-  {&__pyx_n_u_BRK, __pyx_k_BRK, sizeof(__pyx_k_BRK), 0, 1, 0, 1},
-  {&__pyx_n_u_BVC, __pyx_k_BVC, sizeof(__pyx_k_BVC), 0, 1, 0, 1},
-  {&__pyx_n_u_BVS, __pyx_k_BVS, sizeof(__pyx_k_BVS), 0, 1, 0, 1},
-  {&__pyx_n_u_CLC, __pyx_k_CLC, sizeof(__pyx_k_CLC), 0, 1, 0, 1},
-  {&__pyx_n_u_CLD, __pyx_k_CLD, sizeof(__pyx_k_CLD), 0, 1, 0, 1},
-  {&__pyx_n_u_CLI, __pyx_k_CLI, sizeof(__pyx_k_CLI), 0, 1, 0, 1},
-  {&__pyx_n_u_CLV, __pyx_k_CLV, sizeof(__pyx_k_CLV), 0, 1, 0, 1},
-  {&__pyx_n_u_CMP, __pyx_k_CMP, sizeof(__pyx_k_CMP), 0, 1, 0, 1},
-  {&__pyx_n_s_CNROM, __pyx_k_CNROM, sizeof(__pyx_k_CNROM), 0, 0, 1, 1},
-  {&__pyx_n_u_CPX, __pyx_k_CPX, sizeof(__pyx_k_CPX), 0, 1, 0, 1},
-  {&__pyx_n_u_CPY, __pyx_k_CPY, sizeof(__pyx_k_CPY), 0, 1, 0, 1},
-  {&__pyx_n_u_DEC, __pyx_k_DEC, sizeof(__pyx_k_DEC), 0, 1, 0, 1},
-  {&__pyx_n_u_DEX, __pyx_k_DEX, sizeof(__pyx_k_DEX), 0, 1, 0, 1},
-  {&__pyx_n_u_DEY, __pyx_k_DEY, sizeof(__pyx_k_DEY), 0, 1, 0, 1},
-  {&__pyx_n_u_EOR, __pyx_k_EOR, sizeof(__pyx_k_EOR), 0, 1, 0, 1},
-  {&__pyx_n_u_INC, __pyx_k_INC, sizeof(__pyx_k_INC), 0, 1, 0, 1},
-  {&__pyx_n_s_INES, __pyx_k_INES, sizeof(__pyx_k_INES), 0, 0, 1, 1},
-  {&__pyx_n_s_INES2_0, __pyx_k_INES2_0, sizeof(__pyx_k_INES2_0), 0, 0, 1, 1},
-  {&__pyx_n_u_INX, __pyx_k_INX, sizeof(__pyx_k_INX), 0, 1, 0, 1},
-  {&__pyx_n_u_INY, __pyx_k_INY, sizeof(__pyx_k_INY), 0, 1, 0, 1},
-  {&__pyx_n_s_Immediate, __pyx_k_Immediate, sizeof(__pyx_k_Immediate), 0, 0, 1, 1},
-  {&__pyx_n_s_Implicit, __pyx_k_Implicit, sizeof(__pyx_k_Implicit), 0, 0, 1, 1},
-  {&__pyx_n_s_Indirect, __pyx_k_Indirect, sizeof(__pyx_k_Indirect), 0, 0, 1, 1},
-  {&__pyx_n_s_IndirectX, __pyx_k_IndirectX, sizeof(__pyx_k_IndirectX), 0, 0, 1, 1},
-  {&__pyx_n_s_IndirectY, __pyx_k_IndirectY, sizeof(__pyx_k_IndirectY), 0, 0, 1, 1},
-  {&__pyx_n_s_InstructionAddressingModeMap, __pyx_k_InstructionAddressingModeMap, sizeof(__pyx_k_InstructionAddressingModeMap), 0, 0, 1, 1},
-  {&__pyx_n_s_InstructionDisasmExtras, __pyx_k_InstructionDisasmExtras, sizeof(__pyx_k_InstructionDisasmExtras), 0, 0, 1, 1},
-  {&__pyx_n_s_InstructionLengthMap, __pyx_k_InstructionLengthMap, sizeof(__pyx_k_InstructionLengthMap), 0, 0, 1, 1},
-  {&__pyx_n_s_InstructionMnemonicMap, __pyx_k_InstructionMnemonicMap, sizeof(__pyx_k_InstructionMnemonicMap), 0, 0, 1, 1},
-  {&__pyx_n_u_JMP, __pyx_k_JMP, sizeof(__pyx_k_JMP), 0, 1, 0, 1},
-  {&__pyx_n_u_JSR, __pyx_k_JSR, sizeof(__pyx_k_JSR), 0, 1, 0, 1},
-  {&__pyx_n_u_LDA, __pyx_k_LDA, sizeof(__pyx_k_LDA), 0, 1, 0, 1},
-  {&__pyx_n_u_LDX, __pyx_k_LDX, sizeof(__pyx_k_LDX), 0, 1, 0, 1},
-  {&__pyx_n_u_LDY, __pyx_k_LDY, sizeof(__pyx_k_LDY), 0, 1, 0, 1},
-  {&__pyx_n_u_LSR, __pyx_k_LSR, sizeof(__pyx_k_LSR), 0, 1, 0, 1},
-  {&__pyx_n_s_MMC1, __pyx_k_MMC1, sizeof(__pyx_k_MMC1), 0, 0, 1, 1},
-  {&__pyx_n_s_MMC2, __pyx_k_MMC2, sizeof(__pyx_k_MMC2), 0, 0, 1, 1},
-  {&__pyx_n_s_MMC3, __pyx_k_MMC3, sizeof(__pyx_k_MMC3), 0, 0, 1, 1},
-  {&__pyx_n_s_Mapper, __pyx_k_Mapper, sizeof(__pyx_k_Mapper), 0, 0, 1, 1},
-  {&__pyx_kp_s_Maps_mapper_names_to_mapper_val, __pyx_k_Maps_mapper_names_to_mapper_val, sizeof(__pyx_k_Maps_mapper_names_to_mapper_val), 0, 0, 1, 0},
-  {&__pyx_n_u_NOP, __pyx_k_NOP, sizeof(__pyx_k_NOP), 0, 1, 0, 1},
-  {&__pyx_n_s_NROM, __pyx_k_NROM, sizeof(__pyx_k_NROM), 0, 0, 1, 1},
-  {&__pyx_n_s_OAMADDR, __pyx_k_OAMADDR, sizeof(__pyx_k_OAMADDR), 0, 0, 1, 1},
-  {&__pyx_n_s_OAMDATA, __pyx_k_OAMDATA, sizeof(__pyx_k_OAMDATA), 0, 0, 1, 1},
-  {&__pyx_n_u_ORA, __pyx_k_ORA, sizeof(__pyx_k_ORA), 0, 1, 0, 1},
-  {&__pyx_n_u_PHA, __pyx_k_PHA, sizeof(__pyx_k_PHA), 0, 1, 0, 1},
-  {&__pyx_n_u_PHP, __pyx_k_PHP, sizeof(__pyx_k_PHP), 0, 1, 0, 1},
-  {&__pyx_n_u_PLA, __pyx_k_PLA, sizeof(__pyx_k_PLA), 0, 1, 0, 1},
-  {&__pyx_n_u_PLP, __pyx_k_PLP, sizeof(__pyx_k_PLP), 0, 1, 0, 1},
-  {&__pyx_n_s_PPUADDR, __pyx_k_PPUADDR, sizeof(__pyx_k_PPUADDR), 0, 0, 1, 1},
-  {&__pyx_n_s_PPUCTRL, __pyx_k_PPUCTRL, sizeof(__pyx_k_PPUCTRL), 0, 0, 1, 1},
-  {&__pyx_n_s_PPUDATA, __pyx_k_PPUDATA, sizeof(__pyx_k_PPUDATA), 0, 0, 1, 1},
-  {&__pyx_n_s_PPUMASK, __pyx_k_PPUMASK, sizeof(__pyx_k_PPUMASK), 0, 0, 1, 1},
-  {&__pyx_n_s_PPURegister, __pyx_k_PPURegister, sizeof(__pyx_k_PPURegister), 0, 0, 1, 1},
-  {&__pyx_n_s_PPUSCROLL, __pyx_k_PPUSCROLL, sizeof(__pyx_k_PPUSCROLL), 0, 0, 1, 1},
-  {&__pyx_n_s_PPUSTATUS, __pyx_k_PPUSTATUS, sizeof(__pyx_k_PPUSTATUS), 0, 0, 1, 1},
-  {&__pyx_n_u_ROL, __pyx_k_ROL, sizeof(__pyx_k_ROL), 0, 1, 0, 1},
-  {&__pyx_n_s_ROMFormat, __pyx_k_ROMFormat, sizeof(__pyx_k_ROMFormat), 0, 0, 1, 1},
-  {&__pyx_n_u_ROR, __pyx_k_ROR, sizeof(__pyx_k_ROR), 0, 1, 0, 1},
-  {&__pyx_n_u_RTI, __pyx_k_RTI, sizeof(__pyx_k_RTI), 0, 1, 0, 1},
-  {&__pyx_n_u_RTS, __pyx_k_RTS, sizeof(__pyx_k_RTS), 0, 1, 0, 1},
-  {&__pyx_n_s_Relative, __pyx_k_Relative, sizeof(__pyx_k_Relative), 0, 0, 1, 1},
-  {&__pyx_n_u_SBC, __pyx_k_SBC, sizeof(__pyx_k_SBC), 0, 1, 0, 1},
-  {&__pyx_n_u_SEC, __pyx_k_SEC, sizeof(__pyx_k_SEC), 0, 1, 0, 1},
-  {&__pyx_n_u_SED, __pyx_k_SED, sizeof(__pyx_k_SED), 0, 1, 0, 1},
-  {&__pyx_n_u_SEI, __pyx_k_SEI, sizeof(__pyx_k_SEI), 0, 1, 0, 1},
-  {&__pyx_n_u_STA, __pyx_k_STA, sizeof(__pyx_k_STA), 0, 1, 0, 1},
-  {&__pyx_n_u_STX, __pyx_k_STX, sizeof(__pyx_k_STX), 0, 1, 0, 1},
-  {&__pyx_n_u_STY, __pyx_k_STY, sizeof(__pyx_k_STY), 0, 1, 0, 1},
-  {&__pyx_n_u_TAX, __pyx_k_TAX, sizeof(__pyx_k_TAX), 0, 1, 0, 1},
-  {&__pyx_n_u_TAY, __pyx_k_TAY, sizeof(__pyx_k_TAY), 0, 1, 0, 1},
-  {&__pyx_n_u_TSX, __pyx_k_TSX, sizeof(__pyx_k_TSX), 0, 1, 0, 1},
-  {&__pyx_n_u_TXA, __pyx_k_TXA, sizeof(__pyx_k_TXA), 0, 1, 0, 1},
-  {&__pyx_n_u_TXS, __pyx_k_TXS, sizeof(__pyx_k_TXS), 0, 1, 0, 1},
-  {&__pyx_n_u_TYA, __pyx_k_TYA, sizeof(__pyx_k_TYA), 0, 1, 0, 1},
-  {&__pyx_n_s_UXROM, __pyx_k_UXROM, sizeof(__pyx_k_UXROM), 0, 0, 1, 1},
-  {&__pyx_n_s_ZeroPage, __pyx_k_ZeroPage, sizeof(__pyx_k_ZeroPage), 0, 0, 1, 1},
-  {&__pyx_n_s_ZeroPageX, __pyx_k_ZeroPageX, sizeof(__pyx_k_ZeroPageX), 0, 0, 1, 1},
-  {&__pyx_n_s_ZeroPageY, __pyx_k_ZeroPageY, sizeof(__pyx_k_ZeroPageY), 0, 0, 1, 1},
-  {&__pyx_n_s__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 1},
-  {&__pyx_kp_u_a, __pyx_k_a, sizeof(__pyx_k_a), 0, 1, 0, 0},
-  {&__pyx_n_u_absolute, __pyx_k_absolute, sizeof(__pyx_k_absolute), 0, 1, 0, 1},
-  {&__pyx_kp_u_absolute_x, __pyx_k_absolute_x, sizeof(__pyx_k_absolute_x), 0, 1, 0, 0},
-  {&__pyx_kp_u_absolute_y, __pyx_k_absolute_y, sizeof(__pyx_k_absolute_y), 0, 1, 0, 0},
-  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
-  {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
-  {&__pyx_n_s_fromkeys, __pyx_k_fromkeys, sizeof(__pyx_k_fromkeys), 0, 0, 1, 1},
-  {&__pyx_n_u_immediate, __pyx_k_immediate, sizeof(__pyx_k_immediate), 0, 1, 0, 1},
-  {&__pyx_n_u_implicit, __pyx_k_implicit, sizeof(__pyx_k_implicit), 0, 1, 0, 1},
-  {&__pyx_n_u_indirect, __pyx_k_indirect, sizeof(__pyx_k_indirect), 0, 1, 0, 1},
-  {&__pyx_kp_u_indirect_x, __pyx_k_indirect_x, sizeof(__pyx_k_indirect_x), 0, 1, 0, 0},
-  {&__pyx_kp_u_indirect_y, __pyx_k_indirect_y, sizeof(__pyx_k_indirect_y), 0, 1, 0, 0},
-  {&__pyx_n_s_init_subclass, __pyx_k_init_subclass, sizeof(__pyx_k_init_subclass), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
-  {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
-  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-  {&__pyx_n_s_nespy_enum, __pyx_k_nespy_enum, sizeof(__pyx_k_nespy_enum), 0, 0, 1, 1},
-  {&__pyx_kp_u_operand, __pyx_k_operand, sizeof(__pyx_k_operand), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_2, __pyx_k_operand_2, sizeof(__pyx_k_operand_2), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_3, __pyx_k_operand_3, sizeof(__pyx_k_operand_3), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_X, __pyx_k_operand_X, sizeof(__pyx_k_operand_X), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_X_2, __pyx_k_operand_X_2, sizeof(__pyx_k_operand_X_2), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_Y, __pyx_k_operand_Y, sizeof(__pyx_k_operand_Y), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_Y_2, __pyx_k_operand_Y_2, sizeof(__pyx_k_operand_Y_2), 0, 1, 0, 0},
-  {&__pyx_kp_u_operand_value2, __pyx_k_operand_value2, sizeof(__pyx_k_operand_value2), 0, 1, 0, 0},
-  {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
-  {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
-  {&__pyx_n_u_relative, __pyx_k_relative, sizeof(__pyx_k_relative), 0, 1, 0, 1},
-  {&__pyx_n_s_set_name, __pyx_k_set_name, sizeof(__pyx_k_set_name), 0, 0, 1, 1},
-  {&__pyx_n_s_super, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {&__pyx_kp_u_value2, __pyx_k_value2, sizeof(__pyx_k_value2), 0, 1, 0, 0},
-  {&__pyx_kp_u_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 1, 0, 0},
-  {&__pyx_kp_u_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 1, 0, 0},
-  {&__pyx_n_u_zeropage, __pyx_k_zeropage, sizeof(__pyx_k_zeropage), 0, 1, 0, 1},
-  {&__pyx_kp_u_zeropage_x, __pyx_k_zeropage_x, sizeof(__pyx_k_zeropage_x), 0, 1, 0, 0},
-  {&__pyx_kp_u_zeropage_y, __pyx_k_zeropage_y, sizeof(__pyx_k_zeropage_y), 0, 1, 0, 0},
-  #endif
-  {0, 0, 0, 0, 0, 0, 0}
-};
-/* #### Code section: cached_builtins ### */
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  return 0;
-}
-/* #### Code section: cached_constants ### */
-
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-/* #### Code section: init_globals ### */
-
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  #if CYTHON_USE_MODULE_STATE
-  if (__Pyx_InitString(__pyx_string_tab[0], &__pyx_kp_u_) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[1], &__pyx_n_u_ADC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[2], &__pyx_n_u_AND) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[3], &__pyx_n_u_ASL) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[4], &__pyx_n_s_AXROM) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[5], &__pyx_n_s_Absolute) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[6], &__pyx_n_s_AbsoluteX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[7], &__pyx_n_s_AbsoluteY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[8], &__pyx_n_s_AddressingMode) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[9], &__pyx_n_s_AddressingModeDisasmFormat) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[10], &__pyx_n_u_BCC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[11], &__pyx_n_u_BCS) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[12], &__pyx_n_u_BEQ) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[13], &__pyx_n_u_BIT) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[14], &__pyx_n_u_BMI) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[15], &__pyx_n_u_BNE) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[16], &__pyx_n_u_BPL) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[17], &__pyx_n_u_BRK) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[18], &__pyx_n_u_BVC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[19], &__pyx_n_u_BVS) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[20], &__pyx_n_u_CLC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[21], &__pyx_n_u_CLD) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[22], &__pyx_n_u_CLI) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[23], &__pyx_n_u_CLV) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[24], &__pyx_n_u_CMP) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[25], &__pyx_n_s_CNROM) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[26], &__pyx_n_u_CPX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[27], &__pyx_n_u_CPY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[28], &__pyx_n_u_DEC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[29], &__pyx_n_u_DEX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[30], &__pyx_n_u_DEY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[31], &__pyx_n_u_EOR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[32], &__pyx_n_u_INC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[33], &__pyx_n_s_INES) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[34], &__pyx_n_s_INES2_0) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[35], &__pyx_n_u_INX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[36], &__pyx_n_u_INY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[37], &__pyx_n_s_Immediate) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[38], &__pyx_n_s_Implicit) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[39], &__pyx_n_s_Indirect) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[40], &__pyx_n_s_IndirectX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[41], &__pyx_n_s_IndirectY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[42], &__pyx_n_s_InstructionAddressingModeMap) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[43], &__pyx_n_s_InstructionDisasmExtras) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[44], &__pyx_n_s_InstructionLengthMap) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[45], &__pyx_n_s_InstructionMnemonicMap) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[46], &__pyx_n_u_JMP) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[47], &__pyx_n_u_JSR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[48], &__pyx_n_u_LDA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[49], &__pyx_n_u_LDX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[50], &__pyx_n_u_LDY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[51], &__pyx_n_u_LSR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[52], &__pyx_n_s_MMC1) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[53], &__pyx_n_s_MMC2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[54], &__pyx_n_s_MMC3) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[55], &__pyx_n_s_Mapper) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[56], &__pyx_kp_s_Maps_mapper_names_to_mapper_val) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[57], &__pyx_n_u_NOP) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[58], &__pyx_n_s_NROM) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[59], &__pyx_n_s_OAMADDR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[60], &__pyx_n_s_OAMDATA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[61], &__pyx_n_u_ORA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[62], &__pyx_n_u_PHA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[63], &__pyx_n_u_PHP) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[64], &__pyx_n_u_PLA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[65], &__pyx_n_u_PLP) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[66], &__pyx_n_s_PPUADDR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[67], &__pyx_n_s_PPUCTRL) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[68], &__pyx_n_s_PPUDATA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[69], &__pyx_n_s_PPUMASK) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[70], &__pyx_n_s_PPURegister) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[71], &__pyx_n_s_PPUSCROLL) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[72], &__pyx_n_s_PPUSTATUS) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[73], &__pyx_n_u_ROL) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[74], &__pyx_n_s_ROMFormat) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[75], &__pyx_n_u_ROR) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[76], &__pyx_n_u_RTI) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[77], &__pyx_n_u_RTS) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[78], &__pyx_n_s_Relative) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[79], &__pyx_n_u_SBC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[80], &__pyx_n_u_SEC) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[81], &__pyx_n_u_SED) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[82], &__pyx_n_u_SEI) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[83], &__pyx_n_u_STA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[84], &__pyx_n_u_STX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[85], &__pyx_n_u_STY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[86], &__pyx_n_u_TAX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[87], &__pyx_n_u_TAY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[88], &__pyx_n_u_TSX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[89], &__pyx_n_u_TXA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[90], &__pyx_n_u_TXS) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[91], &__pyx_n_u_TYA) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[92], &__pyx_n_s_UXROM) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[93], &__pyx_n_s_ZeroPage) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[94], &__pyx_n_s_ZeroPageX) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[95], &__pyx_n_s_ZeroPageY) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[96], &__pyx_n_s__2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[97], &__pyx_kp_u_a) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[98], &__pyx_n_u_absolute) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[99], &__pyx_kp_u_absolute_x) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[100], &__pyx_kp_u_absolute_y) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[101], &__pyx_n_s_cline_in_traceback) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[102], &__pyx_n_s_dict) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[103], &__pyx_n_s_doc) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[104], &__pyx_n_s_fromkeys) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[105], &__pyx_n_u_immediate) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[106], &__pyx_n_u_implicit) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[107], &__pyx_n_u_indirect) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[108], &__pyx_kp_u_indirect_x) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[109], &__pyx_kp_u_indirect_y) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[110], &__pyx_n_s_init_subclass) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[111], &__pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[112], &__pyx_n_s_metaclass) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[113], &__pyx_n_s_module) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[114], &__pyx_n_s_name) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[115], &__pyx_n_s_nespy_enum) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[116], &__pyx_kp_u_operand) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[117], &__pyx_kp_u_operand_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[118], &__pyx_kp_u_operand_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[119], &__pyx_kp_u_operand_X) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[120], &__pyx_kp_u_operand_X_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[121], &__pyx_kp_u_operand_Y) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[122], &__pyx_kp_u_operand_Y_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[123], &__pyx_kp_u_operand_value2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[124], &__pyx_n_s_prepare) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[125], &__pyx_n_s_qualname) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[126], &__pyx_n_u_relative) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[127], &__pyx_n_s_set_name) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[128], &__pyx_n_s_super) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[129], &__pyx_n_s_test) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[130], &__pyx_kp_u_value2) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[131], &__pyx_kp_u_x) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[132], &__pyx_kp_u_y) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[133], &__pyx_n_u_zeropage) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[134], &__pyx_kp_u_zeropage_x) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  if (__Pyx_InitString(__pyx_string_tab[135], &__pyx_kp_u_zeropage_y) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  #endif
-  #if !CYTHON_USE_MODULE_STATE
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  #endif
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_13 = PyInt_FromLong(13); if (unlikely(!__pyx_int_13)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_14 = PyInt_FromLong(14); if (unlikely(!__pyx_int_14)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_16 = PyInt_FromLong(16); if (unlikely(!__pyx_int_16)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_17 = PyInt_FromLong(17); if (unlikely(!__pyx_int_17)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_21 = PyInt_FromLong(21); if (unlikely(!__pyx_int_21)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_22 = PyInt_FromLong(22); if (unlikely(!__pyx_int_22)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_24 = PyInt_FromLong(24); if (unlikely(!__pyx_int_24)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_25 = PyInt_FromLong(25); if (unlikely(!__pyx_int_25)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_26 = PyInt_FromLong(26); if (unlikely(!__pyx_int_26)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_29 = PyInt_FromLong(29); if (unlikely(!__pyx_int_29)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_30 = PyInt_FromLong(30); if (unlikely(!__pyx_int_30)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_32 = PyInt_FromLong(32); if (unlikely(!__pyx_int_32)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_33 = PyInt_FromLong(33); if (unlikely(!__pyx_int_33)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_36 = PyInt_FromLong(36); if (unlikely(!__pyx_int_36)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_37 = PyInt_FromLong(37); if (unlikely(!__pyx_int_37)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_38 = PyInt_FromLong(38); if (unlikely(!__pyx_int_38)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_40 = PyInt_FromLong(40); if (unlikely(!__pyx_int_40)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_41 = PyInt_FromLong(41); if (unlikely(!__pyx_int_41)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_42 = PyInt_FromLong(42); if (unlikely(!__pyx_int_42)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_44 = PyInt_FromLong(44); if (unlikely(!__pyx_int_44)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_45 = PyInt_FromLong(45); if (unlikely(!__pyx_int_45)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_46 = PyInt_FromLong(46); if (unlikely(!__pyx_int_46)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_48 = PyInt_FromLong(48); if (unlikely(!__pyx_int_48)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_49 = PyInt_FromLong(49); if (unlikely(!__pyx_int_49)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_53 = PyInt_FromLong(53); if (unlikely(!__pyx_int_53)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_54 = PyInt_FromLong(54); if (unlikely(!__pyx_int_54)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_56 = PyInt_FromLong(56); if (unlikely(!__pyx_int_56)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_57 = PyInt_FromLong(57); if (unlikely(!__pyx_int_57)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_58 = PyInt_FromLong(58); if (unlikely(!__pyx_int_58)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_61 = PyInt_FromLong(61); if (unlikely(!__pyx_int_61)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_62 = PyInt_FromLong(62); if (unlikely(!__pyx_int_62)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_64 = PyInt_FromLong(64); if (unlikely(!__pyx_int_64)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_65 = PyInt_FromLong(65); if (unlikely(!__pyx_int_65)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_69 = PyInt_FromLong(69); if (unlikely(!__pyx_int_69)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_70 = PyInt_FromLong(70); if (unlikely(!__pyx_int_70)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_72 = PyInt_FromLong(72); if (unlikely(!__pyx_int_72)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_73 = PyInt_FromLong(73); if (unlikely(!__pyx_int_73)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_74 = PyInt_FromLong(74); if (unlikely(!__pyx_int_74)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_76 = PyInt_FromLong(76); if (unlikely(!__pyx_int_76)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_77 = PyInt_FromLong(77); if (unlikely(!__pyx_int_77)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_78 = PyInt_FromLong(78); if (unlikely(!__pyx_int_78)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_80 = PyInt_FromLong(80); if (unlikely(!__pyx_int_80)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_81 = PyInt_FromLong(81); if (unlikely(!__pyx_int_81)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_85 = PyInt_FromLong(85); if (unlikely(!__pyx_int_85)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_86 = PyInt_FromLong(86); if (unlikely(!__pyx_int_86)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_88 = PyInt_FromLong(88); if (unlikely(!__pyx_int_88)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_89 = PyInt_FromLong(89); if (unlikely(!__pyx_int_89)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_90 = PyInt_FromLong(90); if (unlikely(!__pyx_int_90)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_93 = PyInt_FromLong(93); if (unlikely(!__pyx_int_93)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_94 = PyInt_FromLong(94); if (unlikely(!__pyx_int_94)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_96 = PyInt_FromLong(96); if (unlikely(!__pyx_int_96)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_97 = PyInt_FromLong(97); if (unlikely(!__pyx_int_97)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_101 = PyInt_FromLong(101); if (unlikely(!__pyx_int_101)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_102 = PyInt_FromLong(102); if (unlikely(!__pyx_int_102)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_104 = PyInt_FromLong(104); if (unlikely(!__pyx_int_104)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_105 = PyInt_FromLong(105); if (unlikely(!__pyx_int_105)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_106 = PyInt_FromLong(106); if (unlikely(!__pyx_int_106)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_108 = PyInt_FromLong(108); if (unlikely(!__pyx_int_108)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_109 = PyInt_FromLong(109); if (unlikely(!__pyx_int_109)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_110 = PyInt_FromLong(110); if (unlikely(!__pyx_int_110)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_112 = PyInt_FromLong(112); if (unlikely(!__pyx_int_112)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_113 = PyInt_FromLong(113); if (unlikely(!__pyx_int_113)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_117 = PyInt_FromLong(117); if (unlikely(!__pyx_int_117)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_118 = PyInt_FromLong(118); if (unlikely(!__pyx_int_118)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_120 = PyInt_FromLong(120); if (unlikely(!__pyx_int_120)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_121 = PyInt_FromLong(121); if (unlikely(!__pyx_int_121)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_122 = PyInt_FromLong(122); if (unlikely(!__pyx_int_122)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_125 = PyInt_FromLong(125); if (unlikely(!__pyx_int_125)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_126 = PyInt_FromLong(126); if (unlikely(!__pyx_int_126)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_128 = PyInt_FromLong(128); if (unlikely(!__pyx_int_128)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_129 = PyInt_FromLong(129); if (unlikely(!__pyx_int_129)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_130 = PyInt_FromLong(130); if (unlikely(!__pyx_int_130)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_132 = PyInt_FromLong(132); if (unlikely(!__pyx_int_132)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_133 = PyInt_FromLong(133); if (unlikely(!__pyx_int_133)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_134 = PyInt_FromLong(134); if (unlikely(!__pyx_int_134)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_136 = PyInt_FromLong(136); if (unlikely(!__pyx_int_136)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_137 = PyInt_FromLong(137); if (unlikely(!__pyx_int_137)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_138 = PyInt_FromLong(138); if (unlikely(!__pyx_int_138)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_140 = PyInt_FromLong(140); if (unlikely(!__pyx_int_140)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_141 = PyInt_FromLong(141); if (unlikely(!__pyx_int_141)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_142 = PyInt_FromLong(142); if (unlikely(!__pyx_int_142)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_144 = PyInt_FromLong(144); if (unlikely(!__pyx_int_144)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_145 = PyInt_FromLong(145); if (unlikely(!__pyx_int_145)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_148 = PyInt_FromLong(148); if (unlikely(!__pyx_int_148)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_149 = PyInt_FromLong(149); if (unlikely(!__pyx_int_149)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_150 = PyInt_FromLong(150); if (unlikely(!__pyx_int_150)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_152 = PyInt_FromLong(152); if (unlikely(!__pyx_int_152)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_153 = PyInt_FromLong(153); if (unlikely(!__pyx_int_153)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_154 = PyInt_FromLong(154); if (unlikely(!__pyx_int_154)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_157 = PyInt_FromLong(157); if (unlikely(!__pyx_int_157)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_160 = PyInt_FromLong(160); if (unlikely(!__pyx_int_160)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_161 = PyInt_FromLong(161); if (unlikely(!__pyx_int_161)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_162 = PyInt_FromLong(162); if (unlikely(!__pyx_int_162)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_164 = PyInt_FromLong(164); if (unlikely(!__pyx_int_164)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_165 = PyInt_FromLong(165); if (unlikely(!__pyx_int_165)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_166 = PyInt_FromLong(166); if (unlikely(!__pyx_int_166)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_168 = PyInt_FromLong(168); if (unlikely(!__pyx_int_168)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_169 = PyInt_FromLong(169); if (unlikely(!__pyx_int_169)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_170 = PyInt_FromLong(170); if (unlikely(!__pyx_int_170)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_172 = PyInt_FromLong(172); if (unlikely(!__pyx_int_172)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_173 = PyInt_FromLong(173); if (unlikely(!__pyx_int_173)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_174 = PyInt_FromLong(174); if (unlikely(!__pyx_int_174)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_176 = PyInt_FromLong(176); if (unlikely(!__pyx_int_176)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_177 = PyInt_FromLong(177); if (unlikely(!__pyx_int_177)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_180 = PyInt_FromLong(180); if (unlikely(!__pyx_int_180)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_181 = PyInt_FromLong(181); if (unlikely(!__pyx_int_181)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_182 = PyInt_FromLong(182); if (unlikely(!__pyx_int_182)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_184 = PyInt_FromLong(184); if (unlikely(!__pyx_int_184)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_185 = PyInt_FromLong(185); if (unlikely(!__pyx_int_185)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_186 = PyInt_FromLong(186); if (unlikely(!__pyx_int_186)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_188 = PyInt_FromLong(188); if (unlikely(!__pyx_int_188)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_189 = PyInt_FromLong(189); if (unlikely(!__pyx_int_189)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_190 = PyInt_FromLong(190); if (unlikely(!__pyx_int_190)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_192 = PyInt_FromLong(192); if (unlikely(!__pyx_int_192)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_193 = PyInt_FromLong(193); if (unlikely(!__pyx_int_193)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_194 = PyInt_FromLong(194); if (unlikely(!__pyx_int_194)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_196 = PyInt_FromLong(196); if (unlikely(!__pyx_int_196)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_197 = PyInt_FromLong(197); if (unlikely(!__pyx_int_197)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_198 = PyInt_FromLong(198); if (unlikely(!__pyx_int_198)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_200 = PyInt_FromLong(200); if (unlikely(!__pyx_int_200)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_201 = PyInt_FromLong(201); if (unlikely(!__pyx_int_201)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_202 = PyInt_FromLong(202); if (unlikely(!__pyx_int_202)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_204 = PyInt_FromLong(204); if (unlikely(!__pyx_int_204)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_205 = PyInt_FromLong(205); if (unlikely(!__pyx_int_205)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_206 = PyInt_FromLong(206); if (unlikely(!__pyx_int_206)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_208 = PyInt_FromLong(208); if (unlikely(!__pyx_int_208)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_209 = PyInt_FromLong(209); if (unlikely(!__pyx_int_209)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_213 = PyInt_FromLong(213); if (unlikely(!__pyx_int_213)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_214 = PyInt_FromLong(214); if (unlikely(!__pyx_int_214)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_216 = PyInt_FromLong(216); if (unlikely(!__pyx_int_216)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_217 = PyInt_FromLong(217); if (unlikely(!__pyx_int_217)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_218 = PyInt_FromLong(218); if (unlikely(!__pyx_int_218)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_221 = PyInt_FromLong(221); if (unlikely(!__pyx_int_221)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_222 = PyInt_FromLong(222); if (unlikely(!__pyx_int_222)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_224 = PyInt_FromLong(224); if (unlikely(!__pyx_int_224)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_225 = PyInt_FromLong(225); if (unlikely(!__pyx_int_225)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_226 = PyInt_FromLong(226); if (unlikely(!__pyx_int_226)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_228 = PyInt_FromLong(228); if (unlikely(!__pyx_int_228)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_229 = PyInt_FromLong(229); if (unlikely(!__pyx_int_229)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_230 = PyInt_FromLong(230); if (unlikely(!__pyx_int_230)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_232 = PyInt_FromLong(232); if (unlikely(!__pyx_int_232)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_233 = PyInt_FromLong(233); if (unlikely(!__pyx_int_233)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_234 = PyInt_FromLong(234); if (unlikely(!__pyx_int_234)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_236 = PyInt_FromLong(236); if (unlikely(!__pyx_int_236)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_237 = PyInt_FromLong(237); if (unlikely(!__pyx_int_237)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_238 = PyInt_FromLong(238); if (unlikely(!__pyx_int_238)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_240 = PyInt_FromLong(240); if (unlikely(!__pyx_int_240)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_241 = PyInt_FromLong(241); if (unlikely(!__pyx_int_241)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_245 = PyInt_FromLong(245); if (unlikely(!__pyx_int_245)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_246 = PyInt_FromLong(246); if (unlikely(!__pyx_int_246)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_248 = PyInt_FromLong(248); if (unlikely(!__pyx_int_248)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_249 = PyInt_FromLong(249); if (unlikely(!__pyx_int_249)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_250 = PyInt_FromLong(250); if (unlikely(!__pyx_int_250)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_253 = PyInt_FromLong(253); if (unlikely(!__pyx_int_253)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_254 = PyInt_FromLong(254); if (unlikely(!__pyx_int_254)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8192 = PyInt_FromLong(8192); if (unlikely(!__pyx_int_8192)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8193 = PyInt_FromLong(8193); if (unlikely(!__pyx_int_8193)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8194 = PyInt_FromLong(8194); if (unlikely(!__pyx_int_8194)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8195 = PyInt_FromLong(8195); if (unlikely(!__pyx_int_8195)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8196 = PyInt_FromLong(8196); if (unlikely(!__pyx_int_8196)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8197 = PyInt_FromLong(8197); if (unlikely(!__pyx_int_8197)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8198 = PyInt_FromLong(8198); if (unlikely(!__pyx_int_8198)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8199 = PyInt_FromLong(8199); if (unlikely(!__pyx_int_8199)) __PYX_ERR(0, 1, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitAfterSharedUtility(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
 /* #### Code section: init_module ### */
 
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
-
-static int __Pyx_modinit_global_init_code(void) {
+static int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Global_init_code", 0);
   /*--- Global init code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_variable_export_code(void) {
+static int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_export_code", 0);
   /*--- Variable export code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_function_export_code(void) {
+static int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_export_code", 0);
   /*--- Function export code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_type_init_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
-  /*--- Type init code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_type_import_code(void) {
+static int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Type_import_code", 0);
   /*--- Type import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_variable_import_code(void) {
+static int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_import_code", 0);
   /*--- Variable import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-static int __Pyx_modinit_function_import_code(void) {
+static int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_import_code", 0);
   /*--- Function import code ---*/
   __Pyx_RefNannyFinishContext();
   return 0;
 }
 
-
-#if PY_MAJOR_VERSION >= 3
 #if CYTHON_PEP489_MULTI_PHASE_INIT
 static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
 static int __pyx_pymod_exec_enum(PyObject* module); /*proto*/
 static PyModuleDef_Slot __pyx_moduledef_slots[] = {
   {Py_mod_create, (void*)__pyx_pymod_create},
   {Py_mod_exec, (void*)__pyx_pymod_exec_enum},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
   {0, NULL}
 };
 #endif
@@ -3884,12 +2722,10 @@ namespace {
       PyModuleDef_HEAD_INIT,
       "enum",
       0, /* m_doc */
-    #if CYTHON_PEP489_MULTI_PHASE_INIT
-      0, /* m_size */
-    #elif CYTHON_USE_MODULE_STATE
-      sizeof(__pyx_mstate), /* m_size */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
     #else
-      -1, /* m_size */
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
     #endif
       __pyx_methods /* m_methods */,
     #if CYTHON_PEP489_MULTI_PHASE_INIT
@@ -3910,51 +2746,78 @@ namespace {
   #ifdef __cplusplus
 } /* anonymous namespace */
 #endif
-#endif
 
+/* PyModInitFuncType */
 #ifndef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#elif PY_MAJOR_VERSION < 3
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" void
-#else
-#define __Pyx_PyMODINIT_FUNC void
-#endif
-#else
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
 #else
-#define __Pyx_PyMODINIT_FUNC PyObject *
-#endif
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
 #endif
 
-
-#if PY_MAJOR_VERSION < 3
-__Pyx_PyMODINIT_FUNC initenum(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC initenum(void)
-#else
 __Pyx_PyMODINIT_FUNC PyInit_enum(void) CYTHON_SMALL_CODE; /*proto*/
 __Pyx_PyMODINIT_FUNC PyInit_enum(void)
 #if CYTHON_PEP489_MULTI_PHASE_INIT
 {
   return PyModuleDef_Init(&__pyx_moduledef);
 }
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+                goto bad; // BaseException
+            }
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
-    #if PY_VERSION_HEX >= 0x030700A1
     static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
     PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
     if (main_interpreter_id == -1) {
         main_interpreter_id = current_id;
-        return (unlikely(current_id == -1)) ? -1 : 0;
-    } else if (unlikely(main_interpreter_id != current_id))
-    #else
-    static PyInterpreterState *main_interpreter = NULL;
-    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
-    if (!main_interpreter) {
-        main_interpreter = current_interpreter;
-    } else if (unlikely(main_interpreter != current_interpreter))
-    #endif
-    {
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
         PyErr_SetString(
             PyExc_ImportError,
             "Interpreter change detected - this module can only be loaded into one interpreter per process.");
@@ -3962,21 +2825,14 @@ static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
     }
     return 0;
 }
-#if CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *module, const char* from_name, const char* to_name, int allow_none)
-#else
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
 #endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
 {
     PyObject *value = PyObject_GetAttrString(spec, from_name);
     int result = 0;
     if (likely(value)) {
         if (allow_none || value != Py_None) {
-#if CYTHON_COMPILING_IN_LIMITED_API
-            result = PyModule_AddObject(module, to_name, value);
-#else
             result = PyDict_SetItemString(moddict, to_name, value);
-#endif
         }
         Py_DECREF(value);
     } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
@@ -3989,8 +2845,10 @@ static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject
 static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
     PyObject *module = NULL, *moddict, *modname;
     CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
     if (__Pyx_check_single_interpreter())
         return NULL;
+    #endif
     if (__pyx_m)
         return __Pyx_NewRef(__pyx_m);
     modname = PyObject_GetAttrString(spec, "name");
@@ -3998,12 +2856,8 @@ static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDe
     module = PyModule_NewObject(modname);
     Py_DECREF(modname);
     if (unlikely(!module)) goto bad;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    moddict = module;
-#else
     moddict = PyModule_GetDict(module);
     if (unlikely(!moddict)) goto bad;
-#endif
     if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
     if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
     if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
@@ -4017,13 +2871,20 @@ bad:
 
 static CYTHON_SMALL_CODE int __pyx_pymod_exec_enum(PyObject *__pyx_pyinit_module)
 #endif
-#endif
 {
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  size_t __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -4034,122 +2895,100 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_enum(PyObject *__pyx_pyinit_module
     PyErr_SetString(PyExc_RuntimeError, "Module 'enum' has already been imported. Re-initialisation is not supported.");
     return -1;
   }
-  #elif PY_MAJOR_VERSION >= 3
+  #else
   if (__pyx_m) return __Pyx_NewRef(__pyx_m);
   #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
-  __pyx_m = __pyx_pyinit_module;
-  Py_INCREF(__pyx_m);
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
   #else
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("enum", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #elif CYTHON_COMPILING_IN_LIMITED_API
   __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (unlikely((PyState_AddModule(__pyx_t_1, &__pyx_moduledef) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "enum" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
   #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_m = __pyx_t_1;
   #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
   #endif
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_b);
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
   #if CYTHON_REFNANNY
-__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-if (!__Pyx_RefNanny) {
-  PyErr_Clear();
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-  if (!__Pyx_RefNanny)
-      Py_FatalError("failed to import 'refnanny' module");
-}
-#endif
-  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_enum(void)", 0);
-  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pxy_PyFrame_Initialize_Offsets
-  __Pxy_PyFrame_Initialize_Offsets();
-  #endif
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    if (PyErr_ExceptionMatches(PyExc_Exception)) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    }
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
   #endif
+  
+__Pyx_RefNannySetupContext("PyInit_enum", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  PyEval_InitThreads();
-  #endif
   /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__pyx_module_is_main_nespy__enum) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   }
-  #if PY_MAJOR_VERSION >= 3
   {
     PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
     if (!PyDict_GetItemString(modules, "nespy.enum")) {
       if (unlikely((PyDict_SetItemString(modules, "nespy.enum", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
-  #endif
   /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Global type/function init code ---*/
-  (void)__Pyx_modinit_global_init_code();
-  (void)__Pyx_modinit_variable_export_code();
-  (void)__Pyx_modinit_function_export_code();
-  (void)__Pyx_modinit_type_init_code();
-  (void)__Pyx_modinit_type_import_code();
-  (void)__Pyx_modinit_variable_import_code();
-  (void)__Pyx_modinit_function_import_code();
+  (void)__Pyx_modinit_Global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_export_code(__pyx_mstate);
+  /*--- Type init code ---*/
+  (void)__Pyx_modinit_Type_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_import_code(__pyx_mstate);
+  if (__Pyx_InitAfterSharedUtility() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
 
   /* "nespy/enum.py":1
  * class ROMFormat:             # <<<<<<<<<<<<<<
  *     INES = 0
  *     INES2_0 = 1
- */
-  __pyx_t_1 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_ROMFormat, __pyx_n_s_ROMFormat, (PyObject *) NULL, __pyx_n_s_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_ROMFormat, __pyx_mstate_global->__pyx_n_u_ROMFormat, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
   /* "nespy/enum.py":2
  * class ROMFormat:
  *     INES = 0             # <<<<<<<<<<<<<<
  *     INES2_0 = 1
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_INES, __pyx_int_0) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_INES, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 2, __pyx_L1_error)
 
   /* "nespy/enum.py":3
  * class ROMFormat:
@@ -4157,19 +2996,22 @@ if (!__Pyx_RefNanny) {
  *     INES2_0 = 1             # <<<<<<<<<<<<<<
  * 
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_INES2_0, __pyx_int_1) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_INES2_0, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 3, __pyx_L1_error)
 
   /* "nespy/enum.py":1
  * class ROMFormat:             # <<<<<<<<<<<<<<
  *     INES = 0
  *     INES2_0 = 1
- */
-  __pyx_t_2 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_n_s_ROMFormat, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ROMFormat, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_ROMFormat, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_ROMFormat, __pyx_t_3) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "nespy/enum.py":6
  * 
@@ -4177,9 +3019,9 @@ if (!__Pyx_RefNanny) {
  * class Mapper:             # <<<<<<<<<<<<<<
  *     """
  *     Maps mapper names to mapper values found in iNES ROMs
- */
-  __pyx_t_1 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_Mapper, __pyx_n_s_Mapper, (PyObject *) NULL, __pyx_n_s_nespy_enum, __pyx_kp_s_Maps_mapper_names_to_mapper_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_Mapper, __pyx_mstate_global->__pyx_n_u_Mapper, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, __pyx_mstate_global->__pyx_kp_u_Maps_mapper_names_to_mapper_val); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
   /* "nespy/enum.py":10
  *     Maps mapper names to mapper values found in iNES ROMs
@@ -4187,8 +3029,8 @@ if (!__Pyx_RefNanny) {
  *     NROM = 0             # <<<<<<<<<<<<<<
  *     MMC1 = 1
  *     UXROM = 2
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_NROM, __pyx_int_0) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_NROM, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 10, __pyx_L1_error)
 
   /* "nespy/enum.py":11
  *     """
@@ -4196,8 +3038,8 @@ if (!__Pyx_RefNanny) {
  *     MMC1 = 1             # <<<<<<<<<<<<<<
  *     UXROM = 2
  *     CNROM = 3
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_MMC1, __pyx_int_1) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_MMC1, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
 
   /* "nespy/enum.py":12
  *     NROM = 0
@@ -4205,8 +3047,8 @@ if (!__Pyx_RefNanny) {
  *     UXROM = 2             # <<<<<<<<<<<<<<
  *     CNROM = 3
  *     MMC3 = 4
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_UXROM, __pyx_int_2) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_UXROM, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
 
   /* "nespy/enum.py":13
  *     MMC1 = 1
@@ -4214,8 +3056,8 @@ if (!__Pyx_RefNanny) {
  *     CNROM = 3             # <<<<<<<<<<<<<<
  *     MMC3 = 4
  *     AXROM = 7
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_CNROM, __pyx_int_3) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_CNROM, __pyx_mstate_global->__pyx_int_3) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
 
   /* "nespy/enum.py":14
  *     UXROM = 2
@@ -4223,8 +3065,8 @@ if (!__Pyx_RefNanny) {
  *     MMC3 = 4             # <<<<<<<<<<<<<<
  *     AXROM = 7
  *     MMC2 = 9
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_MMC3, __pyx_int_4) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_MMC3, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
 
   /* "nespy/enum.py":15
  *     CNROM = 3
@@ -4232,8 +3074,8 @@ if (!__Pyx_RefNanny) {
  *     AXROM = 7             # <<<<<<<<<<<<<<
  *     MMC2 = 9
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_AXROM, __pyx_int_7) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_AXROM, __pyx_mstate_global->__pyx_int_7) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
 
   /* "nespy/enum.py":16
  *     MMC3 = 4
@@ -4241,8 +3083,8 @@ if (!__Pyx_RefNanny) {
  *     MMC2 = 9             # <<<<<<<<<<<<<<
  * 
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_MMC2, __pyx_int_9) < 0) __PYX_ERR(0, 16, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_MMC2, __pyx_mstate_global->__pyx_int_9) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
 
   /* "nespy/enum.py":6
  * 
@@ -4250,2469 +3092,2051 @@ if (!__Pyx_RefNanny) {
  * class Mapper:             # <<<<<<<<<<<<<<
  *     """
  *     Maps mapper names to mapper values found in iNES ROMs
- */
-  __pyx_t_2 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_n_s_Mapper, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Mapper, __pyx_t_2) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_Mapper, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_Mapper, __pyx_t_3) < (0)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "nespy/enum.py":19
  * 
  * 
- * class PPURegister:             # <<<<<<<<<<<<<<
- *     PPUCTRL = 0x2000
- *     PPUMASK = 0x2001
- */
-  __pyx_t_1 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_PPURegister, __pyx_n_s_PPURegister, (PyObject *) NULL, __pyx_n_s_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-
-  /* "nespy/enum.py":20
- * 
- * class PPURegister:
- *     PPUCTRL = 0x2000             # <<<<<<<<<<<<<<
- *     PPUMASK = 0x2001
- *     PPUSTATUS = 0x2002
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUCTRL, __pyx_int_8192) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
-
-  /* "nespy/enum.py":21
- * class PPURegister:
- *     PPUCTRL = 0x2000
- *     PPUMASK = 0x2001             # <<<<<<<<<<<<<<
- *     PPUSTATUS = 0x2002
- *     OAMADDR = 0x2003
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUMASK, __pyx_int_8193) < 0) __PYX_ERR(0, 21, __pyx_L1_error)
-
-  /* "nespy/enum.py":22
- *     PPUCTRL = 0x2000
- *     PPUMASK = 0x2001
- *     PPUSTATUS = 0x2002             # <<<<<<<<<<<<<<
- *     OAMADDR = 0x2003
- *     OAMDATA = 0x2004
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUSTATUS, __pyx_int_8194) < 0) __PYX_ERR(0, 22, __pyx_L1_error)
+ * class Button:             # <<<<<<<<<<<<<<
+ *     """
+ *     Controller buttons, as bits in the order the controller reports them
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_Button, __pyx_mstate_global->__pyx_n_u_Button, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, __pyx_mstate_global->__pyx_kp_u_Controller_buttons_as_bits_in_t); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
   /* "nespy/enum.py":23
- *     PPUMASK = 0x2001
- *     PPUSTATUS = 0x2002
- *     OAMADDR = 0x2003             # <<<<<<<<<<<<<<
- *     OAMDATA = 0x2004
- *     PPUSCROLL = 0x2005
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_OAMADDR, __pyx_int_8195) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+ *     Controller buttons, as bits in the order the controller reports them
+ *     """
+ *     A = 0b00000001             # <<<<<<<<<<<<<<
+ *     B = 0b00000010
+ *     SELECT = 0b00000100
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_A, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
 
   /* "nespy/enum.py":24
- *     PPUSTATUS = 0x2002
- *     OAMADDR = 0x2003
+ *     """
+ *     A = 0b00000001
+ *     B = 0b00000010             # <<<<<<<<<<<<<<
+ *     SELECT = 0b00000100
+ *     START = 0b00001000
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_B, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 24, __pyx_L1_error)
+
+  /* "nespy/enum.py":25
+ *     A = 0b00000001
+ *     B = 0b00000010
+ *     SELECT = 0b00000100             # <<<<<<<<<<<<<<
+ *     START = 0b00001000
+ *     UP = 0b00010000
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_SELECT, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+
+  /* "nespy/enum.py":26
+ *     B = 0b00000010
+ *     SELECT = 0b00000100
+ *     START = 0b00001000             # <<<<<<<<<<<<<<
+ *     UP = 0b00010000
+ *     DOWN = 0b00100000
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_START, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+
+  /* "nespy/enum.py":27
+ *     SELECT = 0b00000100
+ *     START = 0b00001000
+ *     UP = 0b00010000             # <<<<<<<<<<<<<<
+ *     DOWN = 0b00100000
+ *     LEFT = 0b01000000
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_UP, __pyx_mstate_global->__pyx_int_16) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+
+  /* "nespy/enum.py":28
+ *     START = 0b00001000
+ *     UP = 0b00010000
+ *     DOWN = 0b00100000             # <<<<<<<<<<<<<<
+ *     LEFT = 0b01000000
+ *     RIGHT = 0b10000000
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_DOWN, __pyx_mstate_global->__pyx_int_32) < (0)) __PYX_ERR(0, 28, __pyx_L1_error)
+
+  /* "nespy/enum.py":29
+ *     UP = 0b00010000
+ *     DOWN = 0b00100000
+ *     LEFT = 0b01000000             # <<<<<<<<<<<<<<
+ *     RIGHT = 0b10000000
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_LEFT, __pyx_mstate_global->__pyx_int_64) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
+
+  /* "nespy/enum.py":30
+ *     DOWN = 0b00100000
+ *     LEFT = 0b01000000
+ *     RIGHT = 0b10000000             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_RIGHT, __pyx_mstate_global->__pyx_int_128) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+
+  /* "nespy/enum.py":19
+ * 
+ * 
+ * class Button:             # <<<<<<<<<<<<<<
+ *     """
+ *     Controller buttons, as bits in the order the controller reports them
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_Button, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_Button, __pyx_t_3) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":33
+ * 
+ * 
+ * class IRQSource:             # <<<<<<<<<<<<<<
+ *     """
+ *     Components that can hold the CPU's IRQ line low, as bits of `nespy.interrupt.InterruptLines.irq`
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_IRQSource, __pyx_mstate_global->__pyx_n_u_IRQSource, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, __pyx_mstate_global->__pyx_kp_u_Components_that_can_hold_the_CP); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "nespy/enum.py":37
+ *     Components that can hold the CPU's IRQ line low, as bits of `nespy.interrupt.InterruptLines.irq`
+ *     """
+ *     FRAME_COUNTER = 0b001             # <<<<<<<<<<<<<<
+ *     DMC = 0b010
+ *     CARTRIDGE = 0b100
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_FRAME_COUNTER, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+
+  /* "nespy/enum.py":38
+ *     """
+ *     FRAME_COUNTER = 0b001
+ *     DMC = 0b010             # <<<<<<<<<<<<<<
+ *     CARTRIDGE = 0b100
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_DMC, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
+
+  /* "nespy/enum.py":39
+ *     FRAME_COUNTER = 0b001
+ *     DMC = 0b010
+ *     CARTRIDGE = 0b100             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_CARTRIDGE, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 39, __pyx_L1_error)
+
+  /* "nespy/enum.py":33
+ * 
+ * 
+ * class IRQSource:             # <<<<<<<<<<<<<<
+ *     """
+ *     Components that can hold the CPU's IRQ line low, as bits of `nespy.interrupt.InterruptLines.irq`
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_IRQSource, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_IRQSource, __pyx_t_3) < (0)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":42
+ * 
+ * 
+ * class Mirroring:             # <<<<<<<<<<<<<<
+ *     """
+ *     Nametable mirroring arrangements. The names describe which nametables share memory,
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_Mirroring, __pyx_mstate_global->__pyx_n_u_Mirroring, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, __pyx_mstate_global->__pyx_kp_u_Nametable_mirroring_arrangement); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "nespy/enum.py":47
+ *     e.g. HORIZONTAL mirrors 0x2000 with 0x2400 and 0x2800 with 0x2C00.
+ *     """
+ *     HORIZONTAL = 0             # <<<<<<<<<<<<<<
+ *     VERTICAL = 1
+ *     SINGLE_SCREEN_LOWER = 2
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_HORIZONTAL, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 47, __pyx_L1_error)
+
+  /* "nespy/enum.py":48
+ *     """
+ *     HORIZONTAL = 0
+ *     VERTICAL = 1             # <<<<<<<<<<<<<<
+ *     SINGLE_SCREEN_LOWER = 2
+ *     SINGLE_SCREEN_UPPER = 3
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_VERTICAL, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 48, __pyx_L1_error)
+
+  /* "nespy/enum.py":49
+ *     HORIZONTAL = 0
+ *     VERTICAL = 1
+ *     SINGLE_SCREEN_LOWER = 2             # <<<<<<<<<<<<<<
+ *     SINGLE_SCREEN_UPPER = 3
+ *     FOUR_SCREEN = 4
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_SINGLE_SCREEN_LOWER, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 49, __pyx_L1_error)
+
+  /* "nespy/enum.py":50
+ *     VERTICAL = 1
+ *     SINGLE_SCREEN_LOWER = 2
+ *     SINGLE_SCREEN_UPPER = 3             # <<<<<<<<<<<<<<
+ *     FOUR_SCREEN = 4
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_SINGLE_SCREEN_UPPER, __pyx_mstate_global->__pyx_int_3) < (0)) __PYX_ERR(0, 50, __pyx_L1_error)
+
+  /* "nespy/enum.py":51
+ *     SINGLE_SCREEN_LOWER = 2
+ *     SINGLE_SCREEN_UPPER = 3
+ *     FOUR_SCREEN = 4             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_FOUR_SCREEN, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 51, __pyx_L1_error)
+
+  /* "nespy/enum.py":42
+ * 
+ * 
+ * class Mirroring:             # <<<<<<<<<<<<<<
+ *     """
+ *     Nametable mirroring arrangements. The names describe which nametables share memory,
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_Mirroring, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_Mirroring, __pyx_t_3) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":54
+ * 
+ * 
+ * class PPURegister:             # <<<<<<<<<<<<<<
+ *     PPUCTRL = 0x2000
+ *     PPUMASK = 0x2001
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_PPURegister, __pyx_mstate_global->__pyx_n_u_PPURegister, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "nespy/enum.py":55
+ * 
+ * class PPURegister:
+ *     PPUCTRL = 0x2000             # <<<<<<<<<<<<<<
+ *     PPUMASK = 0x2001
+ *     PPUSTATUS = 0x2002
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUCTRL, __pyx_mstate_global->__pyx_int_8192) < (0)) __PYX_ERR(0, 55, __pyx_L1_error)
+
+  /* "nespy/enum.py":56
+ * class PPURegister:
+ *     PPUCTRL = 0x2000
+ *     PPUMASK = 0x2001             # <<<<<<<<<<<<<<
+ *     PPUSTATUS = 0x2002
+ *     OAMADDR = 0x2003
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUMASK, __pyx_mstate_global->__pyx_int_8193) < (0)) __PYX_ERR(0, 56, __pyx_L1_error)
+
+  /* "nespy/enum.py":57
+ *     PPUCTRL = 0x2000
+ *     PPUMASK = 0x2001
+ *     PPUSTATUS = 0x2002             # <<<<<<<<<<<<<<
+ *     OAMADDR = 0x2003
+ *     OAMDATA = 0x2004
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUSTATUS, __pyx_mstate_global->__pyx_int_8194) < (0)) __PYX_ERR(0, 57, __pyx_L1_error)
+
+  /* "nespy/enum.py":58
+ *     PPUMASK = 0x2001
+ *     PPUSTATUS = 0x2002
+ *     OAMADDR = 0x2003             # <<<<<<<<<<<<<<
+ *     OAMDATA = 0x2004
+ *     PPUSCROLL = 0x2005
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_OAMADDR, __pyx_mstate_global->__pyx_int_8195) < (0)) __PYX_ERR(0, 58, __pyx_L1_error)
+
+  /* "nespy/enum.py":59
+ *     PPUSTATUS = 0x2002
+ *     OAMADDR = 0x2003
  *     OAMDATA = 0x2004             # <<<<<<<<<<<<<<
  *     PPUSCROLL = 0x2005
  *     PPUADDR = 0x2006
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_OAMDATA, __pyx_int_8196) < 0) __PYX_ERR(0, 24, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_OAMDATA, __pyx_mstate_global->__pyx_int_8196) < (0)) __PYX_ERR(0, 59, __pyx_L1_error)
 
-  /* "nespy/enum.py":25
+  /* "nespy/enum.py":60
  *     OAMADDR = 0x2003
  *     OAMDATA = 0x2004
  *     PPUSCROLL = 0x2005             # <<<<<<<<<<<<<<
  *     PPUADDR = 0x2006
  *     PPUDATA = 0x2007
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUSCROLL, __pyx_int_8197) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUSCROLL, __pyx_mstate_global->__pyx_int_8197) < (0)) __PYX_ERR(0, 60, __pyx_L1_error)
 
-  /* "nespy/enum.py":26
+  /* "nespy/enum.py":61
  *     OAMDATA = 0x2004
  *     PPUSCROLL = 0x2005
  *     PPUADDR = 0x2006             # <<<<<<<<<<<<<<
  *     PPUDATA = 0x2007
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUADDR, __pyx_int_8198) < 0) __PYX_ERR(0, 26, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUADDR, __pyx_mstate_global->__pyx_int_8198) < (0)) __PYX_ERR(0, 61, __pyx_L1_error)
 
-  /* "nespy/enum.py":27
+  /* "nespy/enum.py":62
  *     PPUSCROLL = 0x2005
  *     PPUADDR = 0x2006
  *     PPUDATA = 0x2007             # <<<<<<<<<<<<<<
  * 
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_PPUDATA, __pyx_int_8199) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PPUDATA, __pyx_mstate_global->__pyx_int_8199) < (0)) __PYX_ERR(0, 62, __pyx_L1_error)
 
-  /* "nespy/enum.py":19
+  /* "nespy/enum.py":54
  * 
  * 
  * class PPURegister:             # <<<<<<<<<<<<<<
  *     PPUCTRL = 0x2000
  *     PPUMASK = 0x2001
- */
-  __pyx_t_2 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_n_s_PPURegister, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PPURegister, __pyx_t_2) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_PPURegister, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_PPURegister, __pyx_t_3) < (0)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nespy/enum.py":31
+  /* "nespy/enum.py":66
  * 
  * InstructionMnemonicMap = {
  *     0x69: "ADC", 0x65: "ADC", 0x75: "ADC", 0x6D: "ADC",             # <<<<<<<<<<<<<<
  *     0x7D: "ADC", 0x79: "ADC", 0x61: "ADC", 0x71: "ADC",
  *     0x29: "AND", 0x25: "AND", 0x35: "AND", 0x2D: "AND",
- */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(162); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_105, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_101, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_117, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_109, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_125, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_121, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_97, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_113, __pyx_n_u_ADC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_41, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_37, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_53, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_45, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_61, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_57, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_33, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_49, __pyx_n_u_AND) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_10, __pyx_n_u_ASL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_6, __pyx_n_u_ASL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_22, __pyx_n_u_ASL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_14, __pyx_n_u_ASL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_30, __pyx_n_u_ASL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_144, __pyx_n_u_BCC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_176, __pyx_n_u_BCS) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_240, __pyx_n_u_BEQ) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_36, __pyx_n_u_BIT) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_44, __pyx_n_u_BIT) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_48, __pyx_n_u_BMI) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_208, __pyx_n_u_BNE) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_16, __pyx_n_u_BPL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_0, __pyx_n_u_BRK) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_80, __pyx_n_u_BVC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_112, __pyx_n_u_BVS) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_24, __pyx_n_u_CLC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_216, __pyx_n_u_CLD) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_88, __pyx_n_u_CLI) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_184, __pyx_n_u_CLV) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_201, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_197, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_213, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_205, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_221, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_217, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_193, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_209, __pyx_n_u_CMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_224, __pyx_n_u_CPX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_228, __pyx_n_u_CPX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_236, __pyx_n_u_CPX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_192, __pyx_n_u_CPY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_196, __pyx_n_u_CPY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_204, __pyx_n_u_CPY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_198, __pyx_n_u_DEC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_214, __pyx_n_u_DEC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_206, __pyx_n_u_DEC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_222, __pyx_n_u_DEC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_202, __pyx_n_u_DEX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_136, __pyx_n_u_DEY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_73, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_69, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_85, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_77, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_93, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_89, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_65, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_81, __pyx_n_u_EOR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_230, __pyx_n_u_INC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_246, __pyx_n_u_INC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_238, __pyx_n_u_INC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_254, __pyx_n_u_INC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_232, __pyx_n_u_INX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_200, __pyx_n_u_INY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_76, __pyx_n_u_JMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_108, __pyx_n_u_JMP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_32, __pyx_n_u_JSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_169, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_165, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_181, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_173, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_189, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_185, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_161, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_177, __pyx_n_u_LDA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_162, __pyx_n_u_LDX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_166, __pyx_n_u_LDX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_182, __pyx_n_u_LDX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_174, __pyx_n_u_LDX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_190, __pyx_n_u_LDX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_160, __pyx_n_u_LDY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_164, __pyx_n_u_LDY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_180, __pyx_n_u_LDY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_172, __pyx_n_u_LDY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_188, __pyx_n_u_LDY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_74, __pyx_n_u_LSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_70, __pyx_n_u_LSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_86, __pyx_n_u_LSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_78, __pyx_n_u_LSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_94, __pyx_n_u_LSR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_234, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_26, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_58, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_90, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_122, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_218, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_250, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_128, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_130, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_137, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_194, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_226, __pyx_n_u_NOP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_9, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_5, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_21, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_13, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_29, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_25, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_1, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_17, __pyx_n_u_ORA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_72, __pyx_n_u_PHA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_8, __pyx_n_u_PHP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_104, __pyx_n_u_PLA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_40, __pyx_n_u_PLP) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_42, __pyx_n_u_ROL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_38, __pyx_n_u_ROL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_54, __pyx_n_u_ROL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_46, __pyx_n_u_ROL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_62, __pyx_n_u_ROL) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_106, __pyx_n_u_ROR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_102, __pyx_n_u_ROR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_118, __pyx_n_u_ROR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_110, __pyx_n_u_ROR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_126, __pyx_n_u_ROR) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_64, __pyx_n_u_RTI) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_96, __pyx_n_u_RTS) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_233, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_229, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_245, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_237, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_253, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_249, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_225, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_241, __pyx_n_u_SBC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_56, __pyx_n_u_SEC) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_248, __pyx_n_u_SED) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_120, __pyx_n_u_SEI) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_133, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_149, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_141, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_157, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_153, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_129, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_145, __pyx_n_u_STA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_134, __pyx_n_u_STX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_150, __pyx_n_u_STX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_142, __pyx_n_u_STX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_132, __pyx_n_u_STY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_148, __pyx_n_u_STY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_140, __pyx_n_u_STY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_170, __pyx_n_u_TAX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_168, __pyx_n_u_TAY) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_186, __pyx_n_u_TSX) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_138, __pyx_n_u_TXA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_154, __pyx_n_u_TXS) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_int_152, __pyx_n_u_TYA) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_InstructionMnemonicMap, __pyx_t_1) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "nespy/enum.py":110
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(162); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_105, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_101, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_117, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_109, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_125, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_121, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_97, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_113, __pyx_mstate_global->__pyx_n_u_ADC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_41, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_37, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_53, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_45, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_61, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_57, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_33, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_49, __pyx_mstate_global->__pyx_n_u_AND) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_10, __pyx_mstate_global->__pyx_n_u_ASL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_6, __pyx_mstate_global->__pyx_n_u_ASL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_22, __pyx_mstate_global->__pyx_n_u_ASL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_14, __pyx_mstate_global->__pyx_n_u_ASL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_n_u_ASL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_144, __pyx_mstate_global->__pyx_n_u_BCC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_176, __pyx_mstate_global->__pyx_n_u_BCS) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_240, __pyx_mstate_global->__pyx_n_u_BEQ) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_36, __pyx_mstate_global->__pyx_n_u_BIT) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_44, __pyx_mstate_global->__pyx_n_u_BIT) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_n_u_BMI) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_208, __pyx_mstate_global->__pyx_n_u_BNE) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_16, __pyx_mstate_global->__pyx_n_u_BPL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_n_u_BRK) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_80, __pyx_mstate_global->__pyx_n_u_BVC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_112, __pyx_mstate_global->__pyx_n_u_BVS) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_24, __pyx_mstate_global->__pyx_n_u_CLC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_216, __pyx_mstate_global->__pyx_n_u_CLD) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_88, __pyx_mstate_global->__pyx_n_u_CLI) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_184, __pyx_mstate_global->__pyx_n_u_CLV) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_201, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_197, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_213, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_205, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_221, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_217, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_193, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_209, __pyx_mstate_global->__pyx_n_u_CMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_224, __pyx_mstate_global->__pyx_n_u_CPX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_n_u_CPX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_n_u_CPX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_192, __pyx_mstate_global->__pyx_n_u_CPY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_n_u_CPY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_n_u_CPY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_198, __pyx_mstate_global->__pyx_n_u_DEC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_214, __pyx_mstate_global->__pyx_n_u_DEC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_206, __pyx_mstate_global->__pyx_n_u_DEC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_222, __pyx_mstate_global->__pyx_n_u_DEC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_202, __pyx_mstate_global->__pyx_n_u_DEX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_n_u_DEY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_73, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_69, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_85, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_77, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_93, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_89, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_65, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_81, __pyx_mstate_global->__pyx_n_u_EOR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_230, __pyx_mstate_global->__pyx_n_u_INC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_246, __pyx_mstate_global->__pyx_n_u_INC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_238, __pyx_mstate_global->__pyx_n_u_INC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_254, __pyx_mstate_global->__pyx_n_u_INC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_232, __pyx_mstate_global->__pyx_n_u_INX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_200, __pyx_mstate_global->__pyx_n_u_INY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_n_u_JMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_108, __pyx_mstate_global->__pyx_n_u_JMP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_32, __pyx_mstate_global->__pyx_n_u_JSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_169, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_165, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_181, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_173, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_189, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_185, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_161, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_177, __pyx_mstate_global->__pyx_n_u_LDA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_162, __pyx_mstate_global->__pyx_n_u_LDX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_166, __pyx_mstate_global->__pyx_n_u_LDX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_182, __pyx_mstate_global->__pyx_n_u_LDX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_174, __pyx_mstate_global->__pyx_n_u_LDX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_190, __pyx_mstate_global->__pyx_n_u_LDX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_n_u_LDY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_164, __pyx_mstate_global->__pyx_n_u_LDY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_n_u_LDY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_172, __pyx_mstate_global->__pyx_n_u_LDY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_n_u_LDY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_74, __pyx_mstate_global->__pyx_n_u_LSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_70, __pyx_mstate_global->__pyx_n_u_LSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_86, __pyx_mstate_global->__pyx_n_u_LSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_78, __pyx_mstate_global->__pyx_n_u_LSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_94, __pyx_mstate_global->__pyx_n_u_LSR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_234, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_26, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_58, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_90, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_122, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_218, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_250, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_128, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_130, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_137, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_194, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_226, __pyx_mstate_global->__pyx_n_u_NOP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_9, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_5, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_21, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_13, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_29, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_25, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_1, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_17, __pyx_mstate_global->__pyx_n_u_ORA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_72, __pyx_mstate_global->__pyx_n_u_PHA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_n_u_PHP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_104, __pyx_mstate_global->__pyx_n_u_PLA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_40, __pyx_mstate_global->__pyx_n_u_PLP) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_42, __pyx_mstate_global->__pyx_n_u_ROL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_38, __pyx_mstate_global->__pyx_n_u_ROL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_54, __pyx_mstate_global->__pyx_n_u_ROL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_46, __pyx_mstate_global->__pyx_n_u_ROL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_62, __pyx_mstate_global->__pyx_n_u_ROL) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_106, __pyx_mstate_global->__pyx_n_u_ROR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_102, __pyx_mstate_global->__pyx_n_u_ROR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_118, __pyx_mstate_global->__pyx_n_u_ROR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_110, __pyx_mstate_global->__pyx_n_u_ROR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_126, __pyx_mstate_global->__pyx_n_u_ROR) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_64, __pyx_mstate_global->__pyx_n_u_RTI) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_96, __pyx_mstate_global->__pyx_n_u_RTS) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_233, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_229, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_245, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_237, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_253, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_249, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_225, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_241, __pyx_mstate_global->__pyx_n_u_SBC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_n_u_SEC) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_248, __pyx_mstate_global->__pyx_n_u_SED) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_n_u_SEI) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_133, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_149, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_141, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_157, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_153, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_129, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_145, __pyx_mstate_global->__pyx_n_u_STA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_134, __pyx_mstate_global->__pyx_n_u_STX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_n_u_STX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_142, __pyx_mstate_global->__pyx_n_u_STX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_132, __pyx_mstate_global->__pyx_n_u_STY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_148, __pyx_mstate_global->__pyx_n_u_STY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_140, __pyx_mstate_global->__pyx_n_u_STY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_170, __pyx_mstate_global->__pyx_n_u_TAX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_n_u_TAY) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_186, __pyx_mstate_global->__pyx_n_u_TSX) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_138, __pyx_mstate_global->__pyx_n_u_TXA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_154, __pyx_mstate_global->__pyx_n_u_TXS) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_n_u_TYA) < (0)) __PYX_ERR(0, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionMnemonicMap, __pyx_t_2) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":145
  * 
  * 
  * class AddressingMode:             # <<<<<<<<<<<<<<
  *     Absolute = "absolute"
  *     AbsoluteX = "absolute,x"
- */
-  __pyx_t_1 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_empty_tuple, __pyx_n_s_AddressingMode, __pyx_n_s_AddressingMode, (PyObject *) NULL, __pyx_n_s_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+*/
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare((PyObject *) NULL, __pyx_mstate_global->__pyx_empty_tuple, __pyx_mstate_global->__pyx_n_u_AddressingMode, __pyx_mstate_global->__pyx_n_u_AddressingMode, (PyObject *) NULL, __pyx_mstate_global->__pyx_n_u_nespy_enum, (PyObject *) NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "nespy/enum.py":111
+  /* "nespy/enum.py":146
  * 
  * class AddressingMode:
  *     Absolute = "absolute"             # <<<<<<<<<<<<<<
  *     AbsoluteX = "absolute,x"
  *     AbsoluteY = "absolute,y"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_Absolute, __pyx_n_u_absolute) < 0) __PYX_ERR(0, 111, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Absolute, __pyx_mstate_global->__pyx_n_u_absolute) < (0)) __PYX_ERR(0, 146, __pyx_L1_error)
 
-  /* "nespy/enum.py":112
+  /* "nespy/enum.py":147
  * class AddressingMode:
  *     Absolute = "absolute"
  *     AbsoluteX = "absolute,x"             # <<<<<<<<<<<<<<
  *     AbsoluteY = "absolute,y"
  *     ZeroPage = "zeropage"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_AbsoluteX, __pyx_kp_u_absolute_x) < 0) __PYX_ERR(0, 112, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_AbsoluteX, __pyx_mstate_global->__pyx_kp_u_absolute_x) < (0)) __PYX_ERR(0, 147, __pyx_L1_error)
 
-  /* "nespy/enum.py":113
+  /* "nespy/enum.py":148
  *     Absolute = "absolute"
  *     AbsoluteX = "absolute,x"
  *     AbsoluteY = "absolute,y"             # <<<<<<<<<<<<<<
  *     ZeroPage = "zeropage"
  *     ZeroPageX = "zeropage,x"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_AbsoluteY, __pyx_kp_u_absolute_y) < 0) __PYX_ERR(0, 113, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_AbsoluteY, __pyx_mstate_global->__pyx_kp_u_absolute_y) < (0)) __PYX_ERR(0, 148, __pyx_L1_error)
 
-  /* "nespy/enum.py":114
+  /* "nespy/enum.py":149
  *     AbsoluteX = "absolute,x"
  *     AbsoluteY = "absolute,y"
  *     ZeroPage = "zeropage"             # <<<<<<<<<<<<<<
  *     ZeroPageX = "zeropage,x"
  *     ZeroPageY = "zeropage,y"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_ZeroPage, __pyx_n_u_zeropage) < 0) __PYX_ERR(0, 114, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_ZeroPage, __pyx_mstate_global->__pyx_n_u_zeropage) < (0)) __PYX_ERR(0, 149, __pyx_L1_error)
 
-  /* "nespy/enum.py":115
+  /* "nespy/enum.py":150
  *     AbsoluteY = "absolute,y"
  *     ZeroPage = "zeropage"
  *     ZeroPageX = "zeropage,x"             # <<<<<<<<<<<<<<
  *     ZeroPageY = "zeropage,y"
  *     Immediate = "immediate"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_ZeroPageX, __pyx_kp_u_zeropage_x) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_ZeroPageX, __pyx_mstate_global->__pyx_kp_u_zeropage_x) < (0)) __PYX_ERR(0, 150, __pyx_L1_error)
 
-  /* "nespy/enum.py":116
+  /* "nespy/enum.py":151
  *     ZeroPage = "zeropage"
  *     ZeroPageX = "zeropage,x"
  *     ZeroPageY = "zeropage,y"             # <<<<<<<<<<<<<<
  *     Immediate = "immediate"
  *     Relative = "relative"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_ZeroPageY, __pyx_kp_u_zeropage_y) < 0) __PYX_ERR(0, 116, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_ZeroPageY, __pyx_mstate_global->__pyx_kp_u_zeropage_y) < (0)) __PYX_ERR(0, 151, __pyx_L1_error)
 
-  /* "nespy/enum.py":117
+  /* "nespy/enum.py":152
  *     ZeroPageX = "zeropage,x"
  *     ZeroPageY = "zeropage,y"
  *     Immediate = "immediate"             # <<<<<<<<<<<<<<
  *     Relative = "relative"
  *     Implicit = "implicit"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_Immediate, __pyx_n_u_immediate) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Immediate, __pyx_mstate_global->__pyx_n_u_immediate) < (0)) __PYX_ERR(0, 152, __pyx_L1_error)
 
-  /* "nespy/enum.py":118
+  /* "nespy/enum.py":153
  *     ZeroPageY = "zeropage,y"
  *     Immediate = "immediate"
  *     Relative = "relative"             # <<<<<<<<<<<<<<
  *     Implicit = "implicit"
  *     Indirect = "indirect"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_Relative, __pyx_n_u_relative) < 0) __PYX_ERR(0, 118, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Relative, __pyx_mstate_global->__pyx_n_u_relative) < (0)) __PYX_ERR(0, 153, __pyx_L1_error)
 
-  /* "nespy/enum.py":119
+  /* "nespy/enum.py":154
  *     Immediate = "immediate"
  *     Relative = "relative"
  *     Implicit = "implicit"             # <<<<<<<<<<<<<<
  *     Indirect = "indirect"
  *     IndirectX = "indirect,x"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_Implicit, __pyx_n_u_implicit) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Implicit, __pyx_mstate_global->__pyx_n_u_implicit) < (0)) __PYX_ERR(0, 154, __pyx_L1_error)
 
-  /* "nespy/enum.py":120
+  /* "nespy/enum.py":155
  *     Relative = "relative"
  *     Implicit = "implicit"
  *     Indirect = "indirect"             # <<<<<<<<<<<<<<
  *     IndirectX = "indirect,x"
  *     IndirectY = "indirect,y"
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_Indirect, __pyx_n_u_indirect) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Indirect, __pyx_mstate_global->__pyx_n_u_indirect) < (0)) __PYX_ERR(0, 155, __pyx_L1_error)
 
-  /* "nespy/enum.py":121
+  /* "nespy/enum.py":156
  *     Implicit = "implicit"
  *     Indirect = "indirect"
  *     IndirectX = "indirect,x"             # <<<<<<<<<<<<<<
  *     IndirectY = "indirect,y"
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_IndirectX, __pyx_kp_u_indirect_x) < 0) __PYX_ERR(0, 121, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_IndirectX, __pyx_mstate_global->__pyx_kp_u_indirect_x) < (0)) __PYX_ERR(0, 156, __pyx_L1_error)
 
-  /* "nespy/enum.py":122
+  /* "nespy/enum.py":157
  *     Indirect = "indirect"
  *     IndirectX = "indirect,x"
  *     IndirectY = "indirect,y"             # <<<<<<<<<<<<<<
  * 
  * 
- */
-  if (__Pyx_SetNameInClass(__pyx_t_1, __pyx_n_s_IndirectY, __pyx_kp_u_indirect_y) < 0) __PYX_ERR(0, 122, __pyx_L1_error)
+*/
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_IndirectY, __pyx_mstate_global->__pyx_kp_u_indirect_y) < (0)) __PYX_ERR(0, 157, __pyx_L1_error)
 
-  /* "nespy/enum.py":110
+  /* "nespy/enum.py":145
  * 
  * 
  * class AddressingMode:             # <<<<<<<<<<<<<<
  *     Absolute = "absolute"
  *     AbsoluteX = "absolute,x"
- */
-  __pyx_t_2 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_n_s_AddressingMode, __pyx_empty_tuple, __pyx_t_1, NULL, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AddressingMode, __pyx_t_2) < 0) __PYX_ERR(0, 110, __pyx_L1_error)
+*/
+  __pyx_t_3 = __Pyx_Py3ClassCreate(((PyObject*)&PyType_Type), __pyx_mstate_global->__pyx_n_u_AddressingMode, __pyx_mstate_global->__pyx_empty_tuple, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_3);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_AddressingMode, __pyx_t_3) < (0)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nespy/enum.py":126
+  /* "nespy/enum.py":161
  * 
  * InstructionAddressingModeMap = {  # addressing mode used by the instruction
  *     **dict.fromkeys([0x6D, 0x2D, 0x0E, 0x2C,             # <<<<<<<<<<<<<<
  *                      0xCD, 0xEC, 0xCC, 0xCE,
  *                      0x4D, 0xEE, 0x4C, 0x20,
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(23); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_109);
-  __Pyx_GIVEREF(__pyx_int_109);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_109);
-  __Pyx_INCREF(__pyx_int_45);
-  __Pyx_GIVEREF(__pyx_int_45);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_45);
-  __Pyx_INCREF(__pyx_int_14);
-  __Pyx_GIVEREF(__pyx_int_14);
-  PyList_SET_ITEM(__pyx_t_3, 2, __pyx_int_14);
-  __Pyx_INCREF(__pyx_int_44);
-  __Pyx_GIVEREF(__pyx_int_44);
-  PyList_SET_ITEM(__pyx_t_3, 3, __pyx_int_44);
-  __Pyx_INCREF(__pyx_int_205);
-  __Pyx_GIVEREF(__pyx_int_205);
-  PyList_SET_ITEM(__pyx_t_3, 4, __pyx_int_205);
-  __Pyx_INCREF(__pyx_int_236);
-  __Pyx_GIVEREF(__pyx_int_236);
-  PyList_SET_ITEM(__pyx_t_3, 5, __pyx_int_236);
-  __Pyx_INCREF(__pyx_int_204);
-  __Pyx_GIVEREF(__pyx_int_204);
-  PyList_SET_ITEM(__pyx_t_3, 6, __pyx_int_204);
-  __Pyx_INCREF(__pyx_int_206);
-  __Pyx_GIVEREF(__pyx_int_206);
-  PyList_SET_ITEM(__pyx_t_3, 7, __pyx_int_206);
-  __Pyx_INCREF(__pyx_int_77);
-  __Pyx_GIVEREF(__pyx_int_77);
-  PyList_SET_ITEM(__pyx_t_3, 8, __pyx_int_77);
-  __Pyx_INCREF(__pyx_int_238);
-  __Pyx_GIVEREF(__pyx_int_238);
-  PyList_SET_ITEM(__pyx_t_3, 9, __pyx_int_238);
-  __Pyx_INCREF(__pyx_int_76);
-  __Pyx_GIVEREF(__pyx_int_76);
-  PyList_SET_ITEM(__pyx_t_3, 10, __pyx_int_76);
-  __Pyx_INCREF(__pyx_int_32);
-  __Pyx_GIVEREF(__pyx_int_32);
-  PyList_SET_ITEM(__pyx_t_3, 11, __pyx_int_32);
-  __Pyx_INCREF(__pyx_int_173);
-  __Pyx_GIVEREF(__pyx_int_173);
-  PyList_SET_ITEM(__pyx_t_3, 12, __pyx_int_173);
-  __Pyx_INCREF(__pyx_int_172);
-  __Pyx_GIVEREF(__pyx_int_172);
-  PyList_SET_ITEM(__pyx_t_3, 13, __pyx_int_172);
-  __Pyx_INCREF(__pyx_int_78);
-  __Pyx_GIVEREF(__pyx_int_78);
-  PyList_SET_ITEM(__pyx_t_3, 14, __pyx_int_78);
-  __Pyx_INCREF(__pyx_int_13);
-  __Pyx_GIVEREF(__pyx_int_13);
-  PyList_SET_ITEM(__pyx_t_3, 15, __pyx_int_13);
-  __Pyx_INCREF(__pyx_int_46);
-  __Pyx_GIVEREF(__pyx_int_46);
-  PyList_SET_ITEM(__pyx_t_3, 16, __pyx_int_46);
-  __Pyx_INCREF(__pyx_int_110);
-  __Pyx_GIVEREF(__pyx_int_110);
-  PyList_SET_ITEM(__pyx_t_3, 17, __pyx_int_110);
-  __Pyx_INCREF(__pyx_int_237);
-  __Pyx_GIVEREF(__pyx_int_237);
-  PyList_SET_ITEM(__pyx_t_3, 18, __pyx_int_237);
-  __Pyx_INCREF(__pyx_int_141);
-  __Pyx_GIVEREF(__pyx_int_141);
-  PyList_SET_ITEM(__pyx_t_3, 19, __pyx_int_141);
-  __Pyx_INCREF(__pyx_int_142);
-  __Pyx_GIVEREF(__pyx_int_142);
-  PyList_SET_ITEM(__pyx_t_3, 20, __pyx_int_142);
-  __Pyx_INCREF(__pyx_int_140);
-  __Pyx_GIVEREF(__pyx_int_140);
-  PyList_SET_ITEM(__pyx_t_3, 21, __pyx_int_140);
-  __Pyx_INCREF(__pyx_int_174);
-  __Pyx_GIVEREF(__pyx_int_174);
-  PyList_SET_ITEM(__pyx_t_3, 22, __pyx_int_174);
-
-  /* "nespy/enum.py":132
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[23] = {__pyx_mstate_global->__pyx_int_109, __pyx_mstate_global->__pyx_int_45, __pyx_mstate_global->__pyx_int_14, __pyx_mstate_global->__pyx_int_44, __pyx_mstate_global->__pyx_int_205, __pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_206, __pyx_mstate_global->__pyx_int_77, __pyx_mstate_global->__pyx_int_238, __pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_32, __pyx_mstate_global->__pyx_int_173, __pyx_mstate_global->__pyx_int_172, __pyx_mstate_global->__pyx_int_78, __pyx_mstate_global->__pyx_int_13, __pyx_mstate_global->__pyx_int_46, __pyx_mstate_global->__pyx_int_110, __pyx_mstate_global->__pyx_int_237, __pyx_mstate_global->__pyx_int_141, __pyx_mstate_global->__pyx_int_142, __pyx_mstate_global->__pyx_int_140, __pyx_mstate_global->__pyx_int_174};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 23); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":167
  *                      0x2E, 0x6E, 0xED, 0x8D,
  *                      0x8E, 0x8C, 0xAE],
  *                     AddressingMode.Absolute),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x7D, 0x3D, 0x1E, 0xDD,
  *                      0xDE, 0x5D, 0xFE, 0xBD,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 132, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_Absolute); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 132, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_Absolute); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_t_7};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":126
+  /* "nespy/enum.py":161
  * 
  * InstructionAddressingModeMap = {  # addressing mode used by the instruction
  *     **dict.fromkeys([0x6D, 0x2D, 0x0E, 0x2C,             # <<<<<<<<<<<<<<
  *                      0xCD, 0xEC, 0xCC, 0xCE,
  *                      0x4D, 0xEE, 0x4C, 0x20,
- */
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 126, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
-  __pyx_t_3 = 0;
-  __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 126, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(__pyx_t_5 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 126, __pyx_L1_error)
+    __PYX_ERR(0, 161, __pyx_L1_error)
   }
-  if (likely(PyDict_CheckExact(__pyx_t_5))) {
-    __pyx_t_1 = PyDict_Copy(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (likely(PyDict_CheckExact(__pyx_t_3))) {
+    #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API
+    if (__Pyx_IS_UNIQUELY_REFERENCED(__pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference)) {
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_t_3 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_2 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
 
-  /* "nespy/enum.py":133
+  /* "nespy/enum.py":168
  *                      0x8E, 0x8C, 0xAE],
  *                     AddressingMode.Absolute),
  *     **dict.fromkeys([0x7D, 0x3D, 0x1E, 0xDD,             # <<<<<<<<<<<<<<
  *                      0xDE, 0x5D, 0xFE, 0xBD,
  *                      0xBC, 0x5E, 0x1D, 0x3E,
- */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyList_New(15); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_int_125);
-  __Pyx_GIVEREF(__pyx_int_125);
-  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_int_125);
-  __Pyx_INCREF(__pyx_int_61);
-  __Pyx_GIVEREF(__pyx_int_61);
-  PyList_SET_ITEM(__pyx_t_4, 1, __pyx_int_61);
-  __Pyx_INCREF(__pyx_int_30);
-  __Pyx_GIVEREF(__pyx_int_30);
-  PyList_SET_ITEM(__pyx_t_4, 2, __pyx_int_30);
-  __Pyx_INCREF(__pyx_int_221);
-  __Pyx_GIVEREF(__pyx_int_221);
-  PyList_SET_ITEM(__pyx_t_4, 3, __pyx_int_221);
-  __Pyx_INCREF(__pyx_int_222);
-  __Pyx_GIVEREF(__pyx_int_222);
-  PyList_SET_ITEM(__pyx_t_4, 4, __pyx_int_222);
-  __Pyx_INCREF(__pyx_int_93);
-  __Pyx_GIVEREF(__pyx_int_93);
-  PyList_SET_ITEM(__pyx_t_4, 5, __pyx_int_93);
-  __Pyx_INCREF(__pyx_int_254);
-  __Pyx_GIVEREF(__pyx_int_254);
-  PyList_SET_ITEM(__pyx_t_4, 6, __pyx_int_254);
-  __Pyx_INCREF(__pyx_int_189);
-  __Pyx_GIVEREF(__pyx_int_189);
-  PyList_SET_ITEM(__pyx_t_4, 7, __pyx_int_189);
-  __Pyx_INCREF(__pyx_int_188);
-  __Pyx_GIVEREF(__pyx_int_188);
-  PyList_SET_ITEM(__pyx_t_4, 8, __pyx_int_188);
-  __Pyx_INCREF(__pyx_int_94);
-  __Pyx_GIVEREF(__pyx_int_94);
-  PyList_SET_ITEM(__pyx_t_4, 9, __pyx_int_94);
-  __Pyx_INCREF(__pyx_int_29);
-  __Pyx_GIVEREF(__pyx_int_29);
-  PyList_SET_ITEM(__pyx_t_4, 10, __pyx_int_29);
-  __Pyx_INCREF(__pyx_int_62);
-  __Pyx_GIVEREF(__pyx_int_62);
-  PyList_SET_ITEM(__pyx_t_4, 11, __pyx_int_62);
-  __Pyx_INCREF(__pyx_int_126);
-  __Pyx_GIVEREF(__pyx_int_126);
-  PyList_SET_ITEM(__pyx_t_4, 12, __pyx_int_126);
-  __Pyx_INCREF(__pyx_int_253);
-  __Pyx_GIVEREF(__pyx_int_253);
-  PyList_SET_ITEM(__pyx_t_4, 13, __pyx_int_253);
-  __Pyx_INCREF(__pyx_int_157);
-  __Pyx_GIVEREF(__pyx_int_157);
-  PyList_SET_ITEM(__pyx_t_4, 14, __pyx_int_157);
-
-  /* "nespy/enum.py":137
+*/
+  __pyx_t_7 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_7);
+  {
+    PyObject* __pyx_temp[15] = {__pyx_mstate_global->__pyx_int_125, __pyx_mstate_global->__pyx_int_61, __pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_int_221, __pyx_mstate_global->__pyx_int_222, __pyx_mstate_global->__pyx_int_93, __pyx_mstate_global->__pyx_int_254, __pyx_mstate_global->__pyx_int_189, __pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_int_94, __pyx_mstate_global->__pyx_int_29, __pyx_mstate_global->__pyx_int_62, __pyx_mstate_global->__pyx_int_126, __pyx_mstate_global->__pyx_int_253, __pyx_mstate_global->__pyx_int_157};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 15); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":172
  *                      0xBC, 0x5E, 0x1D, 0x3E,
  *                      0x7E, 0xFD, 0x9D],
  *                     AddressingMode.AbsoluteX),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x79, 0x39, 0xD9, 0x59,
  *                      0xB9, 0x19, 0xF9, 0x99,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_AbsoluteX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_AbsoluteX); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":133
+  /* "nespy/enum.py":168
  *                      0x8E, 0x8C, 0xAE],
  *                     AddressingMode.Absolute),
  *     **dict.fromkeys([0x7D, 0x3D, 0x1E, 0xDD,             # <<<<<<<<<<<<<<
  *                      0xDE, 0x5D, 0xFE, 0xBD,
  *                      0xBC, 0x5E, 0x1D, 0x3E,
- */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-  __pyx_t_4 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 133, __pyx_L1_error)
+    __PYX_ERR(0, 168, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_3) < 0)) {
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
     if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
-    __PYX_ERR(0, 133, __pyx_L1_error)
+    __PYX_ERR(0, 168, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":138
+  /* "nespy/enum.py":173
  *                      0x7E, 0xFD, 0x9D],
  *                     AddressingMode.AbsoluteX),
  *     **dict.fromkeys([0x79, 0x39, 0xD9, 0x59,             # <<<<<<<<<<<<<<
  *                      0xB9, 0x19, 0xF9, 0x99,
  *                      0xBE],
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyList_New(9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_int_121);
-  __Pyx_GIVEREF(__pyx_int_121);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_121);
-  __Pyx_INCREF(__pyx_int_57);
-  __Pyx_GIVEREF(__pyx_int_57);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_int_57);
-  __Pyx_INCREF(__pyx_int_217);
-  __Pyx_GIVEREF(__pyx_int_217);
-  PyList_SET_ITEM(__pyx_t_2, 2, __pyx_int_217);
-  __Pyx_INCREF(__pyx_int_89);
-  __Pyx_GIVEREF(__pyx_int_89);
-  PyList_SET_ITEM(__pyx_t_2, 3, __pyx_int_89);
-  __Pyx_INCREF(__pyx_int_185);
-  __Pyx_GIVEREF(__pyx_int_185);
-  PyList_SET_ITEM(__pyx_t_2, 4, __pyx_int_185);
-  __Pyx_INCREF(__pyx_int_25);
-  __Pyx_GIVEREF(__pyx_int_25);
-  PyList_SET_ITEM(__pyx_t_2, 5, __pyx_int_25);
-  __Pyx_INCREF(__pyx_int_249);
-  __Pyx_GIVEREF(__pyx_int_249);
-  PyList_SET_ITEM(__pyx_t_2, 6, __pyx_int_249);
-  __Pyx_INCREF(__pyx_int_153);
-  __Pyx_GIVEREF(__pyx_int_153);
-  PyList_SET_ITEM(__pyx_t_2, 7, __pyx_int_153);
-  __Pyx_INCREF(__pyx_int_190);
-  __Pyx_GIVEREF(__pyx_int_190);
-  PyList_SET_ITEM(__pyx_t_2, 8, __pyx_int_190);
-
-  /* "nespy/enum.py":141
+*/
+  __pyx_t_6 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_6);
+  {
+    PyObject* __pyx_temp[9] = {__pyx_mstate_global->__pyx_int_121, __pyx_mstate_global->__pyx_int_57, __pyx_mstate_global->__pyx_int_217, __pyx_mstate_global->__pyx_int_89, __pyx_mstate_global->__pyx_int_185, __pyx_mstate_global->__pyx_int_25, __pyx_mstate_global->__pyx_int_249, __pyx_mstate_global->__pyx_int_153, __pyx_mstate_global->__pyx_int_190};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":176
  *                      0xB9, 0x19, 0xF9, 0x99,
  *                      0xBE],
  *                     AddressingMode.AbsoluteY),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x65, 0x25, 0x06, 0x24,
  *                      0xC5, 0xE4, 0xC4, 0xC6,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_AbsoluteY); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 141, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_AbsoluteY); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":138
+  /* "nespy/enum.py":173
  *                      0x7E, 0xFD, 0x9D],
  *                     AddressingMode.AbsoluteX),
  *     **dict.fromkeys([0x79, 0x39, 0xD9, 0x59,             # <<<<<<<<<<<<<<
  *                      0xB9, 0x19, 0xF9, 0x99,
  *                      0xBE],
- */
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-  __pyx_t_2 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(__pyx_t_4 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 138, __pyx_L1_error)
+    __PYX_ERR(0, 173, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_4) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_4);
-    __PYX_ERR(0, 138, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 173, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":142
+  /* "nespy/enum.py":177
  *                      0xBE],
  *                     AddressingMode.AbsoluteY),
  *     **dict.fromkeys([0x65, 0x25, 0x06, 0x24,             # <<<<<<<<<<<<<<
  *                      0xC5, 0xE4, 0xC4, 0xC6,
  *                      0x45, 0xE6, 0xA5, 0xA4,
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyList_New(21); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_INCREF(__pyx_int_101);
-  __Pyx_GIVEREF(__pyx_int_101);
-  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_101);
-  __Pyx_INCREF(__pyx_int_37);
-  __Pyx_GIVEREF(__pyx_int_37);
-  PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_37);
-  __Pyx_INCREF(__pyx_int_6);
-  __Pyx_GIVEREF(__pyx_int_6);
-  PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_6);
-  __Pyx_INCREF(__pyx_int_36);
-  __Pyx_GIVEREF(__pyx_int_36);
-  PyList_SET_ITEM(__pyx_t_5, 3, __pyx_int_36);
-  __Pyx_INCREF(__pyx_int_197);
-  __Pyx_GIVEREF(__pyx_int_197);
-  PyList_SET_ITEM(__pyx_t_5, 4, __pyx_int_197);
-  __Pyx_INCREF(__pyx_int_228);
-  __Pyx_GIVEREF(__pyx_int_228);
-  PyList_SET_ITEM(__pyx_t_5, 5, __pyx_int_228);
-  __Pyx_INCREF(__pyx_int_196);
-  __Pyx_GIVEREF(__pyx_int_196);
-  PyList_SET_ITEM(__pyx_t_5, 6, __pyx_int_196);
-  __Pyx_INCREF(__pyx_int_198);
-  __Pyx_GIVEREF(__pyx_int_198);
-  PyList_SET_ITEM(__pyx_t_5, 7, __pyx_int_198);
-  __Pyx_INCREF(__pyx_int_69);
-  __Pyx_GIVEREF(__pyx_int_69);
-  PyList_SET_ITEM(__pyx_t_5, 8, __pyx_int_69);
-  __Pyx_INCREF(__pyx_int_230);
-  __Pyx_GIVEREF(__pyx_int_230);
-  PyList_SET_ITEM(__pyx_t_5, 9, __pyx_int_230);
-  __Pyx_INCREF(__pyx_int_165);
-  __Pyx_GIVEREF(__pyx_int_165);
-  PyList_SET_ITEM(__pyx_t_5, 10, __pyx_int_165);
-  __Pyx_INCREF(__pyx_int_164);
-  __Pyx_GIVEREF(__pyx_int_164);
-  PyList_SET_ITEM(__pyx_t_5, 11, __pyx_int_164);
-  __Pyx_INCREF(__pyx_int_70);
-  __Pyx_GIVEREF(__pyx_int_70);
-  PyList_SET_ITEM(__pyx_t_5, 12, __pyx_int_70);
-  __Pyx_INCREF(__pyx_int_5);
-  __Pyx_GIVEREF(__pyx_int_5);
-  PyList_SET_ITEM(__pyx_t_5, 13, __pyx_int_5);
-  __Pyx_INCREF(__pyx_int_38);
-  __Pyx_GIVEREF(__pyx_int_38);
-  PyList_SET_ITEM(__pyx_t_5, 14, __pyx_int_38);
-  __Pyx_INCREF(__pyx_int_102);
-  __Pyx_GIVEREF(__pyx_int_102);
-  PyList_SET_ITEM(__pyx_t_5, 15, __pyx_int_102);
-  __Pyx_INCREF(__pyx_int_229);
-  __Pyx_GIVEREF(__pyx_int_229);
-  PyList_SET_ITEM(__pyx_t_5, 16, __pyx_int_229);
-  __Pyx_INCREF(__pyx_int_133);
-  __Pyx_GIVEREF(__pyx_int_133);
-  PyList_SET_ITEM(__pyx_t_5, 17, __pyx_int_133);
-  __Pyx_INCREF(__pyx_int_134);
-  __Pyx_GIVEREF(__pyx_int_134);
-  PyList_SET_ITEM(__pyx_t_5, 18, __pyx_int_134);
-  __Pyx_INCREF(__pyx_int_132);
-  __Pyx_GIVEREF(__pyx_int_132);
-  PyList_SET_ITEM(__pyx_t_5, 19, __pyx_int_132);
-  __Pyx_INCREF(__pyx_int_166);
-  __Pyx_GIVEREF(__pyx_int_166);
-  PyList_SET_ITEM(__pyx_t_5, 20, __pyx_int_166);
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[21] = {__pyx_mstate_global->__pyx_int_101, __pyx_mstate_global->__pyx_int_37, __pyx_mstate_global->__pyx_int_6, __pyx_mstate_global->__pyx_int_36, __pyx_mstate_global->__pyx_int_197, __pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_int_198, __pyx_mstate_global->__pyx_int_69, __pyx_mstate_global->__pyx_int_230, __pyx_mstate_global->__pyx_int_165, __pyx_mstate_global->__pyx_int_164, __pyx_mstate_global->__pyx_int_70, __pyx_mstate_global->__pyx_int_5, __pyx_mstate_global->__pyx_int_38, __pyx_mstate_global->__pyx_int_102, __pyx_mstate_global->__pyx_int_229, __pyx_mstate_global->__pyx_int_133, __pyx_mstate_global->__pyx_int_134, __pyx_mstate_global->__pyx_int_132, __pyx_mstate_global->__pyx_int_166};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 21); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":148
+  /* "nespy/enum.py":183
  *                      0xE5, 0x85, 0x86, 0x84,
  *                      0xA6],
  *                     AddressingMode.ZeroPage),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x75, 0x35, 0x16, 0xD5,
  *                      0xD6, 0x55, 0xF6, 0xB5,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_ZeroPage); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_ZeroPage); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_t_7};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":142
+  /* "nespy/enum.py":177
  *                      0xBE],
  *                     AddressingMode.AbsoluteY),
  *     **dict.fromkeys([0x65, 0x25, 0x06, 0x24,             # <<<<<<<<<<<<<<
  *                      0xC5, 0xE4, 0xC4, 0xC6,
  *                      0x45, 0xE6, 0xA5, 0xA4,
- */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __pyx_t_5 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_t_2 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 142, __pyx_L1_error)
+    __PYX_ERR(0, 177, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_2) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_2);
-    __PYX_ERR(0, 142, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 177, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":149
+  /* "nespy/enum.py":184
  *                      0xA6],
  *                     AddressingMode.ZeroPage),
  *     **dict.fromkeys([0x75, 0x35, 0x16, 0xD5,             # <<<<<<<<<<<<<<
  *                      0xD6, 0x55, 0xF6, 0xB5,
  *                      0xB4, 0x56, 0x15, 0x36,
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(17); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_117);
-  __Pyx_GIVEREF(__pyx_int_117);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_117);
-  __Pyx_INCREF(__pyx_int_53);
-  __Pyx_GIVEREF(__pyx_int_53);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_53);
-  __Pyx_INCREF(__pyx_int_22);
-  __Pyx_GIVEREF(__pyx_int_22);
-  PyList_SET_ITEM(__pyx_t_3, 2, __pyx_int_22);
-  __Pyx_INCREF(__pyx_int_213);
-  __Pyx_GIVEREF(__pyx_int_213);
-  PyList_SET_ITEM(__pyx_t_3, 3, __pyx_int_213);
-  __Pyx_INCREF(__pyx_int_214);
-  __Pyx_GIVEREF(__pyx_int_214);
-  PyList_SET_ITEM(__pyx_t_3, 4, __pyx_int_214);
-  __Pyx_INCREF(__pyx_int_85);
-  __Pyx_GIVEREF(__pyx_int_85);
-  PyList_SET_ITEM(__pyx_t_3, 5, __pyx_int_85);
-  __Pyx_INCREF(__pyx_int_246);
-  __Pyx_GIVEREF(__pyx_int_246);
-  PyList_SET_ITEM(__pyx_t_3, 6, __pyx_int_246);
-  __Pyx_INCREF(__pyx_int_181);
-  __Pyx_GIVEREF(__pyx_int_181);
-  PyList_SET_ITEM(__pyx_t_3, 7, __pyx_int_181);
-  __Pyx_INCREF(__pyx_int_180);
-  __Pyx_GIVEREF(__pyx_int_180);
-  PyList_SET_ITEM(__pyx_t_3, 8, __pyx_int_180);
-  __Pyx_INCREF(__pyx_int_86);
-  __Pyx_GIVEREF(__pyx_int_86);
-  PyList_SET_ITEM(__pyx_t_3, 9, __pyx_int_86);
-  __Pyx_INCREF(__pyx_int_21);
-  __Pyx_GIVEREF(__pyx_int_21);
-  PyList_SET_ITEM(__pyx_t_3, 10, __pyx_int_21);
-  __Pyx_INCREF(__pyx_int_54);
-  __Pyx_GIVEREF(__pyx_int_54);
-  PyList_SET_ITEM(__pyx_t_3, 11, __pyx_int_54);
-  __Pyx_INCREF(__pyx_int_118);
-  __Pyx_GIVEREF(__pyx_int_118);
-  PyList_SET_ITEM(__pyx_t_3, 12, __pyx_int_118);
-  __Pyx_INCREF(__pyx_int_245);
-  __Pyx_GIVEREF(__pyx_int_245);
-  PyList_SET_ITEM(__pyx_t_3, 13, __pyx_int_245);
-  __Pyx_INCREF(__pyx_int_149);
-  __Pyx_GIVEREF(__pyx_int_149);
-  PyList_SET_ITEM(__pyx_t_3, 14, __pyx_int_149);
-  __Pyx_INCREF(__pyx_int_148);
-  __Pyx_GIVEREF(__pyx_int_148);
-  PyList_SET_ITEM(__pyx_t_3, 15, __pyx_int_148);
-  __Pyx_INCREF(__pyx_int_182);
-  __Pyx_GIVEREF(__pyx_int_182);
-  PyList_SET_ITEM(__pyx_t_3, 16, __pyx_int_182);
+*/
+  __pyx_t_7 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_7);
+  {
+    PyObject* __pyx_temp[16] = {__pyx_mstate_global->__pyx_int_117, __pyx_mstate_global->__pyx_int_53, __pyx_mstate_global->__pyx_int_22, __pyx_mstate_global->__pyx_int_213, __pyx_mstate_global->__pyx_int_214, __pyx_mstate_global->__pyx_int_85, __pyx_mstate_global->__pyx_int_246, __pyx_mstate_global->__pyx_int_181, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_86, __pyx_mstate_global->__pyx_int_21, __pyx_mstate_global->__pyx_int_54, __pyx_mstate_global->__pyx_int_118, __pyx_mstate_global->__pyx_int_245, __pyx_mstate_global->__pyx_int_149, __pyx_mstate_global->__pyx_int_148};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 16); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 184, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":154
- *                      0x76, 0xF5, 0x95, 0x94,
- *                      0xB6],
+  /* "nespy/enum.py":188
+ *                      0xB4, 0x56, 0x15, 0x36,
+ *                      0x76, 0xF5, 0x95, 0x94],
  *                     AddressingMode.ZeroPageX),             # <<<<<<<<<<<<<<
- *     **dict.fromkeys([0x96],
+ *     **dict.fromkeys([0x96, 0xB6],
  *                     AddressingMode.ZeroPageY),
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 188, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ZeroPageX); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_ZeroPageX); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":149
+  /* "nespy/enum.py":184
  *                      0xA6],
  *                     AddressingMode.ZeroPage),
  *     **dict.fromkeys([0x75, 0x35, 0x16, 0xD5,             # <<<<<<<<<<<<<<
  *                      0xD6, 0x55, 0xF6, 0xB5,
  *                      0xB4, 0x56, 0x15, 0x36,
- */
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 149, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
-  __pyx_t_3 = 0;
-  __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 149, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(__pyx_t_5 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 149, __pyx_L1_error)
+    __PYX_ERR(0, 184, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_5) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_5);
-    __PYX_ERR(0, 149, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 184, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":155
- *                      0xB6],
+  /* "nespy/enum.py":189
+ *                      0x76, 0xF5, 0x95, 0x94],
  *                     AddressingMode.ZeroPageX),
- *     **dict.fromkeys([0x96],             # <<<<<<<<<<<<<<
+ *     **dict.fromkeys([0x96, 0xB6],             # <<<<<<<<<<<<<<
  *                     AddressingMode.ZeroPageY),
  *     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,
- */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_int_150);
-  __Pyx_GIVEREF(__pyx_int_150);
-  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_int_150);
+*/
+  __pyx_t_6 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_6);
+  {
+    PyObject* __pyx_temp[2] = {__pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_int_182};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":156
+  /* "nespy/enum.py":190
  *                     AddressingMode.ZeroPageX),
- *     **dict.fromkeys([0x96],
+ *     **dict.fromkeys([0x96, 0xB6],
  *                     AddressingMode.ZeroPageY),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,
  *                      0xC0, 0x49, 0xA9, 0xA2,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_ZeroPageY); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_ZeroPageY); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":155
- *                      0xB6],
+  /* "nespy/enum.py":189
+ *                      0x76, 0xF5, 0x95, 0x94],
  *                     AddressingMode.ZeroPageX),
- *     **dict.fromkeys([0x96],             # <<<<<<<<<<<<<<
+ *     **dict.fromkeys([0x96, 0xB6],             # <<<<<<<<<<<<<<
  *                     AddressingMode.ZeroPageY),
  *     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,
- */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-  __pyx_t_4 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 155, __pyx_L1_error)
+    __PYX_ERR(0, 189, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_3) < 0)) {
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
     if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
-    __PYX_ERR(0, 155, __pyx_L1_error)
+    __PYX_ERR(0, 189, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":157
- *     **dict.fromkeys([0x96],
+  /* "nespy/enum.py":191
+ *     **dict.fromkeys([0x96, 0xB6],
  *                     AddressingMode.ZeroPageY),
  *     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,             # <<<<<<<<<<<<<<
  *                      0xC0, 0x49, 0xA9, 0xA2,
- *                      0x09, 0xE9, 0xA0],
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyList_New(11); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_int_105);
-  __Pyx_GIVEREF(__pyx_int_105);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_105);
-  __Pyx_INCREF(__pyx_int_41);
-  __Pyx_GIVEREF(__pyx_int_41);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_int_41);
-  __Pyx_INCREF(__pyx_int_201);
-  __Pyx_GIVEREF(__pyx_int_201);
-  PyList_SET_ITEM(__pyx_t_2, 2, __pyx_int_201);
-  __Pyx_INCREF(__pyx_int_224);
-  __Pyx_GIVEREF(__pyx_int_224);
-  PyList_SET_ITEM(__pyx_t_2, 3, __pyx_int_224);
-  __Pyx_INCREF(__pyx_int_192);
-  __Pyx_GIVEREF(__pyx_int_192);
-  PyList_SET_ITEM(__pyx_t_2, 4, __pyx_int_192);
-  __Pyx_INCREF(__pyx_int_73);
-  __Pyx_GIVEREF(__pyx_int_73);
-  PyList_SET_ITEM(__pyx_t_2, 5, __pyx_int_73);
-  __Pyx_INCREF(__pyx_int_169);
-  __Pyx_GIVEREF(__pyx_int_169);
-  PyList_SET_ITEM(__pyx_t_2, 6, __pyx_int_169);
-  __Pyx_INCREF(__pyx_int_162);
-  __Pyx_GIVEREF(__pyx_int_162);
-  PyList_SET_ITEM(__pyx_t_2, 7, __pyx_int_162);
-  __Pyx_INCREF(__pyx_int_9);
-  __Pyx_GIVEREF(__pyx_int_9);
-  PyList_SET_ITEM(__pyx_t_2, 8, __pyx_int_9);
-  __Pyx_INCREF(__pyx_int_233);
-  __Pyx_GIVEREF(__pyx_int_233);
-  PyList_SET_ITEM(__pyx_t_2, 9, __pyx_int_233);
-  __Pyx_INCREF(__pyx_int_160);
-  __Pyx_GIVEREF(__pyx_int_160);
-  PyList_SET_ITEM(__pyx_t_2, 10, __pyx_int_160);
-
-  /* "nespy/enum.py":160
- *                      0xC0, 0x49, 0xA9, 0xA2,
- *                      0x09, 0xE9, 0xA0],
+ *                      0x09, 0xE9, 0xA0, 0x80,
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[16] = {__pyx_mstate_global->__pyx_int_105, __pyx_mstate_global->__pyx_int_41, __pyx_mstate_global->__pyx_int_201, __pyx_mstate_global->__pyx_int_224, __pyx_mstate_global->__pyx_int_192, __pyx_mstate_global->__pyx_int_73, __pyx_mstate_global->__pyx_int_169, __pyx_mstate_global->__pyx_int_162, __pyx_mstate_global->__pyx_int_9, __pyx_mstate_global->__pyx_int_233, __pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_128, __pyx_mstate_global->__pyx_int_130, __pyx_mstate_global->__pyx_int_137, __pyx_mstate_global->__pyx_int_194, __pyx_mstate_global->__pyx_int_226};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 16); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 191, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":195
+ *                      0x09, 0xE9, 0xA0, 0x80,
+ *                      0x82, 0x89, 0xC2, 0xE2],
  *                     AddressingMode.Immediate),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x90, 0xB0, 0xF0, 0x30,
  *                      0xD0, 0x10, 0x50, 0x70],
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 160, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_Immediate); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_Immediate); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_t_7};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 191, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":157
- *     **dict.fromkeys([0x96],
+  /* "nespy/enum.py":191
+ *     **dict.fromkeys([0x96, 0xB6],
  *                     AddressingMode.ZeroPageY),
  *     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,             # <<<<<<<<<<<<<<
  *                      0xC0, 0x49, 0xA9, 0xA2,
- *                      0x09, 0xE9, 0xA0],
- */
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 157, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-  __pyx_t_2 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(__pyx_t_4 == Py_None)) {
+ *                      0x09, 0xE9, 0xA0, 0x80,
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 157, __pyx_L1_error)
+    __PYX_ERR(0, 191, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_4) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_4);
-    __PYX_ERR(0, 157, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 191, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":161
- *                      0x09, 0xE9, 0xA0],
+  /* "nespy/enum.py":196
+ *                      0x82, 0x89, 0xC2, 0xE2],
  *                     AddressingMode.Immediate),
  *     **dict.fromkeys([0x90, 0xB0, 0xF0, 0x30,             # <<<<<<<<<<<<<<
  *                      0xD0, 0x10, 0x50, 0x70],
  *                     AddressingMode.Relative),
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyList_New(8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_INCREF(__pyx_int_144);
-  __Pyx_GIVEREF(__pyx_int_144);
-  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_144);
-  __Pyx_INCREF(__pyx_int_176);
-  __Pyx_GIVEREF(__pyx_int_176);
-  PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_176);
-  __Pyx_INCREF(__pyx_int_240);
-  __Pyx_GIVEREF(__pyx_int_240);
-  PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_240);
-  __Pyx_INCREF(__pyx_int_48);
-  __Pyx_GIVEREF(__pyx_int_48);
-  PyList_SET_ITEM(__pyx_t_5, 3, __pyx_int_48);
-  __Pyx_INCREF(__pyx_int_208);
-  __Pyx_GIVEREF(__pyx_int_208);
-  PyList_SET_ITEM(__pyx_t_5, 4, __pyx_int_208);
-  __Pyx_INCREF(__pyx_int_16);
-  __Pyx_GIVEREF(__pyx_int_16);
-  PyList_SET_ITEM(__pyx_t_5, 5, __pyx_int_16);
-  __Pyx_INCREF(__pyx_int_80);
-  __Pyx_GIVEREF(__pyx_int_80);
-  PyList_SET_ITEM(__pyx_t_5, 6, __pyx_int_80);
-  __Pyx_INCREF(__pyx_int_112);
-  __Pyx_GIVEREF(__pyx_int_112);
-  PyList_SET_ITEM(__pyx_t_5, 7, __pyx_int_112);
-
-  /* "nespy/enum.py":163
+*/
+  __pyx_t_7 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_7);
+  {
+    PyObject* __pyx_temp[8] = {__pyx_mstate_global->__pyx_int_144, __pyx_mstate_global->__pyx_int_176, __pyx_mstate_global->__pyx_int_240, __pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_int_208, __pyx_mstate_global->__pyx_int_16, __pyx_mstate_global->__pyx_int_80, __pyx_mstate_global->__pyx_int_112};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":198
  *     **dict.fromkeys([0x90, 0xB0, 0xF0, 0x30,
  *                      0xD0, 0x10, 0x50, 0x70],
  *                     AddressingMode.Relative),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x0A, 0x00, 0x18, 0xD8,
  *                      0x58, 0xB8, 0xCA, 0x88,
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_Relative); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_Relative); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":161
- *                      0x09, 0xE9, 0xA0],
+  /* "nespy/enum.py":196
+ *                      0x82, 0x89, 0xC2, 0xE2],
  *                     AddressingMode.Immediate),
  *     **dict.fromkeys([0x90, 0xB0, 0xF0, 0x30,             # <<<<<<<<<<<<<<
  *                      0xD0, 0x10, 0x50, 0x70],
  *                     AddressingMode.Relative),
- */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __pyx_t_5 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_t_2 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 161, __pyx_L1_error)
+    __PYX_ERR(0, 196, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_2) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_2);
-    __PYX_ERR(0, 161, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 196, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":164
+  /* "nespy/enum.py":199
  *                      0xD0, 0x10, 0x50, 0x70],
  *                     AddressingMode.Relative),
  *     **dict.fromkeys([0x0A, 0x00, 0x18, 0xD8,             # <<<<<<<<<<<<<<
  *                      0x58, 0xB8, 0xCA, 0x88,
  *                      0xE8, 0xC8, 0x4A, 0xEA,
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 164, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(29); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_10);
-  __Pyx_GIVEREF(__pyx_int_10);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_10);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_0);
-  __Pyx_INCREF(__pyx_int_24);
-  __Pyx_GIVEREF(__pyx_int_24);
-  PyList_SET_ITEM(__pyx_t_3, 2, __pyx_int_24);
-  __Pyx_INCREF(__pyx_int_216);
-  __Pyx_GIVEREF(__pyx_int_216);
-  PyList_SET_ITEM(__pyx_t_3, 3, __pyx_int_216);
-  __Pyx_INCREF(__pyx_int_88);
-  __Pyx_GIVEREF(__pyx_int_88);
-  PyList_SET_ITEM(__pyx_t_3, 4, __pyx_int_88);
-  __Pyx_INCREF(__pyx_int_184);
-  __Pyx_GIVEREF(__pyx_int_184);
-  PyList_SET_ITEM(__pyx_t_3, 5, __pyx_int_184);
-  __Pyx_INCREF(__pyx_int_202);
-  __Pyx_GIVEREF(__pyx_int_202);
-  PyList_SET_ITEM(__pyx_t_3, 6, __pyx_int_202);
-  __Pyx_INCREF(__pyx_int_136);
-  __Pyx_GIVEREF(__pyx_int_136);
-  PyList_SET_ITEM(__pyx_t_3, 7, __pyx_int_136);
-  __Pyx_INCREF(__pyx_int_232);
-  __Pyx_GIVEREF(__pyx_int_232);
-  PyList_SET_ITEM(__pyx_t_3, 8, __pyx_int_232);
-  __Pyx_INCREF(__pyx_int_200);
-  __Pyx_GIVEREF(__pyx_int_200);
-  PyList_SET_ITEM(__pyx_t_3, 9, __pyx_int_200);
-  __Pyx_INCREF(__pyx_int_74);
-  __Pyx_GIVEREF(__pyx_int_74);
-  PyList_SET_ITEM(__pyx_t_3, 10, __pyx_int_74);
-  __Pyx_INCREF(__pyx_int_234);
-  __Pyx_GIVEREF(__pyx_int_234);
-  PyList_SET_ITEM(__pyx_t_3, 11, __pyx_int_234);
-  __Pyx_INCREF(__pyx_int_72);
-  __Pyx_GIVEREF(__pyx_int_72);
-  PyList_SET_ITEM(__pyx_t_3, 12, __pyx_int_72);
-  __Pyx_INCREF(__pyx_int_8);
-  __Pyx_GIVEREF(__pyx_int_8);
-  PyList_SET_ITEM(__pyx_t_3, 13, __pyx_int_8);
-  __Pyx_INCREF(__pyx_int_104);
-  __Pyx_GIVEREF(__pyx_int_104);
-  PyList_SET_ITEM(__pyx_t_3, 14, __pyx_int_104);
-  __Pyx_INCREF(__pyx_int_40);
-  __Pyx_GIVEREF(__pyx_int_40);
-  PyList_SET_ITEM(__pyx_t_3, 15, __pyx_int_40);
-  __Pyx_INCREF(__pyx_int_42);
-  __Pyx_GIVEREF(__pyx_int_42);
-  PyList_SET_ITEM(__pyx_t_3, 16, __pyx_int_42);
-  __Pyx_INCREF(__pyx_int_106);
-  __Pyx_GIVEREF(__pyx_int_106);
-  PyList_SET_ITEM(__pyx_t_3, 17, __pyx_int_106);
-  __Pyx_INCREF(__pyx_int_64);
-  __Pyx_GIVEREF(__pyx_int_64);
-  PyList_SET_ITEM(__pyx_t_3, 18, __pyx_int_64);
-  __Pyx_INCREF(__pyx_int_96);
-  __Pyx_GIVEREF(__pyx_int_96);
-  PyList_SET_ITEM(__pyx_t_3, 19, __pyx_int_96);
-  __Pyx_INCREF(__pyx_int_56);
-  __Pyx_GIVEREF(__pyx_int_56);
-  PyList_SET_ITEM(__pyx_t_3, 20, __pyx_int_56);
-  __Pyx_INCREF(__pyx_int_248);
-  __Pyx_GIVEREF(__pyx_int_248);
-  PyList_SET_ITEM(__pyx_t_3, 21, __pyx_int_248);
-  __Pyx_INCREF(__pyx_int_120);
-  __Pyx_GIVEREF(__pyx_int_120);
-  PyList_SET_ITEM(__pyx_t_3, 22, __pyx_int_120);
-  __Pyx_INCREF(__pyx_int_170);
-  __Pyx_GIVEREF(__pyx_int_170);
-  PyList_SET_ITEM(__pyx_t_3, 23, __pyx_int_170);
-  __Pyx_INCREF(__pyx_int_168);
-  __Pyx_GIVEREF(__pyx_int_168);
-  PyList_SET_ITEM(__pyx_t_3, 24, __pyx_int_168);
-  __Pyx_INCREF(__pyx_int_186);
-  __Pyx_GIVEREF(__pyx_int_186);
-  PyList_SET_ITEM(__pyx_t_3, 25, __pyx_int_186);
-  __Pyx_INCREF(__pyx_int_138);
-  __Pyx_GIVEREF(__pyx_int_138);
-  PyList_SET_ITEM(__pyx_t_3, 26, __pyx_int_138);
-  __Pyx_INCREF(__pyx_int_154);
-  __Pyx_GIVEREF(__pyx_int_154);
-  PyList_SET_ITEM(__pyx_t_3, 27, __pyx_int_154);
-  __Pyx_INCREF(__pyx_int_152);
-  __Pyx_GIVEREF(__pyx_int_152);
-  PyList_SET_ITEM(__pyx_t_3, 28, __pyx_int_152);
+*/
+  __pyx_t_6 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_6);
+  {
+    PyObject* __pyx_temp[35] = {__pyx_mstate_global->__pyx_int_10, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_24, __pyx_mstate_global->__pyx_int_216, __pyx_mstate_global->__pyx_int_88, __pyx_mstate_global->__pyx_int_184, __pyx_mstate_global->__pyx_int_202, __pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_int_232, __pyx_mstate_global->__pyx_int_200, __pyx_mstate_global->__pyx_int_74, __pyx_mstate_global->__pyx_int_234, __pyx_mstate_global->__pyx_int_72, __pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_104, __pyx_mstate_global->__pyx_int_40, __pyx_mstate_global->__pyx_int_42, __pyx_mstate_global->__pyx_int_106, __pyx_mstate_global->__pyx_int_64, __pyx_mstate_global->__pyx_int_96, __pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_int_248, __pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_int_170, __pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_int_186, __pyx_mstate_global->__pyx_int_138, __pyx_mstate_global->__pyx_int_154, __pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_int_26, __pyx_mstate_global->__pyx_int_58, __pyx_mstate_global->__pyx_int_90, __pyx_mstate_global->__pyx_int_122, __pyx_mstate_global->__pyx_int_218, __pyx_mstate_global->__pyx_int_250};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 35); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":172
- *                      0xA8, 0xBA, 0x8A, 0x9A,
- *                      0x98],
+  /* "nespy/enum.py":208
+ *                      0x98, 0x1A, 0x3A, 0x5A,
+ *                      0x7A, 0xDA, 0xFA],
  *                     AddressingMode.Implicit),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x6C],
  *                     AddressingMode.Indirect),
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_Implicit); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 208, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_Implicit); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":164
+  /* "nespy/enum.py":199
  *                      0xD0, 0x10, 0x50, 0x70],
  *                     AddressingMode.Relative),
  *     **dict.fromkeys([0x0A, 0x00, 0x18, 0xD8,             # <<<<<<<<<<<<<<
  *                      0x58, 0xB8, 0xCA, 0x88,
  *                      0xE8, 0xC8, 0x4A, 0xEA,
- */
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
-  __pyx_t_3 = 0;
-  __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(__pyx_t_5 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 164, __pyx_L1_error)
+    __PYX_ERR(0, 199, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_5) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_5);
-    __PYX_ERR(0, 164, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 199, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":173
- *                      0x98],
+  /* "nespy/enum.py":209
+ *                      0x7A, 0xDA, 0xFA],
  *                     AddressingMode.Implicit),
  *     **dict.fromkeys([0x6C],             # <<<<<<<<<<<<<<
  *                     AddressingMode.Indirect),
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,
- */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_int_108);
-  __Pyx_GIVEREF(__pyx_int_108);
-  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_int_108);
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[1] = {__pyx_mstate_global->__pyx_int_108};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 209, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":174
+  /* "nespy/enum.py":210
  *                     AddressingMode.Implicit),
  *     **dict.fromkeys([0x6C],
  *                     AddressingMode.Indirect),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,
  *                      0xA1, 0x01, 0xE1, 0x81],
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Indirect); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_Indirect); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_t_7};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 209, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":173
- *                      0x98],
+  /* "nespy/enum.py":209
+ *                      0x7A, 0xDA, 0xFA],
  *                     AddressingMode.Implicit),
  *     **dict.fromkeys([0x6C],             # <<<<<<<<<<<<<<
  *                     AddressingMode.Indirect),
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,
- */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-  __pyx_t_4 = 0;
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+*/
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 173, __pyx_L1_error)
+    __PYX_ERR(0, 209, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_3) < 0)) {
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
     if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
-    __PYX_ERR(0, 173, __pyx_L1_error)
+    __PYX_ERR(0, 209, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":175
+  /* "nespy/enum.py":211
  *     **dict.fromkeys([0x6C],
  *                     AddressingMode.Indirect),
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,             # <<<<<<<<<<<<<<
  *                      0xA1, 0x01, 0xE1, 0x81],
  *                     AddressingMode.IndirectX),
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyList_New(8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_int_97);
-  __Pyx_GIVEREF(__pyx_int_97);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_97);
-  __Pyx_INCREF(__pyx_int_33);
-  __Pyx_GIVEREF(__pyx_int_33);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_int_33);
-  __Pyx_INCREF(__pyx_int_193);
-  __Pyx_GIVEREF(__pyx_int_193);
-  PyList_SET_ITEM(__pyx_t_2, 2, __pyx_int_193);
-  __Pyx_INCREF(__pyx_int_65);
-  __Pyx_GIVEREF(__pyx_int_65);
-  PyList_SET_ITEM(__pyx_t_2, 3, __pyx_int_65);
-  __Pyx_INCREF(__pyx_int_161);
-  __Pyx_GIVEREF(__pyx_int_161);
-  PyList_SET_ITEM(__pyx_t_2, 4, __pyx_int_161);
-  __Pyx_INCREF(__pyx_int_1);
-  __Pyx_GIVEREF(__pyx_int_1);
-  PyList_SET_ITEM(__pyx_t_2, 5, __pyx_int_1);
-  __Pyx_INCREF(__pyx_int_225);
-  __Pyx_GIVEREF(__pyx_int_225);
-  PyList_SET_ITEM(__pyx_t_2, 6, __pyx_int_225);
-  __Pyx_INCREF(__pyx_int_129);
-  __Pyx_GIVEREF(__pyx_int_129);
-  PyList_SET_ITEM(__pyx_t_2, 7, __pyx_int_129);
+*/
+  __pyx_t_7 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_7);
+  {
+    PyObject* __pyx_temp[8] = {__pyx_mstate_global->__pyx_int_97, __pyx_mstate_global->__pyx_int_33, __pyx_mstate_global->__pyx_int_193, __pyx_mstate_global->__pyx_int_65, __pyx_mstate_global->__pyx_int_161, __pyx_mstate_global->__pyx_int_1, __pyx_mstate_global->__pyx_int_225, __pyx_mstate_global->__pyx_int_129};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
 
-  /* "nespy/enum.py":177
+  /* "nespy/enum.py":213
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,
  *                      0xA1, 0x01, 0xE1, 0x81],
  *                     AddressingMode.IndirectX),             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x71, 0x31, 0xD1, 0x51,
  *                      0xB1, 0x11, 0xF1, 0x91],
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_IndirectX); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 177, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_IndirectX); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":175
+  /* "nespy/enum.py":211
  *     **dict.fromkeys([0x6C],
  *                     AddressingMode.Indirect),
  *     **dict.fromkeys([0x61, 0x21, 0xC1, 0x41,             # <<<<<<<<<<<<<<
  *                      0xA1, 0x01, 0xE1, 0x81],
  *                     AddressingMode.IndirectX),
- */
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
-  __pyx_t_2 = 0;
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(__pyx_t_4 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 175, __pyx_L1_error)
+    __PYX_ERR(0, 211, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_4) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_4);
-    __PYX_ERR(0, 175, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 211, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":178
+  /* "nespy/enum.py":214
  *                      0xA1, 0x01, 0xE1, 0x81],
  *                     AddressingMode.IndirectX),
  *     **dict.fromkeys([0x71, 0x31, 0xD1, 0x51,             # <<<<<<<<<<<<<<
  *                      0xB1, 0x11, 0xF1, 0x91],
  *                     AddressingMode.IndirectY),
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 178, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyList_New(8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 178, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_INCREF(__pyx_int_113);
-  __Pyx_GIVEREF(__pyx_int_113);
-  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_113);
-  __Pyx_INCREF(__pyx_int_49);
-  __Pyx_GIVEREF(__pyx_int_49);
-  PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_49);
-  __Pyx_INCREF(__pyx_int_209);
-  __Pyx_GIVEREF(__pyx_int_209);
-  PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_209);
-  __Pyx_INCREF(__pyx_int_81);
-  __Pyx_GIVEREF(__pyx_int_81);
-  PyList_SET_ITEM(__pyx_t_5, 3, __pyx_int_81);
-  __Pyx_INCREF(__pyx_int_177);
-  __Pyx_GIVEREF(__pyx_int_177);
-  PyList_SET_ITEM(__pyx_t_5, 4, __pyx_int_177);
-  __Pyx_INCREF(__pyx_int_17);
-  __Pyx_GIVEREF(__pyx_int_17);
-  PyList_SET_ITEM(__pyx_t_5, 5, __pyx_int_17);
-  __Pyx_INCREF(__pyx_int_241);
-  __Pyx_GIVEREF(__pyx_int_241);
-  PyList_SET_ITEM(__pyx_t_5, 6, __pyx_int_241);
-  __Pyx_INCREF(__pyx_int_145);
-  __Pyx_GIVEREF(__pyx_int_145);
-  PyList_SET_ITEM(__pyx_t_5, 7, __pyx_int_145);
-
-  /* "nespy/enum.py":180
+*/
+  __pyx_t_6 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_6);
+  {
+    PyObject* __pyx_temp[8] = {__pyx_mstate_global->__pyx_int_113, __pyx_mstate_global->__pyx_int_49, __pyx_mstate_global->__pyx_int_209, __pyx_mstate_global->__pyx_int_81, __pyx_mstate_global->__pyx_int_177, __pyx_mstate_global->__pyx_int_17, __pyx_mstate_global->__pyx_int_241, __pyx_mstate_global->__pyx_int_145};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+
+  /* "nespy/enum.py":216
  *     **dict.fromkeys([0x71, 0x31, 0xD1, 0x51,
  *                      0xB1, 0x11, 0xF1, 0x91],
  *                     AddressingMode.IndirectY),             # <<<<<<<<<<<<<<
  * }
  * 
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_IndirectY); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_IndirectY); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
 
-  /* "nespy/enum.py":178
+  /* "nespy/enum.py":214
  *                      0xA1, 0x01, 0xE1, 0x81],
  *                     AddressingMode.IndirectX),
  *     **dict.fromkeys([0x71, 0x31, 0xD1, 0x51,             # <<<<<<<<<<<<<<
  *                      0xB1, 0x11, 0xF1, 0x91],
  *                     AddressingMode.IndirectY),
- */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __pyx_t_5 = 0;
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_t_2 == Py_None)) {
+*/
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 178, __pyx_L1_error)
+    __PYX_ERR(0, 214, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_2) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_2);
-    __PYX_ERR(0, 178, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 214, __pyx_L1_error)
   }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionAddressingModeMap, __pyx_t_2) < (0)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_InstructionAddressingModeMap, __pyx_t_1) < 0) __PYX_ERR(0, 125, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nespy/enum.py":185
+  /* "nespy/enum.py":221
  * 
  * InstructionLengthMap = {  # number of bytes each instruction takes up in memory
  *     **dict.fromkeys([0x0A, 0x00, 0x18, 0xD8,             # <<<<<<<<<<<<<<
  *                      0x58, 0xB8, 0xCA, 0x88,
  *                      0xE8, 0xC8, 0x4A, 0xEA,
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(29); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_10);
-  __Pyx_GIVEREF(__pyx_int_10);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_10);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_0);
-  __Pyx_INCREF(__pyx_int_24);
-  __Pyx_GIVEREF(__pyx_int_24);
-  PyList_SET_ITEM(__pyx_t_3, 2, __pyx_int_24);
-  __Pyx_INCREF(__pyx_int_216);
-  __Pyx_GIVEREF(__pyx_int_216);
-  PyList_SET_ITEM(__pyx_t_3, 3, __pyx_int_216);
-  __Pyx_INCREF(__pyx_int_88);
-  __Pyx_GIVEREF(__pyx_int_88);
-  PyList_SET_ITEM(__pyx_t_3, 4, __pyx_int_88);
-  __Pyx_INCREF(__pyx_int_184);
-  __Pyx_GIVEREF(__pyx_int_184);
-  PyList_SET_ITEM(__pyx_t_3, 5, __pyx_int_184);
-  __Pyx_INCREF(__pyx_int_202);
-  __Pyx_GIVEREF(__pyx_int_202);
-  PyList_SET_ITEM(__pyx_t_3, 6, __pyx_int_202);
-  __Pyx_INCREF(__pyx_int_136);
-  __Pyx_GIVEREF(__pyx_int_136);
-  PyList_SET_ITEM(__pyx_t_3, 7, __pyx_int_136);
-  __Pyx_INCREF(__pyx_int_232);
-  __Pyx_GIVEREF(__pyx_int_232);
-  PyList_SET_ITEM(__pyx_t_3, 8, __pyx_int_232);
-  __Pyx_INCREF(__pyx_int_200);
-  __Pyx_GIVEREF(__pyx_int_200);
-  PyList_SET_ITEM(__pyx_t_3, 9, __pyx_int_200);
-  __Pyx_INCREF(__pyx_int_74);
-  __Pyx_GIVEREF(__pyx_int_74);
-  PyList_SET_ITEM(__pyx_t_3, 10, __pyx_int_74);
-  __Pyx_INCREF(__pyx_int_234);
-  __Pyx_GIVEREF(__pyx_int_234);
-  PyList_SET_ITEM(__pyx_t_3, 11, __pyx_int_234);
-  __Pyx_INCREF(__pyx_int_72);
-  __Pyx_GIVEREF(__pyx_int_72);
-  PyList_SET_ITEM(__pyx_t_3, 12, __pyx_int_72);
-  __Pyx_INCREF(__pyx_int_8);
-  __Pyx_GIVEREF(__pyx_int_8);
-  PyList_SET_ITEM(__pyx_t_3, 13, __pyx_int_8);
-  __Pyx_INCREF(__pyx_int_104);
-  __Pyx_GIVEREF(__pyx_int_104);
-  PyList_SET_ITEM(__pyx_t_3, 14, __pyx_int_104);
-  __Pyx_INCREF(__pyx_int_40);
-  __Pyx_GIVEREF(__pyx_int_40);
-  PyList_SET_ITEM(__pyx_t_3, 15, __pyx_int_40);
-  __Pyx_INCREF(__pyx_int_42);
-  __Pyx_GIVEREF(__pyx_int_42);
-  PyList_SET_ITEM(__pyx_t_3, 16, __pyx_int_42);
-  __Pyx_INCREF(__pyx_int_106);
-  __Pyx_GIVEREF(__pyx_int_106);
-  PyList_SET_ITEM(__pyx_t_3, 17, __pyx_int_106);
-  __Pyx_INCREF(__pyx_int_64);
-  __Pyx_GIVEREF(__pyx_int_64);
-  PyList_SET_ITEM(__pyx_t_3, 18, __pyx_int_64);
-  __Pyx_INCREF(__pyx_int_96);
-  __Pyx_GIVEREF(__pyx_int_96);
-  PyList_SET_ITEM(__pyx_t_3, 19, __pyx_int_96);
-  __Pyx_INCREF(__pyx_int_56);
-  __Pyx_GIVEREF(__pyx_int_56);
-  PyList_SET_ITEM(__pyx_t_3, 20, __pyx_int_56);
-  __Pyx_INCREF(__pyx_int_248);
-  __Pyx_GIVEREF(__pyx_int_248);
-  PyList_SET_ITEM(__pyx_t_3, 21, __pyx_int_248);
-  __Pyx_INCREF(__pyx_int_120);
-  __Pyx_GIVEREF(__pyx_int_120);
-  PyList_SET_ITEM(__pyx_t_3, 22, __pyx_int_120);
-  __Pyx_INCREF(__pyx_int_170);
-  __Pyx_GIVEREF(__pyx_int_170);
-  PyList_SET_ITEM(__pyx_t_3, 23, __pyx_int_170);
-  __Pyx_INCREF(__pyx_int_168);
-  __Pyx_GIVEREF(__pyx_int_168);
-  PyList_SET_ITEM(__pyx_t_3, 24, __pyx_int_168);
-  __Pyx_INCREF(__pyx_int_186);
-  __Pyx_GIVEREF(__pyx_int_186);
-  PyList_SET_ITEM(__pyx_t_3, 25, __pyx_int_186);
-  __Pyx_INCREF(__pyx_int_138);
-  __Pyx_GIVEREF(__pyx_int_138);
-  PyList_SET_ITEM(__pyx_t_3, 26, __pyx_int_138);
-  __Pyx_INCREF(__pyx_int_154);
-  __Pyx_GIVEREF(__pyx_int_154);
-  PyList_SET_ITEM(__pyx_t_3, 27, __pyx_int_154);
-  __Pyx_INCREF(__pyx_int_152);
-  __Pyx_GIVEREF(__pyx_int_152);
-  PyList_SET_ITEM(__pyx_t_3, 28, __pyx_int_152);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_INCREF(__pyx_int_1);
-  __Pyx_GIVEREF(__pyx_int_1);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_1);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[35] = {__pyx_mstate_global->__pyx_int_10, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_24, __pyx_mstate_global->__pyx_int_216, __pyx_mstate_global->__pyx_int_88, __pyx_mstate_global->__pyx_int_184, __pyx_mstate_global->__pyx_int_202, __pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_int_232, __pyx_mstate_global->__pyx_int_200, __pyx_mstate_global->__pyx_int_74, __pyx_mstate_global->__pyx_int_234, __pyx_mstate_global->__pyx_int_72, __pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_104, __pyx_mstate_global->__pyx_int_40, __pyx_mstate_global->__pyx_int_42, __pyx_mstate_global->__pyx_int_106, __pyx_mstate_global->__pyx_int_64, __pyx_mstate_global->__pyx_int_96, __pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_int_248, __pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_int_170, __pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_int_186, __pyx_mstate_global->__pyx_int_138, __pyx_mstate_global->__pyx_int_154, __pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_int_26, __pyx_mstate_global->__pyx_int_58, __pyx_mstate_global->__pyx_int_90, __pyx_mstate_global->__pyx_int_122, __pyx_mstate_global->__pyx_int_218, __pyx_mstate_global->__pyx_int_250};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 35); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_int_1};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 185, __pyx_L1_error)
+    __PYX_ERR(0, 221, __pyx_L1_error)
   }
   if (likely(PyDict_CheckExact(__pyx_t_3))) {
-    __pyx_t_1 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API
+    if (__Pyx_IS_UNIQUELY_REFERENCED(__pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference)) {
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_t_3 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_2 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 221, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
 
-  /* "nespy/enum.py":194
- *                      0x98],
+  /* "nespy/enum.py":231
+ *                      0x7A, 0xDA, 0xFA],
  *                     1),
  *     **dict.fromkeys([0x69, 0x65, 0x75, 0x61,             # <<<<<<<<<<<<<<
  *                      0x71, 0x29, 0x25, 0x35,
  *                      0x21, 0x31, 0x06, 0x16,
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyList_New(74); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_int_105);
-  __Pyx_GIVEREF(__pyx_int_105);
-  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_int_105);
-  __Pyx_INCREF(__pyx_int_101);
-  __Pyx_GIVEREF(__pyx_int_101);
-  PyList_SET_ITEM(__pyx_t_4, 1, __pyx_int_101);
-  __Pyx_INCREF(__pyx_int_117);
-  __Pyx_GIVEREF(__pyx_int_117);
-  PyList_SET_ITEM(__pyx_t_4, 2, __pyx_int_117);
-  __Pyx_INCREF(__pyx_int_97);
-  __Pyx_GIVEREF(__pyx_int_97);
-  PyList_SET_ITEM(__pyx_t_4, 3, __pyx_int_97);
-  __Pyx_INCREF(__pyx_int_113);
-  __Pyx_GIVEREF(__pyx_int_113);
-  PyList_SET_ITEM(__pyx_t_4, 4, __pyx_int_113);
-  __Pyx_INCREF(__pyx_int_41);
-  __Pyx_GIVEREF(__pyx_int_41);
-  PyList_SET_ITEM(__pyx_t_4, 5, __pyx_int_41);
-  __Pyx_INCREF(__pyx_int_37);
-  __Pyx_GIVEREF(__pyx_int_37);
-  PyList_SET_ITEM(__pyx_t_4, 6, __pyx_int_37);
-  __Pyx_INCREF(__pyx_int_53);
-  __Pyx_GIVEREF(__pyx_int_53);
-  PyList_SET_ITEM(__pyx_t_4, 7, __pyx_int_53);
-  __Pyx_INCREF(__pyx_int_33);
-  __Pyx_GIVEREF(__pyx_int_33);
-  PyList_SET_ITEM(__pyx_t_4, 8, __pyx_int_33);
-  __Pyx_INCREF(__pyx_int_49);
-  __Pyx_GIVEREF(__pyx_int_49);
-  PyList_SET_ITEM(__pyx_t_4, 9, __pyx_int_49);
-  __Pyx_INCREF(__pyx_int_6);
-  __Pyx_GIVEREF(__pyx_int_6);
-  PyList_SET_ITEM(__pyx_t_4, 10, __pyx_int_6);
-  __Pyx_INCREF(__pyx_int_22);
-  __Pyx_GIVEREF(__pyx_int_22);
-  PyList_SET_ITEM(__pyx_t_4, 11, __pyx_int_22);
-  __Pyx_INCREF(__pyx_int_144);
-  __Pyx_GIVEREF(__pyx_int_144);
-  PyList_SET_ITEM(__pyx_t_4, 12, __pyx_int_144);
-  __Pyx_INCREF(__pyx_int_176);
-  __Pyx_GIVEREF(__pyx_int_176);
-  PyList_SET_ITEM(__pyx_t_4, 13, __pyx_int_176);
-  __Pyx_INCREF(__pyx_int_240);
-  __Pyx_GIVEREF(__pyx_int_240);
-  PyList_SET_ITEM(__pyx_t_4, 14, __pyx_int_240);
-  __Pyx_INCREF(__pyx_int_36);
-  __Pyx_GIVEREF(__pyx_int_36);
-  PyList_SET_ITEM(__pyx_t_4, 15, __pyx_int_36);
-  __Pyx_INCREF(__pyx_int_48);
-  __Pyx_GIVEREF(__pyx_int_48);
-  PyList_SET_ITEM(__pyx_t_4, 16, __pyx_int_48);
-  __Pyx_INCREF(__pyx_int_208);
-  __Pyx_GIVEREF(__pyx_int_208);
-  PyList_SET_ITEM(__pyx_t_4, 17, __pyx_int_208);
-  __Pyx_INCREF(__pyx_int_16);
-  __Pyx_GIVEREF(__pyx_int_16);
-  PyList_SET_ITEM(__pyx_t_4, 18, __pyx_int_16);
-  __Pyx_INCREF(__pyx_int_80);
-  __Pyx_GIVEREF(__pyx_int_80);
-  PyList_SET_ITEM(__pyx_t_4, 19, __pyx_int_80);
-  __Pyx_INCREF(__pyx_int_112);
-  __Pyx_GIVEREF(__pyx_int_112);
-  PyList_SET_ITEM(__pyx_t_4, 20, __pyx_int_112);
-  __Pyx_INCREF(__pyx_int_201);
-  __Pyx_GIVEREF(__pyx_int_201);
-  PyList_SET_ITEM(__pyx_t_4, 21, __pyx_int_201);
-  __Pyx_INCREF(__pyx_int_197);
-  __Pyx_GIVEREF(__pyx_int_197);
-  PyList_SET_ITEM(__pyx_t_4, 22, __pyx_int_197);
-  __Pyx_INCREF(__pyx_int_213);
-  __Pyx_GIVEREF(__pyx_int_213);
-  PyList_SET_ITEM(__pyx_t_4, 23, __pyx_int_213);
-  __Pyx_INCREF(__pyx_int_193);
-  __Pyx_GIVEREF(__pyx_int_193);
-  PyList_SET_ITEM(__pyx_t_4, 24, __pyx_int_193);
-  __Pyx_INCREF(__pyx_int_209);
-  __Pyx_GIVEREF(__pyx_int_209);
-  PyList_SET_ITEM(__pyx_t_4, 25, __pyx_int_209);
-  __Pyx_INCREF(__pyx_int_224);
-  __Pyx_GIVEREF(__pyx_int_224);
-  PyList_SET_ITEM(__pyx_t_4, 26, __pyx_int_224);
-  __Pyx_INCREF(__pyx_int_228);
-  __Pyx_GIVEREF(__pyx_int_228);
-  PyList_SET_ITEM(__pyx_t_4, 27, __pyx_int_228);
-  __Pyx_INCREF(__pyx_int_192);
-  __Pyx_GIVEREF(__pyx_int_192);
-  PyList_SET_ITEM(__pyx_t_4, 28, __pyx_int_192);
-  __Pyx_INCREF(__pyx_int_196);
-  __Pyx_GIVEREF(__pyx_int_196);
-  PyList_SET_ITEM(__pyx_t_4, 29, __pyx_int_196);
-  __Pyx_INCREF(__pyx_int_198);
-  __Pyx_GIVEREF(__pyx_int_198);
-  PyList_SET_ITEM(__pyx_t_4, 30, __pyx_int_198);
-  __Pyx_INCREF(__pyx_int_214);
-  __Pyx_GIVEREF(__pyx_int_214);
-  PyList_SET_ITEM(__pyx_t_4, 31, __pyx_int_214);
-  __Pyx_INCREF(__pyx_int_73);
-  __Pyx_GIVEREF(__pyx_int_73);
-  PyList_SET_ITEM(__pyx_t_4, 32, __pyx_int_73);
-  __Pyx_INCREF(__pyx_int_69);
-  __Pyx_GIVEREF(__pyx_int_69);
-  PyList_SET_ITEM(__pyx_t_4, 33, __pyx_int_69);
-  __Pyx_INCREF(__pyx_int_85);
-  __Pyx_GIVEREF(__pyx_int_85);
-  PyList_SET_ITEM(__pyx_t_4, 34, __pyx_int_85);
-  __Pyx_INCREF(__pyx_int_65);
-  __Pyx_GIVEREF(__pyx_int_65);
-  PyList_SET_ITEM(__pyx_t_4, 35, __pyx_int_65);
-  __Pyx_INCREF(__pyx_int_81);
-  __Pyx_GIVEREF(__pyx_int_81);
-  PyList_SET_ITEM(__pyx_t_4, 36, __pyx_int_81);
-  __Pyx_INCREF(__pyx_int_230);
-  __Pyx_GIVEREF(__pyx_int_230);
-  PyList_SET_ITEM(__pyx_t_4, 37, __pyx_int_230);
-  __Pyx_INCREF(__pyx_int_246);
-  __Pyx_GIVEREF(__pyx_int_246);
-  PyList_SET_ITEM(__pyx_t_4, 38, __pyx_int_246);
-  __Pyx_INCREF(__pyx_int_169);
-  __Pyx_GIVEREF(__pyx_int_169);
-  PyList_SET_ITEM(__pyx_t_4, 39, __pyx_int_169);
-  __Pyx_INCREF(__pyx_int_165);
-  __Pyx_GIVEREF(__pyx_int_165);
-  PyList_SET_ITEM(__pyx_t_4, 40, __pyx_int_165);
-  __Pyx_INCREF(__pyx_int_181);
-  __Pyx_GIVEREF(__pyx_int_181);
-  PyList_SET_ITEM(__pyx_t_4, 41, __pyx_int_181);
-  __Pyx_INCREF(__pyx_int_161);
-  __Pyx_GIVEREF(__pyx_int_161);
-  PyList_SET_ITEM(__pyx_t_4, 42, __pyx_int_161);
-  __Pyx_INCREF(__pyx_int_177);
-  __Pyx_GIVEREF(__pyx_int_177);
-  PyList_SET_ITEM(__pyx_t_4, 43, __pyx_int_177);
-  __Pyx_INCREF(__pyx_int_162);
-  __Pyx_GIVEREF(__pyx_int_162);
-  PyList_SET_ITEM(__pyx_t_4, 44, __pyx_int_162);
-  __Pyx_INCREF(__pyx_int_166);
-  __Pyx_GIVEREF(__pyx_int_166);
-  PyList_SET_ITEM(__pyx_t_4, 45, __pyx_int_166);
-  __Pyx_INCREF(__pyx_int_182);
-  __Pyx_GIVEREF(__pyx_int_182);
-  PyList_SET_ITEM(__pyx_t_4, 46, __pyx_int_182);
-  __Pyx_INCREF(__pyx_int_160);
-  __Pyx_GIVEREF(__pyx_int_160);
-  PyList_SET_ITEM(__pyx_t_4, 47, __pyx_int_160);
-  __Pyx_INCREF(__pyx_int_164);
-  __Pyx_GIVEREF(__pyx_int_164);
-  PyList_SET_ITEM(__pyx_t_4, 48, __pyx_int_164);
-  __Pyx_INCREF(__pyx_int_180);
-  __Pyx_GIVEREF(__pyx_int_180);
-  PyList_SET_ITEM(__pyx_t_4, 49, __pyx_int_180);
-  __Pyx_INCREF(__pyx_int_70);
-  __Pyx_GIVEREF(__pyx_int_70);
-  PyList_SET_ITEM(__pyx_t_4, 50, __pyx_int_70);
-  __Pyx_INCREF(__pyx_int_86);
-  __Pyx_GIVEREF(__pyx_int_86);
-  PyList_SET_ITEM(__pyx_t_4, 51, __pyx_int_86);
-  __Pyx_INCREF(__pyx_int_9);
-  __Pyx_GIVEREF(__pyx_int_9);
-  PyList_SET_ITEM(__pyx_t_4, 52, __pyx_int_9);
-  __Pyx_INCREF(__pyx_int_5);
-  __Pyx_GIVEREF(__pyx_int_5);
-  PyList_SET_ITEM(__pyx_t_4, 53, __pyx_int_5);
-  __Pyx_INCREF(__pyx_int_21);
-  __Pyx_GIVEREF(__pyx_int_21);
-  PyList_SET_ITEM(__pyx_t_4, 54, __pyx_int_21);
-  __Pyx_INCREF(__pyx_int_1);
-  __Pyx_GIVEREF(__pyx_int_1);
-  PyList_SET_ITEM(__pyx_t_4, 55, __pyx_int_1);
-  __Pyx_INCREF(__pyx_int_17);
-  __Pyx_GIVEREF(__pyx_int_17);
-  PyList_SET_ITEM(__pyx_t_4, 56, __pyx_int_17);
-  __Pyx_INCREF(__pyx_int_38);
-  __Pyx_GIVEREF(__pyx_int_38);
-  PyList_SET_ITEM(__pyx_t_4, 57, __pyx_int_38);
-  __Pyx_INCREF(__pyx_int_54);
-  __Pyx_GIVEREF(__pyx_int_54);
-  PyList_SET_ITEM(__pyx_t_4, 58, __pyx_int_54);
-  __Pyx_INCREF(__pyx_int_102);
-  __Pyx_GIVEREF(__pyx_int_102);
-  PyList_SET_ITEM(__pyx_t_4, 59, __pyx_int_102);
-  __Pyx_INCREF(__pyx_int_118);
-  __Pyx_GIVEREF(__pyx_int_118);
-  PyList_SET_ITEM(__pyx_t_4, 60, __pyx_int_118);
-  __Pyx_INCREF(__pyx_int_233);
-  __Pyx_GIVEREF(__pyx_int_233);
-  PyList_SET_ITEM(__pyx_t_4, 61, __pyx_int_233);
-  __Pyx_INCREF(__pyx_int_229);
-  __Pyx_GIVEREF(__pyx_int_229);
-  PyList_SET_ITEM(__pyx_t_4, 62, __pyx_int_229);
-  __Pyx_INCREF(__pyx_int_245);
-  __Pyx_GIVEREF(__pyx_int_245);
-  PyList_SET_ITEM(__pyx_t_4, 63, __pyx_int_245);
-  __Pyx_INCREF(__pyx_int_225);
-  __Pyx_GIVEREF(__pyx_int_225);
-  PyList_SET_ITEM(__pyx_t_4, 64, __pyx_int_225);
-  __Pyx_INCREF(__pyx_int_241);
-  __Pyx_GIVEREF(__pyx_int_241);
-  PyList_SET_ITEM(__pyx_t_4, 65, __pyx_int_241);
-  __Pyx_INCREF(__pyx_int_133);
-  __Pyx_GIVEREF(__pyx_int_133);
-  PyList_SET_ITEM(__pyx_t_4, 66, __pyx_int_133);
-  __Pyx_INCREF(__pyx_int_149);
-  __Pyx_GIVEREF(__pyx_int_149);
-  PyList_SET_ITEM(__pyx_t_4, 67, __pyx_int_149);
-  __Pyx_INCREF(__pyx_int_129);
-  __Pyx_GIVEREF(__pyx_int_129);
-  PyList_SET_ITEM(__pyx_t_4, 68, __pyx_int_129);
-  __Pyx_INCREF(__pyx_int_145);
-  __Pyx_GIVEREF(__pyx_int_145);
-  PyList_SET_ITEM(__pyx_t_4, 69, __pyx_int_145);
-  __Pyx_INCREF(__pyx_int_134);
-  __Pyx_GIVEREF(__pyx_int_134);
-  PyList_SET_ITEM(__pyx_t_4, 70, __pyx_int_134);
-  __Pyx_INCREF(__pyx_int_150);
-  __Pyx_GIVEREF(__pyx_int_150);
-  PyList_SET_ITEM(__pyx_t_4, 71, __pyx_int_150);
-  __Pyx_INCREF(__pyx_int_132);
-  __Pyx_GIVEREF(__pyx_int_132);
-  PyList_SET_ITEM(__pyx_t_4, 72, __pyx_int_132);
-  __Pyx_INCREF(__pyx_int_148);
-  __Pyx_GIVEREF(__pyx_int_148);
-  PyList_SET_ITEM(__pyx_t_4, 73, __pyx_int_148);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-  __Pyx_INCREF(__pyx_int_2);
-  __Pyx_GIVEREF(__pyx_int_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_2);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_4 == Py_None)) {
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[79] = {__pyx_mstate_global->__pyx_int_105, __pyx_mstate_global->__pyx_int_101, __pyx_mstate_global->__pyx_int_117, __pyx_mstate_global->__pyx_int_97, __pyx_mstate_global->__pyx_int_113, __pyx_mstate_global->__pyx_int_41, __pyx_mstate_global->__pyx_int_37, __pyx_mstate_global->__pyx_int_53, __pyx_mstate_global->__pyx_int_33, __pyx_mstate_global->__pyx_int_49, __pyx_mstate_global->__pyx_int_6, __pyx_mstate_global->__pyx_int_22, __pyx_mstate_global->__pyx_int_144, __pyx_mstate_global->__pyx_int_176, __pyx_mstate_global->__pyx_int_240, __pyx_mstate_global->__pyx_int_36, __pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_int_208, __pyx_mstate_global->__pyx_int_16, __pyx_mstate_global->__pyx_int_80, __pyx_mstate_global->__pyx_int_112, __pyx_mstate_global->__pyx_int_201, __pyx_mstate_global->__pyx_int_197, __pyx_mstate_global->__pyx_int_213, __pyx_mstate_global->__pyx_int_193, __pyx_mstate_global->__pyx_int_209, __pyx_mstate_global->__pyx_int_224, __pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_int_192, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_int_198, __pyx_mstate_global->__pyx_int_214, __pyx_mstate_global->__pyx_int_73, __pyx_mstate_global->__pyx_int_69, __pyx_mstate_global->__pyx_int_85, __pyx_mstate_global->__pyx_int_65, __pyx_mstate_global->__pyx_int_81, __pyx_mstate_global->__pyx_int_230, __pyx_mstate_global->__pyx_int_246, __pyx_mstate_global->__pyx_int_169, __pyx_mstate_global->__pyx_int_165, __pyx_mstate_global->__pyx_int_181, __pyx_mstate_global->__pyx_int_161, __pyx_mstate_global->__pyx_int_177, __pyx_mstate_global->__pyx_int_162, __pyx_mstate_global->__pyx_int_166, __pyx_mstate_global->__pyx_int_182, __pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_164, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_70, __pyx_mstate_global->__pyx_int_86, __pyx_mstate_global->__pyx_int_9, __pyx_mstate_global->__pyx_int_5, __pyx_mstate_global->__pyx_int_21, __pyx_mstate_global->__pyx_int_1, __pyx_mstate_global->__pyx_int_17, __pyx_mstate_global->__pyx_int_38, __pyx_mstate_global->__pyx_int_54, __pyx_mstate_global->__pyx_int_102, __pyx_mstate_global->__pyx_int_118, __pyx_mstate_global->__pyx_int_233, __pyx_mstate_global->__pyx_int_229, __pyx_mstate_global->__pyx_int_245, __pyx_mstate_global->__pyx_int_225, __pyx_mstate_global->__pyx_int_241, __pyx_mstate_global->__pyx_int_133, __pyx_mstate_global->__pyx_int_149, __pyx_mstate_global->__pyx_int_129, __pyx_mstate_global->__pyx_int_145, __pyx_mstate_global->__pyx_int_134, __pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_int_132, __pyx_mstate_global->__pyx_int_148, __pyx_mstate_global->__pyx_int_128, __pyx_mstate_global->__pyx_int_130, __pyx_mstate_global->__pyx_int_137, __pyx_mstate_global->__pyx_int_194, __pyx_mstate_global->__pyx_int_226};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 79); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_int_2};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 194, __pyx_L1_error)
+    __PYX_ERR(0, 231, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_4) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_4);
-    __PYX_ERR(0, 194, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 231, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":214
- *                      0x84, 0x94],
+  /* "nespy/enum.py":252
+ *                      0x89, 0xC2, 0xE2],
  *                     2),
  *     **dict.fromkeys([0x6D, 0x7D, 0x79, 0x2D,             # <<<<<<<<<<<<<<
  *                      0x3D, 0x39, 0x0E, 0x1E,
  *                      0x2C, 0xCD, 0xDD, 0xD9,
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 214, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyList_New(48); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_int_109);
-  __Pyx_GIVEREF(__pyx_int_109);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_109);
-  __Pyx_INCREF(__pyx_int_125);
-  __Pyx_GIVEREF(__pyx_int_125);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_int_125);
-  __Pyx_INCREF(__pyx_int_121);
-  __Pyx_GIVEREF(__pyx_int_121);
-  PyList_SET_ITEM(__pyx_t_2, 2, __pyx_int_121);
-  __Pyx_INCREF(__pyx_int_45);
-  __Pyx_GIVEREF(__pyx_int_45);
-  PyList_SET_ITEM(__pyx_t_2, 3, __pyx_int_45);
-  __Pyx_INCREF(__pyx_int_61);
-  __Pyx_GIVEREF(__pyx_int_61);
-  PyList_SET_ITEM(__pyx_t_2, 4, __pyx_int_61);
-  __Pyx_INCREF(__pyx_int_57);
-  __Pyx_GIVEREF(__pyx_int_57);
-  PyList_SET_ITEM(__pyx_t_2, 5, __pyx_int_57);
-  __Pyx_INCREF(__pyx_int_14);
-  __Pyx_GIVEREF(__pyx_int_14);
-  PyList_SET_ITEM(__pyx_t_2, 6, __pyx_int_14);
-  __Pyx_INCREF(__pyx_int_30);
-  __Pyx_GIVEREF(__pyx_int_30);
-  PyList_SET_ITEM(__pyx_t_2, 7, __pyx_int_30);
-  __Pyx_INCREF(__pyx_int_44);
-  __Pyx_GIVEREF(__pyx_int_44);
-  PyList_SET_ITEM(__pyx_t_2, 8, __pyx_int_44);
-  __Pyx_INCREF(__pyx_int_205);
-  __Pyx_GIVEREF(__pyx_int_205);
-  PyList_SET_ITEM(__pyx_t_2, 9, __pyx_int_205);
-  __Pyx_INCREF(__pyx_int_221);
-  __Pyx_GIVEREF(__pyx_int_221);
-  PyList_SET_ITEM(__pyx_t_2, 10, __pyx_int_221);
-  __Pyx_INCREF(__pyx_int_217);
-  __Pyx_GIVEREF(__pyx_int_217);
-  PyList_SET_ITEM(__pyx_t_2, 11, __pyx_int_217);
-  __Pyx_INCREF(__pyx_int_236);
-  __Pyx_GIVEREF(__pyx_int_236);
-  PyList_SET_ITEM(__pyx_t_2, 12, __pyx_int_236);
-  __Pyx_INCREF(__pyx_int_204);
-  __Pyx_GIVEREF(__pyx_int_204);
-  PyList_SET_ITEM(__pyx_t_2, 13, __pyx_int_204);
-  __Pyx_INCREF(__pyx_int_206);
-  __Pyx_GIVEREF(__pyx_int_206);
-  PyList_SET_ITEM(__pyx_t_2, 14, __pyx_int_206);
-  __Pyx_INCREF(__pyx_int_222);
-  __Pyx_GIVEREF(__pyx_int_222);
-  PyList_SET_ITEM(__pyx_t_2, 15, __pyx_int_222);
-  __Pyx_INCREF(__pyx_int_77);
-  __Pyx_GIVEREF(__pyx_int_77);
-  PyList_SET_ITEM(__pyx_t_2, 16, __pyx_int_77);
-  __Pyx_INCREF(__pyx_int_93);
-  __Pyx_GIVEREF(__pyx_int_93);
-  PyList_SET_ITEM(__pyx_t_2, 17, __pyx_int_93);
-  __Pyx_INCREF(__pyx_int_89);
-  __Pyx_GIVEREF(__pyx_int_89);
-  PyList_SET_ITEM(__pyx_t_2, 18, __pyx_int_89);
-  __Pyx_INCREF(__pyx_int_238);
-  __Pyx_GIVEREF(__pyx_int_238);
-  PyList_SET_ITEM(__pyx_t_2, 19, __pyx_int_238);
-  __Pyx_INCREF(__pyx_int_254);
-  __Pyx_GIVEREF(__pyx_int_254);
-  PyList_SET_ITEM(__pyx_t_2, 20, __pyx_int_254);
-  __Pyx_INCREF(__pyx_int_76);
-  __Pyx_GIVEREF(__pyx_int_76);
-  PyList_SET_ITEM(__pyx_t_2, 21, __pyx_int_76);
-  __Pyx_INCREF(__pyx_int_108);
-  __Pyx_GIVEREF(__pyx_int_108);
-  PyList_SET_ITEM(__pyx_t_2, 22, __pyx_int_108);
-  __Pyx_INCREF(__pyx_int_32);
-  __Pyx_GIVEREF(__pyx_int_32);
-  PyList_SET_ITEM(__pyx_t_2, 23, __pyx_int_32);
-  __Pyx_INCREF(__pyx_int_173);
-  __Pyx_GIVEREF(__pyx_int_173);
-  PyList_SET_ITEM(__pyx_t_2, 24, __pyx_int_173);
-  __Pyx_INCREF(__pyx_int_189);
-  __Pyx_GIVEREF(__pyx_int_189);
-  PyList_SET_ITEM(__pyx_t_2, 25, __pyx_int_189);
-  __Pyx_INCREF(__pyx_int_185);
-  __Pyx_GIVEREF(__pyx_int_185);
-  PyList_SET_ITEM(__pyx_t_2, 26, __pyx_int_185);
-  __Pyx_INCREF(__pyx_int_174);
-  __Pyx_GIVEREF(__pyx_int_174);
-  PyList_SET_ITEM(__pyx_t_2, 27, __pyx_int_174);
-  __Pyx_INCREF(__pyx_int_190);
-  __Pyx_GIVEREF(__pyx_int_190);
-  PyList_SET_ITEM(__pyx_t_2, 28, __pyx_int_190);
-  __Pyx_INCREF(__pyx_int_172);
-  __Pyx_GIVEREF(__pyx_int_172);
-  PyList_SET_ITEM(__pyx_t_2, 29, __pyx_int_172);
-  __Pyx_INCREF(__pyx_int_188);
-  __Pyx_GIVEREF(__pyx_int_188);
-  PyList_SET_ITEM(__pyx_t_2, 30, __pyx_int_188);
-  __Pyx_INCREF(__pyx_int_78);
-  __Pyx_GIVEREF(__pyx_int_78);
-  PyList_SET_ITEM(__pyx_t_2, 31, __pyx_int_78);
-  __Pyx_INCREF(__pyx_int_94);
-  __Pyx_GIVEREF(__pyx_int_94);
-  PyList_SET_ITEM(__pyx_t_2, 32, __pyx_int_94);
-  __Pyx_INCREF(__pyx_int_13);
-  __Pyx_GIVEREF(__pyx_int_13);
-  PyList_SET_ITEM(__pyx_t_2, 33, __pyx_int_13);
-  __Pyx_INCREF(__pyx_int_29);
-  __Pyx_GIVEREF(__pyx_int_29);
-  PyList_SET_ITEM(__pyx_t_2, 34, __pyx_int_29);
-  __Pyx_INCREF(__pyx_int_25);
-  __Pyx_GIVEREF(__pyx_int_25);
-  PyList_SET_ITEM(__pyx_t_2, 35, __pyx_int_25);
-  __Pyx_INCREF(__pyx_int_46);
-  __Pyx_GIVEREF(__pyx_int_46);
-  PyList_SET_ITEM(__pyx_t_2, 36, __pyx_int_46);
-  __Pyx_INCREF(__pyx_int_62);
-  __Pyx_GIVEREF(__pyx_int_62);
-  PyList_SET_ITEM(__pyx_t_2, 37, __pyx_int_62);
-  __Pyx_INCREF(__pyx_int_110);
-  __Pyx_GIVEREF(__pyx_int_110);
-  PyList_SET_ITEM(__pyx_t_2, 38, __pyx_int_110);
-  __Pyx_INCREF(__pyx_int_126);
-  __Pyx_GIVEREF(__pyx_int_126);
-  PyList_SET_ITEM(__pyx_t_2, 39, __pyx_int_126);
-  __Pyx_INCREF(__pyx_int_237);
-  __Pyx_GIVEREF(__pyx_int_237);
-  PyList_SET_ITEM(__pyx_t_2, 40, __pyx_int_237);
-  __Pyx_INCREF(__pyx_int_253);
-  __Pyx_GIVEREF(__pyx_int_253);
-  PyList_SET_ITEM(__pyx_t_2, 41, __pyx_int_253);
-  __Pyx_INCREF(__pyx_int_249);
-  __Pyx_GIVEREF(__pyx_int_249);
-  PyList_SET_ITEM(__pyx_t_2, 42, __pyx_int_249);
-  __Pyx_INCREF(__pyx_int_141);
-  __Pyx_GIVEREF(__pyx_int_141);
-  PyList_SET_ITEM(__pyx_t_2, 43, __pyx_int_141);
-  __Pyx_INCREF(__pyx_int_157);
-  __Pyx_GIVEREF(__pyx_int_157);
-  PyList_SET_ITEM(__pyx_t_2, 44, __pyx_int_157);
-  __Pyx_INCREF(__pyx_int_153);
-  __Pyx_GIVEREF(__pyx_int_153);
-  PyList_SET_ITEM(__pyx_t_2, 45, __pyx_int_153);
-  __Pyx_INCREF(__pyx_int_142);
-  __Pyx_GIVEREF(__pyx_int_142);
-  PyList_SET_ITEM(__pyx_t_2, 46, __pyx_int_142);
-  __Pyx_INCREF(__pyx_int_140);
-  __Pyx_GIVEREF(__pyx_int_140);
-  PyList_SET_ITEM(__pyx_t_2, 47, __pyx_int_140);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-  __Pyx_INCREF(__pyx_int_3);
-  __Pyx_GIVEREF(__pyx_int_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_3);
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_t_2 == Py_None)) {
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[48] = {__pyx_mstate_global->__pyx_int_109, __pyx_mstate_global->__pyx_int_125, __pyx_mstate_global->__pyx_int_121, __pyx_mstate_global->__pyx_int_45, __pyx_mstate_global->__pyx_int_61, __pyx_mstate_global->__pyx_int_57, __pyx_mstate_global->__pyx_int_14, __pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_int_44, __pyx_mstate_global->__pyx_int_205, __pyx_mstate_global->__pyx_int_221, __pyx_mstate_global->__pyx_int_217, __pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_206, __pyx_mstate_global->__pyx_int_222, __pyx_mstate_global->__pyx_int_77, __pyx_mstate_global->__pyx_int_93, __pyx_mstate_global->__pyx_int_89, __pyx_mstate_global->__pyx_int_238, __pyx_mstate_global->__pyx_int_254, __pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_108, __pyx_mstate_global->__pyx_int_32, __pyx_mstate_global->__pyx_int_173, __pyx_mstate_global->__pyx_int_189, __pyx_mstate_global->__pyx_int_185, __pyx_mstate_global->__pyx_int_174, __pyx_mstate_global->__pyx_int_190, __pyx_mstate_global->__pyx_int_172, __pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_int_78, __pyx_mstate_global->__pyx_int_94, __pyx_mstate_global->__pyx_int_13, __pyx_mstate_global->__pyx_int_29, __pyx_mstate_global->__pyx_int_25, __pyx_mstate_global->__pyx_int_46, __pyx_mstate_global->__pyx_int_62, __pyx_mstate_global->__pyx_int_110, __pyx_mstate_global->__pyx_int_126, __pyx_mstate_global->__pyx_int_237, __pyx_mstate_global->__pyx_int_253, __pyx_mstate_global->__pyx_int_249, __pyx_mstate_global->__pyx_int_141, __pyx_mstate_global->__pyx_int_157, __pyx_mstate_global->__pyx_int_153, __pyx_mstate_global->__pyx_int_142, __pyx_mstate_global->__pyx_int_140};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 48); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_int_3};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 214, __pyx_L1_error)
+    __PYX_ERR(0, 252, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_2) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_2);
-    __PYX_ERR(0, 214, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 252, __pyx_L1_error)
   }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionLengthMap, __pyx_t_2) < (0)) __PYX_ERR(0, 220, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_InstructionLengthMap, __pyx_t_1) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nespy/enum.py":231
+  /* "nespy/enum.py":269
  * 
- * AddressingModeDisasmFormat = {  # the format string printed by the disassembler for each addressing mode
- *     AddressingMode.Absolute: "${operand}",             # <<<<<<<<<<<<<<
- *     AddressingMode.AbsoluteX: "${operand},X",
- *     AddressingMode.AbsoluteY: "${operand},Y",
- */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(12); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Absolute); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_operand) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+ * InstructionCycleMap = {  # number of CPU cycles each instruction takes, not counting page-cross or branch penalties
+ *     **dict.fromkeys([0x69, 0x29, 0x0A, 0x90,             # <<<<<<<<<<<<<<
+ *                      0xB0, 0xF0, 0x30, 0xD0,
+ *                      0x10, 0x50, 0x70, 0x18,
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[52] = {__pyx_mstate_global->__pyx_int_105, __pyx_mstate_global->__pyx_int_41, __pyx_mstate_global->__pyx_int_10, __pyx_mstate_global->__pyx_int_144, __pyx_mstate_global->__pyx_int_176, __pyx_mstate_global->__pyx_int_240, __pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_int_208, __pyx_mstate_global->__pyx_int_16, __pyx_mstate_global->__pyx_int_80, __pyx_mstate_global->__pyx_int_112, __pyx_mstate_global->__pyx_int_24, __pyx_mstate_global->__pyx_int_216, __pyx_mstate_global->__pyx_int_88, __pyx_mstate_global->__pyx_int_184, __pyx_mstate_global->__pyx_int_201, __pyx_mstate_global->__pyx_int_224, __pyx_mstate_global->__pyx_int_192, __pyx_mstate_global->__pyx_int_202, __pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_int_73, __pyx_mstate_global->__pyx_int_232, __pyx_mstate_global->__pyx_int_200, __pyx_mstate_global->__pyx_int_169, __pyx_mstate_global->__pyx_int_162, __pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_74, __pyx_mstate_global->__pyx_int_234, __pyx_mstate_global->__pyx_int_26, __pyx_mstate_global->__pyx_int_58, __pyx_mstate_global->__pyx_int_90, __pyx_mstate_global->__pyx_int_122, __pyx_mstate_global->__pyx_int_218, __pyx_mstate_global->__pyx_int_250, __pyx_mstate_global->__pyx_int_128, __pyx_mstate_global->__pyx_int_130, __pyx_mstate_global->__pyx_int_137, __pyx_mstate_global->__pyx_int_194, __pyx_mstate_global->__pyx_int_226, __pyx_mstate_global->__pyx_int_9, __pyx_mstate_global->__pyx_int_42, __pyx_mstate_global->__pyx_int_106, __pyx_mstate_global->__pyx_int_233, __pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_int_248, __pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_int_170, __pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_int_186, __pyx_mstate_global->__pyx_int_138, __pyx_mstate_global->__pyx_int_154, __pyx_mstate_global->__pyx_int_152};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 52); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 269, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_int_2};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 269, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 269, __pyx_L1_error)
+  }
+  if (likely(PyDict_CheckExact(__pyx_t_3))) {
+    #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API
+    if (__Pyx_IS_UNIQUELY_REFERENCED(__pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference)) {
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_t_3 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_2 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+  } else {
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 268, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
 
-  /* "nespy/enum.py":232
- * AddressingModeDisasmFormat = {  # the format string printed by the disassembler for each addressing mode
- *     AddressingMode.Absolute: "${operand}",
- *     AddressingMode.AbsoluteX: "${operand},X",             # <<<<<<<<<<<<<<
- *     AddressingMode.AbsoluteY: "${operand},Y",
- *     AddressingMode.ZeroPage: "${operand}",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 232, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_AbsoluteX); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 232, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  /* "nespy/enum.py":283
+ *                      0xBA, 0x8A, 0x9A, 0x98],
+ *                     2),
+ *     **dict.fromkeys([0x65, 0x25, 0x24, 0xC5,             # <<<<<<<<<<<<<<
+ *                      0xE4, 0xC4, 0x45, 0x4C,
+ *                      0xA5, 0xA6, 0xA4, 0x05,
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[18] = {__pyx_mstate_global->__pyx_int_101, __pyx_mstate_global->__pyx_int_37, __pyx_mstate_global->__pyx_int_36, __pyx_mstate_global->__pyx_int_197, __pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_int_69, __pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_165, __pyx_mstate_global->__pyx_int_166, __pyx_mstate_global->__pyx_int_164, __pyx_mstate_global->__pyx_int_5, __pyx_mstate_global->__pyx_int_229, __pyx_mstate_global->__pyx_int_133, __pyx_mstate_global->__pyx_int_134, __pyx_mstate_global->__pyx_int_132, __pyx_mstate_global->__pyx_int_72, __pyx_mstate_global->__pyx_int_8};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 18); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_int_3};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 283, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 283, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nespy/enum.py":289
+ *                      0x48, 0x08],
+ *                     3),
+ *     **dict.fromkeys([0x75, 0x6D, 0x7D, 0x79,             # <<<<<<<<<<<<<<
+ *                      0x35, 0x2D, 0x3D, 0x39,
+ *                      0x2C, 0xD5, 0xCD, 0xDD,
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[45] = {__pyx_mstate_global->__pyx_int_117, __pyx_mstate_global->__pyx_int_109, __pyx_mstate_global->__pyx_int_125, __pyx_mstate_global->__pyx_int_121, __pyx_mstate_global->__pyx_int_53, __pyx_mstate_global->__pyx_int_45, __pyx_mstate_global->__pyx_int_61, __pyx_mstate_global->__pyx_int_57, __pyx_mstate_global->__pyx_int_44, __pyx_mstate_global->__pyx_int_213, __pyx_mstate_global->__pyx_int_205, __pyx_mstate_global->__pyx_int_221, __pyx_mstate_global->__pyx_int_217, __pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_85, __pyx_mstate_global->__pyx_int_77, __pyx_mstate_global->__pyx_int_93, __pyx_mstate_global->__pyx_int_89, __pyx_mstate_global->__pyx_int_181, __pyx_mstate_global->__pyx_int_173, __pyx_mstate_global->__pyx_int_189, __pyx_mstate_global->__pyx_int_185, __pyx_mstate_global->__pyx_int_182, __pyx_mstate_global->__pyx_int_174, __pyx_mstate_global->__pyx_int_190, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_172, __pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_int_21, __pyx_mstate_global->__pyx_int_13, __pyx_mstate_global->__pyx_int_29, __pyx_mstate_global->__pyx_int_25, __pyx_mstate_global->__pyx_int_245, __pyx_mstate_global->__pyx_int_237, __pyx_mstate_global->__pyx_int_253, __pyx_mstate_global->__pyx_int_249, __pyx_mstate_global->__pyx_int_149, __pyx_mstate_global->__pyx_int_141, __pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_int_142, __pyx_mstate_global->__pyx_int_148, __pyx_mstate_global->__pyx_int_140, __pyx_mstate_global->__pyx_int_104, __pyx_mstate_global->__pyx_int_40};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 45); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 289, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_int_4};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 289, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 289, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 289, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nespy/enum.py":302
+ *                      0x28],
+ *                     4),
+ *     **dict.fromkeys([0x71, 0x31, 0x06, 0xD1,             # <<<<<<<<<<<<<<
+ *                      0xC6, 0x51, 0xE6, 0x6C,
+ *                      0xB1, 0x46, 0x11, 0x26,
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[16] = {__pyx_mstate_global->__pyx_int_113, __pyx_mstate_global->__pyx_int_49, __pyx_mstate_global->__pyx_int_6, __pyx_mstate_global->__pyx_int_209, __pyx_mstate_global->__pyx_int_198, __pyx_mstate_global->__pyx_int_81, __pyx_mstate_global->__pyx_int_230, __pyx_mstate_global->__pyx_int_108, __pyx_mstate_global->__pyx_int_177, __pyx_mstate_global->__pyx_int_70, __pyx_mstate_global->__pyx_int_17, __pyx_mstate_global->__pyx_int_38, __pyx_mstate_global->__pyx_int_102, __pyx_mstate_global->__pyx_int_241, __pyx_mstate_global->__pyx_int_157, __pyx_mstate_global->__pyx_int_153};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 16); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 302, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_int_5};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 302, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 302, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 302, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nespy/enum.py":307
+ *                      0x66, 0xF1, 0x9D, 0x99],
+ *                     5),
+ *     **dict.fromkeys([0x61, 0x21, 0x16, 0x0E,             # <<<<<<<<<<<<<<
+ *                      0xC1, 0xD6, 0xCE, 0x41,
+ *                      0xF6, 0xEE, 0x20, 0xA1,
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[24] = {__pyx_mstate_global->__pyx_int_97, __pyx_mstate_global->__pyx_int_33, __pyx_mstate_global->__pyx_int_22, __pyx_mstate_global->__pyx_int_14, __pyx_mstate_global->__pyx_int_193, __pyx_mstate_global->__pyx_int_214, __pyx_mstate_global->__pyx_int_206, __pyx_mstate_global->__pyx_int_65, __pyx_mstate_global->__pyx_int_246, __pyx_mstate_global->__pyx_int_238, __pyx_mstate_global->__pyx_int_32, __pyx_mstate_global->__pyx_int_161, __pyx_mstate_global->__pyx_int_86, __pyx_mstate_global->__pyx_int_78, __pyx_mstate_global->__pyx_int_1, __pyx_mstate_global->__pyx_int_54, __pyx_mstate_global->__pyx_int_46, __pyx_mstate_global->__pyx_int_118, __pyx_mstate_global->__pyx_int_110, __pyx_mstate_global->__pyx_int_225, __pyx_mstate_global->__pyx_int_129, __pyx_mstate_global->__pyx_int_145, __pyx_mstate_global->__pyx_int_64, __pyx_mstate_global->__pyx_int_96};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 24); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_int_6};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 307, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 307, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nespy/enum.py":314
+ *                      0x81, 0x91, 0x40, 0x60],
+ *                     6),
+ *     **dict.fromkeys([0x1E, 0xDE, 0xFE, 0x00,             # <<<<<<<<<<<<<<
+ *                      0x5E, 0x3E, 0x7E],
+ *                     7)
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[7] = {__pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_int_222, __pyx_mstate_global->__pyx_int_254, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_94, __pyx_mstate_global->__pyx_int_62, __pyx_mstate_global->__pyx_int_126};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_int_7};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
+    __PYX_ERR(0, 314, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 314, __pyx_L1_error)
+  }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand_X) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionCycleMap, __pyx_t_2) < (0)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":321
+ * 
+ * InstructionPageCrossPenalty = {  # instructions that take an extra cycle when their effective address crosses a page
+ *     0x7D, 0x79, 0x71, 0x3D,             # <<<<<<<<<<<<<<
+ *     0x39, 0x31, 0xDD, 0xD9,
+ *     0xD1, 0x5D, 0x59, 0x51,
+*/
+  __pyx_t_2 = PySet_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_125) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_121) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_113) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_61) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_57) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_49) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_221) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_217) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_209) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_93) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_89) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_81) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_189) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_185) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_177) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_190) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_188) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_29) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_25) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_17) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_253) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_249) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_2, __pyx_mstate_global->__pyx_int_241) < (0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionPageCrossPenalty, __pyx_t_2) < (0)) __PYX_ERR(0, 320, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "nespy/enum.py":233
+  /* "nespy/enum.py":330
+ * 
+ * AddressingModeDisasmFormat = {  # the format string printed by the disassembler for each addressing mode
+ *     AddressingMode.Absolute: "${operand}",             # <<<<<<<<<<<<<<
+ *     AddressingMode.AbsoluteX: "${operand},X",
+ *     AddressingMode.AbsoluteY: "${operand},Y",
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(12); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_Absolute); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_operand) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "nespy/enum.py":331
+ * AddressingModeDisasmFormat = {  # the format string printed by the disassembler for each addressing mode
+ *     AddressingMode.Absolute: "${operand}",
+ *     AddressingMode.AbsoluteX: "${operand},X",             # <<<<<<<<<<<<<<
+ *     AddressingMode.AbsoluteY: "${operand},Y",
+ *     AddressingMode.ZeroPage: "${operand}",
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 331, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AbsoluteX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand_X) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "nespy/enum.py":332
  *     AddressingMode.Absolute: "${operand}",
  *     AddressingMode.AbsoluteX: "${operand},X",
  *     AddressingMode.AbsoluteY: "${operand},Y",             # <<<<<<<<<<<<<<
  *     AddressingMode.ZeroPage: "${operand}",
  *     AddressingMode.ZeroPageX: "${operand},X",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_AbsoluteY); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 332, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_operand_Y) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AbsoluteY); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 332, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_operand_Y) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "nespy/enum.py":234
+  /* "nespy/enum.py":333
  *     AddressingMode.AbsoluteX: "${operand},X",
  *     AddressingMode.AbsoluteY: "${operand},Y",
  *     AddressingMode.ZeroPage: "${operand}",             # <<<<<<<<<<<<<<
  *     AddressingMode.ZeroPageX: "${operand},X",
  *     AddressingMode.ZeroPageY: "${operand},Y",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_ZeroPage); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_ZeroPage); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "nespy/enum.py":235
+  /* "nespy/enum.py":334
  *     AddressingMode.AbsoluteY: "${operand},Y",
  *     AddressingMode.ZeroPage: "${operand}",
  *     AddressingMode.ZeroPageX: "${operand},X",             # <<<<<<<<<<<<<<
  *     AddressingMode.ZeroPageY: "${operand},Y",
  *     AddressingMode.Immediate: "#${operand}",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_ZeroPageX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 334, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_operand_X) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_ZeroPageX); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_operand_X) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "nespy/enum.py":236
+  /* "nespy/enum.py":335
  *     AddressingMode.ZeroPage: "${operand}",
  *     AddressingMode.ZeroPageX: "${operand},X",
  *     AddressingMode.ZeroPageY: "${operand},Y",             # <<<<<<<<<<<<<<
  *     AddressingMode.Immediate: "#${operand}",
  *     AddressingMode.Relative: "${operand}; = ${value2}",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_ZeroPageY); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_ZeroPageY); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand_Y) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand_Y) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "nespy/enum.py":237
+  /* "nespy/enum.py":336
  *     AddressingMode.ZeroPageX: "${operand},X",
  *     AddressingMode.ZeroPageY: "${operand},Y",
  *     AddressingMode.Immediate: "#${operand}",             # <<<<<<<<<<<<<<
  *     AddressingMode.Relative: "${operand}; = ${value2}",
  *     AddressingMode.Implicit: "",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Immediate); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 237, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_operand_2) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_Immediate); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_operand_2) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "nespy/enum.py":238
+  /* "nespy/enum.py":337
  *     AddressingMode.ZeroPageY: "${operand},Y",
  *     AddressingMode.Immediate: "#${operand}",
  *     AddressingMode.Relative: "${operand}; = ${value2}",             # <<<<<<<<<<<<<<
  *     AddressingMode.Implicit: "",
  *     AddressingMode.Indirect: "(${operand})",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_Relative); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 337, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_Relative); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand_value2) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand_value2) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "nespy/enum.py":239
+  /* "nespy/enum.py":338
  *     AddressingMode.Immediate: "#${operand}",
  *     AddressingMode.Relative: "${operand}; = ${value2}",
  *     AddressingMode.Implicit: "",             # <<<<<<<<<<<<<<
  *     AddressingMode.Indirect: "(${operand})",
  *     AddressingMode.IndirectX: "(${operand},X)",
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Implicit); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 239, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_Implicit); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u__2) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "nespy/enum.py":240
+  /* "nespy/enum.py":339
  *     AddressingMode.Relative: "${operand}; = ${value2}",
  *     AddressingMode.Implicit: "",
  *     AddressingMode.Indirect: "(${operand})",             # <<<<<<<<<<<<<<
  *     AddressingMode.IndirectX: "(${operand},X)",
  *     AddressingMode.IndirectY: "(${operand}),Y"
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 240, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_Indirect); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_Indirect); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand_3) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand_3) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "nespy/enum.py":241
+  /* "nespy/enum.py":340
  *     AddressingMode.Implicit: "",
  *     AddressingMode.Indirect: "(${operand})",
  *     AddressingMode.IndirectX: "(${operand},X)",             # <<<<<<<<<<<<<<
  *     AddressingMode.IndirectY: "(${operand}),Y"
  * }
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_IndirectX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 241, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 340, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_kp_u_operand_X_2) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_IndirectX); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_operand_X_2) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "nespy/enum.py":242
+  /* "nespy/enum.py":341
  *     AddressingMode.Indirect: "(${operand})",
  *     AddressingMode.IndirectX: "(${operand},X)",
  *     AddressingMode.IndirectY: "(${operand}),Y"             # <<<<<<<<<<<<<<
  * }
  * 
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_AddressingMode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 242, __pyx_L1_error)
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_AddressingMode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_IndirectY); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 341, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_IndirectY); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_t_3, __pyx_mstate_global->__pyx_kp_u_operand_Y_2) < (0)) __PYX_ERR(0, 330, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_kp_u_operand_Y_2) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_AddressingModeDisasmFormat, __pyx_t_2) < (0)) __PYX_ERR(0, 329, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_AddressingModeDisasmFormat, __pyx_t_1) < 0) __PYX_ERR(0, 230, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "nespy/enum.py":249
+  /* "nespy/enum.py":348
  *     # any additional information to show when disassembling certain instructions
  *     # example: "STX $20 ;= FF", meaning X was stored in memory at 0x20, and the value of X was 0xFF
  *     **dict.fromkeys([0x85, 0x95, 0x8D, 0x9D,             # <<<<<<<<<<<<<<
  *                      0x99, 0x81, 0x91], "; = {a}"),  # STA
  *     **dict.fromkeys([0x86, 0x96, 0x8E], "; = {x}"),  # STX
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_133);
-  __Pyx_GIVEREF(__pyx_int_133);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_133);
-  __Pyx_INCREF(__pyx_int_149);
-  __Pyx_GIVEREF(__pyx_int_149);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_149);
-  __Pyx_INCREF(__pyx_int_141);
-  __Pyx_GIVEREF(__pyx_int_141);
-  PyList_SET_ITEM(__pyx_t_3, 2, __pyx_int_141);
-  __Pyx_INCREF(__pyx_int_157);
-  __Pyx_GIVEREF(__pyx_int_157);
-  PyList_SET_ITEM(__pyx_t_3, 3, __pyx_int_157);
-  __Pyx_INCREF(__pyx_int_153);
-  __Pyx_GIVEREF(__pyx_int_153);
-  PyList_SET_ITEM(__pyx_t_3, 4, __pyx_int_153);
-  __Pyx_INCREF(__pyx_int_129);
-  __Pyx_GIVEREF(__pyx_int_129);
-  PyList_SET_ITEM(__pyx_t_3, 5, __pyx_int_129);
-  __Pyx_INCREF(__pyx_int_145);
-  __Pyx_GIVEREF(__pyx_int_145);
-  PyList_SET_ITEM(__pyx_t_3, 6, __pyx_int_145);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_INCREF(__pyx_kp_u_a);
-  __Pyx_GIVEREF(__pyx_kp_u_a);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_kp_u_a);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[7] = {__pyx_mstate_global->__pyx_int_133, __pyx_mstate_global->__pyx_int_149, __pyx_mstate_global->__pyx_int_141, __pyx_mstate_global->__pyx_int_157, __pyx_mstate_global->__pyx_int_153, __pyx_mstate_global->__pyx_int_129, __pyx_mstate_global->__pyx_int_145};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_kp_u_a};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 249, __pyx_L1_error)
+    __PYX_ERR(0, 348, __pyx_L1_error)
   }
   if (likely(PyDict_CheckExact(__pyx_t_3))) {
-    __pyx_t_1 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API
+    if (__Pyx_IS_UNIQUELY_REFERENCED(__pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference)) {
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_t_3 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_2 = PyDict_Copy(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 348, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
   } else {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg((PyObject*)&PyDict_Type, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
 
-  /* "nespy/enum.py":251
+  /* "nespy/enum.py":350
  *     **dict.fromkeys([0x85, 0x95, 0x8D, 0x9D,
  *                      0x99, 0x81, 0x91], "; = {a}"),  # STA
  *     **dict.fromkeys([0x86, 0x96, 0x8E], "; = {x}"),  # STX             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x84, 0x94, 0x8C], "; = {y}"),  # STY
  *     **dict.fromkeys([0x24, 0x2C], "; = {value2}"),  # BIT
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyList_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 251, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_int_134);
-  __Pyx_GIVEREF(__pyx_int_134);
-  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_int_134);
-  __Pyx_INCREF(__pyx_int_150);
-  __Pyx_GIVEREF(__pyx_int_150);
-  PyList_SET_ITEM(__pyx_t_4, 1, __pyx_int_150);
-  __Pyx_INCREF(__pyx_int_142);
-  __Pyx_GIVEREF(__pyx_int_142);
-  PyList_SET_ITEM(__pyx_t_4, 2, __pyx_int_142);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
-  __Pyx_INCREF(__pyx_kp_u_x);
-  __Pyx_GIVEREF(__pyx_kp_u_x);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_kp_u_x);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 251, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_4 == Py_None)) {
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_134, __pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_int_142};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_x};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 251, __pyx_L1_error)
+    __PYX_ERR(0, 350, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_4) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_4);
-    __PYX_ERR(0, 251, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 350, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":252
+  /* "nespy/enum.py":351
  *                      0x99, 0x81, 0x91], "; = {a}"),  # STA
  *     **dict.fromkeys([0x86, 0x96, 0x8E], "; = {x}"),  # STX
  *     **dict.fromkeys([0x84, 0x94, 0x8C], "; = {y}"),  # STY             # <<<<<<<<<<<<<<
  *     **dict.fromkeys([0x24, 0x2C], "; = {value2}"),  # BIT
  * }
- */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyList_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_int_132);
-  __Pyx_GIVEREF(__pyx_int_132);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_int_132);
-  __Pyx_INCREF(__pyx_int_148);
-  __Pyx_GIVEREF(__pyx_int_148);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_int_148);
-  __Pyx_INCREF(__pyx_int_140);
-  __Pyx_GIVEREF(__pyx_int_140);
-  PyList_SET_ITEM(__pyx_t_2, 2, __pyx_int_140);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-  __Pyx_INCREF(__pyx_kp_u_y);
-  __Pyx_GIVEREF(__pyx_kp_u_y);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_kp_u_y);
-  __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(__pyx_t_2 == Py_None)) {
+*/
+  __pyx_t_5 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_5);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_132, __pyx_mstate_global->__pyx_int_148, __pyx_mstate_global->__pyx_int_140};
+    __pyx_t_4 = __Pyx_PyList_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_mstate_global->__pyx_kp_u_y};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
+  if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 252, __pyx_L1_error)
+    __PYX_ERR(0, 351, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_2) < 0)) {
-    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_2);
-    __PYX_ERR(0, 252, __pyx_L1_error)
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
+    __PYX_ERR(0, 351, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "nespy/enum.py":253
+  /* "nespy/enum.py":352
  *     **dict.fromkeys([0x86, 0x96, 0x8E], "; = {x}"),  # STX
  *     **dict.fromkeys([0x84, 0x94, 0x8C], "; = {y}"),  # STY
  *     **dict.fromkeys([0x24, 0x2C], "; = {value2}"),  # BIT             # <<<<<<<<<<<<<<
  * }
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyDict_Type)), __pyx_n_s_fromkeys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyList_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 253, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_int_36);
-  __Pyx_GIVEREF(__pyx_int_36);
-  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_36);
-  __Pyx_INCREF(__pyx_int_44);
-  __Pyx_GIVEREF(__pyx_int_44);
-  PyList_SET_ITEM(__pyx_t_3, 1, __pyx_int_44);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 253, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GIVEREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_INCREF(__pyx_kp_u_value2);
-  __Pyx_GIVEREF(__pyx_kp_u_value2);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_kp_u_value2);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 253, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+ * 
+*/
+  __pyx_t_4 = ((PyObject *)(&PyDict_Type));
+  __Pyx_INCREF(__pyx_t_4);
+  {
+    PyObject* __pyx_temp[2] = {__pyx_mstate_global->__pyx_int_36, __pyx_mstate_global->__pyx_int_44};
+    __pyx_t_5 = __Pyx_PyList_FromArray(__pyx_temp, 2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_8 = 0;
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_t_5, __pyx_mstate_global->__pyx_kp_u_value2};
+    __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fromkeys, __pyx_callargs+__pyx_t_8, (3-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+  }
   if (unlikely(__pyx_t_3 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "argument after ** must be a mapping, not NoneType");
-    __PYX_ERR(0, 253, __pyx_L1_error)
+    __PYX_ERR(0, 352, __pyx_L1_error)
   }
-  if (unlikely(PyDict_Update(__pyx_t_1, __pyx_t_3) < 0)) {
+  if (unlikely(PyDict_Update(__pyx_t_2, __pyx_t_3) < 0)) {
     if (PyErr_ExceptionMatches(PyExc_AttributeError)) __Pyx_RaiseMappingExpectedError(__pyx_t_3);
-    __PYX_ERR(0, 253, __pyx_L1_error)
+    __PYX_ERR(0, 352, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_InstructionDisasmExtras, __pyx_t_1) < 0) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_InstructionDisasmExtras, __pyx_t_2) < (0)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nespy/enum.py":358
+ * # RGB values of the 64 colors the NTSC PPU (2C02) can output, indexed by the values stored in palette RAM
+ * NTSCPalette = (
+ *     (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),             # <<<<<<<<<<<<<<
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_NTSCPalette, __pyx_mstate_global->__pyx_tuple[54]) < (0)) __PYX_ERR(0, 357, __pyx_L1_error)
 
   /* "nespy/enum.py":1
  * class ROMFormat:             # <<<<<<<<<<<<<<
  *     INES = 0
  *     INES2_0 = 1
- */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /*--- Wrapped vars code ---*/
 
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   if (__pyx_m) {
-    if (__pyx_d) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init nespy.enum", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
-    #if !CYTHON_COMPILING_IN_LIMITED_API
+    #if !CYTHON_USE_MODULE_STATE
     Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      __Pyx_PyErr_FetchException(&tp, &value, &tb);
+      __Pyx_State_RemoveModule(&__pyx_moduledef);
+      __Pyx_PyErr_RestoreException(tp, value, tb);
+    }
     #endif
   } else if (!PyErr_Occurred()) {
     PyErr_SetString(PyExc_ImportError, "init nespy.enum");
@@ -6721,298 +5145,745 @@ if (!__Pyx_RefNanny) {
   __Pyx_RefNannyFinishContext();
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   return (__pyx_m != NULL) ? 0 : -1;
-  #elif PY_MAJOR_VERSION >= 3
-  return __pyx_m;
   #else
-  return;
+  return __pyx_m;
   #endif
 }
-/* #### Code section: cleanup_globals ### */
-/* #### Code section: cleanup_module ### */
-/* #### Code section: main_method ### */
-/* #### Code section: utility_code_def ### */
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
 
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule(modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, "RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
 }
-#endif
+/* #### Code section: cached_constants ### */
 
-/* CalculateMetaclass */
-static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
-    Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
-    for (i=0; i < nbases; i++) {
-        PyTypeObject *tmptype;
-        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
-        tmptype = Py_TYPE(tmp);
-#if PY_MAJOR_VERSION < 3
-        if (tmptype == &PyClass_Type)
-            continue;
-#endif
-        if (!metaclass) {
-            metaclass = tmptype;
-            continue;
-        }
-        if (PyType_IsSubtype(metaclass, tmptype))
-            continue;
-        if (PyType_IsSubtype(tmptype, metaclass)) {
-            metaclass = tmptype;
-            continue;
-        }
-        PyErr_SetString(PyExc_TypeError,
-                        "metaclass conflict: "
-                        "the metaclass of a derived class "
-                        "must be a (non-strict) subclass "
-                        "of the metaclasses of all its bases");
-        return NULL;
-    }
-    if (!metaclass) {
-#if PY_MAJOR_VERSION < 3
-        metaclass = &PyClass_Type;
-#else
-        metaclass = &PyType_Type;
-#endif
-    }
-    Py_INCREF((PyObject*) metaclass);
-    return (PyObject*) metaclass;
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "nespy/enum.py":358
+ * # RGB values of the 64 colors the NTSC PPU (2C02) can output, indexed by the values stored in palette RAM
+ * NTSCPalette = (
+ *     (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),             # <<<<<<<<<<<<<<
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_84, __pyx_mstate_global->__pyx_int_84, __pyx_mstate_global->__pyx_int_84};
+    __pyx_mstate_global->__pyx_tuple[0] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_int_116};
+    __pyx_mstate_global->__pyx_tuple[1] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_16, __pyx_mstate_global->__pyx_int_144};
+    __pyx_mstate_global->__pyx_tuple[2] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_136};
+    __pyx_mstate_global->__pyx_tuple[3] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[3])) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[3]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[3]);
+
+  /* "nespy/enum.py":359
+ * NTSCPalette = (
+ *     (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),             # <<<<<<<<<<<<<<
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+ *     (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_68, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_100};
+    __pyx_mstate_global->__pyx_tuple[4] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[4])) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[4]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[4]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_92, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_48};
+    __pyx_mstate_global->__pyx_tuple[5] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[5])) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[5]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[5]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_84, __pyx_mstate_global->__pyx_int_4, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[6] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[6])) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[6]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[6]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_60, __pyx_mstate_global->__pyx_int_24, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[7] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[7])) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[7]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[7]);
+
+  /* "nespy/enum.py":360
+ *     (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),             # <<<<<<<<<<<<<<
+ *     (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_32, __pyx_mstate_global->__pyx_int_42, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[8] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[8])) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[8]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[8]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_58, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[9] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[9])) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[9]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[9]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_64, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[10] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[10])) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[10]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[10]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_60, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[11] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[11])) __PYX_ERR(0, 360, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[11]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[11]);
+
+  /* "nespy/enum.py":361
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+ *     (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),             # <<<<<<<<<<<<<<
+ *     (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),
+ *     (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_50, __pyx_mstate_global->__pyx_int_60};
+    __pyx_mstate_global->__pyx_tuple[12] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[12])) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[12]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[12]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[13] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[13])) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[13]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[13]);
+
+  /* "nespy/enum.py":362
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+ *     (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),             # <<<<<<<<<<<<<<
+ *     (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),
+ *     (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_int_150, __pyx_mstate_global->__pyx_int_152};
+    __pyx_mstate_global->__pyx_tuple[14] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[14])) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[14]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[14]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_196};
+    __pyx_mstate_global->__pyx_tuple[15] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[15])) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[15]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[15]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_48, __pyx_mstate_global->__pyx_int_50, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[16] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[16])) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[16]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[16]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_92, __pyx_mstate_global->__pyx_int_30, __pyx_mstate_global->__pyx_int_228};
+    __pyx_mstate_global->__pyx_tuple[17] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[17])) __PYX_ERR(0, 362, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[17]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[17]);
+
+  /* "nespy/enum.py":363
+ *     (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),
+ *     (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),             # <<<<<<<<<<<<<<
+ *     (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),
+ *     (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_int_20, __pyx_mstate_global->__pyx_int_176};
+    __pyx_mstate_global->__pyx_tuple[18] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[18])) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[18]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[18]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_20, __pyx_mstate_global->__pyx_int_100};
+    __pyx_mstate_global->__pyx_tuple[19] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[19])) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[19]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[19]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_int_34, __pyx_mstate_global->__pyx_int_32};
+    __pyx_mstate_global->__pyx_tuple[20] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[20])) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[20]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[20]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_int_60, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[21] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[21])) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[21]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[21]);
+
+  /* "nespy/enum.py":364
+ *     (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),
+ *     (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),
+ *     (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),             # <<<<<<<<<<<<<<
+ *     (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_84, __pyx_mstate_global->__pyx_int_90, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[22] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[22])) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[22]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[22]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_40, __pyx_mstate_global->__pyx_int_114, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[23] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[23])) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[23]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[23]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_8, __pyx_mstate_global->__pyx_int_124, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[24] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[24])) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[24]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[24]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_118, __pyx_mstate_global->__pyx_int_40};
+    __pyx_mstate_global->__pyx_tuple[25] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[25])) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[25]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[25]);
+
+  /* "nespy/enum.py":365
+ *     (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),
+ *     (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),
+ *     (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),             # <<<<<<<<<<<<<<
+ *     (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),
+ *     (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_102, __pyx_mstate_global->__pyx_int_120};
+    __pyx_mstate_global->__pyx_tuple[26] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[26])) __PYX_ERR(0, 365, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[26]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[26]);
+
+  /* "nespy/enum.py":366
+ *     (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),
+ *     (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),             # <<<<<<<<<<<<<<
+ *     (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),
+ *     (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_238, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[27] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[27])) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[27]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[27]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_154, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[28] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[28])) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[28]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[28]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_120, __pyx_mstate_global->__pyx_int_124, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[29] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[29])) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[29]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[29]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_176, __pyx_mstate_global->__pyx_int_98, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[30] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[30])) __PYX_ERR(0, 366, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[30]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[30]);
+
+  /* "nespy/enum.py":367
+ *     (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),
+ *     (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),             # <<<<<<<<<<<<<<
+ *     (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),
+ *     (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_int_84, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[31] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[31])) __PYX_ERR(0, 367, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[31]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[31]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_88, __pyx_mstate_global->__pyx_int_180};
+    __pyx_mstate_global->__pyx_tuple[32] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[32])) __PYX_ERR(0, 367, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[32]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[32]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_106, __pyx_mstate_global->__pyx_int_100};
+    __pyx_mstate_global->__pyx_tuple[33] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[33])) __PYX_ERR(0, 367, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[33]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[33]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_212, __pyx_mstate_global->__pyx_int_136, __pyx_mstate_global->__pyx_int_32};
+    __pyx_mstate_global->__pyx_tuple[34] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[34])) __PYX_ERR(0, 367, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[34]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[34]);
+
+  /* "nespy/enum.py":368
+ *     (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),
+ *     (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),
+ *     (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),             # <<<<<<<<<<<<<<
+ *     (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_170, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[35] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[35])) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[35]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[35]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_116, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_int_0};
+    __pyx_mstate_global->__pyx_tuple[36] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[36])) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[36]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[36]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_76, __pyx_mstate_global->__pyx_int_208, __pyx_mstate_global->__pyx_int_32};
+    __pyx_mstate_global->__pyx_tuple[37] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[37])) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[37]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[37]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_108};
+    __pyx_mstate_global->__pyx_tuple[38] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[38])) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[38]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[38]);
+
+  /* "nespy/enum.py":369
+ *     (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),
+ *     (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),
+ *     (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),             # <<<<<<<<<<<<<<
+ *     (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+ *     (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_56, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_204};
+    __pyx_mstate_global->__pyx_tuple[39] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[39])) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[39]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[39]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_60, __pyx_mstate_global->__pyx_int_60, __pyx_mstate_global->__pyx_int_60};
+    __pyx_mstate_global->__pyx_tuple[40] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[40])) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[40]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[40]);
+
+  /* "nespy/enum.py":370
+ *     (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),
+ *     (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),             # <<<<<<<<<<<<<<
+ *     (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+ *     (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[41] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[41])) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[41]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[41]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_int_188, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[42] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[42])) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[42]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[42]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_212, __pyx_mstate_global->__pyx_int_178, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[43] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[43])) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[43]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[43]);
+
+  /* "nespy/enum.py":371
+ *     (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),
+ *     (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+ *     (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),             # <<<<<<<<<<<<<<
+ *     (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
+ *     (160, 214, 228), (160, 162, 160), (0, 0, 0), (0, 0, 0),
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_174, __pyx_mstate_global->__pyx_int_236};
+    __pyx_mstate_global->__pyx_tuple[44] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[44])) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[44]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[44]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_174, __pyx_mstate_global->__pyx_int_212};
+    __pyx_mstate_global->__pyx_tuple[45] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[45])) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[45]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[45]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_236, __pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_176};
+    __pyx_mstate_global->__pyx_tuple[46] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[46])) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[46]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[46]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_228, __pyx_mstate_global->__pyx_int_196, __pyx_mstate_global->__pyx_int_144};
+    __pyx_mstate_global->__pyx_tuple[47] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[47])) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[47]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[47]);
+
+  /* "nespy/enum.py":372
+ *     (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+ *     (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+ *     (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),             # <<<<<<<<<<<<<<
+ *     (160, 214, 228), (160, 162, 160), (0, 0, 0), (0, 0, 0),
+ * )
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_204, __pyx_mstate_global->__pyx_int_210, __pyx_mstate_global->__pyx_int_120};
+    __pyx_mstate_global->__pyx_tuple[48] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[48])) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[48]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[48]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_180, __pyx_mstate_global->__pyx_int_222, __pyx_mstate_global->__pyx_int_120};
+    __pyx_mstate_global->__pyx_tuple[49] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[49])) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[49]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[49]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_168, __pyx_mstate_global->__pyx_int_226, __pyx_mstate_global->__pyx_int_144};
+    __pyx_mstate_global->__pyx_tuple[50] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[50])) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[50]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[50]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_152, __pyx_mstate_global->__pyx_int_226, __pyx_mstate_global->__pyx_int_180};
+    __pyx_mstate_global->__pyx_tuple[51] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[51])) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[51]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[51]);
+
+  /* "nespy/enum.py":373
+ *     (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+ *     (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
+ *     (160, 214, 228), (160, 162, 160), (0, 0, 0), (0, 0, 0),             # <<<<<<<<<<<<<<
+ * )
+*/
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_214, __pyx_mstate_global->__pyx_int_228};
+    __pyx_mstate_global->__pyx_tuple[52] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[52])) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[52]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[52]);
+  {
+    PyObject* __pyx_temp[3] = {__pyx_mstate_global->__pyx_int_160, __pyx_mstate_global->__pyx_int_162, __pyx_mstate_global->__pyx_int_160};
+    __pyx_mstate_global->__pyx_tuple[53] = __Pyx_PyTuple_FromArray(__pyx_temp, 3); if (unlikely(!__pyx_mstate_global->__pyx_tuple[53])) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[53]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[53]);
+
+  /* "nespy/enum.py":358
+ * # RGB values of the 64 colors the NTSC PPU (2C02) can output, indexed by the values stored in palette RAM
+ * NTSCPalette = (
+ *     (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),             # <<<<<<<<<<<<<<
+ *     (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+ *     (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+*/
+  {
+    PyObject* __pyx_temp[64] = {__pyx_mstate_global->__pyx_tuple[0], __pyx_mstate_global->__pyx_tuple[1], __pyx_mstate_global->__pyx_tuple[2], __pyx_mstate_global->__pyx_tuple[3], __pyx_mstate_global->__pyx_tuple[4], __pyx_mstate_global->__pyx_tuple[5], __pyx_mstate_global->__pyx_tuple[6], __pyx_mstate_global->__pyx_tuple[7], __pyx_mstate_global->__pyx_tuple[8], __pyx_mstate_global->__pyx_tuple[9], __pyx_mstate_global->__pyx_tuple[10], __pyx_mstate_global->__pyx_tuple[11], __pyx_mstate_global->__pyx_tuple[12], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[14], __pyx_mstate_global->__pyx_tuple[15], __pyx_mstate_global->__pyx_tuple[16], __pyx_mstate_global->__pyx_tuple[17], __pyx_mstate_global->__pyx_tuple[18], __pyx_mstate_global->__pyx_tuple[19], __pyx_mstate_global->__pyx_tuple[20], __pyx_mstate_global->__pyx_tuple[21], __pyx_mstate_global->__pyx_tuple[22], __pyx_mstate_global->__pyx_tuple[23], __pyx_mstate_global->__pyx_tuple[24], __pyx_mstate_global->__pyx_tuple[25], __pyx_mstate_global->__pyx_tuple[26], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[27], __pyx_mstate_global->__pyx_tuple[28], __pyx_mstate_global->__pyx_tuple[29], __pyx_mstate_global->__pyx_tuple[30], __pyx_mstate_global->__pyx_tuple[31], __pyx_mstate_global->__pyx_tuple[32], __pyx_mstate_global->__pyx_tuple[33], __pyx_mstate_global->__pyx_tuple[34], __pyx_mstate_global->__pyx_tuple[35], __pyx_mstate_global->__pyx_tuple[36], __pyx_mstate_global->__pyx_tuple[37], __pyx_mstate_global->__pyx_tuple[38], __pyx_mstate_global->__pyx_tuple[39], __pyx_mstate_global->__pyx_tuple[40], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[27], __pyx_mstate_global->__pyx_tuple[41], __pyx_mstate_global->__pyx_tuple[42], __pyx_mstate_global->__pyx_tuple[43], __pyx_mstate_global->__pyx_tuple[44], __pyx_mstate_global->__pyx_tuple[45], __pyx_mstate_global->__pyx_tuple[46], __pyx_mstate_global->__pyx_tuple[47], __pyx_mstate_global->__pyx_tuple[48], __pyx_mstate_global->__pyx_tuple[49], __pyx_mstate_global->__pyx_tuple[50], __pyx_mstate_global->__pyx_tuple[51], __pyx_mstate_global->__pyx_tuple[52], __pyx_mstate_global->__pyx_tuple[53], __pyx_mstate_global->__pyx_tuple[13], __pyx_mstate_global->__pyx_tuple[13]};
+    __pyx_mstate_global->__pyx_tuple[54] = __Pyx_PyTuple_FromArray(__pyx_temp, 64); if (unlikely(!__pyx_mstate_global->__pyx_tuple[54])) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[54]);
+  }
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[54]);
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_tuple;
+    for (Py_ssize_t i=0; i<55; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+      }
+      #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
+/* #### Code section: init_constants ### */
 
-/* PyErrExceptionMatches */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 8; } str_length_index[] = {{0},{106},{78},{63},{164},{11},{10},{12},{12},{23},{12},{14},{14},{7},{12},{7},{7},{1},{10},{10},{10},{10},{10},{10},{1},{3},{3},{3},{5},{8},{9},{9},{14},{26},{1},{3},{3},{3},{3},{3},{3},{3},{3},{3},{3},{6},{9},{3},{3},{3},{3},{3},{5},{3},{3},{3},{3},{3},{3},{4},{3},{11},{13},{10},{3},{4},{7},{3},{3},{9},{9},{8},{8},{9},{9},{28},{19},{23},{20},{22},{27},{3},{3},{3},{3},{3},{4},{3},{4},{4},{4},{6},{9},{3},{4},{11},{7},{7},{3},{3},{3},{3},{3},{7},{7},{7},{7},{11},{9},{9},{5},{3},{9},{3},{3},{3},{8},{3},{3},{3},{3},{6},{19},{19},{3},{5},{3},{3},{3},{3},{3},{3},{3},{3},{2},{5},{8},{8},{9},{9},{7},{8},{13},{10},{8},{11},{12},{8},{8},{18},{8},{9},{8},{8},{10},{8},{10},{8}};
+    #ifndef CYTHON_COMPRESS_STRINGS
+      #define CYTHON_COMPRESS_STRINGS 90
+    #endif
+    #if (CYTHON_COMPRESS_STRINGS) == 1 /* compression: zlib (855 bytes) */
+static const char cstring[] = "x\332mT[o\3336\024~\317\257 \260\002k\001\303\360\262=\014(\206\201\242\224D-u)E\247R_\\Zbl\242\022\351\222Tc/\310\177\337\221l\305NQ\201\302\371xx\370\221<\267+\004\0371\335\316h\251\275C~+<\252\205F[\32360\223\210\344\313\337\035\212\331\047\324*-Qk\036gH8\264V`m\036\320W-\335\3560W\332Kk\373\235\237\307\023\242`\356\346\312~\377z5\034ru<I{k\332VZ\264\356\2757\332\235\311\224\036\3173\266\201\325\001\325gc+w\306\216\327\223\335\231-\021;\207:\261\333\201\205\026\235\204u3\315\177\210\266\007\305\203\351u3P\2534*\020\313\022w\336\236\302\026/\326\255D\235\262\326X\2457HX+\364Fv\2033\346\210\303-\216\304\215t\265Uk\211\036\267\252\336\216\312q\253Cn+,0\310\316\330\303l\344\225\363\315\034\335e,\376\222\245\034\323\023\273C\213\375\365b\261@\217\312o\007\374\027`\001\227\003\370\367\205\232,\026\363\221\346\2677O\006^\002&\317\277B\263\362\002Wg\374\036\375\203\336<\215\317\277~~{\326\277\273\304\263\352\355%\323\273a\323\223\030\367N[G\274?\212\303\363\277b\355L\333{9\333\277\240\203\322\215\262\262\366\263\375\013:\374\047\255\331\211\r\330\275\240\003\306!\301i\210\013\212K\010\001>\021L\262\234@\205\233\306J\347 \020\211i\344\353Y\250\234p\335\215\261\235\360A@H@\212 \372\024\304<H\342 \215\202\234\006\354cpO\202\373\"\030S\213`\306Y\034\336F\204\022BCBcB\357I\222\223\024\356@\362\222\344U\030\2210*\303\250\n\023\022f\237\323(c7\331\222\255\n\302\242(\275a8\211V$[\246<b\347x\306)\211!\231\206\377z\265\210\3232N+(\217\302\364\266\226q\327\311F\t\017`\327\252Z\371\370\344\231I\226\023\250b\355\274\355k\257\214~\375RH\353\2135r\250\333\237TGWD{o\205\273PS\2517~\373\3324\321\220\230Z\325\257\2659\204\205X\343\\.\265h\375\341C\222\177(\030\r1\rK\032V4\272\341\264`IB\376\200\377\032\376?\223\261\252\222\251N\322,\037\274\230\362\202\344\242\225\336\313\014\0478\014\031\210\020s\2341\234\337\301\310s\212s\232\347\371rX\004A8\203\351r\260\001\221\340\342#\010&7\312A\327\000\010\236\317\350`Qp\314\227\005\213o\3578h\340\254c\344Y\306\030\217\031/\230l\205W?d\001y\020\301""\010\213(.\"\032\021\016\221\271\245\321)\206+\232}\216\330k\3252\317A\3051\014 \342e\301+\216K\216+^\224\274\304\243\002/\363\345\220\253\367\021\034G0\375\002\311<xm\222\345\004\252\325\2521\365\n\276N(=J\350\014u+\234\033\047\246\351[9\240\241e\014r\007\275\014:\306\000\277\367\242\235\324^:\277ZM\265U\017\275v\005|\020\342Z\256E\375\355\301\232\356\233<85%\230:%\330Tz\307>,u\337\331\223k\234\364\215|\020}\353\247R\374\037\316\273\023T";
+    PyObject *data = __Pyx_DecompressString(cstring, 855, 1);
+    #define __Pyx_DecompressString_LZSS_UNUSED
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #elif (CYTHON_COMPRESS_STRINGS) > 0 && (CYTHON_COMPRESS_STRINGS) <= 90 /* compression: lzss (1164 bytes) */
+static const char cstring[] = "\377\n    Com\377ponents \377that can\337 hold\013\000e \377CPU\047s IR\377Q line l\377ow, as b\375i+\000of `ne\377spy.inte\177rrupt.I\002\005\375L,\000s.irq`\374`\002c\004ntroll\377er butto\333nsC\007ink\002or\375d\033\000the co\276$\006repor\232\002e\375mD\007Maps m\367appL\000namez\274\000o\010\005valu\016\000\277found X\000i\377NES ROMs\372\203\007N0\000table\377 mirrori\377ng arranwgem\211!. T\203\000\376S\003describ\377e which \375n3\005s shar~?\000emory,\312\"\377e.g. HOR\177IZONTALW\004\377s 0x2000_ with\010\0014\t\000\351a\232\000\024\0008\014\010C00=.\221B#${o\327\000 \000Y}\000\007\n\007,X\001\010Y\"\007\277; = ${\372\0022k}(:\007)\000\t,Y\017\010w,X)1\001{a}\002\002\3644\004\016\002x\r\003y}?a\377bsolute,\375x\001\006yindir\337ect,x\001\006yz?eropag%\000\001\006\377yAADCAND_ASLAX\200@AD\004\372\000\005X\t\005YAddr\367ess\206@Mode\376\000\013DisasmF\377ormatBBC\377CBCSBEQB\377ITBMIBNE\377BPLBRKBV\337CBVSB\326bCA\377RTRIDGEC\377LCCLDCLI\377CLVCMPCN\376\204`CPXCPYD\377ECDEXDEY\377DMCDOWNE\377ORFOUR_S\377CREENFRA\377ME_COUNT{ER\306GINCI\312`\376\000\0012_0INXI\377NYIRQSou\377rceImmed\367iat\006\000plic\247itI\235$\000\005X\t\005Y\377Instructwion\352\013Map\021\010\237Cycle\005\013\205#E\337xtras;\010Le\357ngth0\013Mne_monicF\013P\236@\377CrossPen\377altyJMPJ\377SRLDALDX\377LDYLEFTL\277SRMMC1\001\0002\326\005\0003M\341\205\002M\240\205\005NO\375P\302!NTSCPa\377letteOAM\357ADDR\004\000DAT\277AORAPH\000\000P\377PLAPLPPP\271U\031\001\004\000CTR\014\000U\274 \001\022\000MASK\031\000R\177egister$\000\366\367 OL\036\001STAT\377USRIGHTR\337OLROM\364CRO\377RRTIRTSR\377elativeS\376\205`ECSEDSE\377ISELECTS\337INGLE\275D_L\357OWER\005\013UPP\346\020\000TA`\000F\000TXS\377TYTAXTAY\277TSXTXA\014\002A\267UPU\250\204\001VEl\000C?ALZero\262!\000\005\375X\t\005Y__doc\377____main\376\003\002etaclas}s\020\002odule\033\001\374\235\210\001#\001prepar\336\016\002qual\017\005te\257st__\336\205\005c\350\211\001_\374M\000\340@ceback\377fromkeys\215i\331eim\333c\375\205\005\202\212""\003e\357numr\224$set\177default\215\206\005";
+    PyObject *data = __Pyx_DecompressString_LZSS(cstring, 1164, 1518);
+    #define __Pyx_DecompressString_UNUSED
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #else /* compression: none (1518 bytes) */
+static const char bytes[] = "\n    Components that can hold the CPU\047s IRQ line low, as bits of `nespy.interrupt.InterruptLines.irq`\n    \n    Controller buttons, as bits in the order the controller reports them\n    \n    Maps mapper names to mapper values found in iNES ROMs\n    \n    Nametable mirroring arrangements. The names describe which nametables share memory,\n    e.g. HORIZONTAL mirrors 0x2000 with 0x2400 and 0x2800 with 0x2C00.\n    #${operand}${operand}${operand},X${operand},Y${operand}; = ${value2}(${operand})(${operand}),Y(${operand},X); = {a}; = {value2}; = {x}; = {y}?absolute,xabsolute,yindirect,xindirect,yzeropage,xzeropage,yAADCANDASLAXROMAbsoluteAbsoluteXAbsoluteYAddressingModeAddressingModeDisasmFormatBBCCBCSBEQBITBMIBNEBPLBRKBVCBVSButtonCARTRIDGECLCCLDCLICLVCMPCNROMCPXCPYDECDEXDEYDMCDOWNEORFOUR_SCREENFRAME_COUNTERHORIZONTALINCINESINES2_0INXINYIRQSourceImmediateImplicitIndirectIndirectXIndirectYInstructionAddressingModeMapInstructionCycleMapInstructionDisasmExtrasInstructionLengthMapInstructionMnemonicMapInstructionPageCrossPenaltyJMPJSRLDALDXLDYLEFTLSRMMC1MMC2MMC3MapperMirroringNOPNROMNTSCPaletteOAMADDROAMDATAORAPHAPHPPLAPLPPPUADDRPPUCTRLPPUDATAPPUMASKPPURegisterPPUSCROLLPPUSTATUSRIGHTROLROMFormatRORRTIRTSRelativeSBCSECSEDSEISELECTSINGLE_SCREEN_LOWERSINGLE_SCREEN_UPPERSTASTARTSTXSTYTAXTAYTSXTXATXSTYAUPUXROMVERTICALZeroPageZeroPageXZeroPageY__doc____main____metaclass____module____name____prepare____qualname____test__absolutecline_in_tracebackfromkeysimmediateimplicitindirectnespy.enumrelativesetdefaultzeropage";
+    PyObject *data = NULL;
+    #define __Pyx_DecompressString_UNUSED
+    #define __Pyx_DecompressString_LZSS_UNUSED
+    #endif
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 158; i++) {
+      Py_ssize_t bytes_length = str_length_index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 24) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
     }
-#endif
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 158; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
     }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    PyObject *exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-    if (unlikely(PyTuple_Check(err)))
-        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+  }
+  {
+    PyObject **numbertab = __pyx_mstate->__pyx_number_tab + 0;
+    int8_t const cint_constants_1[] = {0,1,2,3,4,5,6,7,8,9,10,13,14,16,17,20,21,22,24,25,26,29,30,32,33,34,36,37,38,40,41,42,44,45,46,48,49,50,53,54,56,57,58,60,61,62,64,65,68,69,70,72,73,74,76,77,78,80,81,84,85,86,88,89,90,92,93,94,96,97,98,100,101,102,104,105,106,108,109,110,112,113,114,116,117,118,120,121,122,124,125,126};
+    int16_t const cint_constants_2[] = {128,129,130,132,133,134,136,137,138,140,141,142,144,145,148,149,150,152,153,154,157,160,161,162,164,165,166,168,169,170,172,173,174,176,177,178,180,181,182,184,185,186,188,189,190,192,193,194,196,197,198,200,201,202,204,205,206,208,209,210,212,213,214,216,217,218,221,222,224,225,226,228,229,230,232,233,234,236,237,238,240,241,245,246,248,249,250,253,254,8192,8193,8194,8195,8196,8197,8198,8199};
+    for (int i = 0; i < 189; i++) {
+      numbertab[i] = PyLong_FromLong((i < 92 ? cint_constants_1[i - 0] : cint_constants_2[i - 92]));
+      if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_number_tab;
+    for (Py_ssize_t i=0; i<189; ++i) {
+      #if PY_VERSION_HEX >= 0x030F0000
+      PyUnstable_SetImmortal(table[i]);
+      #elif CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      if ((PY_SSIZE_T_MAX <= _Py_IMMORTAL_REFCNT_LOCAL)) break;
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], ((Py_ssize_t)_Py_IMMORTAL_REFCNT_LOCAL + 1));
+      }
+      #else
+      if ((PY_SSIZE_T_MAX < _Py_IMMORTAL_INITIAL_REFCNT)) break;
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  return 0;
+  __pyx_L1_error:;
+  return -1;
 }
-#endif
+/* #### Code section: init_codeobjects ### */
 
-/* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0 && __Pyx_init_tpflags_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* PyFrozenDict.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *builtins = PyEval_GetBuiltins(); // borrowed
+      if (likely(builtins)) {
+          PyObject *type_name = PyUnicode_FromStringAndSize("frozendict", sizeof("frozendict")-1);
+          if (likely(type_name)) {
+              PyObject *frozendict_type = PyObject_GetItem(builtins, type_name);
+              Py_DECREF(type_name);
+              if (!frozendict_type && PyErr_ExceptionMatches(PyExc_KeyError)) {
+                  PyErr_Clear();
+                  frozendict_type = (PyObject*) &PyDict_Type;
+                  Py_INCREF(frozendict_type);
+              }
+              __pyx_mstate_global->__Pyx_PyFrozenDictType = frozendict_type;
+          }
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
 }
-#endif
+/* #### Code section: init_after_shared_utility ### */
 
-/* PyObjectGetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
+static int __Pyx_InitAfterSharedUtility(void) {
+  return 0;
 }
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
 #endif
 
-/* PyObjectGetAttrStrNoError */
-static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
 }
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
-    }
 #endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
-    }
-    return result;
-}
 
-/* GetBuiltinName */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_b, name);
-    if (unlikely(!result) && !PyErr_Occurred()) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
+/* CalculateMetaclass (used by Py3ClassCreate) */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+    Py_ssize_t i, nbases;
+#if CYTHON_ASSUME_SAFE_SIZE
+    nbases = PyTuple_GET_SIZE(bases);
 #else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
+    nbases = PyTuple_Size(bases);
+    if (nbases < 0) return NULL;
 #endif
-    }
-    return result;
-}
-
-/* PyFunctionFastCall */
-#if CYTHON_FAST_PYCALL && !CYTHON_VECTORCALL
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object"))) {
-        return NULL;
-    }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
+    for (i=0; i < nbases; i++) {
+        PyTypeObject *tmptype;
+#if CYTHON_ASSUME_SAFE_MACROS
+        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
+#else
+        PyObject *tmp = PyTuple_GetItem(bases, i);
+        if (!tmp) return NULL;
 #endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
-        }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
-        }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
+        tmptype = Py_TYPE(tmp);
+        if (!metaclass) {
+            metaclass = tmptype;
+            continue;
         }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
+        if (PyType_IsSubtype(metaclass, tmptype))
+            continue;
+        if (PyType_IsSubtype(tmptype, metaclass)) {
+            metaclass = tmptype;
+            continue;
         }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
+        PyErr_SetString(PyExc_TypeError,
+                        "metaclass conflict: "
+                        "the metaclass of a derived class "
+                        "must be a (non-strict) subclass "
+                        "of the metaclasses of all its bases");
+        return NULL;
     }
-    else {
-        d = NULL;
-        nd = 0;
+    if (!metaclass) {
+        metaclass = &PyType_Type;
     }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
+    Py_INCREF((PyObject*) metaclass);
+    return (PyObject*) metaclass;
 }
-#endif
 
-/* PyObjectCall */
+/* PyObjectCall (used by PyObjectFastCall) */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
     ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
         return NULL;
     result = (*call)(func, arg, kw);
     Py_LeaveRecursiveCall();
@@ -7025,14 +5896,14 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 }
 #endif
 
-/* PyObjectCallMethO */
+/* PyObjectCallMethO (used by PyObjectFastCall) */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
     PyObject *self, *result;
     PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
         return NULL;
     result = cfunc(self, arg);
     Py_LeaveRecursiveCall();
@@ -7045,98 +5916,324 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 }
 #endif
 
-/* PyObjectFastCall */
-static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
-    PyObject *argstuple;
+/* PyObjectFastCall (used by PyObjectCall2Args) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !(CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY)
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+            return PyObject_Vectorcall(func, args, nargsf, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, nargsf, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #elif CYTHON_COMPILING_IN_PYPY
+    return PyObject_VectorcallDict(func, args, (size_t) nargs, kwargs);
+    #else
+    return PyObject_VectorcallDict(func, args, nargsf, kwargs);
+    #endif
+}
+
+/* PyObjectCall2Args (used by Py3ClassCreate) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args[3] = {NULL, arg1, arg2};
+    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* FastTypeChecks (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#endif
+
+/* PyErrFetchRestore (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* GivenExceptionMatches (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by Py3ClassCreate) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
     PyObject *result;
-    size_t i;
-    argstuple = PyTuple_New((Py_ssize_t)nargs);
-    if (unlikely(!argstuple)) return NULL;
-    for (i = 0; i < nargs; i++) {
-        Py_INCREF(args[i]);
-        PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]);
-    }
-    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
-    Py_DECREF(argstuple);
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
     return result;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
-    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (nargs == 0 && kwargs == NULL) {
-#ifdef __Pyx_CyFunction_USED
-        if (__Pyx_IsCyOrPyCFunction(func))
 #else
-        if (PyCFunction_Check(func))
-#endif
-        {
-            if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-                return __Pyx_PyObject_CallMethO(func, NULL);
-            }
-        }
-    }
-    else if (nargs == 1 && kwargs == NULL) {
-        if (PyCFunction_Check(func))
-        {
-            if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-                return __Pyx_PyObject_CallMethO(func, args[0]);
-            }
-        }
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
     }
 #endif
-    #if PY_VERSION_HEX < 0x030800B1
-    #if CYTHON_FAST_PYCCALL
-    if (PyCFunction_Check(func)) {
-        if (kwargs) {
-            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
-        } else {
-            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
-        }
-    }
-    #if PY_VERSION_HEX >= 0x030700A1
-    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
-        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
-    }
-    #endif
-    #endif
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
-    }
-    #endif
-    #endif
-    #if CYTHON_VECTORCALL
-    vectorcallfunc f = _PyVectorcall_Function(func);
-    if (f) {
-        return f(func, args, (size_t)nargs, kwargs);
-    }
-    #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
-    if (__Pyx_CyFunction_CheckExact(func)) {
-        __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
-        if (f) return f(func, args, (size_t)nargs, kwargs);
-    }
-    #endif
-    if (nargs == 0) {
-        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
     }
-    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
-}
-
-/* PyObjectCall2Args */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args[3] = {NULL, arg1, arg2};
-    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+    return result;
+#endif
 }
 
-/* PyObjectLookupSpecial */
+/* PyObjectLookupSpecial (used by Py3ClassCreate) */
 #if CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
 static CYTHON_INLINE PyObject* __Pyx__PyObject_LookupSpecial(PyObject* obj, PyObject* attr_name, int with_error) {
     PyObject *res;
     PyTypeObject *tp = Py_TYPE(obj);
-#if PY_MAJOR_VERSION < 3
-    if (unlikely(PyInstance_Check(obj)))
-        return with_error ? __Pyx_PyObject_GetAttrStr(obj, attr_name) : __Pyx_PyObject_GetAttrStrNoError(obj, attr_name);
-#endif
     res = _PyType_Lookup(tp, attr_name);
     if (likely(res)) {
         descrgetfunc f = Py_TYPE(res)->tp_descr_get;
@@ -7157,7 +6254,7 @@ static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases,
                                            PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
     PyObject *ns;
     if (metaclass) {
-        PyObject *prep = __Pyx_PyObject_GetAttrStrNoError(metaclass, __pyx_n_s_prepare);
+        PyObject *prep = __Pyx_PyObject_GetAttrStrNoError(metaclass, __pyx_mstate_global->__pyx_n_u_prepare);
         if (prep) {
             PyObject *pargs[3] = {NULL, name, bases};
             ns = __Pyx_PyObject_FastCallDict(prep, pargs+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, mkw);
@@ -7172,148 +6269,14 @@ static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases,
     }
     if (unlikely(!ns))
         return NULL;
-    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_module, modname) < 0)) goto bad;
-#if PY_VERSION_HEX >= 0x03030000
-    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_qualname, qualname) < 0)) goto bad;
-#else
-    CYTHON_MAYBE_UNUSED_VAR(qualname);
-#endif
-    if (unlikely(doc && PyObject_SetItem(ns, __pyx_n_s_doc, doc) < 0)) goto bad;
+    if (unlikely(PyObject_SetItem(ns, __pyx_mstate_global->__pyx_n_u_module, modname) < 0)) goto bad;
+    if (unlikely(PyObject_SetItem(ns, __pyx_mstate_global->__pyx_n_u_qualname, qualname) < 0)) goto bad;
+    if (unlikely(doc && PyObject_SetItem(ns, __pyx_mstate_global->__pyx_n_u_doc, doc) < 0)) goto bad;
     return ns;
 bad:
     Py_DECREF(ns);
     return NULL;
 }
-#if PY_VERSION_HEX < 0x030600A4 && CYTHON_PEP487_INIT_SUBCLASS
-static int __Pyx_SetNamesPEP487(PyObject *type_obj) {
-    PyTypeObject *type = (PyTypeObject*) type_obj;
-    PyObject *names_to_set, *key, *value, *set_name, *tmp;
-    Py_ssize_t i = 0;
-#if CYTHON_USE_TYPE_SLOTS
-    names_to_set = PyDict_Copy(type->tp_dict);
-#else
-    {
-        PyObject *d = PyObject_GetAttr(type_obj, __pyx_n_s_dict);
-        names_to_set = NULL;
-        if (likely(d)) {
-            PyObject *names_to_set = PyDict_New();
-            int ret = likely(names_to_set) ? PyDict_Update(names_to_set, d) : -1;
-            Py_DECREF(d);
-            if (unlikely(ret < 0))
-                Py_CLEAR(names_to_set);
-        }
-    }
-#endif
-    if (unlikely(names_to_set == NULL))
-        goto bad;
-    while (PyDict_Next(names_to_set, &i, &key, &value)) {
-        set_name = __Pyx_PyObject_LookupSpecialNoError(value, __pyx_n_s_set_name);
-        if (unlikely(set_name != NULL)) {
-            tmp = __Pyx_PyObject_Call2Args(set_name, type_obj, key);
-            Py_DECREF(set_name);
-            if (unlikely(tmp == NULL)) {
-                __Pyx_TypeName value_type_name =
-                    __Pyx_PyType_GetName(Py_TYPE(value));
-                __Pyx_TypeName type_name = __Pyx_PyType_GetName(type);
-                PyErr_Format(PyExc_RuntimeError,
-#if PY_MAJOR_VERSION >= 3
-                    "Error calling __set_name__ on '" __Pyx_FMT_TYPENAME "' instance %R " "in '" __Pyx_FMT_TYPENAME "'",
-                    value_type_name, key, type_name);
-#else
-                    "Error calling __set_name__ on '" __Pyx_FMT_TYPENAME "' instance %.100s in '" __Pyx_FMT_TYPENAME "'",
-                    value_type_name,
-                    PyString_Check(key) ? PyString_AS_STRING(key) : "?",
-                    type_name);
-#endif
-                goto bad;
-            } else {
-                Py_DECREF(tmp);
-            }
-        }
-        else if (unlikely(PyErr_Occurred())) {
-            goto bad;
-        }
-    }
-    Py_DECREF(names_to_set);
-    return 0;
-bad:
-    Py_XDECREF(names_to_set);
-    return -1;
-}
-static PyObject *__Pyx_InitSubclassPEP487(PyObject *type_obj, PyObject *mkw) {
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    PyTypeObject *type = (PyTypeObject*) type_obj;
-    PyObject *mro = type->tp_mro;
-    Py_ssize_t i, nbases;
-    if (unlikely(!mro)) goto done;
-    (void) &__Pyx_GetBuiltinName;
-    Py_INCREF(mro);
-    nbases = PyTuple_GET_SIZE(mro);
-    assert(PyTuple_GET_ITEM(mro, 0) == type_obj);
-    for (i = 1; i < nbases-1; i++) {
-        PyObject *base, *dict, *meth;
-        base = PyTuple_GET_ITEM(mro, i);
-        dict = ((PyTypeObject *)base)->tp_dict;
-        meth = __Pyx_PyDict_GetItemStrWithError(dict, __pyx_n_s_init_subclass);
-        if (unlikely(meth)) {
-            descrgetfunc f = Py_TYPE(meth)->tp_descr_get;
-            PyObject *res;
-            Py_INCREF(meth);
-            if (likely(f)) {
-                res = f(meth, NULL, type_obj);
-                Py_DECREF(meth);
-                if (unlikely(!res)) goto bad;
-                meth = res;
-            }
-            res = __Pyx_PyObject_FastCallDict(meth, NULL, 0, mkw);
-            Py_DECREF(meth);
-            if (unlikely(!res)) goto bad;
-            Py_DECREF(res);
-            goto done;
-        } else if (unlikely(PyErr_Occurred())) {
-            goto bad;
-        }
-    }
-done:
-    Py_XDECREF(mro);
-    return type_obj;
-bad:
-    Py_XDECREF(mro);
-    Py_DECREF(type_obj);
-    return NULL;
-#else
-    PyObject *super_type, *super, *func, *res;
-#if CYTHON_COMPILING_IN_PYPY && !defined(PySuper_Type)
-    super_type = __Pyx_GetBuiltinName(__pyx_n_s_super);
-#else
-    super_type = (PyObject*) &PySuper_Type;
-    (void) &__Pyx_GetBuiltinName;
-#endif
-    super = likely(super_type) ? __Pyx_PyObject_Call2Args(super_type, type_obj, type_obj) : NULL;
-#if CYTHON_COMPILING_IN_PYPY && !defined(PySuper_Type)
-    Py_XDECREF(super_type);
-#endif
-    if (unlikely(!super)) {
-        Py_CLEAR(type_obj);
-        goto done;
-    }
-    func = __Pyx_PyObject_GetAttrStrNoError(super, __pyx_n_s_init_subclass);
-    Py_DECREF(super);
-    if (likely(!func)) {
-        if (unlikely(PyErr_Occurred()))
-            Py_CLEAR(type_obj);
-        goto done;
-    }
-    res = __Pyx_PyObject_FastCallDict(func, NULL, 0, mkw);
-    Py_DECREF(func);
-    if (unlikely(!res))
-        Py_CLEAR(type_obj);
-    Py_XDECREF(res);
-done:
-    return type_obj;
-#endif
-}
-#endif
 static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases,
                                       PyObject *dict, PyObject *mkw,
                                       int calculate_metaclass, int allow_py2_metaclass) {
@@ -7321,7 +6284,7 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
     PyObject *owned_metaclass = NULL;
     PyObject *margs[4] = {NULL, name, bases, dict};
     if (allow_py2_metaclass) {
-        owned_metaclass = PyObject_GetItem(dict, __pyx_n_s_metaclass);
+        owned_metaclass = PyObject_GetItem(dict, __pyx_mstate_global->__pyx_n_u_metaclass);
         if (owned_metaclass) {
             metaclass = owned_metaclass;
         } else if (likely(PyErr_ExceptionMatches(PyExc_KeyError))) {
@@ -7337,29 +6300,63 @@ static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObj
             return NULL;
         owned_metaclass = metaclass;
     }
-    result = __Pyx_PyObject_FastCallDict(metaclass, margs+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET,
-#if PY_VERSION_HEX < 0x030600A4
-        (metaclass == (PyObject*)&PyType_Type) ? NULL : mkw
-#else
-        mkw
-#endif
-    );
+    result = __Pyx_PyObject_FastCallDict(metaclass, margs+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, mkw);
     Py_XDECREF(owned_metaclass);
-#if PY_VERSION_HEX < 0x030600A4 && CYTHON_PEP487_INIT_SUBCLASS
-    if (likely(result) && likely(PyType_Check(result))) {
-        if (unlikely(__Pyx_SetNamesPEP487(result) < 0)) {
-            Py_CLEAR(result);
-        } else {
-            result = __Pyx_InitSubclassPEP487(result, mkw);
-        }
+    return result;
+}
+
+/* CopyObjectArray (used by TupleOrListFromArrayImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
     }
-#else
-    (void) &__Pyx_GetBuiltinName;
+}
 #endif
+
+/* TupleOrListFromArrayImpl (used by ListFromArray) */
+CYTHON_UNUSED static PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n) {
+    PyObject *res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyList_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+
+/* IgnoreException (used by GetModuleGlobalName) */
+static CYTHON_INLINE int __Pyx_IgnoreGivenException(PyObject *given_exception, PyObject *ignorable_exception) {
+    if (PyErr_GivenExceptionMatches(given_exception ? given_exception : PyErr_Occurred(), ignorable_exception)) {
+        PyErr_Clear();
+        return 1;
+    }
+    return 0;
+}
+
+/* GetBuiltinName (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
     return result;
 }
 
-/* PyDictVersioning */
+/* PyDictVersioning (used by GetModuleGlobalName) */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
 static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
     PyObject *dict = Py_TYPE(obj)->tp_dict;
@@ -7393,99 +6390,217 @@ static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
 #endif
 {
     PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#elif CYTHON_COMPILING_IN_LIMITED_API
+#if CYTHON_COMPILING_IN_LIMITED_API
     if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
         return NULL;
     }
     result = PyObject_GetAttr(__pyx_m, name);
     if (likely(result)) {
         return result;
     }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (!__Pyx_IgnoreException(PyExc_Exception)) {
+        return NULL; // BaseException
+    }
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) {
+        if (!__Pyx_IgnoreException(PyExc_Exception)) {
+            return NULL; // BaseException
+        }
+    }
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
-        return __Pyx_NewRef(result);
+        return result;
     }
-#endif
 #else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
         return __Pyx_NewRef(result);
     }
-    PyErr_Clear();
+    PyObject *exc = PyErr_Occurred();
+    if (unlikely(exc) && !__Pyx_IgnoreGivenException(exc, PyExc_Exception)) {
+        return NULL; // BaseException
+    }
 #endif
     return __Pyx_GetBuiltinName(name);
 }
 
+/* PyObjectFastCallMethod */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
+    PyObject *result;
+    switch (__Pyx_PyVectorcall_NARGS(nargsf)) {
+        case 1:
+            return PyObject_CallMethodObjArgs(args[0], name, NULL);
+        case 2:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], NULL);
+        case 3:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], NULL);
+        case 4:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], args[3], NULL);
+        case 5:
+            return PyObject_CallMethodObjArgs(args[0], name, args[1], args[2], args[3], args[4], NULL);
+    }
+    PyObject *attr = PyObject_GetAttr(args[0], name);
+    if (unlikely(!attr))
+        return NULL;
+    result = __Pyx_PyObject_FastCall(attr, args+1, nargsf - 1);
+    Py_DECREF(attr);
+    return result;
+}
+#endif
+
+/* PyFrozenDict */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE PyObject* __Pyx__PyFrozenDict_New(PyObject* frozendict_type, PyObject* it) {
+    return PyObject_CallFunctionObjArgs(frozendict_type, it, NULL);
+}
+#endif
+
 /* PyObjectCallOneArg */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
     PyObject *args[2] = {NULL, arg};
     return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
+/* FormatTypeName (used by RaiseErrorWithObjectType) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+    }
+    goto done;
+}
+#endif
+
+/* RaiseErrorWithObjectType (used by RaiseMappingExpected) */
+static void __Pyx_RaiseErrorWithType(PyObject* exc_type, const char* message, PyTypeObject *type_obj) {
+    __Pyx_TypeName type_name = __Pyx_PyType_GetFullyQualifiedName(type_obj);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!type_name)) return;
+    #endif
+    PyErr_Format(exc_type, message, type_name);
+    __Pyx_DECREF_TypeName(type_name);
+}
+
 /* RaiseMappingExpected */
 static void __Pyx_RaiseMappingExpectedError(PyObject* arg) {
-    __Pyx_TypeName arg_type_name = __Pyx_PyType_GetName(Py_TYPE(arg));
-    PyErr_Format(PyExc_TypeError,
-        "'" __Pyx_FMT_TYPENAME "' object is not a mapping", arg_type_name);
-    __Pyx_DECREF_TypeName(arg_type_name);
+    __Pyx_RaiseTypeErrorWithObjectType(
+        "'" __Pyx_FMT_TYPENAME "' object is not a mapping", arg);
 }
 
-/* CLineInTraceback */
-#ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int c_line) {
-    PyObject *use_cline;
-    PyObject *ptype, *pvalue, *ptraceback;
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject **cython_runtime_dict;
+/* TupleOrListFromArrayImpl (used by TupleFromArray) */
+#if !(PY_VERSION_HEX >= 0x030F0000 && !CYTHON_COMPILING_IN_LIMITED_API)
+CYTHON_UNUSED static PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n) {
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    PyObject *res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    #else
+    Py_ssize_t i;
+    for (i = 0; i < n; i++) {
+        Py_INCREF(src[i]);
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+    }
+    #endif
+    return res;
+}
+#endif
+
+/* dict_setdefault (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
 #endif
-    if (unlikely(!__pyx_cython_runtime)) {
+    return value;
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
         return c_line;
     }
     __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
-#if CYTHON_COMPILING_IN_CPYTHON
-    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
     if (likely(cython_runtime_dict)) {
         __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
-            use_cline, *cython_runtime_dict,
-            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
-    } else
-#endif
-    {
-      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStrNoError(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
-      if (use_cline_obj) {
-        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
-        Py_DECREF(use_cline_obj);
-      } else {
-        PyErr_Clear();
-        use_cline = NULL;
-      }
-    }
-    if (!use_cline) {
-        c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
     }
-    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
     }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
     __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
     return c_line;
 }
 #endif
 
-/* CodeObjectCache */
-#if !CYTHON_COMPILING_IN_LIMITED_API
+/* CodeObjectCache (used by AddTraceback) */
 static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
@@ -7507,129 +6622,197 @@ static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int co
         return mid + 1;
     }
 }
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
     int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
         return NULL;
     }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
         return NULL;
     }
-    code_object = __pyx_code_cache.entries[pos].code_object;
+    code_object = code_cache->entries[pos].code_object;
     Py_INCREF(code_object);
     return code_object;
 }
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
     int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
     if (unlikely(!code_line)) {
         return;
     }
     if (unlikely(!entries)) {
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
         if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
             entries[0].code_line = code_line;
             entries[0].code_object = code_object;
             Py_INCREF(code_object);
         }
         return;
     }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
         entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
         Py_DECREF(tmp);
         return;
     }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
     }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
+    for (i=code_cache->count; i>pos; i--) {
         entries[i] = entries[i-1];
     }
     entries[pos].code_line = code_line;
     entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
+    code_cache->count++;
     Py_INCREF(code_object);
 }
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
 #endif
+#endif
+}
 
 /* AddTraceback */
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 #if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    return NULL;
+}
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
     if (c_line) {
-        (void) __pyx_cfilenm;
         c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
     }
-    _PyTraceback_Add(funcname, filename, c_line ? -c_line : py_line);
+    __Pyx_PyErr_FetchException(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    __Pyx_PyErr_RestoreException(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
 }
 #else
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
-    if (!py_srcfile) goto bad;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
     }
-    if (!py_funcname) goto bad;
-    py_code = __Pyx_PyCode_New(
-        0,
-        0,
-        0,
-        0,
-        0,
-        0,
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
     return NULL;
 }
@@ -7638,20 +6821,30 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
         tstate,            /*PyThreadState *tstate,*/
         py_code,           /*PyCodeObject *code,*/
-        __pyx_d,    /*PyObject *globals,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
         0                  /*PyObject *locals*/
     );
     if (!py_frame) goto bad;
@@ -7663,23 +6856,56 @@ bad:
 }
 #endif
 
-/* FormatTypeName */
-#if CYTHON_COMPILING_IN_LIMITED_API
-static __Pyx_TypeName
-__Pyx_PyType_GetName(PyTypeObject* tp)
-{
-    PyObject *name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
-                                               __pyx_n_s_name);
-    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
-        PyErr_Clear();
-        Py_XSETREF(name, __Pyx_NewRef(__pyx_n_s__2));
+/* PyObjectVectorcallKwds (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i) {
+    PyObject *key = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!key)) return -1;
+#endif
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#else
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n) {
+    PyObject *out = PyDict_New();
+    if (unlikely(!out)) return NULL;
+    for (Py_ssize_t i=0; i<n; ++i) {
+        if (unlikely(PyDict_SetItem(out, keys[i], values[i]) < 0)) {
+            Py_DECREF(out);
+            return NULL;
+        }
+    }
+    return out;
+}
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i) {
+    PyObject *key = kwnames[i];
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
     }
-    return name;
+    return 0;
+}
+#endif
+
+/* PyObjectVectorcallMethodKwds (used by CIntToPy) */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    PyObject *result;
+    PyObject *obj = PyObject_GetAttr(args[0], name);
+    if (unlikely(!obj))
+        return NULL;
+    result = __Pyx_Object_VectorcallKwds(obj, args+1, nargsf-1, kwnames);
+    Py_DECREF(obj);
+    return result;
 }
 #endif
 
 /* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
@@ -7691,32 +6917,73 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
+            return PyLong_FromLong((long) value);
         } else if (sizeof(long) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
+#if !CYTHON_COMPILING_IN_PYPY
         } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
         }
     } else {
         if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
+            return PyLong_FromLong((long) value);
         } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
         }
     }
     {
-        int one = 1; int little = (int)*(unsigned char *)&one;
         unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
         return _PyLong_FromByteArray(bytes, sizeof(long),
                                      little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
     }
 }
 
-/* CIntFromPyVerify */
+/* CIntFromPyVerify (used by CIntFromPy) */
 #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
@@ -7739,606 +7006,887 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     }
 
 /* CIntFromPy */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if ((sizeof(long) < sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (long) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x);
+static long __Pyx_raise_neg_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (long) -1;
+}
+static long __Pyx_raise_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (long) -1;
+}
+static CYTHON_INLINE long __Pyx_PyULong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 1;
 #if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
-                case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
             }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
             }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (long) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
             }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (long) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
 #endif
-            if ((sizeof(long) <= sizeof(unsigned long))) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-            }
-        } else {
+    if ((sizeof(long) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PySLong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 0;
 #if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
-                case -2:
-                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
             }
-#endif
-            if ((sizeof(long) <= sizeof(long))) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
             }
-        }
-        {
-#if (CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available, cannot convert large numbers");
-#else
-            long val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
             }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
             }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(long) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(long) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+    } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
 #endif
+    const int is_unsigned = neg_one > const_zero;
+    long val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (long) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
             return (long) -1;
         }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to long");
+        return (long) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (long) -1;
     } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
-        Py_DECREF(tmp);
-        return val;
+        stepval = v;
+    }
+    v = NULL;
+    val = (long) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((long) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((long) idigit) << bits;
     }
+    if (!is_unsigned) {
+        if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (long) -1;
+    return val;
 raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
 }
-
-/* CIntFromPy */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyLong___Pyx_PyLong_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
+    const long neg_one = (long) -1, const_zero = (long) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if ((sizeof(int) < sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_long(x);
         }
-    } else
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_long(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
 #endif
+}
+static long __Pyx_NonPyLong___Pyx_PyLong_As_long(PyObject *x) {
+    long val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (long) -1;
+    val = __Pyx_PyLong_As_long(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
     if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
+        return __Pyx_PyLong___Pyx_PyLong_As_long(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_long(x);
+    }
+}
+
+/* CIntFromPy */
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x);
+static int __Pyx_raise_neg_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int) -1;
+}
+static int __Pyx_raise_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int) -1;
+}
+static CYTHON_INLINE int __Pyx_PyULong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 1;
 #if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
             }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
             }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (int) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
             }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
 #endif
-            if ((sizeof(int) <= sizeof(unsigned long))) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-            }
-        } else {
+    if ((sizeof(int) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PySLong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 0;
 #if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
-                case -2:
-                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
             }
-#endif
-            if ((sizeof(int) <= sizeof(long))) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
             }
-        }
-        {
-#if (CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
             }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
             }
+        } else
+        {}
+    }
 #endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+    } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
     }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
 raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-/* FastTypeChecks */
-#if CYTHON_COMPILING_IN_CPYTHON
-static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
-    while (a) {
-        a = a->tp_base;
-        if (a == b)
-            return 1;
-    }
-    return b == &PyBaseObject_Type;
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
 }
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (a == b) return 1;
-    mro = a->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
-                return 1;
-        }
-        return 0;
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
     }
-    return __Pyx_InBases(a, b);
-}
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (cls == a || cls == b) return 1;
-    mro = cls->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            PyObject *base = PyTuple_GET_ITEM(mro, i);
-            if (base == (PyObject *)a || base == (PyObject *)b)
-                return 1;
-        }
-        return 0;
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int) -1;
+        assert(PyLong_CheckExact(v));
     }
-    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
-}
-#if PY_MAJOR_VERSION == 2
-static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
-    PyObject *exception, *value, *tb;
-    int res;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&exception, &value, &tb);
-    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
-    if (unlikely(res == -1)) {
-        PyErr_WriteUnraisable(err);
-        res = 0;
-    }
-    if (!res) {
-        res = PyObject_IsSubclass(err, exc_type2);
-        if (unlikely(res == -1)) {
-            PyErr_WriteUnraisable(err);
-            res = 0;
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int) -1;
         }
+        is_negative = result == 1;
     }
-    __Pyx_ErrRestore(exception, value, tb);
-    return res;
-}
-#else
-static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
-    if (exc_type1) {
-        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int");
+        return (int) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int) -1;
     } else {
-        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+        stepval = v;
     }
-}
-#endif
-static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    assert(PyExceptionClass_Check(exc_type));
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    v = NULL;
+    val = (int) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
     }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
 #endif
-    for (i=0; i<n; i++) {
-        PyObject *t = PyTuple_GET_ITEM(tuple, i);
-        #if PY_MAJOR_VERSION < 3
-        if (likely(exc_type == t)) return 1;
+    if (unlikely(ret))
+        return (int) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
         #endif
-        if (likely(PyExceptionClass_Check(t))) {
-            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
-        } else {
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int(x);
         }
     }
-    return 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+#endif
 }
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
-    if (likely(err == exc_type)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        if (likely(PyExceptionClass_Check(exc_type))) {
-            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
-        } else if (likely(PyTuple_Check(exc_type))) {
-            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
-        } else {
-        }
+static int __Pyx_NonPyLong___Pyx_PyLong_As_int(PyObject *x) {
+    int val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int) -1;
+    val = __Pyx_PyLong_As_int(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int(x);
     }
-    return PyErr_GivenExceptionMatches(err, exc_type);
 }
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
-    assert(PyExceptionClass_Check(exc_type1));
-    assert(PyExceptionClass_Check(exc_type2));
-    if (likely(err == exc_type1 || err == exc_type2)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
     }
-    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
 }
 #endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* AddModuleRef */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      if ((PY_VERSION_HEX >= 0x030E0000) &&  Py_Version >= 0x030E0100) {
+          return PyImport_AddModuleRef(name);
+      }
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
 
 /* CheckBinaryVersion */
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
         char message[200];
         PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
         return PyErr_WarnEx(NULL, message, 1);
     }
-    return 0;
 }
 
-/* InitStrings */
-#if PY_MAJOR_VERSION >= 3
-static int __Pyx_InitString(__Pyx_StringTabEntry t, PyObject **str) {
-    if (t.is_unicode | t.is_str) {
-        if (t.intern) {
-            *str = PyUnicode_InternFromString(t.s);
-        } else if (t.encoding) {
-            *str = PyUnicode_Decode(t.s, t.n - 1, t.encoding, NULL);
-        } else {
-            *str = PyUnicode_FromStringAndSize(t.s, t.n - 1);
-        }
-    } else {
-        *str = PyBytes_FromStringAndSize(t.s, t.n - 1);
+/* DecompressString */
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+#ifdef __Pyx_DecompressString_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(length);
+    CYTHON_UNUSED_VAR(algo);
+    return NULL;
+#else
+    PyObject *module = NULL, *decompress, *compressed_bytes, *decompressed;
+    const char* module_name = algo == 3 ? "compression.zstd" : algo == 2 ? "bz2" : "zlib";
+    PyObject *methodname = PyUnicode_FromString("decompress");
+    if (unlikely(!methodname)) return NULL;
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    if (algo == 3) {
+        PyObject *fromlist = Py_BuildValue("[O]", methodname);
+        if (unlikely(!fromlist)) goto bad;
+        module = PyImport_ImportModuleLevel("compression.zstd", NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+    } else
+    #endif
+        module = PyImport_ImportModule(module_name);
+    if (unlikely(!module)) goto import_failed;
+    decompress = PyObject_GetAttr(module, methodname);
+    if (unlikely(!decompress)) goto import_failed;
+    {
+        #ifdef __cplusplus
+            char *memview_bytes = const_cast<char*>(s);
+        #else
+            #if defined(__clang__)
+              #pragma clang diagnostic push
+              #pragma clang diagnostic ignored "-Wcast-qual"
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic push
+              #pragma GCC diagnostic ignored "-Wcast-qual"
+            #endif
+            char *memview_bytes = (char*) s;
+            #if defined(__clang__)
+              #pragma clang diagnostic pop
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic pop
+            #endif
+        #endif
+        #if CYTHON_COMPILING_IN_LIMITED_API && !defined(PyBUF_READ)
+        int memview_flags = 0x100;
+        #else
+        int memview_flags = PyBUF_READ;
+        #endif
+        compressed_bytes = PyMemoryView_FromMemory(memview_bytes, length, memview_flags);
     }
-    if (!*str)
-        return -1;
-    if (PyObject_Hash(*str) == -1)
-        return -1;
-    return 0;
-}
+    if (unlikely(!compressed_bytes)) {
+        Py_DECREF(decompress);
+        goto bad;
+    }
+    decompressed = PyObject_CallFunctionObjArgs(decompress, compressed_bytes, NULL);
+    Py_DECREF(compressed_bytes);
+    Py_DECREF(decompress);
+    Py_DECREF(module);
+    Py_DECREF(methodname);
+    return decompressed;
+import_failed:
+    PyErr_Format(PyExc_ImportError,
+        "Failed to import '%.20s.decompress' - cannot initialise module strings. "
+        "String compression was configured with the C macro 'CYTHON_COMPRESS_STRINGS=%d'.",
+        module_name, algo);
+bad:
+    Py_XDECREF(module);
+    Py_DECREF(methodname);
+    return NULL;
 #endif
-#if !CYTHON_COMPILING_IN_LIMITED_API
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION >= 3
-        __Pyx_InitString(*t, t->p);
-        #else
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+}
+
+/* DecompressString_LZSS */
+#ifndef __Pyx_DecompressString_LZSS_UNUSED
+CYTHON_UNUSED
+static CYTHON_SMALL_CODE size_t __pyx_lzss_decompress(const uint8_t* src, uint8_t* dst, size_t dst_len) {
+    size_t pos = 0, out_pos = 0;
+    while (1) {
+        uint32_t flags = src[pos++] | 0xFF00;
+        while (flags & 0x100) {
+            if (flags & 1) {
+                dst[out_pos++] = src[pos++];
+            } else {
+                uint32_t lo = src[pos++], hi = src[pos++];
+                uint32_t end_offset_of_last_occurrence, match_length;
+                if (!(lo & 0x80)) {
+                    end_offset_of_last_occurrence = lo;
+                    match_length = hi;
+                } else if (!(hi & 0x80)) {
+                    end_offset_of_last_occurrence = 0x80 + (((hi << 2) & 0x180) | (lo & 0x7F));
+                    match_length = hi & 0x1F;
+                } else {
+                    end_offset_of_last_occurrence = 0x80 + ((hi & 0x7F) << 7 | (lo & 0x7F));
+                    match_length = src[pos++];
+                }
+                match_length += 3;
+                size_t ref_pos = out_pos - end_offset_of_last_occurrence - match_length;
+                memcpy(dst + out_pos, dst + ref_pos, match_length);
+                out_pos += match_length;
+            }
+            if (out_pos >= dst_len) return pos;
+            flags >>= 1;
         }
-        if (!*t->p)
-            return -1;
-        if (PyObject_Hash(*t->p) == -1)
-            return -1;
-        #endif
-        ++t;
     }
-    return 0;
 }
 #endif
+static CYTHON_SMALL_CODE PyObject *__Pyx_DecompressString_LZSS(const char *s, size_t compressed_length, size_t uncompressed_length) {
+#ifdef __Pyx_DecompressString_LZSS_UNUSED
+    CYTHON_UNUSED_VAR(s);
+    CYTHON_UNUSED_VAR(compressed_length);
+    CYTHON_UNUSED_VAR(uncompressed_length);
+    return NULL;
+#else
+    PyObject *result;
+    unsigned char *result_data;
+    size_t src_length;
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) uncompressed_length);
+    if (unlikely(!result)) return NULL;
+    result_data = __Pyx_PyBytes_AsWritableUString(result);
+    if (unlikely(!result_data)) goto bad;
+    src_length = __pyx_lzss_decompress((const uint8_t*) s, result_data, uncompressed_length);
+    if (unlikely(src_length != compressed_length)) goto decompression_failed;
+    return result;
+decompression_failed:
+    PyErr_SetString(PyExc_RuntimeError, "LZSS string data decompression failed");
+bad:
+    Py_DECREF(result);
+    return NULL;
+#endif
+}
 
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
 static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
-    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
 }
 static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
     Py_ssize_t ignore;
     return __Pyx_PyObject_AsStringAndSize(o, &ignore);
 }
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-#if !CYTHON_PEP393_ENABLED
-static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-    char* defenc_c;
-    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
-    if (!defenc) return NULL;
-    defenc_c = PyBytes_AS_STRING(defenc);
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
     {
-        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
-        char* c;
-        for (c = defenc_c; c < end; c++) {
-            if ((unsigned char) (*c) >= 128) {
-                PyUnicode_AsASCIIString(o);
-                return NULL;
-            }
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
         }
+        #endif
+        return result;
     }
-#endif
-    *length = PyBytes_GET_SIZE(defenc);
-    return defenc_c;
-}
 #else
-static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
 #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
     if (likely(PyUnicode_IS_ASCII(o))) {
         *length = PyUnicode_GET_LENGTH(o);
@@ -8350,25 +7898,25 @@ static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py
 #else
     return PyUnicode_AsUTF8AndSize(o, length);
 #endif
-}
 #endif
+}
 #endif
 static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-    if (
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-            __Pyx_sys_getdefaultencoding_not_ascii &&
-#endif
-            PyUnicode_Check(o)) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
         return __Pyx_PyUnicode_AsStringAndSize(o, length);
     } else
 #endif
-#if (!CYTHON_COMPILING_IN_PYPY && !CYTHON_COMPILING_IN_LIMITED_API) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
     if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
         *length = PyByteArray_GET_SIZE(o);
         return PyByteArray_AS_STRING(o);
-    } else
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
 #endif
+    } else
     {
         char* result;
         int r = PyBytes_AsStringAndSize(o, &result, length);
@@ -8391,9 +7939,11 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
     Py_DECREF(x);
     return retval;
 }
-static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
-    __Pyx_TypeName result_type_name = __Pyx_PyType_GetName(Py_TYPE(result));
-#if PY_MAJOR_VERSION >= 3
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!result_type_name)) goto bad;
+    #endif
     if (PyLong_Check(result)) {
         if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
@@ -8401,154 +7951,437 @@ static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const
                 "and may be removed in a future version of Python.",
                 result_type_name)) {
             __Pyx_DECREF_TypeName(result_type_name);
-            Py_DECREF(result);
-            return NULL;
+            goto bad;
         }
         __Pyx_DECREF_TypeName(result_type_name);
         return result;
     }
-#endif
     PyErr_Format(PyExc_TypeError,
-                 "__%.4s__ returned non-%.4s (type " __Pyx_FMT_TYPENAME ")",
-                 type_name, type_name, result_type_name);
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
     __Pyx_DECREF_TypeName(result_type_name);
+bad:
     Py_DECREF(result);
     return NULL;
 }
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
 #if CYTHON_USE_TYPE_SLOTS
   PyNumberMethods *m;
 #endif
-  const char *name = NULL;
   PyObject *res = NULL;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_Check(x) || PyLong_Check(x)))
-#else
   if (likely(PyLong_Check(x)))
-#endif
-    return __Pyx_NewRef(x);
+      return __Pyx_NewRef(x);
 #if CYTHON_USE_TYPE_SLOTS
   m = Py_TYPE(x)->tp_as_number;
-  #if PY_MAJOR_VERSION < 3
-  if (m && m->nb_int) {
-    name = "int";
-    res = m->nb_int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = m->nb_long(x);
-  }
-  #else
   if (likely(m && m->nb_int)) {
-    name = "int";
-    res = m->nb_int(x);
+      res = m->nb_int(x);
   }
-  #endif
 #else
   if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
-    res = PyNumber_Int(x);
+      res = PyNumber_Long(x);
   }
 #endif
   if (likely(res)) {
-#if PY_MAJOR_VERSION < 3
-    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
-#else
-    if (unlikely(!PyLong_CheckExact(res))) {
-#endif
-        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
-    }
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
   }
   else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
   }
   return res;
 }
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject *x;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_CheckExact(b))) {
-    if (sizeof(Py_ssize_t) >= sizeof(long))
-        return PyInt_AS_LONG(b);
-    else
-        return PyInt_AsSsize_t(b);
-  }
-#endif
-  if (likely(PyLong_CheckExact(b))) {
+static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_AsSsize_t(PyObject* b) {
     #if CYTHON_USE_PYLONG_INTERNALS
-    const digit* digits = ((PyLongObject*)b)->ob_digit;
-    const Py_ssize_t size = Py_SIZE(b);
-    if (likely(__Pyx_sst_abs(size) <= 1)) {
-        ival = likely(size) ? digits[0] : 0;
-        if (size == -1) ival = -ival;
-        return ival;
-    } else {
-      switch (size) {
-         case 2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-      }
-    }
+    Py_ssize_t ival;
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(b);
+    const int is_neg = __Pyx_PyLong_IsNeg(b);
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    if (size == 0) return 0;
+    #if SIZEOF_SIZE_T * 8 > 1 * PyLong_SHIFT
+    if (size == 1) {
+        ival = (Py_ssize_t) (((size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 2 * PyLong_SHIFT
+    if (size == 2) {
+        ival = (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
     #endif
+    #if SIZEOF_SIZE_T * 8 > 3 * PyLong_SHIFT
+    if (size == 3) {
+        ival = (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 4 * PyLong_SHIFT
+    if (size == 4) {
+        ival = (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+        return PyLong_AsSsize_t(b);
+    return is_neg ? -ival : ival;
+    #else
     return PyLong_AsSsize_t(b);
-  }
-  x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
+    #endif
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+    if (likely(PyLong_Check(b))) {
+        return __Pyx_PyLong_AsSsize_t(b);
+    } else {
+        Py_ssize_t ival;
+        PyObject *x = PyNumber_Index(b);
+        if (unlikely(!x)) return -1;
+        ival = __Pyx_PyLong_AsSsize_t(x);
+        Py_DECREF(x);
+        return ival;
+    }
 }
 static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
   if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
     return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
-#if PY_MAJOR_VERSION < 3
-  } else if (likely(PyInt_CheckExact(o))) {
-    return PyInt_AS_LONG(o);
-#endif
   } else {
     Py_ssize_t ival;
     PyObject *x;
     x = PyNumber_Index(o);
     if (!x) return -1;
-    ival = PyInt_AsLong(x);
+    ival = PyLong_AsLong(x);
     Py_DECREF(x);
     return ival;
   }
 }
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
-  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
 }
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-    return PyInt_FromSize_t(ival);
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
 }
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
 
 
 /* #### Code section: end ### */
@@ -16,6 +16,41 @@ class Mapper:
     MMC2 = 9
 
 
+class Button:
+    """
+    Controller buttons, as bits in the order the controller reports them
+    """
+    A = 0b00000001
+    B = 0b00000010
+    SELECT = 0b00000100
+    START = 0b00001000
+    UP = 0b00010000
+    DOWN = 0b00100000
+    LEFT = 0b01000000
+    RIGHT = 0b10000000
+
+
+class IRQSource:
+    """
+    Components that can hold the CPU's IRQ line low, as bits of `nespy.interrupt.InterruptLines.irq`
+    """
+    FRAME_COUNTER = 0b001
+    DMC = 0b010
+    CARTRIDGE = 0b100
+
+
+class Mirroring:
+    """
+    Nametable mirroring arrangements. The names describe which nametables share memory,
+    e.g. HORIZONTAL mirrors 0x2000 with 0x2400 and 0x2800 with 0x2C00.
+    """
+    HORIZONTAL = 0
+    VERTICAL = 1
+    SINGLE_SCREEN_LOWER = 2
+    SINGLE_SCREEN_UPPER = 3
+    FOUR_SCREEN = 4
+
+
 class PPURegister:
     PPUCTRL = 0x2000
     PPUMASK = 0x2001
@@ -149,14 +184,14 @@ InstructionAddressingModeMap = {  # addressing mode used by the instruction
     **dict.fromkeys([0x75, 0x35, 0x16, 0xD5,
                      0xD6, 0x55, 0xF6, 0xB5,
                      0xB4, 0x56, 0x15, 0x36,
-                     0x76, 0xF5, 0x95, 0x94,
-                     0xB6],
+                     0x76, 0xF5, 0x95, 0x94],
                     AddressingMode.ZeroPageX),
-    **dict.fromkeys([0x96],
+    **dict.fromkeys([0x96, 0xB6],
                     AddressingMode.ZeroPageY),
     **dict.fromkeys([0x69, 0x29, 0xC9, 0xE0,
                      0xC0, 0x49, 0xA9, 0xA2,
-                     0x09, 0xE9, 0xA0],
+                     0x09, 0xE9, 0xA0, 0x80,
+                     0x82, 0x89, 0xC2, 0xE2],
                     AddressingMode.Immediate),
     **dict.fromkeys([0x90, 0xB0, 0xF0, 0x30,
                      0xD0, 0x10, 0x50, 0x70],
@@ -168,7 +203,8 @@ InstructionAddressingModeMap = {  # addressing mode used by the instruction
                      0x2A, 0x6A, 0x40, 0x60,
                      0x38, 0xF8, 0x78, 0xAA,
                      0xA8, 0xBA, 0x8A, 0x9A,
-                     0x98],
+                     0x98, 0x1A, 0x3A, 0x5A,
+                     0x7A, 0xDA, 0xFA],
                     AddressingMode.Implicit),
     **dict.fromkeys([0x6C],
                     AddressingMode.Indirect),
@@ -189,7 +225,8 @@ InstructionLengthMap = {  # number of bytes each instruction takes up in memory
                      0x2A, 0x6A, 0x40, 0x60,
                      0x38, 0xF8, 0x78, 0xAA,
                      0xA8, 0xBA, 0x8A, 0x9A,
-                     0x98],
+                     0x98, 0x1A, 0x3A, 0x5A,
+                     0x7A, 0xDA, 0xFA],
                     1),
     **dict.fromkeys([0x69, 0x65, 0x75, 0x61,
                      0x71, 0x29, 0x25, 0x35,
@@ -209,7 +246,8 @@ InstructionLengthMap = {  # number of bytes each instruction takes up in memory
                      0x76, 0xE9, 0xE5, 0xF5,
                      0xE1, 0xF1, 0x85, 0x95,
                      0x81, 0x91, 0x86, 0x96,
-                     0x84, 0x94],
+                     0x84, 0x94, 0x80, 0x82,
+                     0x89, 0xC2, 0xE2],
                     2),
     **dict.fromkeys([0x6D, 0x7D, 0x79, 0x2D,
                      0x3D, 0x39, 0x0E, 0x1E,
@@ -227,6 +265,67 @@ InstructionLengthMap = {  # number of bytes each instruction takes up in memory
 }
 
 
+InstructionCycleMap = {  # number of CPU cycles each instruction takes, not counting page-cross or branch penalties
+    **dict.fromkeys([0x69, 0x29, 0x0A, 0x90,
+                     0xB0, 0xF0, 0x30, 0xD0,
+                     0x10, 0x50, 0x70, 0x18,
+                     0xD8, 0x58, 0xB8, 0xC9,
+                     0xE0, 0xC0, 0xCA, 0x88,
+                     0x49, 0xE8, 0xC8, 0xA9,
+                     0xA2, 0xA0, 0x4A, 0xEA,
+                     0x1A, 0x3A, 0x5A, 0x7A,
+                     0xDA, 0xFA, 0x80, 0x82,
+                     0x89, 0xC2, 0xE2, 0x09,
+                     0x2A, 0x6A, 0xE9, 0x38,
+                     0xF8, 0x78, 0xAA, 0xA8,
+                     0xBA, 0x8A, 0x9A, 0x98],
+                    2),
+    **dict.fromkeys([0x65, 0x25, 0x24, 0xC5,
+                     0xE4, 0xC4, 0x45, 0x4C,
+                     0xA5, 0xA6, 0xA4, 0x05,
+                     0xE5, 0x85, 0x86, 0x84,
+                     0x48, 0x08],
+                    3),
+    **dict.fromkeys([0x75, 0x6D, 0x7D, 0x79,
+                     0x35, 0x2D, 0x3D, 0x39,
+                     0x2C, 0xD5, 0xCD, 0xDD,
+                     0xD9, 0xEC, 0xCC, 0x55,
+                     0x4D, 0x5D, 0x59, 0xB5,
+                     0xAD, 0xBD, 0xB9, 0xB6,
+                     0xAE, 0xBE, 0xB4, 0xAC,
+                     0xBC, 0x15, 0x0D, 0x1D,
+                     0x19, 0xF5, 0xED, 0xFD,
+                     0xF9, 0x95, 0x8D, 0x96,
+                     0x8E, 0x94, 0x8C, 0x68,
+                     0x28],
+                    4),
+    **dict.fromkeys([0x71, 0x31, 0x06, 0xD1,
+                     0xC6, 0x51, 0xE6, 0x6C,
+                     0xB1, 0x46, 0x11, 0x26,
+                     0x66, 0xF1, 0x9D, 0x99],
+                    5),
+    **dict.fromkeys([0x61, 0x21, 0x16, 0x0E,
+                     0xC1, 0xD6, 0xCE, 0x41,
+                     0xF6, 0xEE, 0x20, 0xA1,
+                     0x56, 0x4E, 0x01, 0x36,
+                     0x2E, 0x76, 0x6E, 0xE1,
+                     0x81, 0x91, 0x40, 0x60],
+                    6),
+    **dict.fromkeys([0x1E, 0xDE, 0xFE, 0x00,
+                     0x5E, 0x3E, 0x7E],
+                    7)
+}
+
+
+InstructionPageCrossPenalty = {  # instructions that take an extra cycle when their effective address crosses a page
+    0x7D, 0x79, 0x71, 0x3D,
+    0x39, 0x31, 0xDD, 0xD9,
+    0xD1, 0x5D, 0x59, 0x51,
+    0xBD, 0xB9, 0xB1, 0xBE,
+    0xBC, 0x1D, 0x19, 0x11,
+    0xFD, 0xF9, 0xF1
+}
+
 AddressingModeDisasmFormat = {  # the format string printed by the disassembler for each addressing mode
     AddressingMode.Absolute: "${operand}",
     AddressingMode.AbsoluteX: "${operand},X",
@@ -252,3 +351,24 @@ InstructionDisasmExtras = {
     **dict.fromkeys([0x84, 0x94, 0x8C], "; = {y}"),  # STY
     **dict.fromkeys([0x24, 0x2C], "; = {value2}"),  # BIT
 }
+
+
+# RGB values of the 64 colors the NTSC PPU (2C02) can output, indexed by the values stored in palette RAM
+NTSCPalette = (
+    (84, 84, 84), (0, 30, 116), (8, 16, 144), (48, 0, 136),
+    (68, 0, 100), (92, 0, 48), (84, 4, 0), (60, 24, 0),
+    (32, 42, 0), (8, 58, 0), (0, 64, 0), (0, 60, 0),
+    (0, 50, 60), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+    (152, 150, 152), (8, 76, 196), (48, 50, 236), (92, 30, 228),
+    (136, 20, 176), (160, 20, 100), (152, 34, 32), (120, 60, 0),
+    (84, 90, 0), (40, 114, 0), (8, 124, 0), (0, 118, 40),
+    (0, 102, 120), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+    (236, 238, 236), (76, 154, 236), (120, 124, 236), (176, 98, 236),
+    (228, 84, 236), (236, 88, 180), (236, 106, 100), (212, 136, 32),
+    (160, 170, 0), (116, 196, 0), (76, 208, 32), (56, 204, 108),
+    (56, 180, 204), (60, 60, 60), (0, 0, 0), (0, 0, 0),
+    (236, 238, 236), (168, 204, 236), (188, 188, 236), (212, 178, 236),
+    (236, 174, 236), (236, 174, 212), (236, 180, 176), (228, 196, 144),
+    (204, 210, 120), (180, 222, 120), (168, 226, 144), (152, 226, 180),
+    (160, 214, 228), (160, 162, 160), (0, 0, 0), (0, 0, 0),
+)
@@ -17,3 +17,10 @@ class UnsupportedMapper(Exception):
     Raised when the emulator attempts to load a ROM that uses an unsupported mapper
     """
     pass
+
+
+class InvalidState(Exception):
+    """
+    Raised when the emulator is unable to load a save state
+    """
+    pass
@@ -0,0 +1,5 @@
+cdef class InterruptLines:
+    cdef public bint nmi
+    cdef public int irq
+
+    cpdef void trigger_nmi(self)
@@ -0,0 +1,59 @@
+import struct
+
+
+# NMI latch, IRQ sources
+_STATE_STRUCT = struct.Struct("<?B")
+
+
+class InterruptLines:
+    """
+    The CPU's NMI and IRQ inputs, shared by every component that can interrupt it.
+
+    NMI is edge triggered: the PPU calls `.trigger_nmi()` when its NMI output goes low, which latches an NMI that is
+    handled at the next instruction boundary. IRQ is level triggered: every source (the APU frame counter, the DMC,
+    the cartridge) holds the line low with `.assert_irq(...)` until the game acknowledges it, and the CPU keeps
+    taking IRQs while any source is asserted and interrupts are enabled.
+    """
+    def __init__(self) -> None:
+        self.nmi = False  # an NMI edge has been seen and not handled yet
+        self.irq = 0  # bitmask of nespy.enum.IRQSource values currently asserting IRQ
+
+    def reset(self) -> None:
+        # IRQ sources keep holding the line until they are reset or acknowledged themselves
+        self.nmi = False
+
+    def save_state(self) -> bytes:
+        """
+        Returns:
+            bytes: the NMI latch and the asserted IRQ sources, packed for a save state
+        """
+        return _STATE_STRUCT.pack(self.nmi, self.irq)
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the interrupt lines' part of the save state starts
+
+        Returns:
+            int: where the interrupt lines' part of the save state ends
+        """
+        self.nmi, self.irq = _STATE_STRUCT.unpack_from(state, offset)
+        return offset + _STATE_STRUCT.size
+
+    def trigger_nmi(self) -> None:
+        self.nmi = True
+
+    def assert_irq(self, source: int) -> None:
+        """
+        Args:
+            source(int): one of the values in `nespy.enum.IRQSource`
+        """
+        self.irq |= source
+
+    def release_irq(self, source: int) -> None:
+        """
+        Args:
+            source(int): one of the values in `nespy.enum.IRQSource`
+        """
+        self.irq &= ~source
@@ -1,18 +1,27 @@
 from nespy.apu cimport APU
+from nespy.bus cimport Bus
 from nespy.clock cimport Clock
+from nespy.controller cimport Controller
 from nespy.cpu cimport CPU
+from nespy.interrupt cimport InterruptLines
 from nespy.ppu cimport PPU
 
 
 cdef class NES:
-    cdef int _memory[0x10000]
-    cdef list memory
-    cdef double _width_scale, _height_scale
-    cdef object _main_window, _debug_window_ppu
+    cdef Bus _bus
+    cdef object _cartridge
+    cdef object _display
+    cdef object _rewind
+    cdef object _screen
+    cdef object _observation
+    cdef InterruptLines _interrupts
     cdef CPU _cpu
     cdef PPU _ppu
     cdef APU _apu
+    cdef list _controllers
     cdef Clock _master_clock
     cdef str _rom
     cdef int _rom_format
-    cdef int _mapper
\ No newline at end of file
+    cdef int _mapper
+    cdef int _state_size
+    cdef public int frameskip
\ No newline at end of file
@@ -1,44 +1,23 @@
-from OpenGL.GL import glBegin, glVertex2f, glEnd, glViewport, glMatrixMode, glLoadIdentity, glOrtho, glClear, \
-    glColor3f, glTexParameteri, GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, \
-    GL_TEXTURE_MAG_FILTER, GL_NEAREST, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_QUADS, GL_PROJECTION, GL_MODELVIEW
-from OpenGL.GLUT import glutInit, glutInitDisplayMode, glutInitWindowSize, glutInitWindowPosition, glutCreateWindow, \
-    glutSwapBuffers, glutSetOption, glutHideWindow, GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_GLUTMAINLOOP_RETURNS, \
-    GLUT_RGBA
+import struct
 from typing import Optional
 
 from nespy.apu import APU
+from nespy.bus import Bus
+from nespy.cartridge import CARTRIDGES, Cartridge
 from nespy.clock import Clock
+from nespy.controller import Controller
 from nespy.cpu import CPU
-from nespy.enum import ROMFormat, Mapper
-from nespy.exceptions import InvalidROM, UnsupportedMapper
+from nespy.exceptions import InvalidState, UnsupportedMapper
+from nespy.interrupt import InterruptLines
 from nespy.ppu import PPU
+from nespy.rewind import RewindBuffer
+from nespy.rom import ROM
 
-
-def square():
-    glBegin(GL_QUADS)
-    glVertex2f(100, 100)
-    glVertex2f(200, 100)
-    glVertex2f(200, 200)
-    glVertex2f(100, 200)
-    glEnd()
-
-
-def iterate():
-    glViewport(0, 0, 500, 500)
-    glMatrixMode(GL_PROJECTION)
-    glLoadIdentity()
-    glOrtho(0.0, 500, 0.0, 500, 0.0, 1.0)
-    glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
-
-
-def show_screen():
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
-    iterate()
-    glColor3f(1.0, 0.0, 3.0)
-    square()
-    glutSwapBuffers()
+# bumped whenever the layout of a save state changes
+STATE_VERSION = 5
+# magic number, version, mapper, size of everything after the header
+_STATE_HEADER_STRUCT = struct.Struct("<4sHHI")
+_STATE_MAGIC = b"NESs"
 
 
 class NES:
@@ -47,108 +26,377 @@ class NES:
         resolution(tuple): in the form (int, int). Render resolution.
             if set to None, the emulator can still run, but no video will be drawn to the screen.
             Controller inputs and other manipulations can be performed via the API.
+        frameskip(int): number of frames skipped between frames that are drawn by `.run_frame()`.
+            skipped frames are emulated in full, but no pixels are drawn
+        audio(bool): whether to make sound, which needs NumPy. without sound, the APU still emulates everything games
+            can see, such as its length counters and interrupts, but is much faster to run
     """
-    def __init__(self, resolution: Optional[tuple[int, int]] = (512, 480), disassemble: bool = False) -> None:
+    def __init__(self, resolution: Optional[tuple[int, int]] = (512, 480), disassemble: bool = False,
+                 frameskip: int = 0, audio: bool = True) -> None:
+        self.frameskip = frameskip
+        self._display = None
         if resolution:
-            self._width_scale = resolution[0] / 256  # NES native width is 256 pixels
-            self._height_scale = resolution[1] / 240  # NES native height is 240 pixels
-            # overrides opengl's default filtering behavior from GL_LINEAR to GL_NEAREST
-            # GL_LINEAR creates really bad blurriness
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-            # initialize graphics
-            glutInit()
-            glutInitDisplayMode(GLUT_RGBA)
-            glutInitWindowSize(*resolution)
-            glutInitWindowPosition(0, 0)
-            self._main_window = glutCreateWindow("NESpy - Main Window")
-            glutSetOption(GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_GLUTMAINLOOP_RETURNS)
-            glutInitWindowSize(int(256 * self._width_scale), int(128 * self._height_scale))
-            self._debug_window_ppu = glutCreateWindow("NESpy - Debug (PPU)")
-            glutHideWindow()
-            #glutSetOption(GLUT_ACTION_ON_WINDOW_CLOSE, GLUT_ACTION_CONTINUE_EXECUTION)
-            #self._render_batch_ppu_debug = pyglet.graphics.Batch()
-        self._memory = [0] * 0x10000  # 64KiB
-        self._cpu = CPU(self._memory, disassemble=disassemble)
-        self._ppu = PPU(self._memory)
-        self._apu = APU(self._memory)
+            # the frontend is imported here so that headless instances never load the GL libraries
+            from nespy.display import Display
+            self._display = Display(resolution)
+        self._bus = Bus()
+        self._interrupts = InterruptLines()
+        self._cpu = CPU(self._bus, self._interrupts, disassemble=disassemble)
+        self._ppu = PPU()
+        self._ppu.nmi_hook = self._interrupts.trigger_nmi
+        self._apu = APU(self._interrupts, audio=audio)
+        self._apu.dmc.read_hook = self._bus.read
+        self._apu.dmc.stall_hook = self._cpu.stall
+        self._controllers = [Controller(), Controller()]
+        self._bus.map_handlers(0x2000, 0x4000, self._ppu.read_register, self._ppu.write_register)
+        self._bus.map_handlers(0x4000, 0x4100, self._read_io_register, self._write_io_register)
+        # PRG ROM, until a ROM is loaded
+        self._bus.map_memory(0x8000, 0x10000, memoryview(self._bus.memory)[0x8000:0x10000], writable=False)
         self._master_clock = Clock(21477272)  # NTSC NES master clock frequency is ~21.477272 MHz
         self._master_clock.add_child(12, self._cpu.emulate_cycle)  # CPU clock frequency is master / 12
-        self._master_clock.add_child(4, self._ppu.emulate_cycle)  # PPU clock frequency is master / 4
+        # PPU clock frequency is master / 4
+        self._master_clock.add_child(4, self._ppu.emulate_cycle, catch_up=self._ppu.emulate_cycles)
+        # the APU is told about CPU cycles as they pass, and only runs when it has to
+        self._apu.clock = self._master_clock.add_child(12, self._apu.emulate_cycle, catch_up=self._apu.emulate_cycles)
+        self._cpu.sync = self._master_clock.sync
 
+        self._cartridge: Optional[Cartridge] = None
+        self._state_size = 0
+        self._rewind: Optional[RewindBuffer] = None
+        self._screen = None  # NumPy views of the framebuffer, created the first time they are asked for
+        self._observation = None
         self._mapper = -1
         self._rom_format = -1
 
+    @property
+    def ram(self) -> memoryview:
+        """
+        The CPU's 2KiB of internal RAM. Writes to this view are seen by the running game.
+        """
+        return self._bus.ram
+
+    @property
+    def ppu_memory(self) -> memoryview:
+        """
+        The PPU's 16KiB of backing memory: nametables and palette.
+        The pattern tables are mapped in from the cartridge's CHR ROM or CHR RAM.
+        """
+        return memoryview(self._ppu._memory)
+
+    @property
+    def oam(self) -> memoryview:
+        """
+        The PPU's 256 bytes of object attribute memory, which holds the attributes of the 64 sprites.
+        """
+        return memoryview(self._ppu._oam)
+
     def load_rom(self, path: str, reset: bool = True) -> None:
-        # read rom into memory
-        rom = open(path, "rb")
-        rom_bytes = []
-        while True:
-            byte = rom.read(1)
-            if not byte:
-                break
-            rom_bytes.append(int.from_bytes(byte, byteorder='little'))
-        rom_header = rom_bytes[0:16]
-        # parse ROM header
-        if rom_header[0:4] != [0x4E, 0x45, 0x53, 0x1A]:  # first 4 bytes should be 'NES\x1A'
-            raise InvalidROM(f'Invalid ROM header: {rom_header}')
-        prg_banks = rom_header[4]
-        chr_banks = rom_header[5]
-        flags6 = rom_header[6]
-        flags7 = rom_header[7]
-
-        # ROM is NES2.0 if 3rd bit of flags7 is set, and 2nd bit is clear
-        if flags7 & 0b1100 == 0b1000:
-            self._rom_format = ROMFormat.INES2_0
-            flags8 = rom_header[8]
-            self._mapper = ((flags6 & 0b11110000) >> 4) | (flags7 & 0b11110000) | ((flags8 & 0b11110000) << 4)
-        else:
-            self._rom_format = ROMFormat.INES
-            self._mapper = ((flags6 & 0b11110000) >> 4) | (flags7 & 0b11110000)
-            prg_ram_size = rom_header[8]
-        flags9 = rom_header[9]
-        flags10 = rom_header[10]
-        # bits 11-15 of the header are unused
-
-        rom_has_trainer = (flags6 & 0b00000100 != 0)  # bit 2 of flags6 indicates whether a trainer is present
-
-        if self._mapper == Mapper.NROM:
-            rom_prg_start = 0x10 + (0x200 * rom_has_trainer)  # trainer is 0x200 bytes long
-            rom_prg_end = rom_prg_start + (0x4000 * prg_banks)  # each prgBank is 0x4000 bytes long
-            memory_pointer = 0x8000  # prg_banks get written to memory starting at 0x8000
-            rom_prg_bytes = rom_bytes[rom_prg_start:rom_prg_end]
-            for byte in rom_prg_bytes:
-                self._memory[memory_pointer] = byte
-                if prg_banks == 1:  # if there's only one PRG bank on the ROM, it gets duplicated to the 2nd area in memory
-                    self._memory[memory_pointer + 0x4000] = byte
-                memory_pointer += 1
-
-            rom_chr_bytes = rom_bytes[rom_prg_end:rom_prg_end + 0x2000]  # CHR ROM is 0x2000 bytes long
-            memory_pointer = 0
-            for byte in rom_chr_bytes:
-                self._ppu.set_memory(memory_pointer, byte)
-                memory_pointer += 1
-        else:
+        rom = ROM.from_file(path)
+        self._rom_format = rom.header.format
+        self._mapper = rom.header.mapper
+
+        cartridge_class = CARTRIDGES.get(self._mapper)
+        if cartridge_class is None:
             raise UnsupportedMapper(f"The mapper {self._mapper} for ROM {path} is not supported.")
+        self._cartridge = cartridge_class(rom)
+        self._cartridge.connect(self._bus, self._ppu, self._interrupts)
+        # the size of a save state only depends on the cartridge, so it is worked out once here to validate states
+        self._state_size = len(self.save_state()) - _STATE_HEADER_STRUCT.size
 
         if reset:
-            self._cpu.reset()
-            self._ppu.reset()
+            self.reset()
 
         self._rom = path
 
-    def update_display(self) -> None:
-        pass
+    def reset(self) -> None:
+        """
+        Presses the console's reset button.
+        """
+        self._interrupts.reset()
+        self._cpu.reset()
+        self._ppu.reset()
+        self._apu.reset()
+
+    def save_state(self) -> bytes:
+        """
+        Captures the state of every component in one binary blob, which can be restored with `.load_state(...)`.
+        The blob only contains the state, not the ROM, so it has to be loaded into an NES running the same ROM.
 
-    def keyboard_handler(self) -> None:
-        pass
+        Returns:
+            bytes: the save state
+        """
+        if self._cartridge is None:
+            raise InvalidState("Save states can't be made before a ROM is loaded.")
+        parts = [
+            self._cpu.save_state(),
+            self._interrupts.save_state(),
+            self._master_clock.save_state(),
+            self._bus.ram,
+            self._ppu.save_state(),
+            self._apu.save_state(),
+            self._controllers[0].save_state(),
+            self._controllers[1].save_state(),
+            self._cartridge.save_state(),
+        ]
+        size = sum(len(part) for part in parts)
+        return b"".join([_STATE_HEADER_STRUCT.pack(_STATE_MAGIC, STATE_VERSION, self._mapper, size)] + parts)
 
-    def run(self) -> None:
+    def load_state(self, state: bytes) -> None:
+        """
+        Restores a save state made by `.save_state()`. The state is validated before anything is restored,
+        so a state that can't be loaded leaves the emulator untouched.
+
+        Args:
+            state(bytes): the save state
+        """
+        view = memoryview(state)
+        if len(view) < _STATE_HEADER_STRUCT.size:
+            raise InvalidState(f"Save state is too short: {len(view)} bytes")
+        magic, version, mapper, size = _STATE_HEADER_STRUCT.unpack_from(view)
+        if magic != _STATE_MAGIC:
+            raise InvalidState("Not a nespy save state.")
+        if version != STATE_VERSION:
+            raise InvalidState(f"Save state version {version} is not supported, expected version {STATE_VERSION}.")
+        if self._cartridge is None or mapper != self._mapper:
+            raise InvalidState(f"Save state was made with mapper {mapper}, "
+                               f"but the loaded ROM uses mapper {self._mapper}.")
+        if size != self._state_size or len(view) != _STATE_HEADER_STRUCT.size + size:
+            raise InvalidState(f"Save state is {len(view)} bytes long, "
+                               f"expected {_STATE_HEADER_STRUCT.size + self._state_size} for the loaded ROM.")
+        offset = self._cpu.load_state(view, _STATE_HEADER_STRUCT.size)
+        offset = self._interrupts.load_state(view, offset)
+        offset = self._master_clock.load_state(view, offset)
+        self._bus.ram[:] = view[offset:offset + len(self._bus.ram)]
+        offset += len(self._bus.ram)
+        offset = self._ppu.load_state(view, offset)
+        offset = self._apu.load_state(view, offset)
+        offset = self._controllers[0].load_state(view, offset)
+        offset = self._controllers[1].load_state(view, offset)
+        self._cartridge.load_state(view, offset)
+
+    def set_buttons(self, buttons: int, controller: int = 0) -> None:
+        """
+        Sets the buttons being held on a controller, until they are set again.
+
+        Args:
+            buttons(int): bitmask of `nespy.enum.Button` values
+            controller(int): 0 for player 1, 1 for player 2
+        """
+        self._controllers[controller].buttons = buttons
+
+    def _read_io_register(self, address: int) -> int:
+        """
+        Bus read handler for 0x4000-0x40FF. The controllers are at 0x4016 and 0x4017, the rest belongs to the APU.
+        """
+        if address == 0x4016:
+            return self._controllers[0].read()
+        if address == 0x4017:
+            return self._controllers[1].read()
+        return self._apu.read_register(address)
+
+    def _write_io_register(self, address: int, value: int) -> None:
+        """
+        Bus write handler for 0x4000-0x40FF. Writes to 0x4016 strobe both controllers, and writes to 0x4014
+        start OAM DMA. 0x4017 is the APU's frame counter when written to.
+        """
+        if address == 0x4016:
+            self._controllers[0].write(value)
+            self._controllers[1].write(value)
+            return
+        if address == 0x4014:
+            self._oam_dma(value)
+            return
+        self._apu.write_register(address, value)
+
+    def _oam_dma(self, page: int) -> None:
+        """
+        Copies a page of CPU memory into OAM in one go, and halts the CPU for as long as the real DMA would take:
+        one cycle to let the write finish, one more if the DMA starts on an odd cycle, then 256 reads and 256 writes.
+
+        Args:
+            page(int): the high byte of the address to copy from
+        """
+        self._ppu.write_oam(self._bus.read_page(page))
+        # the CPU cycle after the write, which the DMA starts on
+        cycle = self._master_clock.cycle // 12 + self._cpu.cycles  # CPU clock is master / 12
+        self._cpu.stall(514 if cycle & 1 else 513)
+
+    @property
+    def framebuffer(self) -> memoryview:
+        """
+        The last frame drawn by the PPU, as 256x240 bytes in row-major order.
+        Each byte is an index into the NES's 64-color palette.
+        """
+        return memoryview(self._ppu._framebuffer)
+
+    @property
+    def framebuffer_rgb(self) -> bytearray:
+        """
+        The last frame drawn by the PPU, as 256x240 pixels in row-major order, 3 bytes (red, green, blue) per pixel.
+        This is a new copy every time it is accessed.
+        """
+        return self._ppu.get_rgb_framebuffer()
+
+    @property
+    def framebuffer_array(self) -> "numpy.ndarray":
+        """
+        The last frame drawn by the PPU, as a (240, 256) uint8 NumPy array of palette indices. Needs NumPy.
+        The array shares memory with the framebuffer, so it always holds the latest frame without being copied.
+        """
+        return self._get_screen().indices
+
+    @property
+    def framebuffer_rgb_array(self) -> "numpy.ndarray":
+        """
+        The last frame drawn by the PPU, as a (240, 256, 3) uint8 NumPy array of RGB colors. Needs NumPy.
+        The same array is converted into in place and returned every time, so it is overwritten by the next access.
+        """
+        return self._get_screen().update_rgb()
+
+    def set_observation(self, crop: Optional[tuple[int, int, int, int]] = None, size: Optional[tuple[int, int]] = None,
+                        grayscale: bool = False, stack: int = 1, interpolation: str = "nearest") -> None:
+        """
+        Sets up the observations returned by `.observe()`. Needs NumPy. See `nespy.screen.Observation`.
+
+        Args:
+            crop(tuple): the region of the frame to keep, as (top, bottom, left, right) pixel bounds. None keeps it all
+            size(tuple): (height, width) to shrink the cropped region to, e.g. (84, 84). None keeps the cropped size
+            grayscale(bool): whether observations are one luminance byte per pixel instead of RGB
+            stack(int): number of frames in every observation
+            interpolation(str): "nearest" or "area"
+        """
+        from nespy.screen import Observation
+        self._observation = Observation(self._ppu._framebuffer, crop=crop, size=size, grayscale=grayscale,
+                                        stack=stack, interpolation=interpolation)
+
+    def observe(self) -> "numpy.ndarray":
+        """
+        Adds the last frame drawn to the observation stack set up by `.set_observation(...)`, and returns the stack.
+        The returned array is overwritten by later calls.
+
+        Returns:
+            numpy.ndarray: (stack, height, width) uint8 array in grayscale, or (stack, height, width, 3) in RGB
+        """
+        if self._observation is None:
+            self.set_observation()
+        return self._observation.update()
+
+    def read_audio(self) -> "numpy.ndarray":
         """
-        glutDisplayFunc(self.update_display)
-        glutKeyboardFunc(self.keyboard_handler)
-        glutIdleFunc(self._master_clock.tick)
+        The sound made since the last call. Needs NumPy.
+        Up to a second of sound is kept between calls, anything older is dropped.
 
-        glutMainLoop()
+        Returns:
+            numpy.ndarray: float32 array of mono samples in the range -1 to 1, at 48kHz or at the sample rate of the
+                stream from `.audio_stream(...)`
+        """
+        return self._apu.read_samples()
+
+    def audio_stream(self, sample_rate: int = 48000, capacity: Optional[int] = None) -> "AudioStream":
+        """
+        Starts writing the sound to a ring buffer of 16-bit samples, which an audio device can read from another
+        thread without blocking the emulator. Needs NumPy. See `nespy.audio.AudioStream`.
+        A stream asked for earlier stops getting samples.
+
+        Args:
+            sample_rate(int): samples per second, e.g. 44100 or 48000
+            capacity(int): the most samples the ring buffer holds. a quarter of a second if not given
+
+        Returns:
+            AudioStream: the stream
+        """
+        from nespy.audio import AudioStream
+        stream = AudioStream(sample_rate, capacity)
+        self._apu.set_stream(stream)
+        return stream
+
+    def _get_screen(self):
+        if self._screen is None:
+            # NumPy is only imported by instances that ask for arrays
+            from nespy.screen import Screen
+            self._screen = Screen(self._ppu._framebuffer)
+        return self._screen
+
+    @property
+    def frame(self) -> int:
+        """
+        The number of frames the PPU has finished drawing. A frame is finished when vblank starts.
+        """
+        return self._ppu._frame
+
+    def step_instruction(self) -> int:
+        """
+        Runs a single CPU instruction, catching the PPU up to the start of it first.
+
+        Returns:
+            int: the number of CPU cycles the instruction took
+        """
+        return self._master_clock.step()
+
+    def run_cycles(self, cycles: int) -> None:
+        """
+        Runs whole CPU instructions until at least the given number of CPU cycles have passed.
+
+        Args:
+            cycles(int): number of CPU cycles to run
+        """
+        self._master_clock.run_until(self._master_clock.cycle + cycles * 12)  # CPU clock is master / 12
+
+    def run_frame(self, render: bool = True) -> None:
+        """
+        Runs until the PPU finishes the current frame, i.e. until the next vblank starts.
+
+        Args:
+            render(bool): whether to draw the frame into the framebuffer. frames that aren't drawn are emulated the
+                same way, including sprite 0 hits, but are faster to run.
+                the framebuffer keeps the last frame that was drawn. see also `frameskip`
+        """
+        frame = self._ppu._frame
+        # frames are counted when they finish, so the frame being run is frame + 1
+        self._ppu.render = render and (frame + 1) % (self.frameskip + 1) == 0
+        while self._ppu._frame == frame:
+            self._master_clock.step()
+        self._ppu.render = True
+        if self._rewind is not None:
+            self._rewind.record(self.save_state())
+
+    def enable_rewind(self, memory_budget: int = 16 * 1024 * 1024, keyframe_interval: int = 60) -> None:
+        """
+        Starts recording a save state at the end of every frame run with `.run_frame()`, so `.rewind(...)` can go
+        back to it. See `nespy.rewind.RewindBuffer` for how the states are stored.
+
+        Args:
+            memory_budget(int): maximum number of bytes of compressed save states to keep.
+                16MiB holds several minutes of most games
+            keyframe_interval(int): number of frames between whole save states
+        """
+        if self._cartridge is None:
+            raise InvalidState("Rewinding can't be enabled before a ROM is loaded.")
+        self._rewind = RewindBuffer(memory_budget, keyframe_interval)
+        self._rewind.record(self.save_state())
+
+    def disable_rewind(self) -> None:
+        self._rewind = None
+
+    def rewind(self, frames: int) -> int:
+        """
+        Goes back the given number of frames, as recorded since `.enable_rewind()` was called.
+        Frames after the one being rewound to are discarded.
+
+        Args:
+            frames(int): number of frames to go back
+
+        Returns:
+            int: the number of frames actually gone back, which is less than `frames` if not enough were recorded
+        """
+        if self._rewind is None:
+            raise InvalidState("Rewinding is not enabled.")
+        frames, state = self._rewind.rewind(frames)
+        self.load_state(state)
+        return frames
+
+    def run(self) -> None:
+        """
+        Runs the emulator in the caller's thread until the master clock is stopped.
         """
         self._master_clock.start()
@@ -0,0 +1,163 @@
+"""
+Runs many independent NES instances across a pool of processes, for training agents on batches of environments.
+
+This module needs NumPy, which the emulation core does not depend on.
+"""
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from typing import Optional, Sequence
+
+import numpy
+
+from nespy.nes import NES
+
+
+_SCREEN_WIDTH = 256
+_SCREEN_HEIGHT = 240
+_RAM_SIZE = 0x800
+
+
+def _shared_array(context, shape: tuple[int, ...]) -> tuple[object, numpy.ndarray]:
+    """
+    Allocates a uint8 array in shared memory.
+
+    Returns:
+        tuple: the raw shared buffer, which can be passed to child processes, and a NumPy view of it
+    """
+    buffer = context.RawArray("B", int(numpy.prod(shape)))
+    return buffer, numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(shape)
+
+
+def _worker(connection: Connection, rom: str, indices: list[int], num_instances: int,
+            actions_buffer, ram_buffer, frames_buffer) -> None:
+    """
+    Runs in a child process. Owns the instances in `indices`, and writes their RAM and framebuffers straight into
+    the shared arrays whenever the parent asks for a step.
+    """
+    actions = numpy.frombuffer(actions_buffer, dtype=numpy.uint8).reshape(num_instances, 2)
+    ram = numpy.frombuffer(ram_buffer, dtype=numpy.uint8).reshape(num_instances, _RAM_SIZE)
+    frames = numpy.frombuffer(frames_buffer, dtype=numpy.uint8).reshape(num_instances, _SCREEN_HEIGHT * _SCREEN_WIDTH)
+    instances: dict[int, NES] = {}
+
+    def power_on() -> None:
+        for index in indices:
+            nes = NES(resolution=None, audio=False)
+            nes.load_rom(rom)
+            instances[index] = nes
+            ram[index] = nes.ram
+            frames[index] = nes.framebuffer
+
+    while True:
+        command = connection.recv()
+        try:
+            if command == "step":
+                for index, nes in instances.items():
+                    nes.set_buttons(int(actions[index, 0]), 0)
+                    nes.set_buttons(int(actions[index, 1]), 1)
+                    nes.run_frame()
+                    ram[index] = nes.ram
+                    frames[index] = nes.framebuffer
+            elif command == "reset":
+                power_on()
+            elif command == "close":
+                connection.send(None)
+                break
+            connection.send(None)
+        except Exception as e:
+            connection.send(e)
+    connection.close()
+
+
+class NESPool:
+    """
+    N independent NES instances running the same ROM, spread across a pool of processes.
+
+    Every call to `.step(...)` gives each instance its controller input, runs every instance for one frame in
+    parallel, and returns the RAM and framebuffers of all instances as NumPy arrays.
+    The arrays live in shared memory that the worker processes write into directly, so nothing is copied between
+    processes. The same arrays are returned by every call, and are overwritten by the next step or reset.
+
+    Args:
+        rom(str): path to the ROM every instance runs
+        num_instances(int): number of instances
+        processes(int): number of worker processes. defaults to the number of CPUs, and never exceeds `num_instances`
+    """
+    def __init__(self, rom: str, num_instances: int, processes: Optional[int] = None) -> None:
+        self.num_instances = num_instances
+        context = multiprocessing.get_context()
+        actions_buffer, self._actions = _shared_array(context, (num_instances, 2))
+        ram_buffer, self.ram = _shared_array(context, (num_instances, _RAM_SIZE))
+        frames_buffer, self.frames = _shared_array(context, (num_instances, _SCREEN_HEIGHT, _SCREEN_WIDTH))
+        num_processes = min(processes or os.cpu_count() or 1, num_instances)
+        self._connections: list[Connection] = []
+        self._processes = []
+        for indices in numpy.array_split(numpy.arange(num_instances), num_processes):
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(target=_worker, daemon=True,
+                                      args=(child_connection, rom, [int(index) for index in indices], num_instances,
+                                            actions_buffer, ram_buffer, frames_buffer))
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+        self.reset()
+
+    def reset(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Powers every instance off and on again.
+
+        Returns:
+            tuple: RAM as a (num_instances, 2048) array, and framebuffers as a (num_instances, 240, 256) array
+        """
+        self._broadcast("reset")
+        return self.ram, self.frames
+
+    def step(self, actions: Sequence[int]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Runs every instance for one frame.
+
+        Args:
+            actions: one bitmask of `nespy.enum.Button` values per instance, for player 1.
+                an array of shape (num_instances, 2) sets both players' controllers
+
+        Returns:
+            tuple: RAM as a (num_instances, 2048) array, and framebuffers as a (num_instances, 240, 256) array
+        """
+        actions = numpy.asarray(actions, dtype=numpy.uint8)
+        if actions.ndim == 1:
+            self._actions[:, 0] = actions
+            self._actions[:, 1] = 0
+        else:
+            self._actions[:] = actions
+        self._broadcast("step")
+        return self.ram, self.frames
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        if not self._processes:
+            return
+        self._broadcast("close")
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._connections = []
+
+    def _broadcast(self, command: str) -> None:
+        """
+        Sends a command to every worker, then waits for all of them to finish it.
+        """
+        for connection in self._connections:
+            connection.send(command)
+        errors = [connection.recv() for connection in self._connections]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def __enter__(self) -> "NESPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
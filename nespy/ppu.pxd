@@ -1,6 +1,30 @@
 cdef class PPU:
-    cdef list _cpu_memory
-    cdef list _memory
+    cdef bytearray _registers
+    cdef bytearray _memory
+    cdef bytearray _oam
+    cdef bytearray _framebuffer
+    cdef list _read_pages
+    cdef list _write_pages
+    cdef dict _nametable_layouts
+    cdef public object scanline_hook
+    cdef public object nmi_hook
+    cdef public object pattern_hook
+    cdef public bint render
+    cdef int _v
+    cdef int _t
+    cdef int _x
+    cdef bint _w
+    cdef int _read_buffer
+    cdef int _io_latch
+    cdef int _rendered_x
+    cdef int _line_x
+    cdef int _line_v
+    cdef bytearray _line_sprite_pixels
+    cdef list _line_sprite_xs
+    cdef bytearray _line_pixels
+    cdef list _tiles
+    cdef list _flipped_tiles
+    cdef list _scan_line_events
     cdef dict _sprites
     cdef dict _debug_sprites
     cdef int _scan_line
@@ -8,5 +32,6 @@ cdef class PPU:
     cdef bint _odd_frame
     cdef int _max_cycle_count
     cdef int _max_scan_line
+    cdef long long _frame
 
     #cpdef set_memory(self, location, value)
\ No newline at end of file
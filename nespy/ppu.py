@@ -1,17 +1,90 @@
 # import pyglet
-from nespy.enum import PPURegister
+import struct
+from typing import Callable, Optional
 
-"""
-TODO: clear vblank any time 0x2002 (PPUSTATUS) is read
-"""
+from nespy.enum import Mirroring, NTSCPalette, PPURegister
+
+# scanline, cycle, odd frame flag, frame counter, v, t, fine x, write toggle, PPUDATA read buffer, I/O latch
+_STATE_STRUCT = struct.Struct("<HH?QHHB?BB")
+
+# translation tables from palette indices to each RGB channel of the NTSC palette
+_RED_TABLE = bytes(color[0] for color in NTSCPalette) * 4
+_GREEN_TABLE = bytes(color[1] for color in NTSCPalette) * 4
+_BLUE_TABLE = bytes(color[2] for color in NTSCPalette) * 4
+
+# spreads the 8 bits of a byte out into 8 bytes, most significant bit first. used to decode pattern table rows
+_SPREAD_BITS = tuple(int.from_bytes(bytes(byte >> (7 - bit) & 1 for bit in range(8)), "big") for byte in range(0x100))
+# translation tables from decoded 2-bit tile pixels to the background palette entry for each of the 4 palettes.
+# pixels with value 0 are transparent and map to the backdrop color at entry 0
+_BACKGROUND_PALETTES = tuple(bytes(palette << 2 | value if value else 0 for value in range(4)) + bytes(0xFC)
+                             for palette in range(4))
+# translation tables that mask palette RAM values down to NTSC palette indices, in color and in grayscale
+_COLOR_MASK = bytes(value & 0x3F for value in range(0x100))
+_GRAYSCALE_MASK = bytes(value & 0x30 for value in range(0x100))
 
 
 class PPU:
-    # TODO: rename cpu_memory?
-    def __init__(self, cpu_memory: list[int]) -> None:
-        self._cpu_memory = cpu_memory
+    def __init__(self) -> None:
+        # the eight registers visible to the CPU at 0x2000-0x2007, mirrored up to 0x3FFF
+        self._registers = bytearray(8)
         # TODO: verify PPU startup and reset states
-        self._memory = [0] * 0x4000  # 16KiB of RAM
+        self._memory = bytearray(0x4000)  # 16KiB of RAM. the palette lives at 0x3F00-0x3F1F
+        self._oam = bytearray(0x100)  # 256 bytes of object attribute memory (sprites)
+        self._framebuffer = bytearray(256 * 240)  # one palette index per pixel
+        # the 16KiB address space is split into sixteen 1KiB pages, each mapped to a memoryview window.
+        # the pattern tables at 0x0000-0x1FFF are mapped by the cartridge, and the nametables at 0x2000-0x2FFF
+        # (mirrored at 0x3000-0x3EFF) are mapped according to the current nametable mirroring.
+        # windows that are read-only, such as CHR ROM, have None in the write page table
+        view = memoryview(self._memory)
+        self._read_pages: list[memoryview] = [view[page << 10:(page + 1) << 10] for page in range(0x10)]
+        self._write_pages: list[Optional[memoryview]] = list(self._read_pages)
+        # the console only has 2KiB of nametable memory (0x2000-0x27FF). four-screen cartridges provide another 2KiB
+        nametable_a = view[0x2000:0x2400]
+        nametable_b = view[0x2400:0x2800]
+        self._nametable_layouts = {
+            Mirroring.HORIZONTAL: [nametable_a, nametable_a, nametable_b, nametable_b],
+            Mirroring.VERTICAL: [nametable_a, nametable_b, nametable_a, nametable_b],
+            Mirroring.SINGLE_SCREEN_LOWER: [nametable_a] * 4,
+            Mirroring.SINGLE_SCREEN_UPPER: [nametable_b] * 4,
+            Mirroring.FOUR_SCREEN: [view[page << 10:(page + 1) << 10] for page in range(0x8, 0xC)],
+        }
+        self.set_mirroring(Mirroring.HORIZONTAL)
+        # called once per scanline while rendering is enabled, at the point where the PPU starts fetching sprite
+        # data for the next scanline. cartridges that count scanlines (MMC3) hook in here
+        self.scanline_hook: Optional[Callable[[], None]] = None
+        # called when the PPU's NMI output goes low: when vblank starts with NMIs enabled in PPUCTRL, or when NMIs are
+        # enabled during vblank
+        self.nmi_hook: Optional[Callable[[], None]] = None
+        # called with the address of the high byte of every pattern fetched for drawing. used by MMC2's CHR latches
+        self.pattern_hook: Optional[Callable[[int], None]] = None
+        # whether pixels are drawn into the framebuffer. when False, only the work that the game can observe is
+        # done: sprite 0 hits and sprite overflow are still found, and the framebuffer keeps the last frame drawn
+        self.render = True
+        # the scroll registers. v is the address of the tile being drawn, t is where v is reloaded from,
+        # and x is the fine horizontal scroll. w is the toggle shared by PPUSCROLL and PPUADDR, which is set after
+        # their first write
+        self._v = 0
+        self._t = 0
+        self._x = 0
+        self._w = False
+        self._read_buffer = 0  # reads from PPUDATA return the byte fetched by the previous read
+        self._io_latch = 0  # the last value written to any register, returned by reads of write-only registers
+        # state of the scanline being drawn. pixels before _rendered_x have already been drawn.
+        # the sprite buffer holds the palette entry of the sprite pixel at every X, or 0 if there is none,
+        # along with its priority and whether it belongs to sprite 0
+        self._rendered_x = 0
+        self._line_x = 0
+        self._line_v = 0
+        self._line_sprite_pixels = bytearray(256)
+        self._line_sprite_xs: list[int] = []  # the X coordinates that have a sprite pixel, in order
+        self._line_pixels = bytearray(256)  # palette entries of the scanline being drawn
+        # decoded pattern table tiles. every tile is 64 bytes, one 2-bit pixel per byte, in row-major order.
+        # tiles are decoded the first time they are drawn, and dropped whenever the bytes behind them might change:
+        # when they are written to, or when the cartridge switches CHR banks.
+        # horizontally flipped copies are only made for tiles drawn by flipped sprites
+        self._tiles: list[Optional[bytes]] = [None] * 0x200
+        self._flipped_tiles: list[Optional[bytes]] = [None] * 0x200
+        self._scan_line_events = self._build_scan_line_events()
         self._sprites = {}
         self._debug_sprites = {}
         self._scan_line = 261
@@ -19,10 +92,11 @@ class PPU:
         self._odd_frame = False
         self._max_cycle_count = 340
         self._max_scan_line = 261
+        self._frame = 0  # number of frames completed, counted at the start of each vblank
         self.reset()
 
     def reset(self) -> None:
-        self._memory = [0] * 0x4000  # 16KiB of RAM
+        # the reset button doesn't clear VRAM, and the pattern tables hold the cartridge's CHR data
         self._sprites = {}
         self._debug_sprites = {}
         self._scan_line = 261
@@ -30,14 +104,274 @@ class PPU:
         self._odd_frame = False
         self._max_cycle_count = 340
         self._max_scan_line = 261
-        self._cpu_memory[PPURegister.PPUCTRL] = 0
-        self._cpu_memory[PPURegister.PPUMASK] = 0
-        self._cpu_memory[PPURegister.PPUSTATUS] = 0b10100000
-        self._cpu_memory[PPURegister.PPUSCROLL] = 0
-        self._cpu_memory[PPURegister.PPUDATA] = 0
+        self._rendered_x = 0
+        self._w = False
+        self._read_buffer = 0
+        self._registers[PPURegister.PPUCTRL & 0x7] = 0
+        self._registers[PPURegister.PPUMASK & 0x7] = 0
+        self._registers[PPURegister.PPUSTATUS & 0x7] = 0b10100000
+        self._registers[PPURegister.PPUSCROLL & 0x7] = 0
+        self._registers[PPURegister.PPUDATA & 0x7] = 0
+
+    def save_state(self) -> bytes:
+        """
+        The framebuffer is not included, it is redrawn by the next frame.
+
+        Returns:
+            bytes: the PPU's timing, registers, memory and OAM, packed for a save state
+        """
+        return b"".join((_STATE_STRUCT.pack(self._scan_line, self._cycle, self._odd_frame, self._frame,
+                                            self._v, self._t, self._x, self._w, self._read_buffer, self._io_latch),
+                         self._registers, self._memory, self._oam))
+
+    def load_state(self, state: memoryview, offset: int) -> int:
+        """
+        Args:
+            state(memoryview): a save state
+            offset(int): where the PPU's part of the save state starts
+
+        Returns:
+            int: where the PPU's part of the save state ends
+        """
+        (self._scan_line, self._cycle, self._odd_frame, self._frame, self._v, self._t, self._x,
+         self._w, self._read_buffer, self._io_latch) = _STATE_STRUCT.unpack_from(state, offset)
+        offset += _STATE_STRUCT.size
+        # the scanline being drawn when the state was saved is drawn again from the start.
+        # CHR RAM is restored by the cartridge, so every decoded tile is dropped
+        self._rendered_x = 0
+        self._invalidate_tiles(0, 0x200)
+        self._registers[:] = state[offset:offset + len(self._registers)]
+        offset += len(self._registers)
+        self._memory[:] = state[offset:offset + len(self._memory)]
+        offset += len(self._memory)
+        self._oam[:] = state[offset:offset + len(self._oam)]
+        return offset + len(self._oam)
 
     def set_memory(self, location: int, value: int) -> None:
         self._memory[location] = value
+        if location < 0x2000:
+            self._tiles[location >> 4] = None
+            self._flipped_tiles[location >> 4] = None
+
+    def read_memory(self, address: int) -> int:
+        """
+        Reads from the PPU's address space, through the page table.
+
+        Args:
+            address(int): PPU address to read from
+
+        Returns:
+            int: one byte
+        """
+        address &= 0x3FFF
+        if address >= 0x3F00:
+            return self._memory[0x3F00 | self._palette_index(address)]
+        return self._read_pages[address >> 10][address & 0x3FF]
+
+    def write_memory(self, address: int, value: int) -> None:
+        """
+        Writes to the PPU's address space, through the page table. Writes to read-only memory are ignored.
+
+        Args:
+            address(int): PPU address to write to
+            value(int): one byte
+        """
+        address &= 0x3FFF
+        if address >= 0x3F00:
+            self._memory[0x3F00 | self._palette_index(address)] = value
+            return
+        window = self._write_pages[address >> 10]
+        if window is not None:
+            window[address & 0x3FF] = value
+            if address < 0x2000:
+                self._tiles[address >> 4] = None
+                self._flipped_tiles[address >> 4] = None
+
+    def _palette_index(self, address: int) -> int:
+        """
+        The palette is 32 bytes, mirrored up to 0x3FFF. The first entry of each sprite palette is a mirror of the
+        corresponding entry in the background palettes.
+        """
+        index = address & 0x1F
+        if index & 0x13 == 0x10:
+            index &= 0x0F
+        return index
+
+    def swap_pages(self, address: int, windows: list[memoryview], writable: bool) -> None:
+        """
+        Maps a run of 1KiB windows into the page table, starting at `address`.
+        Used by cartridges for CHR bank switching.
+
+        Args:
+            address(int): first PPU address to map. must be 1KiB-aligned
+            windows(list): 1KiB memoryview windows
+            writable(bool): whether the windows are CHR RAM rather than CHR ROM
+        """
+        page = address >> 10
+        ii = 0
+        while ii < len(windows):
+            # the decoded tiles of a page are only dropped if a different bank is mapped into it
+            if self._read_pages[page + ii] is not windows[ii]:
+                self._invalidate_tiles((page + ii) << 6, (page + ii + 1) << 6)
+            ii += 1
+        self._read_pages[page:page + len(windows)] = windows
+        if writable:
+            self._write_pages[page:page + len(windows)] = windows
+        else:
+            self._write_pages[page:page + len(windows)] = [None] * len(windows)
+
+    def _invalidate_tiles(self, start: int, end: int) -> None:
+        """
+        Drops the decoded tiles from `start` to `end`, which are tile numbers (PPU address / 16).
+        """
+        self._tiles[start:end] = [None] * (end - start)
+        self._flipped_tiles[start:end] = [None] * (end - start)
+
+    def _decode_tile(self, tile: int) -> bytes:
+        """
+        Decodes a tile from the pattern tables, and caches it.
+
+        Args:
+            tile(int): tile number, which is the tile's PPU address / 16
+
+        Returns:
+            bytes: the tile's 8x8 2-bit pixels, one per byte, in row-major order
+        """
+        window = self._read_pages[tile >> 6]
+        offset = (tile & 0x3F) << 4
+        # each row is stored as two bit planes, 8 bytes apart
+        pixels = b"".join([(_SPREAD_BITS[window[offset + row]] | _SPREAD_BITS[window[offset + row + 8]] << 1)
+                           .to_bytes(8, "big") for row in range(8)])
+        self._tiles[tile] = pixels
+        return pixels
+
+    def _decode_flipped_tile(self, tile: int) -> bytes:
+        """
+        Same as `_decode_tile`, but every row of the tile is mirrored horizontally.
+        """
+        pixels = self._tiles[tile]
+        if pixels is None:
+            pixels = self._decode_tile(tile)
+        flipped = b"".join([pixels[row:row + 8][::-1] for row in range(0, 64, 8)])
+        self._flipped_tiles[tile] = flipped
+        return flipped
+
+    def set_mirroring(self, mirroring: int) -> None:
+        """
+        Maps the nametables at 0x2000-0x2FFF, and their mirror at 0x3000-0x3EFF, according to the given arrangement.
+
+        Args:
+            mirroring(int): one of the values in `nespy.enum.Mirroring`
+        """
+        windows = self._nametable_layouts[mirroring]
+        self._read_pages[0x8:0xC] = windows
+        self._read_pages[0xC:0x10] = windows
+        self._write_pages[0x8:0xC] = windows
+        self._write_pages[0xC:0x10] = windows
+
+    def read_register(self, address: int) -> int:
+        """
+        Bus read handler for the PPU registers at 0x2000-0x3FFF.
+
+        Args:
+            address(int): CPU address being read. mirrors of 0x2000-0x2007 are accepted
+
+        Returns:
+            int: the value of the register
+        """
+        self._catch_up_rendering()
+        register = address & 0x7
+        if register == PPURegister.PPUSTATUS & 0x7:
+            status = self._registers[register]
+            # reading the status clears the vblank flag and the write toggle. the low 5 bits aren't driven
+            self._registers[register] = status & 0b01111111
+            self._w = False
+            self._io_latch = status & 0b11100000 | self._io_latch & 0b00011111
+        elif register == PPURegister.OAMDATA & 0x7:
+            self._io_latch = self._oam[self._registers[PPURegister.OAMADDR & 0x7]]
+        elif register == PPURegister.PPUDATA & 0x7:
+            v = self._v & 0x3FFF
+            if v >= 0x3F00:
+                # palette reads aren't buffered, but the nametable byte underneath the palette is put in the buffer
+                self._io_latch = self.read_memory(v)
+                self._read_buffer = self.read_memory(v - 0x1000)
+            else:
+                self._io_latch = self._read_buffer
+                self._read_buffer = self.read_memory(v)
+            self._increment_v()
+        # the other registers are write-only, and read back the last value written to any register
+        return self._io_latch
+
+    def write_register(self, address: int, value: int) -> None:
+        """
+        Bus write handler for the PPU registers at 0x2000-0x3FFF.
+
+        Args:
+            address(int): CPU address being written. mirrors of 0x2000-0x2007 are accepted
+            value(int): one byte
+        """
+        self._catch_up_rendering()
+        self._io_latch = value
+        register = address & 0x7
+        registers = self._registers
+        if register == PPURegister.PPUCTRL & 0x7:
+            # enabling NMIs during vblank raises one straight away
+            if (value & 0b10000000 and not registers[register] & 0b10000000
+                    and registers[PPURegister.PPUSTATUS & 0x7] & 0b10000000 and self.nmi_hook is not None):
+                self.nmi_hook()
+            registers[register] = value
+            # the nametable select bits go into t
+            self._t = (self._t & 0b111001111111111) | (value & 0b11) << 10
+        elif register == PPURegister.PPUMASK & 0x7 or register == PPURegister.OAMADDR & 0x7:
+            registers[register] = value
+        elif register == PPURegister.OAMDATA & 0x7:
+            oam_address = registers[PPURegister.OAMADDR & 0x7]
+            self._oam[oam_address] = value
+            registers[PPURegister.OAMADDR & 0x7] = oam_address + 1 & 0xFF
+        elif register == PPURegister.PPUSCROLL & 0x7:
+            if not self._w:
+                # coarse X into t, fine X straight into x, which moves the rest of the current scanline
+                self._t = (self._t & 0b111111111100000) | value >> 3
+                self._line_x += (value & 0b111) - self._x
+                self._x = value & 0b111
+            else:
+                # fine Y and coarse Y into t
+                self._t = (self._t & 0b000110000011111) | (value & 0b111) << 12 | (value & 0b11111000) << 2
+            self._w = not self._w
+        elif register == PPURegister.PPUADDR & 0x7:
+            if not self._w:
+                # the high 6 bits of the address. bit 14 of t is cleared
+                self._t = (self._t & 0b000000011111111) | (value & 0b00111111) << 8
+            else:
+                self._t = (self._t & 0b111111100000000) | value
+                self._v = self._t
+                if 0 < self._rendered_x < 256:
+                    # the rest of the current scanline is drawn from the new address
+                    self._latch_scroll()
+            self._w = not self._w
+        elif register == PPURegister.PPUDATA & 0x7:
+            self.write_memory(self._v, value)
+            self._increment_v()
+
+    def write_oam(self, data: bytes) -> None:
+        """
+        Copies 256 bytes into OAM, starting at OAMADDR and wrapping around, the way OAM DMA does.
+
+        Args:
+            data(bytes): 256 bytes of sprite attributes
+        """
+        address = self._registers[PPURegister.OAMADDR & 0x7]
+        if address == 0:
+            self._oam[:] = data
+        else:
+            self._oam[address:] = data[:0x100 - address]
+            self._oam[:address] = data[0x100 - address:]
+
+    def _increment_v(self) -> None:
+        """
+        Moves v forward after a PPUDATA access, by 1 or by 32 (one row of tiles) depending on PPUCTRL.
+        """
+        self._v = self._v + (32 if self._registers[PPURegister.PPUCTRL & 0x7] & 0b00000100 else 1) & 0x7FFF
 
     """
     def generate_debug_sprites(self) -> None:
@@ -84,25 +418,328 @@ class PPU:
                 sprite.y += self._nes._debug_window_ppu.height
     """
 
+    def get_rgb_framebuffer(self) -> bytearray:
+        """
+        Converts the framebuffer to RGB using the NTSC palette.
+
+        Returns:
+            bytearray: 256x240 pixels in row-major order, 3 bytes (red, green, blue) per pixel
+        """
+        rgb = bytearray(len(self._framebuffer) * 3)
+        # bytes.translate looks every palette index up in one pass per channel
+        rgb[0::3] = self._framebuffer.translate(_RED_TABLE)
+        rgb[1::3] = self._framebuffer.translate(_GREEN_TABLE)
+        rgb[2::3] = self._framebuffer.translate(_BLUE_TABLE)
+        return rgb
+
     def emulate_cycle(self) -> None:
-        self._tick()
-
-    def _tick(self) -> None:
-        if 0 <= self._scan_line <= 239:
-            pass
-        elif self._scan_line == 240:
-            pass
-        elif self._scan_line == 241 and self._cycle == 1:
+        self.emulate_cycles(1)
+
+    def emulate_cycles(self, count: int) -> None:
+        """
+        Runs the given number of PPU cycles. Used by the master clock to catch the PPU up to the CPU.
+
+        Instead of stepping through every cycle, this jumps straight to the next cycle on the current scanline where
+        something happens (see `_scan_line_events`), so a whole scanline only costs a few steps.
+        Pixels are drawn a scanline at a time, at the end of the visible part of each scanline, or up to the current
+        cycle when a PPU register is accessed in the middle of a scanline.
+        """
+        while count > 0:
+            cycle = self._cycle
+            events = self._scan_line_events[self._scan_line]
+            ii = 0
+            while events[ii] < cycle:
+                ii += 1
+            event = events[ii]
+            if event > cycle:
+                # nothing happens until the next event, or the end of the scanline
+                if event - cycle > count:
+                    self._cycle = cycle + count
+                    return
+                count -= event - cycle
+                self._cycle = event
+            else:
+                self._run_event()
+                self._cycle += 1
+                count -= 1
+            if self._cycle > self._max_cycle_count:
+                self._next_scan_line()
+
+    def _build_scan_line_events(self) -> list[tuple[int, ...]]:
+        """
+        Returns:
+            list: for every scanline, the cycles at which `_run_event` has something to do, in order.
+                every scanline ends with a cycle past the end of the line
+        """
+        visible = (256, 257, 260, 341)
+        vblank_start = (1, 341)
+        idle = (341,)
+        pre_render = (1, 256, 257, 260, 304, 339, 341)
+        return [visible] * 240 + [idle, vblank_start] + [idle] * 19 + [pre_render]
+
+    def _run_event(self) -> None:
+        """
+        Runs the PPU cycle `self._cycle` of `self._scan_line`, which is one of the cycles in `_scan_line_events`.
+        """
+        scan_line = self._scan_line
+        cycle = self._cycle
+        if scan_line <= 239 or scan_line == 261:
+            if scan_line <= 239 and cycle == 256:
+                # the last pixel of the scanline is drawn on cycle 256
+                self._render_pixels(256)
+            if cycle == 1:
+                # unset the vblank, sprite 0 hit, and overflow flags
+                self._registers[PPURegister.PPUSTATUS & 0x7] = 0
+            elif not self._rendering_enabled():
+                return
+            elif cycle == 256:
+                self._increment_y()
+            elif cycle == 257:
+                # copy the horizontal scroll position from t to v
+                self._v = (self._v & 0b111101111100000) | (self._t & 0b000010000011111)
+            elif cycle == 260:
+                if self.scanline_hook is not None:
+                    self.scanline_hook()
+            elif cycle == 304:
+                # copy the vertical scroll position from t to v (happens over cycles 280-304)
+                self._v = (self._v & 0b000010000011111) | (self._t & 0b111101111100000)
+            elif cycle == 339 and self._odd_frame:
+                # the pre-render scanline is one cycle shorter on odd frames while rendering
+                self._cycle = self._max_cycle_count
+        elif scan_line == 241:
             # set the vblank flag
-            self._cpu_memory[PPURegister.PPUSTATUS] |= 0b10000000
-        elif self._scan_line == 261 and self._cycle == 1:
-            # unset the vblank, sprite 0 hit, and overflow flags
-            self._cpu_memory[PPURegister.PPUSTATUS] = 0
-
-        self._cycle += 1
-        if self._cycle > self._max_cycle_count:
-            self._cycle = 0
-            self._scan_line += 1
-            if self._scan_line > self._max_scan_line:
-                self._scan_line = 0
-                self._odd_frame = not self._odd_frame
+            self._registers[PPURegister.PPUSTATUS & 0x7] |= 0b10000000
+            self._frame += 1
+            if self._registers[PPURegister.PPUCTRL & 0x7] & 0b10000000 and self.nmi_hook is not None:
+                self.nmi_hook()
+
+    def _next_scan_line(self) -> None:
+        self._cycle = 0
+        self._rendered_x = 0
+        self._scan_line += 1
+        if self._scan_line > self._max_scan_line:
+            self._scan_line = 0
+            self._odd_frame = not self._odd_frame
+
+    def _rendering_enabled(self) -> bool:
+        # rendering is on if either the background or sprites are being shown
+        return self._registers[PPURegister.PPUMASK & 0x7] & 0b00011000 != 0
+
+    def _increment_y(self) -> None:
+        """
+        Moves v down one pixel, wrapping from the bottom of a nametable to the top of the one below it.
+        """
+        v = self._v
+        if v & 0x7000 != 0x7000:
+            self._v = v + 0x1000  # fine Y
+            return
+        v &= ~0x7000
+        coarse_y = (v & 0x03E0) >> 5
+        if coarse_y == 29:
+            coarse_y = 0
+            v ^= 0x0800  # switch vertical nametable
+        elif coarse_y == 31:
+            coarse_y = 0  # coarse Y can be pointed into the attribute table, and wraps without switching nametables
+        else:
+            coarse_y += 1
+        self._v = (v & ~0x03E0) | (coarse_y << 5)
+
+    def _catch_up_rendering(self) -> None:
+        """
+        Draws the pixels of the current scanline up to the current cycle.
+        Called before a PPU register is accessed, so that a change in the middle of a scanline only affects the pixels
+        after it, and so that sprite 0 hits are visible at the right time.
+        """
+        if self._scan_line <= 239:
+            x = self._cycle - 1
+            if x > self._rendered_x:
+                self._render_pixels(x if x < 256 else 256)
+
+    def _start_scan_line(self) -> None:
+        """
+        Latches the scroll position the current scanline is drawn with, and finds the sprites on it.
+        """
+        self._latch_scroll()
+        self._evaluate_sprites()
+
+    def _latch_scroll(self) -> None:
+        """
+        Latches v as the scroll position the current scanline is drawn with, from the next pixel to be drawn.
+        """
+        v = self._v
+        # horizontal position, in pixels, of the first pixel of the scanline within the two horizontal nametables
+        self._line_x = ((v & 0x0400) >> 2 | (v & 0x001F) << 3) + self._x - self._rendered_x
+        self._line_v = v
+
+    def _evaluate_sprites(self) -> None:
+        """
+        Draws the first 8 sprites that are on the current scanline into the scanline's sprite buffer.
+        """
+        sprite_pixels = self._line_sprite_pixels
+        sprite_xs = self._line_sprite_xs
+        if sprite_xs:
+            sprite_pixels[:] = bytes(len(sprite_pixels))
+            sprite_xs.clear()
+        if not self._registers[PPURegister.PPUMASK & 0x7] & 0b00010000:
+            return
+        # without drawing, only sprite 0 is needed, for sprite 0 hits. the other sprites are only counted.
+        # MMC2 watches every pattern fetch, so everything is fetched as usual for it
+        draw = self.render or self.pattern_hook is not None
+        oam = self._oam
+        ctrl = self._registers[PPURegister.PPUCTRL & 0x7]
+        height = 16 if ctrl & 0b00100000 else 8
+        table = 0x100 if ctrl & 0b00001000 else 0x000
+        pattern_hook = self.pattern_hook
+        # sprites are drawn one scanline below their Y coordinate
+        target = self._scan_line - 1
+        found = 0
+        sprite = 0
+        while sprite < 0x100:
+            row = target - oam[sprite]
+            if 0 <= row < height:
+                if found == 8:
+                    self._registers[PPURegister.PPUSTATUS & 0x7] |= 0b00100000  # sprite overflow
+                    break
+                found += 1
+                if not draw and sprite != 0:
+                    sprite += 4
+                    continue
+                tile = oam[sprite + 1]
+                attributes = oam[sprite + 2]
+                x = oam[sprite + 3]
+                if attributes & 0b10000000:  # vertical flip
+                    row = height - 1 - row
+                if height == 16:
+                    # 8x16 sprites take their pattern table from bit 0 of the tile number
+                    tile = (tile & 1) << 8 | (tile & 0xFE)
+                    if row >= 8:
+                        tile += 1
+                        row -= 8
+                else:
+                    tile |= table
+                if attributes & 0b01000000:  # horizontal flip
+                    pixels = self._flipped_tiles[tile]
+                    if pixels is None:
+                        pixels = self._decode_flipped_tile(tile)
+                else:
+                    pixels = self._tiles[tile]
+                    if pixels is None:
+                        pixels = self._decode_tile(tile)
+                if pattern_hook is not None:
+                    pattern_hook(tile << 4 | row | 8)
+                # bits 0-4 hold the sprite palette entry, bit 6 priority, bit 7 whether this is sprite 0
+                flags = 0b00010000 | (attributes & 0b11) << 2 | (attributes & 0b00100000) << 1
+                if sprite == 0:
+                    flags |= 0b10000000
+                row <<= 3
+                column = 0
+                while column < 8 and x + column < 256:
+                    value = pixels[row + column]
+                    # lower numbered sprites win, even if they're behind the background
+                    if value and not sprite_pixels[x + column]:
+                        sprite_pixels[x + column] = flags | value
+                        sprite_xs.append(x + column)
+                    column += 1
+            sprite += 4
+        sprite_xs.sort()
+
+    def _render_pixels(self, end: int) -> None:
+        """
+        Draws the pixels of the current scanline from where drawing last stopped up to, but not including, `end`.
+        """
+        start = self._rendered_x
+        if start == 0:
+            self._start_scan_line()
+        self._rendered_x = end
+        mask = self._registers[PPURegister.PPUMASK & 0x7]
+        if not self.render and self.pattern_hook is None:
+            # nothing is drawn, but sprite 0 hits still have to be found, which only needs the pixels under sprite 0
+            sprite_xs = self._line_sprite_xs
+            if (mask & 0b00011000 != 0b00011000 or not sprite_xs
+                    or self._registers[PPURegister.PPUSTATUS & 0x7] & 0b01000000):
+                return
+            if start < sprite_xs[0]:
+                start = sprite_xs[0]
+            if end > sprite_xs[-1] + 1:
+                end = sprite_xs[-1] + 1
+            if start < end:
+                self._compose_line(start, end, mask)
+            return
+        memory = self._memory
+        framebuffer = self._framebuffer
+        row = self._scan_line << 8
+        if not mask & 0b00011000:
+            # with rendering off, the backdrop color is drawn
+            framebuffer[row + start:row + end] = bytes((memory[0x3F00] & (0x30 if mask & 1 else 0x3F),)) * (end - start)
+            return
+        self._compose_line(start, end, mask)
+        colors = memory[0x3F00:0x3F20].translate(_GRAYSCALE_MASK if mask & 1 else _COLOR_MASK) + bytes(0xE0)
+        framebuffer[row + start:row + end] = self._line_pixels[start:end].translate(colors)
+
+    def _compose_line(self, start: int, end: int, mask: int) -> None:
+        """
+        Draws the background and sprites of the current scanline from `start` to `end` into the scanline buffer,
+        as palette entries, and sets the sprite 0 hit flag if it happens.
+        """
+        line = self._line_pixels
+        if mask & 0b00001000:
+            self._render_background(start, end)
+            if start < 8 and not mask & 0b00000010:
+                # the background is hidden in the leftmost 8 pixels
+                line[start:min(end, 8)] = bytes(min(end, 8) - start)
+        else:
+            line[start:end] = bytes(end - start)
+        if mask & 0b00010000 and self._line_sprite_xs:
+            sprite_pixels = self._line_sprite_pixels
+            sprites_left = mask & 0b00000100
+            for x in self._line_sprite_xs:
+                if x < start or (x < 8 and not sprites_left):
+                    continue
+                if x >= end:
+                    break
+                sprite = sprite_pixels[x]
+                if line[x]:
+                    if sprite & 0b10000000 and x != 255:
+                        self._registers[PPURegister.PPUSTATUS & 0x7] |= 0b01000000  # sprite 0 hit
+                    if sprite & 0b01000000:
+                        # the sprite is behind the background
+                        continue
+                line[x] = sprite & 0b00011111
+
+    def _render_background(self, start: int, end: int) -> None:
+        """
+        Draws the background of the current scanline from `start` to `end` into the scanline buffer,
+        a tile at a time.
+        """
+        pages = self._read_pages
+        tiles = self._tiles
+        pattern_hook = self.pattern_hook
+        line = self._line_pixels
+        pattern_table = (self._registers[PPURegister.PPUCTRL & 0x7] & 0b00010000) << 4
+        v = self._line_v
+        fine_y = v >> 12
+        coarse_y = (v & 0x03E0) >> 5
+        nametable_y = v & 0x0800
+        line_x = self._line_x
+        x = start
+        while x < end:
+            position = (line_x + x) & 0x1FF
+            column = position >> 3
+            # fetch the tile under this pixel, and its palette from the attribute table
+            nametable = 0x2000 | nametable_y | (position & 0x100) << 2
+            address = nametable | coarse_y << 5 | (column & 0x1F)
+            tile = pattern_table | pages[address >> 10][address & 0x3FF]
+            address = nametable | 0x03C0 | (coarse_y >> 2) << 3 | (column & 0x1F) >> 2
+            palette = pages[address >> 10][address & 0x3FF] >> ((coarse_y & 2) << 1 | (column & 2)) & 0b11
+            pixels = tiles[tile]
+            if pixels is None:
+                pixels = self._decode_tile(tile)
+            if pattern_hook is not None:
+                pattern_hook(tile << 4 | fine_y | 8)
+            # copy the rest of the tile's row, or as much of it as is being drawn
+            offset = fine_y << 3 | (position & 7)
+            count = 8 - (position & 7)
+            if count > end - x:
+                count = end - x
+            line[x:x + count] = pixels[offset:offset + count].translate(_BACKGROUND_PALETTES[palette])
+            x += count
@@ -0,0 +1,112 @@
+import zlib
+from collections import deque
+from typing import Optional
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    """
+    XORs two byte strings of the same length, using Python's arbitrary precision integers to do it in C.
+    """
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+class RewindBuffer:
+    """
+    A ring buffer of save states, one per frame.
+
+    Every `keyframe_interval` frames a whole save state is stored, and every frame in between is stored as the XOR
+    of its save state with the previous frame's, which is almost all zeros. Both are compressed with zlib.
+    Rewinding decompresses one keyframe and at most `keyframe_interval - 1` deltas, no matter how far back it goes.
+
+    When the buffer grows past `memory_budget` bytes, the oldest keyframe and its deltas are dropped.
+
+    Args:
+        memory_budget(int): maximum number of bytes of compressed save states to keep
+        keyframe_interval(int): number of frames between keyframes
+        compression_level(int): zlib compression level. higher levels make the buffer hold more frames
+            in the same budget, but take longer to record every frame
+    """
+    def __init__(self, memory_budget: int = 16 * 1024 * 1024, keyframe_interval: int = 60,
+                 compression_level: int = 1) -> None:
+        self.memory_budget = memory_budget
+        self.keyframe_interval = keyframe_interval
+        self.compression_level = compression_level
+        # every group is a compressed keyframe, followed by the compressed deltas of the frames after it
+        self._groups: deque[list[bytes]] = deque()
+        self._size = 0
+        self._frames = 0
+        self._last_state: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        """
+        The number of frames in the buffer.
+        """
+        return self._frames
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes of compressed save states in the buffer.
+        """
+        return self._size
+
+    def record(self, state: bytes) -> None:
+        """
+        Adds a frame's save state to the buffer.
+
+        Args:
+            state(bytes): save state from `NES.save_state()`
+        """
+        last_state = self._last_state
+        if not self._groups or len(self._groups[-1]) >= self.keyframe_interval or len(state) != len(last_state):
+            entry = zlib.compress(state, self.compression_level)
+            self._groups.append([entry])
+        else:
+            entry = zlib.compress(_xor(state, last_state), self.compression_level)
+            self._groups[-1].append(entry)
+        self._last_state = state
+        self._size += len(entry)
+        self._frames += 1
+        while self._size > self.memory_budget and len(self._groups) > 1:
+            group = self._groups.popleft()
+            self._size -= sum(len(entry) for entry in group)
+            self._frames -= len(group)
+
+    def rewind(self, frames: int) -> tuple[int, bytes]:
+        """
+        Drops the most recent frames from the buffer, and rebuilds the save state of the frame that is now the
+        most recent one. The oldest frame in the buffer is never dropped.
+
+        Args:
+            frames(int): number of frames to go back. 0 rebuilds the most recent frame
+
+        Returns:
+            tuple: the number of frames actually gone back, and the save state
+        """
+        if not self._frames:
+            raise IndexError("The rewind buffer is empty.")
+        frames = max(0, min(frames, self._frames - 1))
+        remaining = frames
+        while remaining >= len(self._groups[-1]):
+            group = self._groups.pop()
+            self._size -= sum(len(entry) for entry in group)
+            remaining -= len(group)
+        group = self._groups[-1]
+        if remaining:
+            self._size -= sum(len(entry) for entry in group[-remaining:])
+            del group[-remaining:]
+        self._frames -= frames
+
+        state = zlib.decompress(group[0])
+        ii = 1
+        while ii < len(group):
+            state = _xor(state, zlib.decompress(group[ii]))
+            ii += 1
+        self._last_state = state
+        return frames, state
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self._size = 0
+        self._frames = 0
+        self._last_state = None
@@ -0,0 +1,96 @@
+import struct
+
+from nespy.enum import ROMFormat
+from nespy.exceptions import InvalidROM
+
+
+# magic number, PRG ROM size, CHR ROM size, flags 6-10, 5 bytes of padding
+_HEADER_STRUCT = struct.Struct("<4s7B5x")
+_HEADER_MAGIC = b"NES\x1a"
+_TRAINER_SIZE = 0x200
+_PRG_BANK_SIZE = 0x4000  # 16KiB
+_CHR_BANK_SIZE = 0x2000  # 8KiB
+
+
+class ROMHeader:
+    """
+    The 16-byte header at the start of an iNES or NES 2.0 ROM file.
+
+    Args:
+        data(bytes): at least the first 16 bytes of the ROM file
+    """
+    SIZE = 16
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < self.SIZE:
+            raise InvalidROM(f"ROM is too short to contain a header: {len(data)} bytes")
+        magic, prg_banks, chr_banks, flags6, flags7, flags8, flags9, flags10 = _HEADER_STRUCT.unpack_from(data)
+        if magic != _HEADER_MAGIC:  # first 4 bytes should be 'NES\x1A'
+            raise InvalidROM(f"Invalid ROM header: {bytes(data[0:self.SIZE])}")
+        self.flags6 = flags6
+        self.flags7 = flags7
+        self.flags8 = flags8
+        self.flags9 = flags9
+        self.flags10 = flags10
+        self.prg_banks = prg_banks
+        self.chr_banks = chr_banks
+
+        # ROM is NES2.0 if 3rd bit of flags7 is set, and 2nd bit is clear
+        if flags7 & 0b1100 == 0b1000:
+            self.format = ROMFormat.INES2_0
+            self.mapper = ((flags6 & 0b11110000) >> 4) | (flags7 & 0b11110000) | ((flags8 & 0b00001111) << 8)
+            # the low nibble of flags9 holds the most significant bits of the ROM sizes
+            self.prg_banks |= (flags9 & 0b00001111) << 8
+            self.chr_banks |= (flags9 & 0b11110000) << 4
+            self.prg_ram_size = 64 << (flags10 & 0b00001111) if flags10 & 0b00001111 else 0
+        else:
+            self.format = ROMFormat.INES
+            self.mapper = ((flags6 & 0b11110000) >> 4) | (flags7 & 0b11110000)
+            self.prg_ram_size = 0x2000 * (flags8 or 1)  # 0 means 8KiB, for compatibility
+
+        self.vertical_mirroring = flags6 & 0b00000001 != 0  # bit 0 of flags6, horizontal mirroring when clear
+        self.has_battery = flags6 & 0b00000010 != 0  # bit 1 of flags6 indicates battery-backed PRG RAM
+        self.has_trainer = flags6 & 0b00000100 != 0  # bit 2 of flags6 indicates whether a trainer is present
+        self.four_screen = flags6 & 0b00001000 != 0  # bit 3 of flags6 ignores the mirroring bit
+
+        self.prg_size = _PRG_BANK_SIZE * self.prg_banks
+        self.chr_size = _CHR_BANK_SIZE * self.chr_banks
+        self.prg_start = self.SIZE + (_TRAINER_SIZE * self.has_trainer)  # trainer comes before PRG ROM
+        self.chr_start = self.prg_start + self.prg_size
+
+
+class ROM:
+    """
+    An iNES or NES 2.0 ROM.
+
+    The whole file is held in one buffer, and `prg` and `chr` are memoryview slices of that buffer,
+    so no ROM data is copied until it is installed into the emulator.
+    If the cartridge uses CHR RAM instead of CHR ROM, `chr` is empty.
+
+    Args:
+        data(bytes): contents of the ROM file
+    """
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.header = ROMHeader(self.data)
+        header = self.header
+        if len(self.data) < header.chr_start + header.chr_size:
+            raise InvalidROM(f"ROM is truncated: header describes {header.chr_start + header.chr_size} bytes, "
+                             f"file has {len(self.data)}")
+        self.trainer = self.data[header.SIZE:header.prg_start]
+        self.prg = self.data[header.prg_start:header.chr_start]
+        self.chr = self.data[header.chr_start:header.chr_start + header.chr_size]
+
+    @classmethod
+    def from_file(cls, path: str) -> "ROM":
+        """
+        Reads a whole ROM file in one go.
+
+        Args:
+            path(str): path to the ROM file
+
+        Returns:
+            ROM: the parsed ROM
+        """
+        with open(path, "rb") as rom_file:
+            return cls(rom_file.read())
@@ -0,0 +1,154 @@
+"""
+NumPy arrays of the PPU's framebuffer, and observations made from it, for consumers such as machine learning
+pipelines.
+
+This module needs NumPy, which the emulation core does not depend on. It is only imported the first time an NES is
+asked for a NumPy frame.
+"""
+from typing import Optional
+
+import numpy
+
+from nespy.enum import NTSCPalette
+
+
+# the NTSC palette as a (64, 3) array, so a whole frame of palette indices is converted to RGB by indexing into it
+NTSC_PALETTE = numpy.array(NTSCPalette, dtype=numpy.uint8)
+# the same palette with every color padded to 4 bytes and read as one uint32. gathering one uint32 per pixel is
+# several times faster than gathering 3 separate bytes
+_NTSC_PALETTE_32 = numpy.pad(NTSC_PALETTE, ((0, 0), (0, 1))).view(numpy.uint32).reshape(64)
+
+
+class Screen:
+    """
+    NumPy views of a PPU framebuffer.
+
+    `.indices` is a (240, 256) view of the framebuffer's palette indices. It shares memory with the framebuffer,
+    so it always holds the last frame drawn and never needs to be updated.
+    `.rgb` is a (240, 256, 3) array of RGB colors that is converted from the palette indices in place by
+    `.update_rgb()`. It is allocated once, so every conversion overwrites the previous one.
+    It is a view of a padded (240, 256, 4) buffer, so it is not C-contiguous.
+
+    Args:
+        framebuffer(bytearray): the PPU's framebuffer, 256x240 palette indices in row-major order
+    """
+    def __init__(self, framebuffer: bytearray) -> None:
+        self.indices = numpy.frombuffer(framebuffer, dtype=numpy.uint8).reshape(240, 256)
+        self._colors = numpy.empty((240, 256), dtype=numpy.uint32)
+        self.rgb = self._colors.view(numpy.uint8).reshape(240, 256, 4)[:, :, :3]
+
+    def update_rgb(self) -> numpy.ndarray:
+        """
+        Converts the framebuffer to RGB with the NTSC palette.
+
+        Returns:
+            numpy.ndarray: `.rgb`
+        """
+        # palette indices are always below 64, so clipping never changes them, and saves numpy a bounds check
+        numpy.take(_NTSC_PALETTE_32, self.indices, out=self._colors, mode="clip")
+        return self.rgb
+
+
+# the luminance of every color in the NTSC palette, for grayscale observations
+NTSC_LUMINANCE = numpy.rint(NTSC_PALETTE @ numpy.array([0.299, 0.587, 0.114])).astype(numpy.uint8)
+# the palette as one row of floats per channel, for averaging RGB observations
+_NTSC_CHANNELS = NTSC_PALETTE.T.astype(numpy.float32)
+
+
+def _area_weights(source: int, target: int) -> numpy.ndarray:
+    """
+    Builds the matrix that shrinks `source` pixels to `target` pixels along one axis, averaging the source pixels
+    that each target pixel covers, weighted by how much of them it covers.
+
+    Returns:
+        numpy.ndarray: a (target, source) float32 matrix
+    """
+    weights = numpy.zeros((target, source), dtype=numpy.float32)
+    scale = source / target
+    for ii in range(target):
+        start = ii * scale
+        end = start + scale
+        jj = int(start)
+        while jj < end and jj < source:
+            weights[ii, jj] = (min(end, jj + 1) - max(start, jj)) / scale
+            jj += 1
+    return weights
+
+
+class Observation:
+    """
+    Turns the framebuffer into observations for reinforcement learning: crops it, shrinks it, optionally converts it
+    to grayscale, and stacks the last few frames.
+
+    Everything is computed from the palette indices, and colors are only looked up for the pixels that end up in the
+    observation, so a full resolution RGB frame is never made. With nearest neighbor sampling the pixels are picked
+    out of the palette indices before their colors are looked up. Area averaging has to look up every pixel in the
+    cropped region, but only as one luminance byte, or as floats for RGB.
+
+    The stack is a ring buffer that holds every frame twice, so the last `stack` frames are always one contiguous
+    slice of it and `.update()` returns them without copying. The returned array is overwritten by later updates.
+
+    Args:
+        framebuffer(bytearray): the PPU's framebuffer, 256x240 palette indices in row-major order
+        crop(tuple): the region of the frame to keep, as (top, bottom, left, right) pixel bounds. None keeps it all
+        size(tuple): (height, width) to shrink the cropped region to. None keeps the cropped size
+        grayscale(bool): whether observations are one luminance byte per pixel instead of RGB
+        stack(int): number of frames in every observation
+        interpolation(str): "nearest" to sample one pixel for every observation pixel, or "area" to average all of
+            the pixels each observation pixel covers
+    """
+    def __init__(self, framebuffer: bytearray, crop: Optional[tuple[int, int, int, int]] = None,
+                 size: Optional[tuple[int, int]] = None, grayscale: bool = False, stack: int = 1,
+                 interpolation: str = "nearest") -> None:
+        if interpolation not in ("nearest", "area"):
+            raise ValueError(f"Unknown interpolation {interpolation}, expected 'nearest' or 'area'.")
+        top, bottom, left, right = crop or (0, 240, 0, 256)
+        self._cropped = numpy.frombuffer(framebuffer, dtype=numpy.uint8).reshape(240, 256)[top:bottom, left:right]
+        height, width = size or self._cropped.shape
+        self.grayscale = grayscale
+        self.stack = stack
+        self._area = interpolation == "area" and (height, width) != self._cropped.shape
+        if self._area:
+            self._row_weights = _area_weights(self._cropped.shape[0], height)
+            self._column_weights = _area_weights(self._cropped.shape[1], width).T
+        else:
+            # the source pixel nearest to the center of every observation pixel
+            self._rows = ((numpy.arange(height) + 0.5) * self._cropped.shape[0] / height).astype(numpy.intp)
+            self._columns = ((numpy.arange(width) + 0.5) * self._cropped.shape[1] / width).astype(numpy.intp)
+        shape = (height, width) if grayscale else (height, width, 3)
+        self._frames = numpy.zeros((2 * stack,) + shape, dtype=numpy.uint8)
+        self._next = 0  # the slot the next frame goes in
+
+    def update(self) -> numpy.ndarray:
+        """
+        Adds the current frame to the stack.
+
+        Returns:
+            numpy.ndarray: the last `stack` frames, oldest first, as a (stack, height, width) array in grayscale,
+                or (stack, height, width, 3) in RGB
+        """
+        frame = self._frames[self._next]
+        if self._area:
+            if self.grayscale:
+                pixels = NTSC_LUMINANCE.take(self._cropped).astype(numpy.float32)
+                frame[...] = numpy.rint(self._row_weights @ pixels @ self._column_weights)
+            else:
+                # one (height, width) plane per channel
+                pixels = _NTSC_CHANNELS.take(self._cropped, axis=1)
+                frame[...] = numpy.rint(self._row_weights @ pixels @ self._column_weights).transpose(1, 2, 0)
+        else:
+            indices = self._cropped.take(self._rows, axis=0).take(self._columns, axis=1)
+            if self.grayscale:
+                NTSC_LUMINANCE.take(indices, out=frame, mode="clip")
+            else:
+                NTSC_PALETTE.take(indices, axis=0, out=frame, mode="clip")
+        self._frames[self._next + self.stack] = frame
+        self._next = (self._next + 1) % self.stack
+        return self._frames[self._next:self._next + self.stack]
+
+    def clear(self) -> None:
+        """
+        Empties the stack, e.g. at the start of an episode. Frames that haven't been added yet are black.
+        """
+        self._frames[:] = 0
+        self._next = 0
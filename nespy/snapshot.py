@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from typing import Optional
+
+from nespy.exceptions import InvalidState
+from nespy.nes import NES
+
+
+class Snapshot:
+    """
+    One node in a tree of save states. A snapshot either holds a whole save state, or only the chunks of the save
+    state that differ from its parent's.
+    """
+    __slots__ = ("parent", "depth", "state", "chunks")
+
+    def __init__(self, parent: Optional["Snapshot"], state: Optional[bytes],
+                 chunks: tuple[tuple[int, bytes], ...]) -> None:
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.state = state  # the whole save state, for snapshots without a parent
+        self.chunks = chunks  # (offset, data) pairs to apply on top of the parent's save state
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes of save state held by this snapshot itself, not counting its parents.
+        """
+        if self.state is not None:
+            return len(self.state)
+        return sum(len(data) for offset, data in self.chunks)
+
+
+class SnapshotStore:
+    """
+    Copy-on-write save states for tree search.
+
+    Every snapshot is taken as a child of the snapshot that was most recently taken or restored, and only stores the
+    chunks of the save state that changed since then. Branches that only touch a few pages of RAM cost a few hundred
+    bytes each, instead of a whole save state.
+
+    Chunks are found by comparing the new save state against the parent's, halving the regions that differ until
+    they are `chunk_size` bytes long, so large unchanged regions (most of VRAM, CHR, PRG RAM) are skipped in a
+    single comparison and the CPU's memory writes don't have to track anything.
+
+    The store keeps at most `capacity` snapshots, dropping the least recently used. A dropped snapshot stays in memory
+    as long as one of its children is still in the store, because children are stored relative to it.
+
+    Args:
+        nes(NES): the emulator to take and restore snapshots of. it must already have a ROM loaded
+        capacity(int): maximum number of snapshots kept in the store
+        chunk_size(int): granularity of the diffs, in bytes
+        max_depth(int): a whole save state is stored instead of a diff once a snapshot has this many ancestors,
+            which bounds the work needed to restore it
+    """
+    def __init__(self, nes: NES, capacity: int = 4096, chunk_size: int = 64, max_depth: int = 32) -> None:
+        self._nes = nes
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        self.max_depth = max_depth
+        self._snapshots: OrderedDict[int, Snapshot] = OrderedDict()
+        self._next_id = 0
+        # the most recently taken or restored snapshot, and its whole save state
+        self._current: Optional[Snapshot] = None
+        self._current_state: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, snapshot_id: int) -> bool:
+        return snapshot_id in self._snapshots
+
+    def snapshot(self) -> int:
+        """
+        Takes a snapshot of the emulator, as a child of the most recently taken or restored snapshot.
+
+        Returns:
+            int: the snapshot's id, to pass to `.restore(...)`
+        """
+        state = self._nes.save_state()
+        parent = self._current
+        if parent is None or parent.depth + 1 >= self.max_depth or len(state) != len(self._current_state):
+            snapshot = Snapshot(None, state, ())
+        else:
+            chunks: list[tuple[int, bytes]] = []
+            self._diff(self._current_state, state, 0, len(state), chunks)
+            snapshot = Snapshot(parent, None, tuple(chunks))
+        self._current = snapshot
+        self._current_state = state
+        snapshot_id = self._next_id
+        self._next_id += 1
+        self._snapshots[snapshot_id] = snapshot
+        if len(self._snapshots) > self.capacity:
+            self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def restore(self, snapshot_id: int) -> None:
+        """
+        Restores the emulator to a snapshot. The next snapshot taken will be a child of this one.
+
+        Args:
+            snapshot_id(int): id returned by `.snapshot()`
+        """
+        snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise InvalidState(f"Snapshot {snapshot_id} is not in the store.")
+        self._snapshots.move_to_end(snapshot_id)
+        state = self._build_state(snapshot)
+        self._nes.load_state(state)
+        self._current = snapshot
+        self._current_state = state
+
+    def discard(self, snapshot_id: int) -> None:
+        """
+        Removes a snapshot from the store, e.g. when its branch of the search is pruned.
+
+        Args:
+            snapshot_id(int): id returned by `.snapshot()`
+        """
+        self._snapshots.pop(snapshot_id, None)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._current = None
+        self._current_state = None
+
+    def _build_state(self, snapshot: Snapshot) -> bytes:
+        """
+        Rebuilds the whole save state of a snapshot by applying the chunks of every snapshot on the way down from
+        its nearest ancestor that holds a whole save state, or from the current snapshot if it is on the way.
+        """
+        path = []
+        node = snapshot
+        while node.state is None and node is not self._current:
+            path.append(node)
+            node = node.parent
+        if not path:
+            return node.state if node.state is not None else self._current_state
+        state = bytearray(node.state if node.state is not None else self._current_state)
+        for node in reversed(path):
+            for offset, data in node.chunks:
+                state[offset:offset + len(data)] = data
+        return bytes(state)
+
+    def _diff(self, old: bytes, new: bytes, start: int, end: int, chunks: list[tuple[int, bytes]]) -> None:
+        """
+        Appends the chunks of `new[start:end]` that differ from `old` to `chunks`, in order.
+        """
+        # comparing bytes objects is a memcmp, comparing memoryviews goes byte by byte
+        if old[start:end] == new[start:end]:
+            return
+        if end - start <= self.chunk_size:
+            chunks.append((start, new[start:end]))
+            return
+        middle = start + ((end - start) // 2 + self.chunk_size - 1) // self.chunk_size * self.chunk_size
+        self._diff(old, new, start, middle, chunks)
+        self._diff(old, new, middle, end, chunks)
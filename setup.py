@@ -3,8 +3,8 @@ from Cython.Build import cythonize
 
 
 # python3 setup.py build_ext --inplace
-# cythonize -3 -a -i .\nespy\util.py .\nespy\cpu.py .\nespy\ppu.py .\nespy\clock.py .\nespy\nes.py .\nespy\apu.py .\nespy\enum.py
-setup(ext_modules=cythonize(['nespy/nes.py', 'nespy/apu.py', 'nespy/clock.py',
-                             'nespy/cpu.py', 'nespy/ppu.py', 'nespy/enum.py',
-                             'nespy/util.py', 'nespy/exceptions.py'],
+# cythonize -3 -a -i .\nespy\util.py .\nespy\cpu.py .\nespy\ppu.py .\nespy\clock.py .\nespy\controller.py .\nespy\nes.py .\nespy\apu.py .\nespy\enum.py .\nespy\bus.py .\nespy\interrupt.py
+setup(ext_modules=cythonize(['nespy/nes.py', 'nespy/apu.py', 'nespy/bus.py', 'nespy/clock.py',
+                             'nespy/controller.py', 'nespy/cpu.py', 'nespy/interrupt.py', 'nespy/ppu.py',
+                             'nespy/enum.py', 'nespy/util.py', 'nespy/exceptions.py'],
                             language_level='3', annotate=True))
@@ -0,0 +1,71 @@
+from typing import Callable
+
+import pytest
+
+from nespy.nes import NES
+
+
+PRG_BANK_SIZE = 0x4000  # PRG ROM is counted in 16KiB banks, a ROM with one bank mirrors it at 0x8000 and 0xC000
+CHR_BANK_SIZE = 0x2000  # CHR ROM is counted in 8KiB banks
+NMI_HANDLER = 0xFE00
+IRQ_HANDLER = 0xFF00
+
+RTI = 0x40
+
+
+def build_rom(code: bytes, origin: int = 0x8000, nmi: bytes = bytes([RTI]), irq: bytes = bytes([RTI]), mapper: int = 0,
+              prg_banks: int = 1, chr_banks: int = 1) -> bytes:
+    """
+    Builds an iNES image. The program, the interrupt handlers and the vectors go in the last 16KiB bank of PRG ROM,
+    which every supported mapper except AxROM maps at 0xC000 at power on.
+
+    Every 8KiB of PRG ROM and every 1KiB of CHR ROM starts with its number, counting from 0, so tests can tell which
+    banks are mapped where. The program and the handlers are written over those numbers.
+
+    Args:
+        code(bytes): the program run after reset
+        origin(int): the address the program is placed at. with more than one PRG bank, it must be 0xC000 or above
+        nmi(bytes): the NMI handler, at `NMI_HANDLER`
+        irq(bytes): the IRQ/BRK handler, at `IRQ_HANDLER`
+        mapper(int): one of the values in `nespy.enum.Mapper`
+        prg_banks(int): number of 16KiB PRG ROM banks
+        chr_banks(int): number of 8KiB CHR ROM banks. 0 gives the cartridge 8KiB of CHR RAM instead
+
+    Returns:
+        bytes: the iNES file
+    """
+    prg = bytearray(PRG_BANK_SIZE * prg_banks)
+    prg[::0x2000] = bytes(range(len(prg) // 0x2000))
+    chr_rom = bytearray(CHR_BANK_SIZE * chr_banks)
+    chr_rom[::0x400] = bytes(range(len(chr_rom) // 0x400))
+    last_bank = PRG_BANK_SIZE * (prg_banks - 1)
+    for address, data in ((origin, code), (NMI_HANDLER, nmi), (IRQ_HANDLER, irq)):
+        offset = last_bank + (address & 0x3FFF)
+        prg[offset:offset + len(data)] = data
+    # the NMI, reset and IRQ vectors
+    prg[-6:] = bytes([NMI_HANDLER & 0xFF, NMI_HANDLER >> 8, origin & 0xFF, origin >> 8,
+                      IRQ_HANDLER & 0xFF, IRQ_HANDLER >> 8])
+    header = b"NES\x1a" + bytes([prg_banks, chr_banks, (mapper & 0x0F) << 4, mapper & 0xF0]) + bytes(8)
+    return header + bytes(prg) + bytes(chr_rom)
+
+
+@pytest.fixture
+def make_nes(tmp_path) -> Callable[..., NES]:
+    """
+    Returns:
+        callable: takes the arguments of `build_rom`, plus keyword arguments for `NES`, and returns an NES that has
+            just been reset into the program
+    """
+    roms = []
+
+    def make(code: bytes, origin: int = 0x8000, nmi: bytes = bytes([RTI]), irq: bytes = bytes([RTI]), mapper: int = 0,
+             prg_banks: int = 1, chr_banks: int = 1, **kwargs) -> NES:
+        path = tmp_path / f"test{len(roms)}.nes"
+        path.write_bytes(build_rom(code, origin, nmi, irq, mapper, prg_banks, chr_banks))
+        roms.append(path)
+        kwargs.setdefault("audio", False)
+        nes = NES(resolution=None, **kwargs)
+        nes.load_rom(str(path))
+        return nes
+
+    return make
@@ -0,0 +1,159 @@
+import pytest
+
+from nespy.apu import APU, LENGTH_TABLE
+from nespy.enum import IRQSource
+from nespy.interrupt import InterruptLines
+
+
+STATUS = 0x4015
+FRAME_COUNTER = 0x4017
+# each channel's register with the halt flag, its length counter load register, its halt bit, and its status bit
+CHANNELS = [
+    (0x4000, 0x4003, 0x20, 0x01),  # pulse 1
+    (0x4004, 0x4007, 0x20, 0x02),  # pulse 2
+    (0x4008, 0x400B, 0x80, 0x04),  # triangle
+    (0x400C, 0x400F, 0x20, 0x08),  # noise
+]
+FRAME_INTERRUPT = 0x40
+# CPU cycles from the start of the frame counter's 4-step sequence to its interrupt, and to its two half frames
+FRAME_INTERRUPT_CYCLE = 29829
+HALF_FRAME_CYCLES = (14913, 29829)
+
+
+@pytest.fixture
+def interrupts():
+    return InterruptLines()
+
+
+@pytest.fixture(params=[False, True], ids=["silent", "audio"])
+def apu(request, interrupts):
+    if request.param:
+        pytest.importorskip("numpy")
+    return APU(interrupts, audio=request.param)
+
+
+def frame_irq(interrupts: InterruptLines) -> bool:
+    return bool(interrupts.irq & IRQSource.FRAME_COUNTER)
+
+
+def test_frame_interrupt(apu, interrupts):
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE - 1)
+    assert not frame_irq(interrupts)
+    apu.emulate_cycles(1)
+    assert frame_irq(interrupts)
+
+
+def test_status_read_clears_frame_interrupt(apu, interrupts):
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE)
+    assert apu.read_register(STATUS) & FRAME_INTERRUPT
+    assert not frame_irq(interrupts)
+    assert not apu.read_register(STATUS) & FRAME_INTERRUPT
+
+
+@pytest.mark.parametrize("value", [0x40, 0xC0])
+def test_no_frame_interrupt_when_inhibited(apu, interrupts, value):
+    apu.write_register(FRAME_COUNTER, value)
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE * 3)
+    assert not frame_irq(interrupts)
+    assert not apu.read_register(STATUS) & FRAME_INTERRUPT
+
+
+def test_no_frame_interrupt_in_five_step_mode(apu, interrupts):
+    apu.write_register(FRAME_COUNTER, 0x80)
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE * 3)
+    assert not frame_irq(interrupts)
+
+
+def test_inhibiting_clears_frame_interrupt(apu, interrupts):
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE)
+    assert frame_irq(interrupts)
+    apu.write_register(FRAME_COUNTER, 0x40)
+    assert not frame_irq(interrupts)
+    assert not apu.read_register(STATUS) & FRAME_INTERRUPT
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_length_counter_follows_enable(apu, channel):
+    halt_register, length_register, halt_bit, status_bit = channel
+    apu.write_register(STATUS, status_bit)
+    apu.write_register(length_register, 0x08)  # the longest length, 254
+    assert apu.read_register(STATUS) & status_bit
+    # disabling a channel clears its length counter straight away
+    apu.write_register(STATUS, 0)
+    assert not apu.read_register(STATUS) & status_bit
+    # and lengths aren't loaded while it is disabled
+    apu.write_register(length_register, 0x08)
+    assert not apu.read_register(STATUS) & status_bit
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_length_counter_counts_down(apu, channel):
+    halt_register, length_register, halt_bit, status_bit = channel
+    assert LENGTH_TABLE[3] == 2
+    apu.write_register(STATUS, 0x0F)
+    apu.write_register(length_register, 3 << 3)
+    apu.emulate_cycles(HALF_FRAME_CYCLES[0])
+    assert apu.read_register(STATUS) & status_bit
+    apu.emulate_cycles(HALF_FRAME_CYCLES[1] - HALF_FRAME_CYCLES[0])
+    assert not apu.read_register(STATUS) & status_bit
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_length_counter_halted(apu, channel):
+    halt_register, length_register, halt_bit, status_bit = channel
+    apu.write_register(STATUS, 0x0F)
+    apu.write_register(halt_register, halt_bit)
+    apu.write_register(length_register, 3 << 3)
+    apu.emulate_cycles(FRAME_INTERRUPT_CYCLE * 3)
+    assert apu.read_register(STATUS) & status_bit
+
+
+# sets the channels' length counters going, and plays a DMC sample with its interrupt enabled alongside the frame
+# interrupt. then logs $4015 to 0x0300 in a loop, with X counting the iterations, so the log depends on exactly when
+# the DMC's memory reads stall the CPU. the IRQ handler logs $4015 and X to 0x0400 and 0x0500, and restarts the sample
+TIMING_PROGRAM = bytes([
+    0xA9, 0x00, 0x8D, 0x17, 0x40,  # LDA #$00, STA $4017: 4-step sequence, with its interrupt
+    0xA9, 0x8F, 0x8D, 0x10, 0x40,  # LDA #$8F, STA $4010: DMC interrupt, fastest rate
+    0xA9, 0x00, 0x8D, 0x12, 0x40,  # LDA #$00, STA $4012: sample at 0xC000
+    0xA9, 0x01, 0x8D, 0x13, 0x40,  # LDA #$01, STA $4013: 17 bytes long
+    0xA9, 0x1F, 0x8D, 0x15, 0x40,  # LDA #$1F, STA $4015: every channel on
+    0xA9, 0x18, 0x8D, 0x03, 0x40,  # LDA #$18, STA $4003: pulse 1 length 2
+    0xA9, 0xF8, 0x8D, 0x07, 0x40,  # LDA #$F8, STA $4007: pulse 2 length 30
+    0xA9, 0x48, 0x8D, 0x0B, 0x40,  # LDA #$48, STA $400B: triangle length 8
+    0xA9, 0x28, 0x8D, 0x0F, 0x40,  # LDA #$28, STA $400F: noise length 4
+    0x58,  # CLI
+    0xAD, 0x15, 0x40,  # 0x802E LDA $4015
+    0x9D, 0x00, 0x03,  # STA $0300,X
+    0xE8,  # INX
+    0x4C, 0x2E, 0x80,  # JMP $802E
+])
+TIMING_IRQ = bytes([
+    0x48,  # PHA
+    0xAD, 0x15, 0x40,  # LDA $4015
+    0xA4, 0x20,  # LDY $20
+    0x99, 0x00, 0x04,  # STA $0400,Y
+    0x8A,  # TXA
+    0x99, 0x00, 0x05,  # STA $0500,Y
+    0xE6, 0x20,  # INC $20
+    0xA9, 0x1F, 0x8D, 0x15, 0x40,  # LDA #$1F, STA $4015: restarts the sample, and acknowledges its interrupt
+    0x68,  # PLA
+    0x40,  # RTI
+])
+
+
+def test_timing_matches_without_audio(make_nes):
+    pytest.importorskip("numpy")
+    silent = make_nes(TIMING_PROGRAM, irq=TIMING_IRQ, audio=False)
+    audio = make_nes(TIMING_PROGRAM, irq=TIMING_IRQ, audio=True)
+    statuses = set()
+    for ii in range(10):
+        silent.run_frame()
+        audio.run_frame()
+        assert bytes(silent.ram) == bytes(audio.ram)
+        statuses.update(silent.ram[0x0300:0x0400])
+    # the channels' length counters ran out at different times, and both kinds of interrupt were taken
+    assert len(statuses) > 2
+    interrupts = silent.ram[0x20]
+    assert interrupts > 10
+    assert any(status & 0x80 for status in silent.ram[0x0400:0x0400 + interrupts])
+    assert any(status & 0x40 for status in silent.ram[0x0400:0x0400 + interrupts])
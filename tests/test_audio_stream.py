@@ -0,0 +1,88 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from nespy.audio import AudioStream, Synthesizer, dynamic_rate_control
+
+
+def ramp(start: int, count: int) -> numpy.ndarray:
+    """
+    Samples that are all different, and exact in both float and 16-bit.
+    """
+    return numpy.arange(start, start + count) / 1024
+
+
+def as_int16(samples: numpy.ndarray) -> list[int]:
+    return [int(sample * 1024) * 32767 // 1024 for sample in samples]
+
+
+def test_scaling():
+    stream = AudioStream(capacity=8)
+    stream.write(numpy.array([0.0, 0.5, -0.5, 1.0, -1.0, 2.0, -2.0]))
+    assert stream.read().tolist() == [0, 16383, -16383, 32767, -32767, 32767, -32768]
+
+
+def test_wrap_around():
+    stream = AudioStream(capacity=8)
+    stream.write(ramp(0, 5))
+    assert stream.read(5).tolist() == as_int16(ramp(0, 5))
+    # the next writes and reads go past the end of the buffer and carry on from its start
+    for start in (5, 11, 17):
+        stream.write(ramp(start, 6))
+        assert stream.available == 6
+        assert stream.fill == 6 / 8
+        assert stream.read(4).tolist() == as_int16(ramp(start, 4))
+        assert stream.read(2).tolist() == as_int16(ramp(start + 4, 2))
+        assert stream.available == 0
+    assert stream.overruns == 0
+    assert stream.underruns == 0
+
+
+def test_overrun():
+    stream = AudioStream(capacity=8)
+    stream.write(ramp(0, 5))
+    stream.write(ramp(5, 5))
+    # the samples that don't fit are dropped
+    assert stream.overruns == 2
+    assert stream.available == 8
+    stream.write(ramp(10, 1))
+    assert stream.overruns == 3
+    assert stream.read().tolist() == as_int16(ramp(0, 8))
+    stream.write(ramp(10, 3))
+    assert stream.read().tolist() == as_int16(ramp(10, 3))
+    assert stream.overruns == 3
+
+
+def test_underrun():
+    stream = AudioStream(capacity=8)
+    # nothing has been read yet, so silence is made up
+    assert stream.read(2).tolist() == [0, 0]
+    assert stream.underruns == 2
+    stream.write(ramp(1, 3))
+    # the rest is made up by repeating the last sample read
+    assert stream.read(5).tolist() == as_int16(ramp(1, 3)) + as_int16(ramp(3, 1)) * 2
+    assert stream.underruns == 4
+    assert stream.read(1).tolist() == as_int16(ramp(3, 1))
+    assert stream.underruns == 5
+    assert stream.available == 0
+
+
+@pytest.mark.parametrize("written, ratio", [(0, 1.01), (25, 1.005), (50, 1.0), (75, 0.995), (100, 0.99)])
+def test_dynamic_rate_control(written, ratio):
+    stream = AudioStream(capacity=100)
+    stream.rate_control = dynamic_rate_control(0.01)
+    assert stream.ratio == 1.0
+    # the ratio is updated after every write
+    stream.write(ramp(0, written))
+    assert stream.ratio == pytest.approx(ratio)
+
+
+def test_ratio_changes_sample_count():
+    # a second of CPU cycles makes a second of samples, times the ratio. the fraction of a sample left over goes in
+    # the next block
+    for ratio in (1.0, 1.005, 0.995):
+        synthesizer = Synthesizer(1789773, 48000)
+        synthesizer.stream = AudioStream(capacity=96000)
+        synthesizer.stream.ratio = ratio
+        synthesizer.end_block(1789773)
+        assert synthesizer.stream.available == pytest.approx(48000 * ratio, abs=1)
@@ -0,0 +1,393 @@
+import pytest
+
+from conftest import build_rom
+from nespy.bus import Bus
+from nespy.cartridge import CARTRIDGES, Cartridge
+from nespy.enum import IRQSource, Mapper
+from nespy.interrupt import InterruptLines
+from nespy.ppu import PPU
+from nespy.rom import ROM
+
+
+PRG_BANKS = 8  # 128KiB, sixteen 8KiB banks
+CHR_BANKS = 4  # 32KiB, thirty-two 1KiB banks
+
+
+class Console:
+    """
+    The parts of the console a cartridge plugs into.
+    """
+    def __init__(self, mapper: int, prg_banks: int = PRG_BANKS, chr_banks: int = CHR_BANKS) -> None:
+        self.rom = ROM(build_rom(b"", 0xC000, mapper=mapper, prg_banks=prg_banks, chr_banks=chr_banks))
+        self.bus = Bus()
+        self.ppu = PPU()
+        self.interrupts = InterruptLines()
+        self.cartridge: Cartridge = CARTRIDGES[mapper](self.rom)
+        self.cartridge.connect(self.bus, self.ppu, self.interrupts)
+
+    def prg(self) -> tuple[int, ...]:
+        """
+        The 8KiB PRG banks mapped at 0x8000, 0xA000, 0xC000 and 0xE000.
+        """
+        return tuple(self.bus.peek(address) for address in range(0x8000, 0x10000, 0x2000))
+
+    def chr(self) -> tuple[int, ...]:
+        """
+        The 1KiB CHR banks mapped at 0x0000-0x1FFF.
+        """
+        return tuple(self.ppu.read_memory(address) for address in range(0x0000, 0x2000, 0x400))
+
+    def nametables(self) -> tuple[int, ...]:
+        """
+        Which of the four nametables share memory with each other, as the number of the first nametable each one
+        is the same as.
+        """
+        addresses = range(0x2000, 0x3000, 0x400)
+        for address in addresses:
+            self.ppu.write_memory(address, 0)
+        shared = []
+        for address in addresses:
+            self.ppu.write_memory(address, 0xFF)
+            shared.append(next(ii for ii, other in enumerate(addresses) if self.ppu.read_memory(other)))
+            self.ppu.write_memory(address, 0)
+        return tuple(shared)
+
+
+HORIZONTAL = (0, 0, 2, 2)
+VERTICAL = (0, 1, 0, 1)
+SINGLE_SCREEN = (0, 0, 0, 0)
+
+
+def mmc1_write(console: Console, address: int, value: int) -> None:
+    # MMC1 registers are written one bit at a time, lowest bit first
+    for ii in range(5):
+        console.bus.write(address, value >> ii & 1)
+
+
+def test_nrom():
+    console = Console(Mapper.NROM, prg_banks=1, chr_banks=1)
+    assert console.prg() == (0, 1, 0, 1)
+    assert console.chr() == tuple(range(8))
+    assert console.nametables() == HORIZONTAL
+    # writes to PRG ROM are ignored
+    console.bus.write(0x8000, 0x55)
+    assert console.bus.peek(0x8000) == 0
+
+
+def test_mmc1_shift_register():
+    console = Console(Mapper.MMC1)
+    # nothing changes until the 5th bit is written
+    for bit in (0, 1, 0, 0):
+        console.bus.write(0xE000, bit)
+        assert console.prg()[:2] == (0, 1)
+    console.bus.write(0xE000, 0)
+    assert console.prg()[:2] == (4, 5)
+    # a write with bit 7 set throws away the bits written so far
+    console.bus.write(0xE000, 1)
+    console.bus.write(0xE000, 1)
+    console.bus.write(0xE000, 0x80)
+    mmc1_write(console, 0xE000, 3)
+    assert console.prg()[:2] == (6, 7)
+
+
+def test_mmc1_prg_modes():
+    console = Console(Mapper.MMC1)
+    # mode 3 at power on: 16KiB switched at 0x8000, the last bank fixed at 0xC000
+    assert console.prg() == (0, 1, 14, 15)
+    mmc1_write(console, 0xE000, 2)
+    assert console.prg() == (4, 5, 14, 15)
+    # mode 2: the first bank fixed at 0x8000, 16KiB switched at 0xC000
+    mmc1_write(console, 0x8000, 0b01000)
+    assert console.prg() == (0, 1, 4, 5)
+    # modes 0 and 1: 32KiB switched at once, ignoring the low bit of the bank number
+    mmc1_write(console, 0x8000, 0b00000)
+    assert console.prg() == (4, 5, 6, 7)
+    mmc1_write(console, 0xE000, 3)
+    assert console.prg() == (4, 5, 6, 7)
+    # writing bit 7 goes back to mode 3
+    console.bus.write(0x8000, 0x80)
+    assert console.prg() == (6, 7, 14, 15)
+
+
+def test_mmc1_chr_modes():
+    console = Console(Mapper.MMC1)
+    # 8KiB mode, ignoring the low bit of the bank number
+    mmc1_write(console, 0xA000, 3)
+    assert console.chr() == tuple(range(8, 16))
+    # two 4KiB banks
+    mmc1_write(console, 0x8000, 0b11100)
+    mmc1_write(console, 0xC000, 5)
+    assert console.chr() == (12, 13, 14, 15, 20, 21, 22, 23)
+
+
+@pytest.mark.parametrize("control, nametables", [
+    (0b00, SINGLE_SCREEN), (0b01, SINGLE_SCREEN), (0b10, VERTICAL), (0b11, HORIZONTAL),
+])
+def test_mmc1_mirroring(control, nametables):
+    console = Console(Mapper.MMC1)
+    mmc1_write(console, 0x8000, 0b01100 | control)
+    assert console.nametables() == nametables
+
+
+def test_mmc1_single_screen_nametables():
+    console = Console(Mapper.MMC1)
+    mmc1_write(console, 0x8000, 0b01100)
+    console.ppu.write_memory(0x2000, 0x11)
+    mmc1_write(console, 0x8000, 0b01101)
+    console.ppu.write_memory(0x2000, 0x22)
+    mmc1_write(console, 0x8000, 0b01100)
+    assert console.ppu.read_memory(0x2C00) == 0x11
+    mmc1_write(console, 0x8000, 0b01101)
+    assert console.ppu.read_memory(0x2C00) == 0x22
+
+
+def test_uxrom():
+    console = Console(Mapper.UXROM, chr_banks=0)
+    assert console.prg() == (0, 1, 14, 15)
+    console.bus.write(0x8000, 3)
+    assert console.prg() == (6, 7, 14, 15)
+    # CHR RAM
+    console.ppu.write_memory(0x1234, 0x56)
+    assert console.ppu.read_memory(0x1234) == 0x56
+
+
+def test_cnrom():
+    console = Console(Mapper.CNROM, prg_banks=2)
+    assert console.prg() == (0, 1, 2, 3)
+    console.bus.write(0x8000, 2)
+    assert console.chr() == tuple(range(16, 24))
+    # CHR ROM can't be written
+    console.ppu.write_memory(0x0000, 0x56)
+    assert console.ppu.read_memory(0x0000) == 16
+
+
+def select_mmc3_banks(console: Console, bank_select: int, banks: list[int]) -> None:
+    for register, bank in enumerate(banks):
+        console.bus.write(0x8000, bank_select | register)
+        console.bus.write(0x8001, bank)
+
+
+def test_mmc3_banks():
+    console = Console(Mapper.MMC3)
+    # R0 and R1 switch 2KiB of CHR and ignore their low bit, R2-R5 switch 1KiB, R6 and R7 switch 8KiB of PRG
+    select_mmc3_banks(console, 0, [9, 10, 20, 21, 22, 23, 3, 5])
+    assert console.prg() == (3, 5, 14, 15)
+    assert console.chr() == (8, 9, 10, 11, 20, 21, 22, 23)
+    # bit 6 swaps the bank at 0x8000 with the fixed second-to-last bank at 0xC000
+    console.bus.write(0x8000, 0x40)
+    assert console.prg() == (14, 5, 3, 15)
+    # bit 7 swaps the 2KiB CHR banks with the 1KiB ones
+    console.bus.write(0x8000, 0x80)
+    assert console.prg() == (3, 5, 14, 15)
+    assert console.chr() == (20, 21, 22, 23, 8, 9, 10, 11)
+    # the registers are mirrored across 0x8000-0x9FFF, by whether the address is even or odd
+    console.bus.write(0x9FFE, 7)
+    console.bus.write(0x9FFF, 9)
+    assert console.prg() == (3, 9, 14, 15)
+
+
+def test_mmc3_mirroring():
+    console = Console(Mapper.MMC3)
+    console.bus.write(0xA000, 0)
+    assert console.nametables() == VERTICAL
+    console.bus.write(0xBFFE, 1)
+    assert console.nametables() == HORIZONTAL
+
+
+def cartridge_irq(console: Console) -> bool:
+    return bool(console.interrupts.irq & IRQSource.CARTRIDGE)
+
+
+def test_mmc3_irq_counter():
+    console = Console(Mapper.MMC3)
+    console.bus.write(0xC000, 3)  # latch
+    console.bus.write(0xC001, 0)  # reload
+    console.bus.write(0xE001, 0)  # enable
+    # the first scanline reloads the counter from the latch, then it counts down to 0
+    for ii in range(3):
+        console.cartridge.clock_scanline()
+        assert not cartridge_irq(console)
+    console.cartridge.clock_scanline()
+    assert cartridge_irq(console)
+    # the IRQ is held until it is acknowledged by disabling IRQs
+    console.cartridge.clock_scanline()
+    assert cartridge_irq(console)
+    console.bus.write(0xE000, 0)
+    assert not cartridge_irq(console)
+    # the counter reloads on the scanline after it reached 0, and while IRQs are disabled it never raises one
+    for ii in range(8):
+        console.cartridge.clock_scanline()
+    assert not cartridge_irq(console)
+    # after a reload, the next scanline reloads from the latch again instead of counting down
+    console.bus.write(0xE001, 0)
+    console.bus.write(0xC000, 1)
+    console.bus.write(0xC001, 0)
+    console.cartridge.clock_scanline()
+    assert not cartridge_irq(console)
+    console.cartridge.clock_scanline()
+    assert cartridge_irq(console)
+
+
+def test_mmc3_clocked_by_rendering():
+    console = Console(Mapper.MMC3)
+    console.bus.write(0xC000, 9)
+    console.bus.write(0xE001, 0)
+    # nothing is clocked while rendering is off. two frames, so the next one is even and its pre-render line isn't
+    # a cycle short
+    console.ppu.emulate_cycles(341 * 262 * 2)
+    assert not cartridge_irq(console)
+    console.ppu.write_register(0x2001, 0b00011000)
+    # the counter is clocked on cycle 260 of the pre-render scanline and every visible one. the first clock loads it
+    console.ppu.emulate_cycles(341 * 9 + 260)
+    assert not cartridge_irq(console)
+    console.ppu.emulate_cycles(1)
+    assert cartridge_irq(console)
+
+
+# turns off the APU's frame interrupt, enables MMC3 IRQs every 8 scanlines and rendering, then counts IRQs at 0x10
+MMC3_IRQ_PROGRAM = bytes([
+    0xA9, 0x40,  # LDA #$40
+    0x8D, 0x17, 0x40,  # STA $4017
+    0xA9, 0x07,  # LDA #$07
+    0x8D, 0x00, 0xC0,  # STA $C000
+    0x8D, 0x01, 0xE0,  # STA $E001
+    0xA9, 0x18,  # LDA #$18
+    0x8D, 0x01, 0x20,  # STA $2001
+    0x58,  # CLI
+    0x4C, 0x13, 0xC0,  # JMP *
+])
+MMC3_IRQ_HANDLER = bytes([
+    0xE6, 0x10,  # INC $10
+    0x8D, 0x00, 0xE0,  # STA $E000, acknowledging the IRQ
+    0x8D, 0x01, 0xE0,  # STA $E001
+    0x40,  # RTI
+])
+
+
+def test_mmc3_irq_handled_by_cpu(make_nes):
+    nes = make_nes(MMC3_IRQ_PROGRAM, origin=0xC000, irq=MMC3_IRQ_HANDLER, mapper=Mapper.MMC3, prg_banks=PRG_BANKS,
+                   chr_banks=CHR_BANKS)
+    nes.run_frame()
+    irqs = nes.ram[0x10]
+    nes.run_frame()
+    # 241 scanlines are clocked every frame, an IRQ every 8 of them
+    assert nes.ram[0x10] - irqs in (30, 31)
+
+
+def test_mmc2_latches():
+    console = Console(Mapper.MMC2)
+    # 4KiB banks for tiles 0xFD and 0xFE of each pattern table
+    for address, bank in zip((0xB000, 0xC000, 0xD000, 0xE000), (1, 2, 3, 4)):
+        console.bus.write(address, bank)
+    # both latches are 0xFE at power on
+    assert console.chr() == (8, 9, 10, 11, 16, 17, 18, 19)
+    console.cartridge.latch(0x0FD8)
+    assert console.chr() == (4, 5, 6, 7, 16, 17, 18, 19)
+    console.cartridge.latch(0x1FDB)
+    assert console.chr() == (4, 5, 6, 7, 12, 13, 14, 15)
+    # other fetches from the same tiles leave the low latch alone
+    console.cartridge.latch(0x0FE9)
+    assert console.chr() == (4, 5, 6, 7, 12, 13, 14, 15)
+    console.cartridge.latch(0x0FE8)
+    console.cartridge.latch(0x1FEF)
+    assert console.chr() == (8, 9, 10, 11, 16, 17, 18, 19)
+
+
+def test_mmc2_latched_by_rendering():
+    console = Console(Mapper.MMC2)
+    for address, bank in zip((0xB000, 0xC000), (1, 2)):
+        console.bus.write(address, bank)
+    for address in range(0x2000, 0x23C0):
+        console.ppu.write_memory(address, 0xFD)
+    console.ppu.write_register(0x2001, 0b00001000)
+    # drawing the first scanline fetches tile 0xFD
+    console.ppu.emulate_cycles(341 * 2)
+    assert console.chr()[:4] == (4, 5, 6, 7)
+
+
+def test_mmc2_prg_and_mirroring():
+    console = Console(Mapper.MMC2)
+    assert console.prg() == (0, 13, 14, 15)
+    console.bus.write(0xA000, 2)
+    assert console.prg() == (2, 13, 14, 15)
+    console.bus.write(0xF000, 0)
+    assert console.nametables() == VERTICAL
+    console.bus.write(0xF000, 1)
+    assert console.nametables() == HORIZONTAL
+
+
+def test_axrom():
+    console = Console(Mapper.AXROM, chr_banks=0)
+    assert console.prg() == (0, 1, 2, 3)
+    console.bus.write(0x8000, 2)
+    assert console.prg() == (8, 9, 10, 11)
+    assert console.nametables() == SINGLE_SCREEN
+    console.ppu.write_memory(0x2000, 0x11)
+    console.bus.write(0x8000, 0x12)
+    assert console.prg() == (8, 9, 10, 11)
+    assert console.ppu.read_memory(0x2000) != 0x11
+    console.bus.write(0x8000, 0x02)
+    assert console.ppu.read_memory(0x2000) == 0x11
+
+
+def set_up_mmc1(console: Console) -> None:
+    mmc1_write(console, 0x8000, 0b11010)
+    mmc1_write(console, 0xA000, 3)
+    mmc1_write(console, 0xC000, 6)
+    mmc1_write(console, 0xE000, 5)
+    # a write left halfway through the shift register
+    console.bus.write(0x8000, 1)
+
+
+def set_up_mmc3(console: Console) -> None:
+    select_mmc3_banks(console, 0xC0, [2, 4, 6, 7, 8, 9, 10, 11])
+    console.bus.write(0xA000, 1)
+    console.bus.write(0xC000, 5)
+    console.bus.write(0xE001, 0)
+    for ii in range(3):
+        console.cartridge.clock_scanline()
+
+
+def set_up_mmc2(console: Console) -> None:
+    for address, bank in zip((0xA000, 0xB000, 0xC000, 0xD000, 0xE000, 0xF000), (3, 1, 2, 3, 4, 1)):
+        console.bus.write(address, bank)
+    console.cartridge.latch(0x1FD8)
+
+
+@pytest.mark.parametrize("mapper, chr_banks, set_up", [
+    (Mapper.NROM, 1, lambda console: None),
+    (Mapper.MMC1, CHR_BANKS, set_up_mmc1),
+    (Mapper.UXROM, 0, lambda console: console.bus.write(0x8000, 5)),
+    (Mapper.CNROM, CHR_BANKS, lambda console: console.bus.write(0x8000, 3)),
+    (Mapper.MMC3, CHR_BANKS, set_up_mmc3),
+    (Mapper.AXROM, 0, lambda console: console.bus.write(0x8000, 0x13)),
+    (Mapper.MMC2, CHR_BANKS, set_up_mmc2),
+], ids=lambda value: getattr(value, "__name__", None))
+def test_save_state_round_trip(mapper, chr_banks, set_up):
+    console = Console(mapper, chr_banks=chr_banks)
+    set_up(console)
+    console.bus.write(0x6123, 0x45)
+    if chr_banks == 0:
+        console.ppu.write_memory(0x0ABC, 0xDE)
+    state = console.cartridge.save_state()
+
+    restored = Console(mapper, chr_banks=chr_banks)
+    assert restored.cartridge.load_state(memoryview(state), 0) == len(state)
+    assert restored.cartridge.save_state() == state
+    assert restored.prg() == console.prg()
+    assert restored.chr() == console.chr()
+    assert restored.nametables() == console.nametables()
+    assert restored.bus.peek(0x6123) == 0x45
+    if chr_banks == 0:
+        assert restored.ppu.read_memory(0x0ABC) == 0xDE
+    # the registers carry on from where they were, e.g. a half-written MMC1 shift register or the MMC3 IRQ counter
+    if mapper == Mapper.MMC1:
+        for each in (console, restored):
+            for ii in range(4):
+                each.bus.write(0xE000, 0)
+        assert restored.prg() == console.prg()
+    if mapper == Mapper.MMC3:
+        for each in (console, restored):
+            for ii in range(3):
+                each.cartridge.clock_scanline()
+        assert cartridge_irq(restored) and cartridge_irq(console)
@@ -0,0 +1,73 @@
+import pytest
+
+
+CLC = 0x18
+SEC = 0x38
+LDA_IMMEDIATE = 0xA9
+LDX_IMMEDIATE = 0xA2
+LDY_IMMEDIATE = 0xA0
+ADC_IMMEDIATE = 0x69
+SBC_IMMEDIATE = 0xE9
+CMP_IMMEDIATE = 0xC9
+CPX_IMMEDIATE = 0xE0
+CPY_IMMEDIATE = 0xC0
+STA_ZERO_PAGE = 0x85
+PHP = 0x08
+PLA = 0x68
+
+N = 0x80
+V = 0x40
+Z = 0x02
+C = 0x01
+
+
+def run_flags(make_nes, code: bytes, instructions: int) -> tuple[int, int]:
+    """
+    Runs the `instructions` instructions in `code`, then stores A at 0x00 and the N, V, Z and C flags at 0x01.
+
+    Returns:
+        tuple: A and the flags
+    """
+    nes = make_nes(code + bytes([STA_ZERO_PAGE, 0x00, PHP, PLA, STA_ZERO_PAGE, 0x01]))
+    for ii in range(instructions + 4):
+        nes.step_instruction()
+    return nes.ram[0x00], nes.ram[0x01] & (N | V | Z | C)
+
+
+@pytest.mark.parametrize("accumulator, flags", [
+    (0x00, Z | C),
+    (0x7F, C),
+    (0x80, N | C),
+])
+def test_adc_ff_with_carry_in(make_nes, accumulator, flags):
+    # A + 0xFF + 1 is A + 0x100: the result is A, with the carry out set
+    result = run_flags(make_nes, bytes([SEC, LDA_IMMEDIATE, accumulator, ADC_IMMEDIATE, 0xFF]), 3)
+    assert result == (accumulator, flags)
+
+
+@pytest.mark.parametrize("accumulator, flags", [
+    (0x00, Z),
+    (0x7F, 0),
+    (0x80, N),
+])
+def test_sbc_ff_with_carry_clear(make_nes, accumulator, flags):
+    # A - 0xFF - 1 is A - 0x100: the result is A, with a borrow (carry clear)
+    result = run_flags(make_nes, bytes([CLC, LDA_IMMEDIATE, accumulator, SBC_IMMEDIATE, 0xFF]), 3)
+    assert result == (accumulator, flags)
+
+
+@pytest.mark.parametrize("load, compare", [
+    (LDA_IMMEDIATE, CMP_IMMEDIATE),
+    (LDX_IMMEDIATE, CPX_IMMEDIATE),
+    (LDY_IMMEDIATE, CPY_IMMEDIATE),
+])
+@pytest.mark.parametrize("register, operand, flags", [
+    (0x10, 0x90, N),  # 0x10 - 0x90 wraps to 0x80
+    (0x90, 0x10, N | C),  # 0x80 without wrapping, but still negative as a byte
+    (0x10, 0x20, N),
+    (0x20, 0x10, C),
+    (0x10, 0x10, Z | C),
+])
+def test_compare(make_nes, load, compare, register, operand, flags):
+    result = run_flags(make_nes, bytes([load, register, compare, operand]), 2)
+    assert result[1] == flags
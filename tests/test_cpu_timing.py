@@ -0,0 +1,123 @@
+import pytest
+
+from nespy.enum import AddressingMode, InstructionAddressingModeMap, InstructionCycleMap, InstructionMnemonicMap, \
+    InstructionPageCrossPenalty
+
+
+LDX_1 = bytes([0xA2, 0x01])
+LDY_1 = bytes([0xA0, 0x01])
+CLC = bytes([0x18])
+CLV = bytes([0xB8])
+
+READ_MODIFY_WRITE = {"ASL", "LSR", "ROL", "ROR", "INC", "DEC"}
+STORES = {"STA", "STX", "STY"}
+IMPLIED_CYCLES = {"BRK": 7, "RTI": 6, "RTS": 6, "PHA": 3, "PHP": 3, "PLA": 4, "PLP": 4}
+OPERAND_CYCLES = {
+    AddressingMode.Immediate: 2,
+    AddressingMode.ZeroPage: 3,
+    AddressingMode.ZeroPageX: 4,
+    AddressingMode.ZeroPageY: 4,
+    AddressingMode.Absolute: 4,
+    AddressingMode.AbsoluteX: 4,
+    AddressingMode.AbsoluteY: 4,
+    AddressingMode.IndirectX: 6,
+    AddressingMode.IndirectY: 5,
+}
+READ_MODIFY_WRITE_CYCLES = {
+    AddressingMode.ZeroPage: 5,
+    AddressingMode.ZeroPageX: 6,
+    AddressingMode.Absolute: 6,
+    AddressingMode.AbsoluteX: 7,
+}
+
+
+def expected_cycles(mnemonic: str, addressing_mode: str) -> int:
+    """
+    The 6502's cycle counts, worked out from how each kind of instruction uses the bus rather than copied from
+    the table under test.
+    """
+    if addressing_mode == AddressingMode.Implicit:
+        return IMPLIED_CYCLES.get(mnemonic, 2)
+    if addressing_mode == AddressingMode.Relative:
+        return 2
+    if mnemonic == "JMP":
+        return 5 if addressing_mode == AddressingMode.Indirect else 3
+    if mnemonic == "JSR":
+        return 6
+    if mnemonic in READ_MODIFY_WRITE:
+        return READ_MODIFY_WRITE_CYCLES[addressing_mode]
+    if mnemonic in STORES and addressing_mode in (AddressingMode.AbsoluteX, AddressingMode.AbsoluteY,
+                                                  AddressingMode.IndirectY):
+        # stores always take the cycle that reads do only when they cross a page
+        return OPERAND_CYCLES[addressing_mode] + 1
+    return OPERAND_CYCLES[addressing_mode]
+
+
+def run_instruction(nes, setup_instructions: int) -> int:
+    for ii in range(setup_instructions):
+        nes.step_instruction()
+    return nes.step_instruction()
+
+
+@pytest.mark.parametrize("opcode", sorted(InstructionMnemonicMap))
+def test_base_cycles(opcode):
+    mnemonic = InstructionMnemonicMap[opcode]
+    assert InstructionCycleMap.get(opcode, 2) == expected_cycles(mnemonic, InstructionAddressingModeMap[opcode])
+
+
+def test_page_cross_penalty_opcodes():
+    # the indexed and indirect indexed reads. stores and read-modify-write instructions always take the extra cycle
+    reads = {opcode for opcode, mnemonic in InstructionMnemonicMap.items()
+             if InstructionAddressingModeMap[opcode] in (AddressingMode.AbsoluteX, AddressingMode.AbsoluteY,
+                                                         AddressingMode.IndirectY)
+             and mnemonic not in STORES | READ_MODIFY_WRITE}
+    assert len(InstructionPageCrossPenalty) == 23
+    assert InstructionPageCrossPenalty == reads
+
+
+@pytest.mark.parametrize("opcode", sorted(InstructionPageCrossPenalty))
+@pytest.mark.parametrize("crossed", [False, True])
+def test_page_cross_penalty(make_nes, opcode, crossed):
+    base = 0x02FF if crossed else 0x0200
+    if InstructionAddressingModeMap[opcode] == AddressingMode.IndirectY:
+        # the pointer lives at 0x10 in the zero page
+        nes = make_nes(LDX_1 + LDY_1 + bytes([opcode, 0x10]))
+        nes.ram[0x10] = base & 0xFF
+        nes.ram[0x11] = base >> 8
+    else:
+        nes = make_nes(LDX_1 + LDY_1 + bytes([opcode, base & 0xFF, base >> 8]))
+    assert run_instruction(nes, 2) == InstructionCycleMap[opcode] + crossed
+
+
+@pytest.mark.parametrize("opcode", [0x9D, 0x99, 0x91, 0x1E, 0xFE])
+def test_no_page_cross_penalty_for_writes(make_nes, opcode):
+    # STA abs,X, STA abs,Y, STA (zp),Y, ASL abs,X, INC abs,X
+    if InstructionAddressingModeMap[opcode] == AddressingMode.IndirectY:
+        nes = make_nes(LDX_1 + LDY_1 + bytes([opcode, 0x10]))
+        nes.ram[0x10] = 0xFF
+        nes.ram[0x11] = 0x02
+    else:
+        nes = make_nes(LDX_1 + LDY_1 + bytes([opcode, 0xFF, 0x02]))
+    assert run_instruction(nes, 2) == InstructionCycleMap[opcode]
+
+
+# after LDX #1, CLC and CLV, Z, N, C and V are all clear
+TAKEN_BRANCHES = [0xD0, 0x10, 0x90, 0x50]  # BNE, BPL, BCC, BVC
+NOT_TAKEN_BRANCHES = [0xF0, 0x30, 0xB0, 0x70]  # BEQ, BMI, BCS, BVS
+
+
+@pytest.mark.parametrize("opcode", NOT_TAKEN_BRANCHES)
+def test_branch_not_taken(make_nes, opcode):
+    nes = make_nes(LDX_1 + CLC + CLV + bytes([opcode, 0x10]))
+    assert run_instruction(nes, 3) == 2
+
+
+@pytest.mark.parametrize("opcode", TAKEN_BRANCHES)
+@pytest.mark.parametrize("origin, offset, cycles", [
+    (0x8000, 0x10, 3),  # 0x8006 -> 0x8016
+    (0x80F0, 0x10, 4),  # 0x80F6 -> 0x8106, forwards onto the next page
+    (0x8100, 0xF0, 4),  # 0x8106 -> 0x80F6, backwards onto the previous page
+])
+def test_branch_taken(make_nes, opcode, origin, offset, cycles):
+    nes = make_nes(LDX_1 + CLC + CLV + bytes([opcode, offset]), origin=origin)
+    assert run_instruction(nes, 3) == cycles
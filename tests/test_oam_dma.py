@@ -0,0 +1,44 @@
+import pytest
+
+
+LDA_ZP = bytes([0xA5, 0x00])  # 3 cycles, to move the DMA onto the other kind of cycle
+DMA_PAGE_2 = bytes([
+    0xA9, 0x02,  # LDA #$02
+    0x8D, 0x14, 0x40,  # STA $4014
+    0x4C, 0x00, 0x90,  # JMP $9000
+])
+SET_OAMADDR = bytes([
+    0xA9, 0x10,  # LDA #$10
+    0x8D, 0x03, 0x20,  # STA $2003
+])
+PAGE = bytes((ii * 7 + 3) & 0xFF for ii in range(0x100))
+
+
+@pytest.mark.parametrize("prefix", [b"", LDA_ZP, LDA_ZP + LDA_ZP])
+def test_dma_stalls_cpu(make_nes, prefix):
+    nes = make_nes(prefix + DMA_PAGE_2)
+    steps = len(prefix) // 2 + 2
+    cycles = sum(nes.step_instruction() for ii in range(steps))
+    # CPU cycles are counted from 1, the cycle the first instruction starts on. the DMA starts on the cycle after
+    # the write, and takes an extra cycle to line up if that is an odd one
+    dma_cycle = 1 + cycles
+    assert nes.step_instruction() == (514 if dma_cycle & 1 else 513)
+    # the stall is a step of its own, and the CPU carries on after it
+    assert nes.step_instruction() == 3
+
+
+def test_dma_copies_page(make_nes):
+    nes = make_nes(DMA_PAGE_2)
+    nes.ram[0x200:0x300] = PAGE
+    for ii in range(3):
+        nes.step_instruction()
+    assert bytes(nes.oam) == PAGE
+
+
+def test_dma_starts_at_oam_address(make_nes):
+    nes = make_nes(SET_OAMADDR + DMA_PAGE_2)
+    nes.ram[0x200:0x300] = PAGE
+    for ii in range(5):
+        nes.step_instruction()
+    # the copy wraps around to the start of OAM
+    assert bytes(nes.oam) == PAGE[0xF0:] + PAGE[:0xF0]
@@ -0,0 +1,113 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from nespy.enum import NTSCPalette
+from nespy.screen import Observation
+
+
+WHITE = 0x30
+RED = 0x16
+
+
+def luminance(index: int) -> int:
+    red, green, blue = NTSCPalette[index]
+    return round(0.299 * red + 0.587 * green + 0.114 * blue)
+
+
+def pattern() -> bytearray:
+    # every pixel has a palette index that depends on where it is
+    return bytearray((y * 7 + x * 3) % 64 for y in range(240) for x in range(256))
+
+
+def test_full_frame():
+    framebuffer = pattern()
+    indices = numpy.frombuffer(framebuffer, dtype=numpy.uint8).reshape(240, 256)
+    observation = Observation(framebuffer)
+    frames = observation.update()
+    assert frames.shape == (1, 240, 256, 3)
+    assert (frames[0] == numpy.array(NTSCPalette, dtype=numpy.uint8)[indices]).all()
+
+
+@pytest.mark.parametrize("grayscale", [False, True])
+def test_crop(grayscale):
+    framebuffer = pattern()
+    indices = numpy.frombuffer(framebuffer, dtype=numpy.uint8).reshape(240, 256)
+    observation = Observation(framebuffer, crop=(8, 232, 16, 200), grayscale=grayscale)
+    frame = observation.update()[0]
+    cropped = indices[8:232, 16:200]
+    assert frame.shape[:2] == (224, 184)
+    if grayscale:
+        expected = numpy.array([luminance(index) for index in range(64)], dtype=numpy.uint8)[cropped]
+    else:
+        expected = numpy.array(NTSCPalette, dtype=numpy.uint8)[cropped]
+    assert (frame == expected).all()
+
+
+def test_grayscale_palette():
+    # one column per color in the palette, 4 pixels wide
+    framebuffer = bytearray(bytes(index for index in range(64) for ii in range(4)) * 240)
+    frame = Observation(framebuffer, grayscale=True).update()[0]
+    assert frame.shape == (240, 256)
+    assert frame[0, ::4].tolist() == [luminance(index) for index in range(64)]
+    assert (frame == frame[0]).all()
+
+
+def checkerboard() -> bytearray:
+    """
+    2x2 blocks that are white in the top left pixel and red in the other three.
+    """
+    return bytearray(WHITE if y % 2 == 0 and x % 2 == 0 else RED for y in range(240) for x in range(256))
+
+
+@pytest.mark.parametrize("grayscale", [False, True])
+def test_downscale(grayscale):
+    # a 168x168 crop shrinks to 84x84 by exactly 2 in both directions
+    crop = (0, 168, 0, 168)
+    nearest = Observation(checkerboard(), crop=crop, size=(84, 84), grayscale=grayscale).update()[0]
+    area = Observation(checkerboard(), crop=crop, size=(84, 84), grayscale=grayscale,
+                       interpolation="area").update()[0]
+    assert nearest.shape[:2] == area.shape[:2] == (84, 84)
+    if grayscale:
+        white = numpy.array(luminance(WHITE))
+        red = numpy.array(luminance(RED))
+    else:
+        white = numpy.array(NTSCPalette[WHITE])
+        red = numpy.array(NTSCPalette[RED])
+    # nearest neighbor samples the pixel nearest the center of each block, which is its bottom right pixel
+    assert (nearest == red).all()
+    # area averages the whole block
+    assert (area == numpy.rint((white + 3 * red) / 4)).all()
+
+
+@pytest.mark.parametrize("interpolation", ["nearest", "area"])
+def test_downscale_whole_frame(interpolation):
+    # 240x256 doesn't divide evenly into 84x84, but a solid frame stays solid
+    framebuffer = bytearray([WHITE]) * (256 * 240)
+    frame = Observation(framebuffer, size=(84, 84), grayscale=True, interpolation=interpolation).update()[0]
+    assert frame.shape == (84, 84)
+    assert (frame == luminance(WHITE)).all()
+
+
+def test_unknown_interpolation():
+    with pytest.raises(ValueError):
+        Observation(pattern(), interpolation="cubic")
+
+
+def test_stack():
+    framebuffer = bytearray(256 * 240)
+    observation = Observation(framebuffer, size=(84, 84), grayscale=True, stack=4)
+    colors = [0x01, 0x00, 0x10, 0x20, 0x16, 0x2A]
+    assert len({luminance(color) for color in colors}) == len(colors)
+    for ii, color in enumerate(colors):
+        framebuffer[:] = bytes([color]) * len(framebuffer)
+        frames = observation.update()
+        assert frames.shape == (4, 84, 84)
+        # oldest first, with black before the first frame
+        expected = [0] * max(0, 3 - ii) + [luminance(color) for color in colors[max(0, ii - 3):ii + 1]]
+        assert frames[:, 0, 0].tolist() == expected
+        assert all((frame == frame[0, 0]).all() for frame in frames)
+
+    observation.clear()
+    frames = observation.update()
+    assert frames[:, 0, 0].tolist() == [0, 0, 0, luminance(colors[-1])]
@@ -0,0 +1,83 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from conftest import build_rom
+from nespy.enum import Button
+from nespy.pool import NESPool
+
+
+# reads controller 1 into 0x01 and counts the reads in 0x00, forever
+CONTROLLER_PROGRAM = bytes([
+    0xA9, 0x01,        # 0x8000 LDA #1
+    0x8D, 0x16, 0x40,  # 0x8002 STA $4016
+    0xA9, 0x00,        # 0x8005 LDA #0
+    0x8D, 0x16, 0x40,  # 0x8007 STA $4016
+    0xA2, 0x08,        # 0x800A LDX #8
+    0xAD, 0x16, 0x40,  # 0x800C LDA $4016
+    0x4A,              # 0x800F LSR A
+    0x66, 0x02,        # 0x8010 ROR $02
+    0xCA,              # 0x8012 DEX
+    0xD0, 0xF7,        # 0x8013 BNE $800C
+    0xA5, 0x02,        # 0x8015 LDA $02
+    0x85, 0x01,        # 0x8017 STA $01
+    0xE6, 0x00,        # 0x8019 INC $00
+    0x4C, 0x00, 0x80,  # 0x801B JMP $8000
+])
+
+
+@pytest.fixture
+def rom(tmp_path):
+    path = tmp_path / "pool.nes"
+    path.write_bytes(build_rom(CONTROLLER_PROGRAM))
+    return path
+
+
+def test_step(rom):
+    with NESPool(str(rom), 2, processes=2) as pool:
+        assert len(pool._processes) == 2
+        ram, frames = pool.step([Button.A | Button.START, Button.LEFT])
+        # the workers write straight into the arrays the pool owns
+        assert ram is pool.ram
+        assert frames is pool.frames
+        assert ram.shape == (2, 0x800)
+        assert frames.shape == (2, 240, 256)
+        assert ram[0, 1] == Button.A | Button.START
+        assert ram[1, 1] == Button.LEFT
+        counts = ram[:, 0].copy()
+        # both instances ran the same program for a frame
+        assert counts[0] > 0
+        assert counts[0] == counts[1]
+
+        ram, frames = pool.step(numpy.array([[0, 0], [Button.B, Button.B]]))
+        assert ram is pool.ram
+        assert ram[0, 1] == 0
+        assert ram[1, 1] == Button.B
+        assert (ram[:, 0] != counts).all()
+
+
+def test_worker_error(rom):
+    with NESPool(str(rom), 2, processes=2) as pool:
+        rom.unlink()
+        # the workers can't load the ROM again. their errors are raised in the parent
+        with pytest.raises(FileNotFoundError):
+            pool.reset()
+        # the instances they already had still run
+        ram, frames = pool.step([0, 0])
+        assert ram[0, 0] > 0
+
+
+def test_close(rom):
+    pool = NESPool(str(rom), 2, processes=2)
+    processes = list(pool._processes)
+    assert all(process.is_alive() for process in processes)
+    pool.close()
+    assert not any(process.is_alive() for process in processes)
+    assert [process.exitcode for process in processes] == [0, 0]
+    # closing again does nothing
+    pool.close()
+
+    with NESPool(str(rom), 2, processes=2) as pool:
+        processes = list(pool._processes)
+    assert not any(process.is_alive() for process in processes)
+    assert [process.exitcode for process in processes] == [0, 0]
@@ -0,0 +1,148 @@
+import pytest
+
+from nespy.ppu import PPU, _STATE_STRUCT
+
+
+PPUCTRL = 0x2000
+PPUSTATUS = 0x2002
+PPUSCROLL = 0x2005
+PPUADDR = 0x2006
+PPUDATA = 0x2007
+
+
+@pytest.fixture
+def ppu():
+    ppu = PPU()
+    # the vblank flag is set at power on
+    ppu.read_register(PPUSTATUS)
+    return ppu
+
+
+def run_into_vblank(ppu: PPU) -> None:
+    # from the pre-render scanline, through the 240 visible scanlines and the post-render scanline, into vblank
+    ppu.emulate_cycles(341 * 243)
+
+
+def set_address(ppu: PPU, address: int) -> None:
+    ppu.write_register(PPUADDR, address >> 8)
+    ppu.write_register(PPUADDR, address & 0xFF)
+
+
+def test_status_read_clears_vblank(ppu):
+    run_into_vblank(ppu)
+    assert ppu.read_register(PPUSTATUS) & 0x80
+    assert not ppu.read_register(PPUSTATUS) & 0x80
+
+
+def test_status_read_resets_write_toggle(ppu):
+    ppu.write_register(PPUADDR, 0x21)
+    ppu.read_register(PPUSTATUS)
+    # without the read, 0x23 would have been taken as the low byte
+    set_address(ppu, 0x2345)
+    ppu.write_register(PPUDATA, 0x99)
+    assert ppu.read_memory(0x2345) == 0x99
+
+
+def test_address_latch(ppu):
+    # the top two bits of the high byte are dropped
+    set_address(ppu, 0xE210)
+    ppu.write_register(PPUDATA, 0x42)
+    ppu.write_register(PPUDATA, 0x43)
+    assert ppu.read_memory(0x2210) == 0x42
+    assert ppu.read_memory(0x2211) == 0x43
+    # PPUCTRL bit 2 makes the address go down a row of tiles instead
+    ppu.write_register(PPUCTRL, 0b100)
+    set_address(ppu, 0x2000)
+    ppu.write_register(PPUDATA, 0x44)
+    ppu.write_register(PPUDATA, 0x45)
+    assert ppu.read_memory(0x2000) == 0x44
+    assert ppu.read_memory(0x2020) == 0x45
+
+
+def latches(ppu: PPU) -> tuple[int, int, bool]:
+    # t, x and w, as packed into the save state
+    return _STATE_STRUCT.unpack_from(ppu.save_state())[5:8]
+
+
+def test_scroll_latch(ppu):
+    ppu.write_register(PPUSCROLL, 0x7D)  # coarse X 15, fine X 5
+    t, x, w = latches(ppu)
+    assert (t & 0x1F, x, w) == (15, 5, True)
+    ppu.write_register(PPUSCROLL, 0x5E)  # coarse Y 11, fine Y 6
+    assert latches(ppu) == (6 << 12 | 11 << 5 | 15, 5, False)
+
+
+def test_scroll_and_address_share_the_toggle(ppu):
+    ppu.write_register(PPUSCROLL, 0x00)
+    # the toggle is set, so this is taken as the low byte of the address, under the high byte of 0 left in t
+    ppu.write_register(PPUADDR, 0x24)
+    ppu.write_register(PPUDATA, 0x77)
+    assert ppu.read_memory(0x0024) == 0x77
+
+
+def test_data_reads_are_buffered(ppu):
+    ppu.write_memory(0x2400, 0x11)
+    ppu.write_memory(0x2401, 0x22)
+    set_address(ppu, 0x2400)
+    ppu.read_register(PPUDATA)  # returns whatever was in the buffer
+    assert ppu.read_register(PPUDATA) == 0x11
+    assert ppu.read_register(PPUDATA) == 0x22
+
+
+def test_palette_reads_are_not_buffered(ppu):
+    ppu.write_memory(0x3F01, 0x2A)
+    ppu.write_memory(0x2F01, 0x33)
+    set_address(ppu, 0x3F01)
+    assert ppu.read_register(PPUDATA) == 0x2A
+    # the nametable byte underneath the palette went into the buffer
+    set_address(ppu, 0x2000)
+    assert ppu.read_register(PPUDATA) == 0x33
+
+
+def test_nmi_at_vblank_start(ppu):
+    nmis = []
+    ppu.nmi_hook = lambda: nmis.append(True)
+    ppu.write_register(PPUCTRL, 0x80)
+    assert not nmis
+    run_into_vblank(ppu)
+    assert len(nmis) == 1
+
+
+def test_nmi_when_enabled_during_vblank(ppu):
+    nmis = []
+    ppu.nmi_hook = lambda: nmis.append(True)
+    run_into_vblank(ppu)
+    assert not nmis
+    ppu.write_register(PPUCTRL, 0x80)
+    assert len(nmis) == 1
+    # only turning NMIs on raises one
+    ppu.write_register(PPUCTRL, 0x80)
+    assert len(nmis) == 1
+    ppu.write_register(PPUCTRL, 0x00)
+    ppu.write_register(PPUCTRL, 0x80)
+    assert len(nmis) == 2
+    # not once the vblank flag has been read
+    ppu.write_register(PPUCTRL, 0x00)
+    ppu.read_register(PPUSTATUS)
+    ppu.write_register(PPUCTRL, 0x80)
+    assert len(nmis) == 2
+
+
+VBLANK_COUNTER = bytes([
+    0x2C, 0x02, 0x20,  # wait: BIT $2002
+    0x10, 0xFB,  # BPL wait
+    0xE6, 0x10,  # INC $10
+    0x4C, 0x00, 0x80,  # JMP wait
+])
+
+
+def test_disassembly_does_not_read_registers(make_nes, capsys):
+    counts = []
+    for disassemble in (False, True):
+        nes = make_nes(VBLANK_COUNTER, disassemble=disassemble)
+        for ii in range(5):
+            nes.run_frame()
+        counts.append(nes.ram[0x10])
+    assert counts[0] >= 4
+    assert counts[1] == counts[0]
+    assert "BIT $2002; = ??" in capsys.readouterr().out
@@ -0,0 +1,143 @@
+import pytest
+
+from conftest import build_rom
+from nespy.bus import Bus
+from nespy.cartridge import CARTRIDGES
+from nespy.enum import Mapper
+from nespy.interrupt import InterruptLines
+from nespy.ppu import PPU
+from nespy.rom import ROM
+
+
+PPUCTRL = 0x2000
+PPUMASK = 0x2001
+PPUSTATUS = 0x2002
+PPUSCROLL = 0x2005
+PPUADDR = 0x2006
+PPUDATA = 0x2007
+
+SHOW_BACKGROUND = 0b00001010  # including the leftmost 8 pixels
+SHOW_SPRITES = 0b00010100
+
+SOLID_TILE = bytes([0xFF] * 8 + [0x00] * 8)  # every pixel is color 1
+OFFSCREEN = bytes([0xFF] * 0x100)  # every sprite below the bottom of the screen
+
+
+def make_ppu(render: bool = True) -> PPU:
+    """
+    Returns:
+        PPU: a PPU with an NROM cartridge that has CHR RAM, starting at the pre-render scanline
+    """
+    ppu = PPU()
+    ppu.render = render
+    cartridge = CARTRIDGES[Mapper.NROM](ROM(build_rom(b"", chr_banks=0)))
+    cartridge.connect(Bus(), ppu, InterruptLines())
+    return ppu
+
+
+@pytest.fixture(params=[True, False], ids=["render", "no-render"])
+def ppu(request):
+    # sprite 0 hits and overflow are found whether or not pixels are drawn, so tests run both ways
+    return make_ppu(request.param)
+
+
+def write_memory(ppu: PPU, address: int, data: bytes) -> None:
+    """
+    Writes to VRAM through PPUADDR and PPUDATA, then points the scroll back at the top left of the first nametable.
+    """
+    ppu.write_register(PPUADDR, address >> 8)
+    ppu.write_register(PPUADDR, address & 0xFF)
+    for value in data:
+        ppu.write_register(PPUDATA, value)
+    ppu.write_register(PPUCTRL, 0)
+    ppu.write_register(PPUSCROLL, 0)
+    ppu.write_register(PPUSCROLL, 0)
+
+
+def set_sprites(ppu: PPU, *sprites: tuple[int, int, int, int]) -> None:
+    oam = bytearray(OFFSCREEN)
+    for ii, sprite in enumerate(sprites):
+        oam[ii * 4:ii * 4 + 4] = bytes(sprite)
+    ppu.write_oam(bytes(oam))
+
+
+def run_to_scan_line(ppu: PPU, scan_line: int) -> None:
+    # from the start of the pre-render scanline to the start of `scan_line`
+    ppu.emulate_cycles(341 * (scan_line + 1))
+
+
+def status(ppu: PPU) -> int:
+    return ppu.read_register(PPUSTATUS)
+
+
+@pytest.mark.parametrize("x, hit", [(100, True), (254, True), (255, False)])
+def test_sprite_0_hit(ppu, x, hit):
+    # the background is solid everywhere, sprite 0 is solid on scanlines 51-58
+    write_memory(ppu, 0x0000, SOLID_TILE * 2)
+    set_sprites(ppu, (50, 1, 0, x))
+    ppu.write_register(PPUMASK, SHOW_BACKGROUND | SHOW_SPRITES)
+    run_to_scan_line(ppu, 51)
+    assert not status(ppu) & 0x40
+    ppu.emulate_cycles(341 * 8)
+    # there is no hit on the last pixel of a scanline
+    assert bool(status(ppu) & 0x40) == hit
+    # the flag stays set until the pre-render scanline
+    ppu.emulate_cycles(341 * (261 - 59))
+    assert bool(status(ppu) & 0x40) == hit
+    ppu.emulate_cycles(2)
+    assert not status(ppu) & 0x40
+
+
+@pytest.mark.parametrize("mask", [SHOW_SPRITES, SHOW_BACKGROUND])
+def test_no_sprite_0_hit_on_transparent_pixels(ppu, mask):
+    write_memory(ppu, 0x0000, SOLID_TILE * 2)
+    set_sprites(ppu, (50, 1, 0, 100))
+    # without the background, or without sprites, there is nothing to overlap
+    ppu.write_register(PPUMASK, mask)
+    run_to_scan_line(ppu, 240)
+    assert not status(ppu) & 0x40
+    # a sprite 0 over a transparent background doesn't hit either
+    write_memory(ppu, 0x0000, bytes(16) + SOLID_TILE)
+    ppu.emulate_cycles(341 * 21)
+    ppu.write_register(PPUMASK, SHOW_BACKGROUND | SHOW_SPRITES)
+    run_to_scan_line(ppu, 240)
+    assert not status(ppu) & 0x40
+
+
+@pytest.mark.parametrize("sprites, overflow", [(8, False), (9, True)])
+def test_sprite_overflow(ppu, sprites, overflow):
+    write_memory(ppu, 0x0000, SOLID_TILE * 2)
+    # the sprites are spread out across the scanline, and a 9th sprite on another scanline doesn't count
+    set_sprites(ppu, *[(80, 1, 0, ii * 20) for ii in range(sprites)], (120, 1, 0, 0))
+    ppu.write_register(PPUMASK, SHOW_BACKGROUND | SHOW_SPRITES)
+    run_to_scan_line(ppu, 81)
+    assert not status(ppu) & 0x20
+    ppu.emulate_cycles(341 * 8)
+    assert bool(status(ppu) & 0x20) == overflow
+    # cleared on the pre-render scanline
+    ppu.emulate_cycles(341 * (261 - 89))
+    assert bool(status(ppu) & 0x20) == overflow
+    ppu.emulate_cycles(2)
+    assert not status(ppu) & 0x20
+
+
+def test_chr_ram_write_redraws_tile():
+    ppu = make_ppu()
+    # color 1 of the first background palette is white, color 2 is red. every tile on the screen is tile 0
+    write_memory(ppu, 0x3F00, bytes([0x0F, 0x30, 0x16]))
+    write_memory(ppu, 0x0000, SOLID_TILE)
+    ppu.write_register(PPUMASK, SHOW_BACKGROUND)
+    run_to_scan_line(ppu, 240)
+    white = ppu.get_rgb_framebuffer()
+    assert white == white[:3] * (256 * 240)
+
+    # the tile is decoded once it has been drawn. writing to it must drop the decoded copy
+    ppu.write_register(PPUMASK, 0)
+    write_memory(ppu, 0x0008, bytes([0xFF] * 8))
+    write_memory(ppu, 0x0000, bytes(8))
+    ppu.write_register(PPUMASK, SHOW_BACKGROUND)
+    ppu.emulate_cycles(341 * 21)
+    run_to_scan_line(ppu, 240)
+    red = ppu.get_rgb_framebuffer()
+    assert red == red[:3] * (256 * 240)
+    assert red[:3] != white[:3]
@@ -0,0 +1,314 @@
+import struct
+import time
+
+import pytest
+
+from nespy.exceptions import InvalidState
+from nespy.nes import STATE_VERSION
+from nespy.rewind import RewindBuffer
+from nespy.snapshot import SnapshotStore
+
+
+# enables NMIs, then keeps scattering increments over page 3 of RAM, indexed by a mix of a loop counter and the
+# number of NMIs, so the RAM depends on exactly when every NMI lands
+PROGRAM = bytes([
+    0xA9, 0x80,  # LDA #$80
+    0x8D, 0x00, 0x20,  # STA $2000
+    0xE6, 0x11,  # loop: INC $11
+    0xA5, 0x11,  # LDA $11
+    0x45, 0x10,  # EOR $10
+    0xAA,  # TAX
+    0xFE, 0x00, 0x03,  # INC $0300,X
+    0x4C, 0x05, 0x80,  # JMP loop
+])
+NMI = bytes([
+    0xE6, 0x10,  # INC $10
+    0x40,  # RTI
+])
+
+
+@pytest.fixture
+def nes(make_nes):
+    nes = make_nes(PROGRAM, nmi=NMI)
+    for ii in range(5):
+        nes.run_frame()
+    return nes
+
+
+def run_frames(nes, frames: int) -> None:
+    for ii in range(frames):
+        nes.run_frame()
+
+
+def test_round_trip(nes):
+    state = nes.save_state()
+    run_frames(nes, 20)
+    ram = bytes(nes.ram)
+    later_state = nes.save_state()
+    assert nes.ram[0x10] >= 20
+
+    nes.load_state(state)
+    assert nes.save_state() == state
+    run_frames(nes, 20)
+    assert bytes(nes.ram) == ram
+    assert nes.save_state() == later_state
+
+
+def test_round_trip_with_sound(make_nes):
+    nes = make_nes(PROGRAM, nmi=NMI, audio=True)
+    run_frames(nes, 5)
+    state = nes.save_state()
+    run_frames(nes, 10)
+    later_state = nes.save_state()
+    nes.load_state(state)
+    run_frames(nes, 10)
+    assert nes.save_state() == later_state
+
+
+def test_rejects_other_versions(nes):
+    state = nes.save_state()
+    run_frames(nes, 3)
+    ram = bytes(nes.ram)
+    # the header is the magic number, then the version
+    other_version = state[:4] + struct.pack("<H", STATE_VERSION + 1) + state[6:]
+    with pytest.raises(InvalidState, match="version"):
+        nes.load_state(other_version)
+    with pytest.raises(InvalidState):
+        nes.load_state(state[:-1])
+    with pytest.raises(InvalidState):
+        nes.load_state(b"NESx" + state[4:])
+    # states are validated before anything is restored
+    assert bytes(nes.ram) == ram
+
+
+def test_snapshot_store(nes):
+    store = SnapshotStore(nes, chunk_size=16)
+    root = store.snapshot()
+    root_state = nes.save_state()
+    run_frames(nes, 3)
+    left = store.snapshot()
+    left_state = nes.save_state()
+
+    store.restore(root)
+    assert nes.save_state() == root_state
+    nes.set_buttons(0xFF)
+    run_frames(nes, 5)
+    right = store.snapshot()
+    right_state = nes.save_state()
+
+    store.restore(left)
+    assert nes.save_state() == left_state
+    store.restore(right)
+    assert nes.save_state() == right_state
+    store.discard(left)
+    with pytest.raises(InvalidState):
+        store.restore(left)
+
+
+def test_rewind(nes):
+    nes.enable_rewind(keyframe_interval=4)
+    states = [nes.save_state()]
+    for ii in range(10):
+        nes.run_frame()
+        states.append(nes.save_state())
+
+    assert nes.rewind(3) == 3
+    assert nes.save_state() == states[7]
+    # frames after the one rewound to are gone, and new ones are recorded after it
+    nes.run_frame()
+    assert nes.save_state() == states[8]
+    assert nes.rewind(100) == 8
+    assert nes.save_state() == states[0]
+
+
+def test_rewind_buffer_drops_oldest_frames():
+    states = [bytes([ii]) * 1000 + bytes(range(256)) for ii in range(50)]
+    buffer = RewindBuffer(memory_budget=400, keyframe_interval=5)
+    for state in states:
+        buffer.record(state)
+    assert 0 < len(buffer) < 50
+    assert buffer.size <= 400 or len(buffer) <= 5
+    frames = len(buffer)
+    assert buffer.rewind(1) == (1, states[-2])
+    assert buffer.rewind(frames) == (frames - 2, states[50 - frames])
+
+
+def test_snapshot_chain(nes):
+    store = SnapshotStore(nes, chunk_size=16)
+    ids = []
+    states = []
+    for ii in range(4):
+        ids.append(store.snapshot())
+        states.append(nes.save_state())
+        nes.run_frame()
+    # only the root holds a whole save state, the rest are chunks on top of their parents
+    snapshots = [store._snapshots[snapshot_id] for snapshot_id in ids]
+    assert snapshots[0].state is not None
+    assert all(snapshot.state is None for snapshot in snapshots[1:])
+    assert [snapshot.parent for snapshot in snapshots[1:]] == snapshots[:-1]
+
+    # restoring the most recent snapshot doesn't apply any chunks
+    store.restore(ids[3])
+    assert nes.save_state() == states[3]
+    # neither does restoring a child of it, apart from its own
+    run_frames(nes, 2)
+    child = store.snapshot()
+    child_state = nes.save_state()
+    store.restore(ids[3])
+    store.restore(child)
+    assert nes.save_state() == child_state
+
+    # from somewhere else in the tree, every snapshot back to the root is applied
+    store.restore(ids[0])
+    nes.set_buttons(0xFF)
+    run_frames(nes, 3)
+    store.snapshot()
+    store.restore(ids[3])
+    assert nes.save_state() == states[3]
+    store.restore(ids[1])
+    assert nes.save_state() == states[1]
+
+
+def test_snapshot_evicted_ancestor(nes):
+    store = SnapshotStore(nes, capacity=3, chunk_size=16)
+    ids = []
+    states = []
+    for ii in range(4):
+        ids.append(store.snapshot())
+        states.append(nes.save_state())
+        nes.run_frame()
+    assert len(store) == 3
+    assert ids[0] not in store
+    with pytest.raises(InvalidState):
+        store.restore(ids[0])
+    # the evicted root is still what its descendants are stored relative to
+    store.restore(ids[1])
+    assert nes.save_state() == states[1]
+    store.restore(ids[3])
+    assert nes.save_state() == states[3]
+
+
+def test_snapshot_max_depth(nes):
+    store = SnapshotStore(nes, chunk_size=16, max_depth=3)
+    ids = []
+    states = []
+    for ii in range(5):
+        ids.append(store.snapshot())
+        states.append(nes.save_state())
+        nes.run_frame()
+    snapshots = [store._snapshots[snapshot_id] for snapshot_id in ids]
+    assert [snapshot.depth for snapshot in snapshots] == [0, 1, 2, 0, 1]
+    assert snapshots[3].parent is None
+    assert snapshots[3].state == states[3]
+    store.restore(ids[1])
+    store.restore(ids[4])
+    assert nes.save_state() == states[4]
+
+
+def test_snapshot_size(nes):
+    store = SnapshotStore(nes, chunk_size=16)
+    root = store.snapshot()
+    state = nes.save_state()
+    nes.run_frame()
+    branch = store.snapshot()
+    # a frame of this program changes a few pages of RAM and some registers, out of a save state of tens of KiB
+    assert store._snapshots[root].size == len(state)
+    assert 0 < store._snapshots[branch].size < 1000
+    assert len(state) > 20000
+
+
+def test_rewind_matches_save_states(nes):
+    nes.enable_rewind(keyframe_interval=8)
+    rams = [bytes(nes.ram)]
+    for ii in range(30):
+        nes.run_frame()
+        rams.append(bytes(nes.ram))
+    for frames, frame in [(0, 30), (5, 25), (7, 18), (1, 17), (12, 5)]:
+        assert nes.rewind(frames) == frames
+        assert bytes(nes.ram) == rams[frame]
+
+
+def frame_state(frame: int, length: int = 300) -> bytes:
+    """
+    A made up save state, which changes a little every frame like a real one.
+    """
+    return bytes([frame & 0xFF, frame >> 8]) + bytes(range(256)) + bytes([frame % 7]) * (length - 258)
+
+
+def record_frames(buffer: RewindBuffer, frames: int) -> list[bytes]:
+    states = [frame_state(ii) for ii in range(frames)]
+    for state in states:
+        buffer.record(state)
+    return states
+
+
+def test_rewind_buffer_crosses_keyframes():
+    buffer = RewindBuffer(keyframe_interval=4)
+    states = record_frames(buffer, 10)
+    assert [len(group) for group in buffer._groups] == [4, 4, 2]
+    # back past the last keyframe drops its whole group, and part of the one before
+    assert buffer.rewind(5) == (5, states[4])
+    assert [len(group) for group in buffer._groups] == [4, 1]
+    assert len(buffer) == 5
+    assert buffer.rewind(1) == (1, states[3])
+    assert [len(group) for group in buffer._groups] == [4]
+    # new frames carry on from the frame rewound to
+    buffer.record(states[4])
+    buffer.record(frame_state(100))
+    assert [len(group) for group in buffer._groups] == [4, 2]
+    assert buffer.rewind(1) == (1, states[4])
+
+
+def test_rewind_buffer_limits():
+    buffer = RewindBuffer(keyframe_interval=4)
+    with pytest.raises(IndexError):
+        buffer.rewind(1)
+    states = record_frames(buffer, 10)
+    size = buffer.size
+    # going back 0 frames rebuilds the most recent one
+    assert buffer.rewind(0) == (0, states[9])
+    assert len(buffer) == 10
+    assert buffer.size == size
+    # going back further than the buffer reaches stops at the oldest frame, which is kept
+    assert buffer.rewind(100) == (9, states[0])
+    assert len(buffer) == 1
+    assert buffer.rewind(1) == (0, states[0])
+
+
+def test_rewind_buffer_budget():
+    buffer = RewindBuffer(keyframe_interval=4)
+    states = record_frames(buffer, 8)
+    buffer.memory_budget = buffer.size
+    # one more frame goes over the budget, which drops the oldest keyframe and all of its deltas
+    buffer.record(frame_state(8))
+    assert len(buffer) == 5
+    assert buffer.size <= buffer.memory_budget
+    assert buffer.rewind(100) == (4, states[4])
+
+
+def test_rewind_buffer_state_length_change():
+    buffer = RewindBuffer(keyframe_interval=4)
+    states = record_frames(buffer, 2)
+    # e.g. a different ROM was loaded. a delta can't be taken against a state of another length
+    longer = frame_state(2, length=400)
+    buffer.record(longer)
+    buffer.record(frame_state(3, length=400))
+    assert [len(group) for group in buffer._groups] == [2, 2]
+    assert buffer.rewind(1) == (1, longer)
+    assert buffer.rewind(1) == (1, states[1])
+
+
+def test_rewind_a_minute_within_a_frame(nes):
+    # 60 seconds of frames, each changing a scattering of bytes of the save state. the emulator is too slow to run
+    # them in a test
+    state = bytearray(nes.save_state())
+    buffer = RewindBuffer()
+    for frame in range(60 * 60):
+        for offset in range(0x300, 0x400, 7):
+            state[offset] = (state[offset] + frame) & 0xFF
+        buffer.record(bytes(state))
+    start = time.perf_counter()
+    frames, oldest = buffer.rewind(60 * 60)
+    nes.load_state(oldest)
+    assert time.perf_counter() - start < 1 / 60
+    assert frames == 60 * 60 - 1